@@ -227,6 +227,71 @@ INGEST_PAGE_SIZE = config('INGEST_PAGE_SIZE', default=200, cast=int)
 DB_BULK_BATCH_SIZE = config('DB_BULK_BATCH_SIZE', default=1000, cast=int)
 # Database cursor chunk size for large queries
 DB_CURSOR_CHUNK_SIZE = config('DB_CURSOR_CHUNK_SIZE', default=1000, cast=int)
+# Bulk upsert backend: 'copy' streams rows through a COPY staging table on PostgreSQL,
+# 'orm' keeps Django bulk_create(update_conflicts=True)
+BULK_UPSERT_BACKEND = config('BULK_UPSERT_BACKEND', default='copy')
+# Skip rewriting rows whose content fingerprint matches the last synced version
+SYNC_SKIP_UNCHANGED = config('SYNC_SKIP_UNCHANGED', default=True, cast=bool)
+# Batches buffered between fetch/transform/save stages in BaseSyncEngine (0 = sequential)
+SYNC_PIPELINE_DEPTH = config('SYNC_PIPELINE_DEPTH', default=0, cast=int)
+# Worker processes for CPU-bound transforms (0 = transform in the sync's own process)
+SYNC_TRANSFORM_WORKERS = config('SYNC_TRANSFORM_WORKERS', default=0, cast=int)
+# Smallest batch worth shipping to the transform pool
+SYNC_TRANSFORM_MIN_BATCH = config('SYNC_TRANSFORM_MIN_BATCH', default=500, cast=int)
+# How transform workers are started; 'forkserver' avoids forking a process that runs threads
+SYNC_TRANSFORM_START_METHOD = config('SYNC_TRANSFORM_START_METHOD', default='forkserver')
+# Grow page and write sizes while latency and memory stay healthy, halve them when they
+# degrade (AIMD, see ingestion.base.adaptive_batching); each run starts where the last ended
+SYNC_ADAPTIVE_BATCHING = config('SYNC_ADAPTIVE_BATCHING', default=True, cast=bool)
+SYNC_ADAPTIVE_MIN_BATCH_SIZE = config('SYNC_ADAPTIVE_MIN_BATCH_SIZE', default=50, cast=int)
+SYNC_ADAPTIVE_MAX_BATCH_SIZE = config('SYNC_ADAPTIVE_MAX_BATCH_SIZE', default=10000, cast=int)
+# Seconds one page fetch or write may take before sizes are cut
+SYNC_ADAPTIVE_TARGET_SECONDS = config('SYNC_ADAPTIVE_TARGET_SECONDS', default=5.0, cast=float)
+# Share of the MemoryGuard limit above which sizes are cut
+SYNC_ADAPTIVE_MEMORY_FRACTION = config('SYNC_ADAPTIVE_MEMORY_FRACTION', default=0.8, cast=float)
+# Process RSS limit for write sizes of engines without their own MemoryGuard (0 = ignore memory)
+SYNC_ADAPTIVE_MEMORY_LIMIT_MB = config('SYNC_ADAPTIVE_MEMORY_LIMIT_MB', default=0, cast=int)
+# Seconds between checkpoint writes of a running sync's stream cursor (see ingestion.base.checkpoint)
+SYNC_CHECKPOINT_INTERVAL = config('SYNC_CHECKPOINT_INTERVAL', default=30, cast=int)
+# Continue interrupted syncs from their last checkpoint without --resume
+SYNC_AUTO_RESUME = config('SYNC_AUTO_RESUME', default=False, cast=bool)
+# Sub-syncs the *_all commands run at once, dependencies permitting (1 = serial)
+SYNC_ALL_MAX_PARALLEL = config('SYNC_ALL_MAX_PARALLEL', default=3, cast=int)
+# Process RSS above which the *_all commands hold back new sub-syncs (0 = no budget)
+SYNC_ALL_MEMORY_BUDGET_MB = config('SYNC_ALL_MEMORY_BUDGET_MB', default=0, cast=int)
+# SalesPro Athena extraction: 'single_pass' streams one query's result set,
+# 'chunked' re-queries per 50K rows (legacy)
+SALESPRO_EXTRACTION_MODE = config('SALESPRO_EXTRACTION_MODE', default='single_pass')
+# Where single-pass results are read from: 'api' (GetQueryResults pages) or 's3' (result CSV)
+SALESPRO_ATHENA_RESULT_SOURCE = config('SALESPRO_ATHENA_RESULT_SOURCE', default='api')
+# SalesPro lead result line items: 'reconcile' writes only inserts, updates and deletes
+# keyed on (estimate_id, job_type_number); 'replace' deletes and recreates them per batch
+SALESPRO_LINE_ITEM_MODE = config('SALESPRO_LINE_ITEM_MODE', default='reconcile')
+# LeadConduit event extraction: the sync range is split into windows of this many hours,
+# each paged with its own after_id cursor, and this many windows are walked at once
+LEADCONDUIT_SHARD_HOURS = config('LEADCONDUIT_SHARD_HOURS', default=6, cast=float)
+LEADCONDUIT_SHARD_CONCURRENCY = config('LEADCONDUIT_SHARD_CONCURRENCY', default=4, cast=int)
+# MarketSharp OData pages fetched ahead of the one being written (--concurrent overrides)
+MARKETSHARP_PREFETCH_PAGES = config('MARKETSHARP_PREFETCH_PAGES', default=3, cast=int)
+# Google Sheets syncs write only rows whose cells changed since the last run
+# (--full / --force clear the table and reload every row)
+GSHEET_INCREMENTAL_SYNC = config('GSHEET_INCREMENTAL_SYNC', default=True, cast=bool)
+# Five9 contact lists downloaded at once, each on its own Admin session
+# (capped at Five9Config.CONCURRENT_REQUESTS)
+FIVE9_LIST_CONCURRENCY = config('FIVE9_LIST_CONCURRENCY', default=4, cast=int)
+# Concurrent HubSpot v4 batch association reads (1000 source IDs each)
+HUBSPOT_ASSOCIATION_CONCURRENCY = config('HUBSPOT_ASSOCIATION_CONCURRENCY', default=4, cast=int)
+# API rate limiter state: 'redis' shares each CRM's token bucket across workers, 'local' is per process
+API_RATE_LIMIT_BACKEND = config(
+    'API_RATE_LIMIT_BACKEND',
+    default='redis' if CELERY_BROKER_URL.startswith('redis') else 'local'
+)
+API_RATE_LIMIT_REDIS_URL = config('API_RATE_LIMIT_REDIS_URL', default='') or None
+# Shared keep-alive HTTP sessions (one per API host per worker process)
+HTTP_POOL_MAX_CONNECTIONS = config('HTTP_POOL_MAX_CONNECTIONS', default=100, cast=int)
+HTTP_POOL_MAX_CONNECTIONS_PER_HOST = config('HTTP_POOL_MAX_CONNECTIONS_PER_HOST', default=20, cast=int)
+HTTP_POOL_KEEPALIVE_TIMEOUT = config('HTTP_POOL_KEEPALIVE_TIMEOUT', default=60, cast=int)
+HTTP_POOL_DNS_CACHE_TTL = config('HTTP_POOL_DNS_CACHE_TTL', default=300, cast=int)
 
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
@@ -312,6 +377,16 @@ GENIUS_DB_HOST = config("GENIUS_DB_HOST", default="")
 GENIUS_DB_NAME = config("GENIUS_DB_NAME", default="")
 GENIUS_DB_USER = config("GENIUS_DB_USER", default="")
 GENIUS_DB_PASSWORD = config("GENIUS_DB_PASSWORD", default="")
+# Pooled connections for short Genius queries; streamed reads open their own
+GENIUS_DB_POOL_SIZE = config("GENIUS_DB_POOL_SIZE", default=5, cast=int)
+# Chunked Genius reads: 'stream' (one unbuffered query read with fetchmany) or 'keyset' (LIMIT query per chunk)
+GENIUS_READ_MODE = config("GENIUS_READ_MODE", default="stream")
+# Rows per fetchmany page of a streamed read
+GENIUS_STREAM_PAGE_SIZE = config("GENIUS_STREAM_PAGE_SIZE", default=5000, cast=int)
+# Pages read ahead on a background thread while the previous page is written (0 = no read-ahead)
+GENIUS_STREAM_PREFETCH = config("GENIUS_STREAM_PREFETCH", default=1, cast=int)
+# Seconds MySQL waits for a streaming client to take the next rows before dropping it
+GENIUS_STREAM_NET_WRITE_TIMEOUT = config("GENIUS_STREAM_NET_WRITE_TIMEOUT", default=600, cast=int)
 
 # SalesRabbit API Configuration
 SALESRABBIT_API_TOKEN = config('SALESRABBIT_API_TOKEN', default='')
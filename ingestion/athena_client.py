@@ -3,9 +3,11 @@ AWS Athena client utility using boto3
 Replaces pyathena dependency for SalesPro data operations
 """
 import boto3
+import codecs
+import csv
 import time
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from botocore.exceptions import ClientError, NoCredentialsError
 import logging
 
@@ -207,6 +209,25 @@ class AthenaClient:
         Returns:
             Tuple of (column_names, rows) or (None, None) if query fails
         """
+        query_execution_id = self.start_query(query, database=database, timeout=timeout)
+        if query_execution_id is None:
+            return None, None
+        
+        # Fetch results with column information
+        return self._fetch_query_results_with_columns(query_execution_id)
+    
+    def start_query(self, query: str, database: str = None, timeout: int = 300) -> Optional[str]:
+        """
+        Start an Athena query and wait for it to finish
+        
+        Args:
+            query: SQL query string
+            database: Database name (uses default if not provided)
+            timeout: Maximum wait time in seconds
+            
+        Returns:
+            Query execution ID, or None if the query failed
+        """
         db_name = database or self.database
         
         try:
@@ -227,7 +248,7 @@ class AthenaClient:
             while True:
                 if time.time() - start_time > timeout:
                     logger.error(f"Query timeout after {timeout} seconds")
-                    return None, None
+                    return None
                 
                 status_response = self.client.get_query_execution(QueryExecutionId=query_execution_id)
                 state = status_response["QueryExecution"]["Status"]["State"]
@@ -246,14 +267,11 @@ class AthenaClient:
                         logger.error("SOLUTION: Check IAM permissions for the user. See docs/aws_iam_policy_for_athena.json for required permissions.")
                     else:
                         logger.error(f"Athena query {state.lower()}: {error_reason}")
-                    return None, None
-                elif state in ["QUEUED", "RUNNING"]:
-                    time.sleep(2)
+                    return None
                 else:
                     time.sleep(2)
             
-            # Fetch results with column information
-            return self._fetch_query_results_with_columns(query_execution_id)
+            return query_execution_id
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
@@ -268,13 +286,130 @@ class AthenaClient:
                 logger.error("SOLUTION: Check IAM permissions. See docs/aws_iam_policy_for_athena.json for required policy.")
             else:
                 logger.error(f"AWS Athena error [{error_code}]: {error_message}")
-            return None, None
+            return None
         except NoCredentialsError:
             logger.error("AWS credentials not found or invalid")
-            return None, None
+            return None
         except Exception as e:
             logger.exception(f"Error executing Athena query with columns: {e}")
-            return None, None
+            return None
+    
+    def get_query_state(self, query_execution_id: str) -> Optional[str]:
+        """
+        Return the state of a query execution (e.g. SUCCEEDED), or None if it is unknown
+        
+        Athena keeps a finished query's results readable for as long as its
+        output location retains them, so a resumed sync can keep paging them.
+        """
+        try:
+            execution = self.client.get_query_execution(QueryExecutionId=query_execution_id)
+            return execution["QueryExecution"]["Status"]["State"]
+        except ClientError as e:
+            logger.warning(f"Could not look up Athena query {query_execution_id}: {e}")
+            return None
+    
+    def iter_result_pages(self, query_execution_id: str, page_size: int = 1000) -> Iterator[Tuple[List[str], List[List[str]]]]:
+        """
+        Stream the result set of a completed query one API page at a time
+        
+        Unlike _fetch_query_results_with_columns this never holds more than
+        one page in memory, so a single query can feed a sync of any size.
+        
+        Args:
+            query_execution_id: The execution ID of the completed query
+            page_size: Rows per GetQueryResults call (Athena caps this at 1000)
+            
+        Yields:
+            Tuples of (column_names, rows)
+        """
+        for column_names, rows, _ in self.iter_result_pages_with_tokens(query_execution_id, page_size):
+            yield column_names, rows
+    
+    def iter_result_pages_with_tokens(self, query_execution_id: str, page_size: int = 1000,
+                                      start_token: Optional[str] = None,
+                                      column_names: Optional[List[str]] = None
+                                      ) -> Iterator[Tuple[List[str], List[List[str]], Optional[str]]]:
+        """
+        Stream result pages together with the NextToken that follows each page
+        
+        Args:
+            query_execution_id: The execution ID of the completed query
+            page_size: Rows per GetQueryResults call (Athena caps this at 1000)
+            start_token: Start at the page fetched with this NextToken
+            column_names: Column names, required with start_token since only
+                the first page carries the header row
+            
+        Yields:
+            Tuples of (column_names, rows, next_token)
+        """
+        if start_token and column_names is None:
+            raise ValueError("column_names are required when starting from a NextToken")
+        next_token = start_token
+        
+        while True:
+            request = {"QueryExecutionId": query_execution_id, "MaxResults": min(page_size, 1000)}
+            if next_token:
+                request["NextToken"] = next_token
+            results = self.client.get_query_results(**request)
+            
+            result_rows = results.get("ResultSet", {}).get("Rows", [])
+            rows = [
+                [col.get("VarCharValue", "") for col in row_data.get("Data", [])]
+                for row_data in result_rows
+            ]
+            
+            # The first row of the first page is the header
+            if column_names is None:
+                if not rows:
+                    return
+                column_names, rows = rows[0], rows[1:]
+            
+            next_token = results.get("NextToken")
+            if rows:
+                yield column_names, rows, next_token
+            
+            if not next_token:
+                break
+    
+    def iter_result_pages_from_s3(self, query_execution_id: str, page_size: int = 10000) -> Iterator[Tuple[List[str], List[List[str]]]]:
+        """
+        Stream the result CSV of a completed query straight from its S3 output location
+        
+        Reading the result object avoids one GetQueryResults round trip per
+        1000 rows on very large result sets. Requires s3:GetObject on the
+        Athena output location.
+        
+        Yields:
+            Tuples of (column_names, rows)
+        """
+        execution = self.client.get_query_execution(QueryExecutionId=query_execution_id)
+        output_location = execution["QueryExecution"]["ResultConfiguration"]["OutputLocation"]
+        bucket, key = output_location.replace("s3://", "", 1).split("/", 1)
+        
+        s3 = boto3.client(
+            "s3",
+            region_name=self.region,
+            aws_access_key_id=self.aws_key,
+            aws_secret_access_key=self.aws_secret
+        )
+        body = s3.get_object(Bucket=bucket, Key=key)["Body"]
+        
+        try:
+            reader = csv.reader(codecs.getreader("utf-8")(body))
+            column_names = next(reader, None)
+            if column_names is None:
+                return
+            
+            rows = []
+            for row in reader:
+                rows.append(row)
+                if len(rows) >= page_size:
+                    yield column_names, rows
+                    rows = []
+            if rows:
+                yield column_names, rows
+        finally:
+            body.close()
     
     def _fetch_query_results_with_columns(self, query_execution_id: str) -> Tuple[List[str], List[List[str]]]:
         """
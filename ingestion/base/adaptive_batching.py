@@ -0,0 +1,180 @@
+"""
+Adaptive (AIMD) sizing of sync pages and write batches.
+
+An ``AIMDController`` is fed one observation per page fetched or batch
+written: the rows it held, the seconds it took and the process RSS. While
+they stay healthy and the batch was full, the size grows by a fixed step
+(additive increase). A batch that exceeds the latency target, takes more than
+``slowdown_ratio`` times the best per-row time seen so far, fails, or leaves
+RSS above the memory limit halves it (multiplicative decrease).
+
+The size each controller ended on is stored per sync under
+``SyncHistory.performance_metrics['adaptive_batching']`` and is the starting
+size of the next run of the same CRM source and sync type. Memory pressure
+says more about the process than about the API or database, so cuts made
+for memory are not carried over: the learned size is the one the run had
+before its first memory-driven decrease, unless it later grew past it.
+"""
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Keys under performance_metrics['adaptive_batching']
+PAGE = 'page'
+FLUSH = 'flush'
+
+LATENCY = 'latency'
+SLOWDOWN = 'slowdown'
+MEMORY = 'memory'
+ERROR = 'error'
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease batch size"""
+
+    def __init__(self, size: int, minimum: int, maximum: int, step: Optional[int] = None,
+                 backoff: float = 0.5, target_seconds: float = 5.0, slowdown_ratio: float = 2.0,
+                 memory_limit_mb: Optional[float] = None,
+                 rss_mb: Optional[Callable[[], float]] = None):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.size = self._clamp(size)
+        self.initial_size = self.size
+        self.step = step or max(1, self.size // 10)
+        self.backoff = backoff
+        self.target_seconds = target_seconds
+        self.slowdown_ratio = slowdown_ratio
+        self.memory_limit_mb = memory_limit_mb or None
+        self.rss_mb = rss_mb
+        self.best_seconds_per_row: Optional[float] = None
+        self.peak_size = self.size
+        # Size before the first memory-driven decrease, if there was one
+        self.size_before_memory_cut: Optional[int] = None
+        self.observations = 0
+        self.increases = 0
+        self.decreases: Dict[str, int] = {}
+
+    def _clamp(self, size: int) -> int:
+        return min(self.maximum, max(self.minimum, int(size)))
+
+    def _decrease(self, reason: str) -> int:
+        self.decreases[reason] = self.decreases.get(reason, 0) + 1
+        if reason == MEMORY and self.size_before_memory_cut is None:
+            self.size_before_memory_cut = self.size
+        size = self._clamp(self.size * self.backoff)
+        if size != self.size:
+            logger.info(f"Reducing batch size {self.size} -> {size} ({reason})")
+        self.size = size
+        return self.size
+
+    def observe(self, rows: int, seconds: float, rss_mb: Optional[float] = None) -> int:
+        """Fold in one batch and return the size for the next one"""
+        self.observations += 1
+        if rss_mb is None and self.memory_limit_mb and self.rss_mb:
+            rss_mb = self.rss_mb()
+        if self.memory_limit_mb and rss_mb is not None and rss_mb > self.memory_limit_mb:
+            return self._decrease(MEMORY)
+        if seconds > self.target_seconds:
+            return self._decrease(LATENCY)
+        if rows <= 0:
+            return self.size
+
+        per_row = seconds / rows
+        if self.best_seconds_per_row is not None and per_row > self.best_seconds_per_row * self.slowdown_ratio:
+            return self._decrease(SLOWDOWN)
+        if self.best_seconds_per_row is None or per_row < self.best_seconds_per_row:
+            self.best_seconds_per_row = per_row
+
+        # A partial batch says nothing about whether a bigger one would be healthy
+        if rows >= self.size and self.size < self.maximum:
+            self.size = self._clamp(self.size + self.step)
+            self.increases += 1
+            self.peak_size = max(self.peak_size, self.size)
+        return self.size
+
+    def fail(self) -> int:
+        """The batch failed; back off before the next one"""
+        self.observations += 1
+        return self._decrease(ERROR)
+
+    @property
+    def learned_size(self) -> int:
+        """Size for the next run to start at, ignoring memory-driven cuts"""
+        if self.size_before_memory_cut is None:
+            return self.size
+        return max(self.size, self.size_before_memory_cut)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'size': self.size,
+            'learned_size': self.learned_size,
+            'initial_size': self.initial_size,
+            'peak_size': self.peak_size,
+            'min_size': self.minimum,
+            'max_size': self.maximum,
+            'observations': self.observations,
+            'increases': self.increases,
+            'decreases': dict(self.decreases),
+        }
+
+
+def adaptive_batching_enabled() -> bool:
+    return getattr(settings, 'SYNC_ADAPTIVE_BATCHING', True)
+
+
+def memory_guard_from_settings():
+    """MemoryGuard at ``SYNC_ADAPTIVE_MEMORY_LIMIT_MB``, or None when that is 0 (no memory signal)"""
+    limit_mb = getattr(settings, 'SYNC_ADAPTIVE_MEMORY_LIMIT_MB', 0)
+    if not limit_mb:
+        return None
+    from ingestion.base.streaming_client import MemoryGuard
+    return MemoryGuard(max_memory_mb=limit_mb)
+
+
+def build_controller(size: int, learned: Optional[int] = None, maximum: Optional[int] = None,
+                     memory_guard=None) -> AIMDController:
+    """Controller from the ``SYNC_ADAPTIVE_*`` settings, starting at ``learned`` when known.
+
+    Sizes are only cut for memory when a ``memory_guard`` is given, at
+    ``SYNC_ADAPTIVE_MEMORY_FRACTION`` of its limit.
+    """
+    memory_limit_mb = None
+    if memory_guard is not None:
+        memory_limit_mb = memory_guard.max_memory_mb * getattr(settings, 'SYNC_ADAPTIVE_MEMORY_FRACTION', 0.8)
+    return AIMDController(
+        learned or size,
+        minimum=getattr(settings, 'SYNC_ADAPTIVE_MIN_BATCH_SIZE', 50),
+        maximum=maximum or getattr(settings, 'SYNC_ADAPTIVE_MAX_BATCH_SIZE', 10000),
+        target_seconds=getattr(settings, 'SYNC_ADAPTIVE_TARGET_SECONDS', 5.0),
+        memory_limit_mb=memory_limit_mb,
+        rss_mb=memory_guard.memory_mb if memory_guard is not None else None,
+    )
+
+
+def learned_sizes(crm_source: str, sync_type: str) -> Dict[str, int]:
+    """Sizes the last successful run of this sync ended on, by controller key"""
+    from ingestion.models.common import SyncHistory
+
+    try:
+        recent = SyncHistory.objects.filter(
+            crm_source=crm_source,
+            sync_type=sync_type,
+            status__in=['success', 'completed'],
+        ).order_by('-end_time').values_list('performance_metrics', flat=True)[:5]
+        for metrics in recent:
+            adaptive = (metrics or {}).get('adaptive_batching') if isinstance(metrics, dict) else None
+            if adaptive:
+                return {key: stats.get('learned_size') or stats['size'] for key, stats in adaptive.items()
+                        if isinstance(stats, dict) and stats.get('size')}
+    except Exception as e:
+        logger.warning(f"Could not load learned batch sizes for {crm_source} {sync_type}: {e}")
+    return {}
+
+
+def adaptive_summary(**controllers: Optional[AIMDController]) -> Dict[str, Dict[str, Any]]:
+    """``performance_metrics['adaptive_batching']`` for the controllers that were used"""
+    return {key: controller.summary() for key, controller in controllers.items()
+            if controller is not None and controller.observations}
@@ -0,0 +1,319 @@
+"""
+Bulk upsert backend shared by sync engines and processors.
+
+On PostgreSQL rows are streamed with ``COPY`` into a temporary staging table
+and merged into the target table with a single
+``INSERT ... SELECT ... ON CONFLICT DO UPDATE``. This avoids building Django
+model instances and binding thousands of parameters per batch, and the
+``RETURNING (xmax = 0)`` trick gives exact created/updated counts.
+
+Other database backends (SQLite in local tests) fall back to
+``bulk_create(update_conflicts=True)`` with the same return contract.
+"""
+import io
+import json
+import logging
+import uuid
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from ingestion.base.rows import Row
+
+logger = logging.getLogger(__name__)
+
+COPY_NULL = '\\N'
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def _copy_text_value(value: Any) -> str:
+    """Encode a Python value for PostgreSQL COPY text format"""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (dict, list)):
+        text = json.dumps(value, cls=DjangoJSONEncoder)
+    elif isinstance(value, (datetime, date, time)):
+        text = value.isoformat()
+    else:
+        text = str(value)
+    return text.translate(_COPY_ESCAPES)
+
+
+class BulkUpserter:
+    """Upsert dict records into one model's table in bulk.
+
+    Records are plain dicts keyed by model field name (or attname for
+    foreign keys), the same shape the engines already pass to
+    ``Model(**record)``, or read-only ``Row``s (``ingestion.base.rows``)
+    with the same keys.
+    """
+
+    def __init__(
+        self,
+        model_class,
+        unique_fields: Sequence[str] = ('id',),
+        update_fields: Optional[Sequence[str]] = None,
+        using: str = 'default',
+        backend: Optional[str] = None,
+        skip_unchanged: bool = False,
+    ):
+        self.model_class = model_class
+        self.unique_fields = list(unique_fields)
+        self.update_fields = list(update_fields) if update_fields is not None else None
+        self.using = using
+        self.backend = backend or getattr(settings, 'BULK_UPSERT_BACKEND', 'copy')
+        self._fields_by_key = self._build_field_lookup()
+        
+        # Content fingerprints let full/force syncs skip rows that did not change
+        self.fingerprints = None
+        if skip_unchanged and getattr(settings, 'SYNC_SKIP_UNCHANGED', True):
+            from ingestion.base.fingerprint import FingerprintStore
+            self.fingerprints = FingerprintStore(model_class, self.unique_fields, using=using)
+
+    def _build_field_lookup(self) -> Dict[str, models.Field]:
+        """Map both field names and attnames to concrete fields"""
+        lookup = {}
+        for field in self.model_class._meta.concrete_fields:
+            lookup[field.name] = field
+            lookup[field.attname] = field
+        return lookup
+
+    @property
+    def use_copy(self) -> bool:
+        return (
+            self.backend == 'copy'
+            and connections[self.using].vendor == 'postgresql'
+        )
+
+    def upsert(self, records: List[Dict[str, Any]], update: bool = True) -> Dict[str, int]:
+        """Insert new rows and update existing ones.
+
+        Args:
+            records: Records to write; later duplicates of a key win
+            update: When False existing rows are left untouched (DO NOTHING)
+
+        Returns:
+            Dict with ``created``, ``updated`` and ``skipped`` counts
+        """
+        records = self._dedupe(records)
+        if not records:
+            return {'created': 0, 'updated': 0, 'skipped': 0}
+        
+        if not (update and self.fingerprints):
+            counts = self._write(records, update)
+            counts['skipped'] = 0
+            return counts
+        
+        records, pairs, skipped = self.fingerprints.split_unchanged(records)
+        if skipped:
+            logger.debug(f"Skipping {skipped} unchanged {self.model_class.__name__} records")
+        counts = {'created': 0, 'updated': 0}
+        if records:
+            with transaction.atomic(using=self.using):
+                counts = self._write(records, update)
+                self.fingerprints.remember(pairs)
+        counts['skipped'] = skipped
+        return counts
+    
+    def _write(self, records: List[Dict[str, Any]], update: bool) -> Dict[str, int]:
+        if self.use_copy:
+            return self._copy_upsert(records, update)
+        return self._orm_upsert(records, update)
+
+    def _dedupe(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """ON CONFLICT cannot touch the same row twice in one statement"""
+        by_key = {}
+        for record in records:
+            key = tuple(record.get(name) for name in self.unique_fields)
+            if None in key:
+                logger.warning(f"Skipping {self.model_class.__name__} record without {self.unique_fields}")
+                continue
+            by_key[key] = record
+        return list(by_key.values())
+
+    def _columns_for(self, records: List[Dict[str, Any]]) -> List[models.Field]:
+        """Resolve the columns written for this batch.
+
+        Like ``bulk_create`` every concrete column is written, with model
+        defaults filling keys a record does not carry. Auto-generated primary
+        keys are only included when the records supply them.
+        """
+        present = set()
+        unknown = set()
+        schemas = set()
+        for record in records:
+            # Rows sharing a schema carry the same keys; look at each schema once
+            if isinstance(record, Row):
+                if id(record.schema) in schemas:
+                    continue
+                schemas.add(id(record.schema))
+            for key in record:
+                field = self._fields_by_key.get(key)
+                if field is None:
+                    unknown.add(key)
+                else:
+                    present.add(field.attname)
+        if unknown:
+            logger.debug(f"Ignoring non-model keys for {self.model_class.__name__}: {sorted(unknown)}")
+        return [
+            field for field in self.model_class._meta.concrete_fields
+            if not (isinstance(field, models.AutoField) and field.attname not in present)
+        ]
+
+    def _update_columns(self, columns: List[models.Field]) -> List[models.Field]:
+        unique = {self._fields_by_key[name].attname for name in self.unique_fields}
+        if self.update_fields is not None:
+            wanted = {self._fields_by_key[name].attname for name in self.update_fields}
+        else:
+            wanted = None
+        result = []
+        for field in columns:
+            if field.attname in unique or field.primary_key:
+                continue
+            if getattr(field, 'auto_now_add', False):
+                continue
+            if wanted is not None and field.attname not in wanted:
+                continue
+            result.append(field)
+        return result
+
+    def _row_value(self, record: Dict[str, Any], field: models.Field, now: datetime) -> Any:
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            value = record.get(field.name, record.get(field.attname))
+            return value if value is not None else now
+        if field.attname in record:
+            value = record[field.attname]
+        elif field.name in record:
+            value = record[field.name]
+            if isinstance(value, models.Model):
+                value = value.pk
+        else:
+            default = field.get_default()
+            value = default.pk if isinstance(default, models.Model) else default
+        if isinstance(field, models.JSONField):
+            # Scalars must be JSON-encoded too ("abc", true); None stays SQL NULL
+            if value is None:
+                return None
+            return json.dumps(value, cls=field.encoder or DjangoJSONEncoder)
+        return field.get_prep_value(value)
+
+    def _copy_upsert(self, records: List[Dict[str, Any]], update: bool) -> Dict[str, int]:
+        connection = connections[self.using]
+        qn = connection.ops.quote_name
+        columns = self._columns_for(records)
+        update_columns = self._update_columns(columns) if update else []
+        table = qn(self.model_class._meta.db_table)
+        staging = qn(f"_stage_{uuid.uuid4().hex[:12]}")
+        column_sql = ', '.join(qn(f.column) for f in columns)
+        conflict_sql = ', '.join(qn(self._fields_by_key[name].column) for name in self.unique_fields)
+
+        now = timezone.now()
+        buffer = io.StringIO()
+        for record in records:
+            buffer.write('\t'.join(
+                _copy_text_value(self._row_value(record, field, now)) for field in columns
+            ))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        if update_columns:
+            action = 'DO UPDATE SET ' + ', '.join(
+                f"{qn(f.column)} = EXCLUDED.{qn(f.column)}" for f in update_columns
+            )
+        else:
+            action = 'DO NOTHING'
+
+        with transaction.atomic(using=self.using):
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+                    f"SELECT {column_sql} FROM {table} WITH NO DATA"
+                )
+                copy_sql = f"COPY {staging} ({column_sql}) FROM STDIN"
+                if hasattr(cursor.cursor, 'copy_expert'):
+                    cursor.cursor.copy_expert(copy_sql, buffer)
+                else:  # psycopg 3
+                    with cursor.cursor.copy(copy_sql) as copy:
+                        copy.write(buffer.getvalue())
+                cursor.execute(
+                    f"INSERT INTO {table} ({column_sql}) "
+                    f"SELECT {column_sql} FROM {staging} "
+                    f"ON CONFLICT ({conflict_sql}) {action} "
+                    f"RETURNING (xmax = 0) AS inserted"
+                )
+                flags = [row[0] for row in cursor.fetchall()]
+
+        created = sum(1 for inserted in flags if inserted)
+        return {'created': created, 'updated': len(flags) - created}
+
+    def _orm_upsert(self, records: List[Dict[str, Any]], update: bool) -> Dict[str, int]:
+        manager = self.model_class.objects.using(self.using)
+        keys = [tuple(record.get(name) for name in self.unique_fields) for record in records]
+        if len(self.unique_fields) == 1:
+            name = self.unique_fields[0]
+            existing = {
+                (value,) for value in manager.filter(
+                    **{f"{name}__in": [key[0] for key in keys]}
+                ).values_list(name, flat=True)
+            }
+        else:
+            condition = models.Q()
+            for key in keys:
+                condition |= models.Q(**dict(zip(self.unique_fields, key)))
+            existing = set(manager.filter(condition).values_list(*self.unique_fields))
+
+        objects = []
+        for record in records:
+            known = {k: v for k, v in record.items() if k in self._fields_by_key}
+            objects.append(self.model_class(**known))
+
+        with transaction.atomic(using=self.using):
+            if update:
+                columns = self._columns_for(records)
+                update_columns = self._update_columns(columns)
+                manager.bulk_create(
+                    objects,
+                    update_conflicts=bool(update_columns),
+                    ignore_conflicts=not update_columns,
+                    update_fields=[f.name for f in update_columns] or None,
+                    unique_fields=self.unique_fields if update_columns else None,
+                )
+            else:
+                manager.bulk_create(objects, ignore_conflicts=True)
+
+        updated = sum(1 for key in keys if key in existing)
+        return {
+            'created': len(records) - updated,
+            'updated': updated if update else 0,
+        }
+
+
+def bulk_upsert(
+    model_class,
+    records: List[Dict[str, Any]],
+    unique_fields: Sequence[str] = ('id',),
+    update_fields: Optional[Sequence[str]] = None,
+    update: bool = True,
+    using: str = 'default',
+    skip_unchanged: bool = False,
+) -> Dict[str, int]:
+    """Convenience wrapper around :class:`BulkUpserter` for one-off batches"""
+    upserter = BulkUpserter(
+        model_class,
+        unique_fields=unique_fields,
+        update_fields=update_fields,
+        using=using,
+        skip_unchanged=skip_unchanged,
+    )
+    return upserter.upsert(records, update=update)
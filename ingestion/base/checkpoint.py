@@ -0,0 +1,129 @@
+"""
+Resumable sync checkpoints stored on the running SyncHistory row.
+
+Engines describe their position in the source stream with a small JSON
+cursor (a HubSpot ``after`` token, a keyset ``last_key``, the timestamp of
+the last saved row, ...). ``SyncCheckpoint`` writes that cursor to the
+running ``SyncHistory`` row at most once per ``SYNC_CHECKPOINT_INTERVAL``
+seconds, and only after the batch it points past has been saved.
+
+When a run dies (worker restart, ``cleanup_stale_syncs``) its row keeps the
+last cursor. A later run started with ``--resume`` (or with
+``SYNC_AUTO_RESUME`` enabled) picks it up through ``find_resumable_sync``
+and continues from there instead of from the last successful ``end_time``.
+Checkpoint writes double as a heartbeat, so ``cleanup_stale_syncs`` leaves
+long syncs that are still making progress alone.
+"""
+import json
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _jsonable(cursor: Dict[str, Any]) -> Dict[str, Any]:
+    """Round-trip a cursor through JSON so datetimes and tuples are stored as strings and lists"""
+    return json.loads(json.dumps(cursor, cls=DjangoJSONEncoder, default=str))
+
+
+def resume_enabled(requested: bool = False) -> bool:
+    """Whether a run should continue from an interrupted run's checkpoint"""
+    return bool(requested) or getattr(settings, 'SYNC_AUTO_RESUME', False)
+
+
+def find_resumable_sync(crm_source: str, sync_type: str, exclude_id: Optional[int] = None):
+    """Return the newest interrupted run of this sync that left a checkpoint.
+
+    Failed runs qualify, as do runs still marked ``running`` whose last
+    checkpoint is older than ``WORKER_POOL_STALE_MINUTES`` (the worker died
+    before anything marked them failed). Runs older than the last successful
+    sync are superseded by it and ignored.
+    """
+    from django.db.models import Q
+    from ingestion.models.common import SyncHistory
+
+    history = SyncHistory.objects.filter(crm_source=crm_source, sync_type=sync_type)
+    last_success = history.filter(status='success').order_by('-start_time').first()
+
+    stale_cutoff = timezone.now() - timedelta(minutes=getattr(settings, 'WORKER_POOL_STALE_MINUTES', 30))
+    candidates = history.filter(checkpoint__isnull=False).filter(
+        Q(status='failed') | Q(status='running', checkpoint_at__lt=stale_cutoff)
+    )
+    if last_success:
+        candidates = candidates.filter(start_time__gt=last_success.start_time)
+    if exclude_id:
+        candidates = candidates.exclude(id=exclude_id)
+    return candidates.order_by('-start_time').first()
+
+
+def load_resume_checkpoint(crm_source: str, sync_type: str, requested: bool = False):
+    """Return ``(interrupted_sync, cursor)`` to continue from, or ``(None, None)``"""
+    if not resume_enabled(requested):
+        return None, None
+    previous = find_resumable_sync(crm_source, sync_type)
+    if previous is None:
+        logger.info(f"No interrupted {crm_source} {sync_type} sync to resume")
+        return None, None
+    cursor = (previous.checkpoint or {}).get('cursor')
+    if not cursor:
+        return None, None
+    logger.info(f"Resuming {crm_source} {sync_type} from sync {previous.pk} at {cursor}")
+    return previous, cursor
+
+
+class SyncCheckpoint:
+    """Throttled writer of one running sync's stream cursor"""
+
+    def __init__(self, sync_history, interval: Optional[float] = None):
+        self.sync_history = sync_history
+        self.interval = interval if interval is not None else getattr(settings, 'SYNC_CHECKPOINT_INTERVAL', 30)
+        self.cursor: Optional[Dict[str, Any]] = None
+        self._written_at: Optional[float] = None
+
+    def update(self, cursor: Optional[Dict[str, Any]], records_processed: int = 0, force: bool = False) -> bool:
+        """Record the position after the last saved batch; returns True if it was persisted"""
+        if cursor is None or self.sync_history is None:
+            return False
+        self.cursor = cursor
+        if not force and self._written_at is not None and time.monotonic() - self._written_at < self.interval:
+            return False
+
+        from ingestion.models.common import SyncHistory
+        checkpoint = {
+            'cursor': _jsonable(cursor),
+            'records_processed': records_processed,
+            'resumed_from': self.sync_history.configuration.get('resumed_from')
+            if isinstance(self.sync_history.configuration, dict) else None,
+        }
+        now = timezone.now()
+        # Only touch the checkpoint columns so a concurrent complete_sync save is not overwritten
+        SyncHistory.objects.filter(pk=self.sync_history.pk).update(checkpoint=checkpoint, checkpoint_at=now)
+        self.sync_history.checkpoint = checkpoint
+        self.sync_history.checkpoint_at = now
+        self._written_at = time.monotonic()
+        logger.debug(f"Checkpoint for sync {self.sync_history.pk}: {checkpoint['cursor']}")
+        return True
+
+    async def aupdate(self, cursor: Optional[Dict[str, Any]], records_processed: int = 0, force: bool = False) -> bool:
+        return await sync_to_async(self.update)(cursor, records_processed, force)
+
+    def flush(self, records_processed: int = 0) -> bool:
+        """Persist the latest cursor regardless of the interval (used when a sync fails)"""
+        return self.update(self.cursor, records_processed, force=True)
+
+    def clear(self) -> None:
+        """Drop the checkpoint once the sync has finished successfully.
+
+        Only the in-memory row is changed; the caller's final ``save()`` of
+        the SyncHistory row persists it.
+        """
+        if self.sync_history is not None:
+            self.sync_history.checkpoint = None
+
@@ -2,22 +2,50 @@
 Base API client for all CRM integrations
 """
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 import aiohttp
 import asyncio
 import logging
 from typing import Dict, Any, Optional, List
+from urllib.parse import urlparse
+from ingestion.base.connection_pool import shared_http_sessions
 from ingestion.base.exceptions import APIException, RateLimitException
+from ingestion.base.rate_limiter import TokenBucket, get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 class BaseAPIClient(ABC):
     """Base class for all API clients"""
     
+    # Token bucket shared by every client of one CRM (defaults to the API host)
+    rate_limit_name: Optional[str] = None
+    # Starting requests per second; response quota headers retune it
+    default_rate_limit: float = 10.0
+    # Response body bytes received by make_request, reported in sync stage metrics
+    bytes_fetched: int = 0
+    
     def __init__(self, base_url: str, timeout: int = 30):
         self.base_url = base_url
         self.timeout = timeout
         self.session = None
         self.headers = {}
+        self._rate_limiter = None
+        self._session_lease = None
+    
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        if getattr(self, '_rate_limiter', None) is None:
+            name = self.rate_limit_name or urlparse(self.base_url).hostname or self.base_url
+            self._rate_limiter = get_rate_limiter(name, self.default_rate_limit)
+        return self._rate_limiter
+    
+    async def acquire_rate_limit(self) -> None:
+        """Wait for a rate limiter token before sending a request"""
+        await self.rate_limiter.acquire()
+    
+    def record_rate_limit_headers(self, headers) -> None:
+        """Feed a response's quota headers back into the rate limiter"""
+        self.rate_limiter.update_from_headers(headers)
         
     @abstractmethod
     async def authenticate(self) -> None:
@@ -34,26 +62,49 @@ class BaseAPIClient(ABC):
         # First authenticate to set up headers
         await self.authenticate()
         
-        # Then create session with the authenticated headers
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout),
-            headers=self.headers
-        )
+        # Then lease the shared keep-alive session for this API host
+        await self.open_shared_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        await self.close()
+    
+    async def open_shared_session(self) -> aiohttp.ClientSession:
+        """Use the process-wide pooled session for this client's host.
+        
+        The shared session carries no client headers or timeout; make_request
+        sends them per request.
+        """
+        if self.session is None or self.session.closed:
+            self.session = await shared_http_sessions.acquire(self.base_url)
+            self._session_lease = self.session
+        return self.session
+    
+    @asynccontextmanager
+    async def pooled_session(self):
+        """Yield the shared session, leasing it just for this block if none is open"""
+        if self.session is not None and not self.session.closed:
+            yield self.session
+            return
+        await self.open_shared_session()
+        try:
+            yield self.session
+        finally:
+            await self.close()
     
     async def make_request(self, method: str, endpoint: str, params: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
         """Make HTTP request with retry logic"""
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        kwargs['headers'] = {**self.headers, **(kwargs.get('headers') or {})}
+        kwargs.setdefault('timeout', aiohttp.ClientTimeout(total=self.timeout))
         
         for attempt in range(3):
             try:
+                await self.acquire_rate_limit()
                 # Pass params explicitly to aiohttp
                 async with self.session.request(method, url, params=params, **kwargs) as response:
+                    self.record_rate_limit_headers(response.headers)
                     if response.status == 429:
                         await self.handle_rate_limit(response)
                         continue
@@ -62,6 +113,8 @@ class BaseAPIClient(ABC):
                         error_text = await response.text()
                         raise APIException(f"HTTP {response.status}: {error_text}")
                     
+                    # read() caches the body, so json() below does not read it again
+                    self.bytes_fetched += len(await response.read())
                     return await response.json()
                     
             except aiohttp.ClientError as e:
@@ -75,12 +128,24 @@ class BaseAPIClient(ABC):
                 await asyncio.sleep(2 ** attempt)
     
     async def handle_rate_limit(self, response: aiohttp.ClientResponse):
-        """Handle rate limiting"""
-        retry_after = int(response.headers.get('Retry-After', 60))
+        """Handle rate limiting.
+        
+        The wait is taken from Retry-After or the quota headers (60s when the
+        response has neither) and applied to the shared rate limiter, so other
+        requests for the same CRM back off too; the retry waits on the limiter.
+        """
+        info = self.rate_limiter.update_from_headers(response.headers)
+        retry_after = (info and (info.reset_after or info.window_seconds)) or 60
         logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-        await asyncio.sleep(retry_after)
+        self.rate_limiter.penalize(retry_after)
     
     async def close(self):
-        """Close the session"""
-        if self.session:
+        """Close the session, or return it to the shared pool"""
+        if self.session is None:
+            return
+        if self.session is getattr(self, '_session_lease', None):
+            self._session_lease = None
+            await shared_http_sessions.release(self.session)
+        else:
             await self.session.close()
+        self.session = None
@@ -412,6 +412,142 @@ class HTTPConnectionPool(ConnectionPool):
         """Get a session from the connection pool (backward compatibility method)"""
         return await self.acquire_connection()
 
+@dataclass
+class HTTPHostStats:
+    """Connection-level statistics for one API host"""
+    sessions_created: int = 0
+    requests: int = 0
+    failed_requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    
+    @property
+    def reuse_rate(self) -> float:
+        """Share of requests served over an already open connection"""
+        total = self.connections_created + self.connections_reused
+        if total == 0:
+            return 0.0
+        return self.connections_reused / total
+
+
+class SharedHTTPSessionPool:
+    """One keep-alive, DNS-cached aiohttp session per API host.
+    
+    Clients lease the session for their host instead of opening their own,
+    so every client of a CRM in a worker process shares the same TCP/TLS
+    connections. aiohttp sessions are bound to an event loop, so sessions
+    are keyed by host and loop. A session nobody leases stays open for the
+    keep-alive timeout so back-to-back syncs reuse it, and is closed when
+    its event loop shuts down.
+    """
+    
+    def __init__(self):
+        self._sessions: Dict[tuple, Dict[str, Any]] = {}
+        self.stats: Dict[str, HTTPHostStats] = defaultdict(HTTPHostStats)
+    
+    @staticmethod
+    def origin(base_url: str) -> str:
+        from urllib.parse import urlparse
+        parsed = urlparse(base_url)
+        return f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else base_url
+    
+    async def acquire(self, base_url: str) -> aiohttp.ClientSession:
+        """Lease the shared session for ``base_url``'s host"""
+        origin = self.origin(base_url)
+        key = (origin, asyncio.get_running_loop())
+        entry = self._sessions.get(key)
+        if entry is None or entry['session'].closed:
+            entry = {'session': self._create_session(origin), 'leases': 0}
+            self._sessions[key] = entry
+            self.stats[origin].sessions_created += 1
+        entry['leases'] += 1
+        return entry['session']
+    
+    async def release(self, session: aiohttp.ClientSession) -> None:
+        """Return a lease; idle sessions linger for reuse before closing"""
+        for key, entry in list(self._sessions.items()):
+            if entry['session'] is session:
+                entry['leases'] -= 1
+                if entry['leases'] <= 0:
+                    asyncio.get_running_loop().create_task(self._close_when_idle(key, entry))
+                return
+    
+    async def _close_when_idle(self, key: tuple, entry: Dict[str, Any]) -> None:
+        try:
+            await asyncio.sleep(getattr(settings, 'HTTP_POOL_KEEPALIVE_TIMEOUT', 60))
+            if entry['leases'] > 0:
+                return
+        except asyncio.CancelledError:
+            # The event loop is shutting down; the session cannot outlive it
+            pass
+        if self._sessions.get(key) is entry:
+            del self._sessions[key]
+        if not entry['session'].closed:
+            await entry['session'].close()
+    
+    async def close_all(self) -> None:
+        """Close every session owned by the running event loop"""
+        loop = asyncio.get_running_loop()
+        for key, entry in list(self._sessions.items()):
+            if key[1] is loop:
+                del self._sessions[key]
+                await entry['session'].close()
+    
+    def _create_session(self, origin: str) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=getattr(settings, 'HTTP_POOL_MAX_CONNECTIONS', 100),
+            limit_per_host=getattr(settings, 'HTTP_POOL_MAX_CONNECTIONS_PER_HOST', 20),
+            keepalive_timeout=getattr(settings, 'HTTP_POOL_KEEPALIVE_TIMEOUT', 60),
+            ttl_dns_cache=getattr(settings, 'HTTP_POOL_DNS_CACHE_TTL', 300),
+            use_dns_cache=True,
+            enable_cleanup_closed=True,
+        )
+        logger.debug(f"Creating shared HTTP session for {origin}")
+        return aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config(origin)])
+    
+    def _trace_config(self, origin: str) -> aiohttp.TraceConfig:
+        stats = self.stats[origin]
+        trace = aiohttp.TraceConfig()
+        
+        def counter(attribute: str):
+            async def increment(session, context, params):
+                setattr(stats, attribute, getattr(stats, attribute) + 1)
+            return increment
+        
+        trace.on_request_end.append(counter('requests'))
+        trace.on_request_exception.append(counter('failed_requests'))
+        trace.on_connection_create_end.append(counter('connections_created'))
+        trace.on_connection_reuseconn.append(counter('connections_reused'))
+        trace.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-host connection statistics for monitoring"""
+        open_sessions = defaultdict(int)
+        for origin, _ in self._sessions:
+            open_sessions[origin] += 1
+        return {
+            origin: {
+                'open_sessions': open_sessions.get(origin, 0),
+                'sessions_created': host.sessions_created,
+                'requests': host.requests,
+                'failed_requests': host.failed_requests,
+                'connections_created': host.connections_created,
+                'connections_reused': host.connections_reused,
+                'connection_reuse_rate': host.reuse_rate,
+                'dns_cache_hits': host.dns_cache_hits,
+                'dns_cache_misses': host.dns_cache_misses,
+            }
+            for origin, host in self.stats.items()
+        }
+
+
+# Process-wide shared HTTP sessions used by BaseAPIClient
+shared_http_sessions = SharedHTTPSessionPool()
+
 class DatabaseConnectionPool(ConnectionPool):
     """Database connection pool implementation"""
     
@@ -572,7 +708,8 @@ class ConnectionManager:
         """Get statistics for all pools and circuit breakers"""
         stats = {
             'pools': {},
-            'circuit_breakers': {}
+            'circuit_breakers': {},
+            'http_hosts': shared_http_sessions.get_stats()
         }
         
         for name, pool in self.pools.items():
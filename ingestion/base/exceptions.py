@@ -93,3 +93,11 @@ class TransformationException(SyncException):
         super().__init__(message, **kwargs)
         self.input_data = input_data
         self.transformation_step = transformation_step
+
+class PartialSaveException(DatabaseException):
+    """Exception raised when a batch save fails after part of the batch was written"""
+    def __init__(self, message, written=None, unwritten=None, error=None, **kwargs):
+        super().__init__(message, **kwargs)
+        self.written = written or {}
+        self.unwritten = unwritten or []
+        self.error = error
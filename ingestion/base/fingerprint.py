@@ -0,0 +1,160 @@
+"""
+Content fingerprints for skipping no-op writes during syncs.
+
+Each record written by a sync gets a short content hash stored in
+``SyncRecordFingerprint``. Before the next write of the same batch shape the
+stored hashes are loaded in one query per batch and records whose content
+has not changed are dropped, so full and ``--force`` syncs only write rows
+that actually differ.
+
+Only the bulk upserter keeps fingerprints current. A row written any other
+way (per-record saves, fallback paths) gets a newer ``sync_updated_at`` than
+its fingerprint, and that fingerprint is no longer trusted.
+"""
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+
+def record_fingerprint(record: Dict[str, Any], fields: Sequence[str]) -> str:
+    """Stable 128-bit hash of the given fields of a record"""
+    payload = json.dumps(
+        [record.get(name) for name in fields],
+        cls=DjangoJSONEncoder,
+        separators=(',', ':'),
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class FingerprintStore:
+    """Bulk lookup and persistence of record fingerprints for one model"""
+
+    def __init__(self, model_class, unique_fields: Sequence[str] = ('id',), using: str = 'default'):
+        self.model_class = model_class
+        self.model_label = model_class._meta.label
+        self.unique_fields = list(unique_fields)
+        self.using = using
+        self.row_updated_field = self._row_updated_field()
+
+    def _row_updated_field(self) -> Optional[str]:
+        """The model's ``auto_now`` column, preferring ``sync_updated_at``"""
+        stamped = [
+            field.name for field in self.model_class._meta.concrete_fields
+            if getattr(field, 'auto_now', False)
+        ]
+        if 'sync_updated_at' in stamped:
+            return 'sync_updated_at'
+        return stamped[0] if stamped else None
+
+    def _record_key(self, record: Dict[str, Any]) -> str:
+        return '|'.join(str(record.get(name)) for name in self.unique_fields)
+
+    def _content_fields(self, record: Dict[str, Any]) -> List[str]:
+        """Model fields carried by the record, minus sync bookkeeping columns"""
+        names = []
+        for field in self.model_class._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                continue
+            if field.name in record:
+                names.append(field.name)
+            elif field.attname in record:
+                names.append(field.attname)
+        return names
+
+    def fingerprint(self, record: Dict[str, Any]) -> str:
+        return record_fingerprint(record, self._content_fields(record))
+
+    def split_unchanged(
+        self, records: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, str]], int]:
+        """Separate records whose content differs from the stored fingerprint.
+
+        Returns:
+            Tuple of (changed records, (key, hash) pairs for them, skipped count)
+        """
+        from ingestion.models.common import SyncRecordFingerprint
+
+        hashed = [(record, self._record_key(record), self.fingerprint(record)) for record in records]
+        if not hashed:
+            return [], [], 0
+
+        stored = {
+            key: (content_hash, updated_at)
+            for key, content_hash, updated_at in SyncRecordFingerprint.objects.using(self.using).filter(
+                model_label=self.model_label,
+                record_key__in=[key for _, key, _ in hashed],
+            ).values_list('record_key', 'content_hash', 'updated_at')
+        }
+        candidates = [record for record, key, digest in hashed if stored.get(key, (None,))[0] == digest]
+
+        # A matching fingerprint only counts if the row still exists, so rows
+        # deleted locally are written again, and was not written since.
+        rows = self._row_updates(candidates) if candidates else {}
+
+        changed, pairs, skipped = [], [], 0
+        for record, key, digest in hashed:
+            if self._is_current(stored.get(key), digest, key, rows):
+                skipped += 1
+            else:
+                changed.append(record)
+                pairs.append((key, digest))
+        return changed, pairs, skipped
+
+    @staticmethod
+    def _is_current(stored: Optional[Tuple[str, datetime]], digest: str, key: str,
+                    rows: Dict[str, Optional[datetime]]) -> bool:
+        """The stored fingerprint matches and is not older than the row it describes"""
+        if stored is None or stored[0] != digest or key not in rows:
+            return False
+        row_updated, fingerprint_updated = rows[key], stored[1]
+        return row_updated is None or fingerprint_updated is None or fingerprint_updated >= row_updated
+
+    def _row_updates(self, records: List[Dict[str, Any]]) -> Dict[str, Optional[datetime]]:
+        """Record key -> last write time of the existing rows (None without an ``auto_now`` column)"""
+        manager = self.model_class.objects.using(self.using)
+        columns = list(self.unique_fields)
+        if self.row_updated_field:
+            columns.append(self.row_updated_field)
+
+        if len(self.unique_fields) == 1:
+            name = self.unique_fields[0]
+            rows = manager.filter(
+                **{f"{name}__in": [record.get(name) for record in records]}
+            ).values_list(*columns)
+        else:
+            condition = models.Q()
+            for record in records:
+                condition |= models.Q(**{name: record.get(name) for name in self.unique_fields})
+            rows = manager.filter(condition).values_list(*columns)
+
+        width = len(self.unique_fields)
+        return {
+            '|'.join(str(value) for value in row[:width]): row[width] if self.row_updated_field else None
+            for row in rows
+        }
+
+    def remember(self, pairs: List[Tuple[str, str]]) -> None:
+        """Persist fingerprints for records that were just written"""
+        from ingestion.base.bulk_upsert import BulkUpserter
+        from ingestion.models.common import SyncRecordFingerprint
+
+        if not pairs:
+            return
+        upserter = BulkUpserter(
+            SyncRecordFingerprint,
+            unique_fields=['model_label', 'record_key'],
+            update_fields=['content_hash', 'updated_at'],
+            using=self.using,
+        )
+        upserter.upsert([
+            {'model_label': self.model_label, 'record_key': key, 'content_hash': digest}
+            for key, digest in pairs
+        ])
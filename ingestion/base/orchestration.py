@@ -0,0 +1,221 @@
+"""
+Dependency-aware runner for the ``*_all`` sync commands.
+
+Orchestrators declare each sub-sync as a ``SyncStep`` with the steps it
+depends on. ``SyncDAG.run`` starts every step whose dependencies succeeded,
+up to ``max_parallel`` at a time, on worker threads. While the process RSS
+is above ``memory_budget_mb`` no new step is started until a running one
+finishes. A failed step skips everything downstream of it; independent
+branches carry on.
+
+Steps run in this process, so concurrent steps of one CRM draw from that
+CRM's shared token bucket (``ingestion.base.rate_limiter``) and never exceed
+its API quota together. Each worker thread closes its own database
+connections when its step ends.
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import psutil
+from django.db import connections
+from django.db.models import Sum
+
+logger = logging.getLogger(__name__)
+
+SUCCESS = 'success'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+# Seconds between memory re-checks while new steps are held back
+MEMORY_POLL_INTERVAL = 5.0
+
+
+@dataclass
+class SyncStep:
+    """One sub-sync of an orchestrator; ``run`` raises on failure"""
+    name: str
+    run: Callable[[], Any]
+    depends_on: Tuple[str, ...] = ()
+    description: str = ''
+
+
+@dataclass
+class StepResult:
+    name: str
+    status: str
+    started_offset: float = 0.0
+    duration_seconds: float = 0.0
+    error: str = ''
+    result: Any = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'status': self.status,
+            'started_offset': round(self.started_offset, 3),
+            'duration_seconds': round(self.duration_seconds, 3),
+            'error': self.error,
+        }
+
+
+@dataclass
+class DAGRun:
+    """Outcome of one ``SyncDAG.run``, in step declaration order"""
+    results: Dict[str, StepResult]
+    duration_seconds: float
+    max_parallel: int
+    peak_parallel: int = 0
+    memory_waits: int = 0
+
+    def by_status(self, status: str) -> List[StepResult]:
+        return [result for result in self.results.values() if result.status == status]
+
+    @property
+    def succeeded(self) -> bool:
+        return all(result.status == SUCCESS for result in self.results.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate metrics for the orchestrator's SyncHistory row"""
+        serial_seconds = sum(result.duration_seconds for result in self.results.values())
+        total = len(self.results)
+        successful = len(self.by_status(SUCCESS))
+        return {
+            'duration_seconds': self.duration_seconds,
+            'serial_seconds': serial_seconds,
+            'parallel_speedup': serial_seconds / self.duration_seconds if self.duration_seconds > 0 else 0,
+            'max_parallel': self.max_parallel,
+            'peak_parallel': self.peak_parallel,
+            'memory_waits': self.memory_waits,
+            'total_steps': total,
+            'successful_steps': successful,
+            'failed_steps': len(self.by_status(FAILED)),
+            'skipped_steps': len(self.by_status(SKIPPED)),
+            'success_rate': successful / total * 100 if total else 0,
+            'steps': {name: result.as_dict() for name, result in self.results.items()},
+        }
+
+
+def child_history_totals(crm_source: str, since, exclude_id: Optional[int] = None) -> Dict[str, int]:
+    """Record counts summed over the SyncHistory rows the steps wrote since ``since``"""
+    from ingestion.models.common import SyncHistory
+
+    rows = SyncHistory.objects.filter(crm_source=crm_source, start_time__gte=since)
+    if exclude_id is not None:
+        rows = rows.exclude(id=exclude_id)
+    totals = rows.aggregate(
+        records_processed=Sum('records_processed'),
+        records_created=Sum('records_created'),
+        records_updated=Sum('records_updated'),
+        records_failed=Sum('records_failed'),
+    )
+    return {key: value or 0 for key, value in totals.items()}
+
+
+def process_rss_mb() -> float:
+    return psutil.Process().memory_info().rss / 1024 / 1024
+
+
+class SyncDAG:
+    """Runs ``SyncStep``s concurrently in dependency order"""
+
+    def __init__(self, steps: Sequence[SyncStep], max_parallel: int = 1,
+                 memory_budget_mb: Optional[float] = None,
+                 on_start: Optional[Callable[[SyncStep], None]] = None,
+                 on_finish: Optional[Callable[[StepResult], None]] = None,
+                 rss_mb: Callable[[], float] = process_rss_mb):
+        self.steps = {step.name: step for step in steps}
+        if len(self.steps) != len(steps):
+            raise ValueError("Duplicate step names in sync DAG")
+        self.max_parallel = max(1, max_parallel)
+        self.memory_budget_mb = memory_budget_mb or None
+        self.on_start = on_start
+        self.on_finish = on_finish
+        self.rss_mb = rss_mb
+        self.levels()
+
+    def levels(self) -> List[List[str]]:
+        """Steps grouped by dependency depth; raises ValueError on unknown deps or cycles"""
+        for step in self.steps.values():
+            unknown = [name for name in step.depends_on if name not in self.steps]
+            if unknown:
+                raise ValueError(f"Step '{step.name}' depends on unknown step(s): {', '.join(unknown)}")
+
+        levels, placed = [], set()
+        while len(placed) < len(self.steps):
+            level = [name for name, step in self.steps.items()
+                     if name not in placed and all(dep in placed for dep in step.depends_on)]
+            if not level:
+                cycle = sorted(set(self.steps) - placed)
+                raise ValueError(f"Dependency cycle among steps: {', '.join(cycle)}")
+            levels.append(level)
+            placed.update(level)
+        return levels
+
+    def _over_budget(self) -> bool:
+        return self.memory_budget_mb is not None and self.rss_mb() > self.memory_budget_mb
+
+    def _execute(self, step: SyncStep, started: float) -> StepResult:
+        offset = time.perf_counter() - started
+        try:
+            value = step.run()
+            status, error = SUCCESS, ''
+        except Exception as e:
+            logger.error(f"Sync step {step.name} failed: {e}", exc_info=True)
+            value, status, error = None, FAILED, str(e)
+        finally:
+            connections.close_all()
+        return StepResult(step.name, status, offset, time.perf_counter() - started - offset, error, value)
+
+    def _finish(self, run: DAGRun, result: StepResult) -> None:
+        run.results[result.name] = result
+        if self.on_finish:
+            self.on_finish(result)
+
+    def run(self) -> DAGRun:
+        started = time.perf_counter()
+        run = DAGRun(results={}, duration_seconds=0.0, max_parallel=self.max_parallel)
+        waiting = list(self.steps)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix='sync-dag') as pool:
+            while waiting or running:
+                for name in list(waiting):
+                    statuses = [run.results[dep].status for dep in self.steps[name].depends_on
+                                if dep in run.results]
+                    if any(status != SUCCESS for status in statuses):
+                        waiting.remove(name)
+                        blocked = [dep for dep in self.steps[name].depends_on
+                                   if run.results.get(dep) and run.results[dep].status != SUCCESS]
+                        self._finish(run, StepResult(name, SKIPPED, error=f"dependency failed: {', '.join(blocked)}"))
+
+                ready = [name for name in waiting
+                         if all(dep in run.results for dep in self.steps[name].depends_on)]
+                held_back = False
+                for name in ready:
+                    if len(running) >= self.max_parallel:
+                        break
+                    # Always let one step run so an over-budget baseline cannot stall the DAG
+                    if running and self._over_budget():
+                        run.memory_waits += 1
+                        held_back = True
+                        break
+                    step = self.steps[name]
+                    waiting.remove(name)
+                    if self.on_start:
+                        self.on_start(step)
+                    running[pool.submit(self._execute, step, started)] = name
+                run.peak_parallel = max(run.peak_parallel, len(running))
+
+                if not running:
+                    continue
+                done, _ = wait(running, timeout=MEMORY_POLL_INTERVAL if held_back else None,
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+                    self._finish(run, future.result())
+
+        run.results = {name: run.results[name] for name in self.steps}
+        run.duration_seconds = time.perf_counter() - started
+        return run
@@ -7,6 +7,7 @@ import logging
 from django.db import transaction
 from asgiref.sync import sync_to_async
 from ingestion.base.exceptions import ValidationException
+from ingestion.base.recovery import abisect_batch, aquarantine_records
 
 logger = logging.getLogger(__name__)
 
@@ -62,73 +63,85 @@ class BaseDataProcessor(ABC):
         return results
     
     async def save_records(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Save records to database with bulk operations"""
+        """Save records to database with bulk operations.
+        
+        A batch whose bulk write fails is bisected (see ingestion.base.recovery)
+        so only the offending records are quarantined instead of the whole batch.
+        """
         results = {'created': 0, 'updated': 0, 'failed': 0}
         
         try:
-            # Use sync_to_async for database operations
-            return await self._save_records_sync(records)
-                
+            return await sync_to_async(self._write_records)(records)
         except Exception as e:
-            logger.warning(f"Bulk save failed: {e}. Falling back to individual saves.")
-            # Fallback to individual saves
-            individual_results = await self.save_individual_records(records)
-            results.update(individual_results)
+            logger.warning(f"Bulk save failed: {e}. Bisecting the batch to isolate bad records.")
+            outcome = await abisect_batch(records, sync_to_async(self._write_records), error=e)
+            for key in results:
+                results[key] += outcome.results.get(key, 0)
+            results['failed'] += len(outcome.failures)
+            if outcome.failures:
+                await aquarantine_records(
+                    outcome.failures,
+                    getattr(self, 'crm_source', self.model_class._meta.app_label),
+                    self.model_class._meta.model_name,
+                )
         
         return results
     
     @sync_to_async
     def _save_records_sync(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
         """Synchronous save operation wrapped for async"""
+        try:
+            return self._write_records(records)
+        except Exception as e:
+            logger.error(f"Database operation failed: {e}")
+            return {'created': 0, 'updated': 0, 'failed': len(records)}
+    
+    def _write_records(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Bulk create/update ``records`` in one transaction; raises if the transaction fails"""
         results = {'created': 0, 'updated': 0, 'failed': 0}
         
-        try:
-            with transaction.atomic():
-                # Get existing records
-                existing_ids = set()
-                if records and 'id' in records[0]:
-                    existing_ids = set(
-                        self.model_class.objects.filter(
-                            id__in=[r.get('id') for r in records if r.get('id')]
-                        ).values_list('id', flat=True)
+        with transaction.atomic():
+            # Get existing records
+            existing_ids = set()
+            if records and 'id' in records[0]:
+                existing_ids = set(
+                    self.model_class.objects.filter(
+                        id__in=[r.get('id') for r in records if r.get('id')]
+                    ).values_list('id', flat=True)
+                )
+            
+            to_create = []
+            to_update = []
+            
+            for record in records:
+                record_id = record.get('id')
+                if record_id in existing_ids:
+                    to_update.append(record)
+                else:
+                    to_create.append(record)
+            
+            # Bulk create
+            if to_create:
+                objects = [self.model_class(**record) for record in to_create]
+                created_objects = self.model_class.objects.bulk_create(
+                    objects, batch_size=self.batch_size, ignore_conflicts=True
+                )
+                results['created'] = len(created_objects)
+            
+            # Bulk update using get_or_create for simplicity
+            for record in to_update:
+                try:
+                    obj, created = self.model_class.objects.update_or_create(
+                        id=record['id'],
+                        defaults=record
                     )
-                
-                to_create = []
-                to_update = []
-                
-                for record in records:
-                    record_id = record.get('id')
-                    if record_id in existing_ids:
-                        to_update.append(record)
+                    if created:
+                        results['created'] += 1
                     else:
-                        to_create.append(record)
-                
-                # Bulk create
-                if to_create:
-                    objects = [self.model_class(**record) for record in to_create]
-                    created_objects = self.model_class.objects.bulk_create(
-                        objects, batch_size=self.batch_size, ignore_conflicts=True
-                    )
-                    results['created'] = len(created_objects)
-                
-                # Bulk update using get_or_create for simplicity
-                for record in to_update:
-                    try:
-                        obj, created = self.model_class.objects.update_or_create(
-                            id=record['id'],
-                            defaults=record
-                        )
-                        if created:
-                            results['created'] += 1
-                        else:
-                            results['updated'] += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to update record {record.get('id')}: {e}")
-                        results['failed'] += 1
-                        
-        except Exception as e:
-            logger.error(f"Database operation failed: {e}")
-            results['failed'] = len(records)
+                        results['updated'] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to update record {record.get('id')}: {e}")
+                    results['failed'] += 1
         
         return results
     
@@ -0,0 +1,306 @@
+"""
+Token-bucket rate limiting for CRM API clients.
+
+Each CRM gets one bucket per process (``get_rate_limiter``). Requests reserve
+a token before they are sent and sleep until the reservation is due, so
+pacing happens before the API starts answering 429. Quota headers on every
+response (HubSpot interval limits, ``X-RateLimit-*``, ``Retry-After``) retune
+the bucket's rate and clamp its tokens to what the server says is left.
+
+With ``API_RATE_LIMIT_BACKEND = 'redis'`` the bucket state lives in Redis and
+is updated by Lua scripts, so concurrent Celery workers syncing the same CRM
+draw from one shared budget. Redis errors fall back to the local bucket.
+"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Reset headers above this are epoch timestamps rather than seconds from now
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Redis calls run inline on the event loop: bound how long one can block it,
+# and after a failure pace locally for a while before trying Redis again
+REDIS_SOCKET_TIMEOUT = 0.25
+REDIS_RETRY_AFTER = 30.0
+
+
+@dataclass
+class QuotaInfo:
+    """Quota state reported by one API response"""
+    remaining: Optional[float] = None
+    limit: Optional[float] = None
+    window_seconds: Optional[float] = None
+    reset_after: Optional[float] = None
+
+
+def _number(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value in (None, ''):
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def parse_quota_headers(headers: Mapping[str, str], now: Optional[float] = None) -> Optional[QuotaInfo]:
+    """Read the remaining-quota headers used by the CRMs we sync.
+
+    HubSpot reports ``X-HubSpot-RateLimit-Max/Remaining`` per
+    ``X-HubSpot-RateLimit-Interval-Milliseconds`` window (and a per-second
+    ``Secondly`` pair); SalesRabbit and LeadConduit use ``X-RateLimit-*``.
+    """
+    now = time.time() if now is None else now
+    info = QuotaInfo()
+
+    secondly_remaining = _number(headers, 'X-HubSpot-RateLimit-Secondly-Remaining')
+    secondly_limit = _number(headers, 'X-HubSpot-RateLimit-Secondly')
+    interval_ms = _number(headers, 'X-HubSpot-RateLimit-Interval-Milliseconds')
+
+    if secondly_limit is not None:
+        info.limit, info.remaining, info.window_seconds = secondly_limit, secondly_remaining, 1.0
+    else:
+        info.limit = _number(headers, 'X-HubSpot-RateLimit-Max', 'X-RateLimit-Limit')
+        info.remaining = _number(headers, 'X-HubSpot-RateLimit-Remaining', 'X-RateLimit-Remaining')
+        if interval_ms:
+            info.window_seconds = interval_ms / 1000.0
+
+    reset = _number(headers, 'X-RateLimit-Reset')
+    if reset is not None:
+        info.reset_after = max(0.0, reset - now) if reset > _EPOCH_THRESHOLD else reset
+        if info.window_seconds is None and info.reset_after:
+            info.window_seconds = info.reset_after
+
+    retry_after = _number(headers, 'Retry-After')
+    if retry_after is not None:
+        info.reset_after = max(info.reset_after or 0.0, retry_after)
+
+    if info.remaining is None and info.limit is None and info.reset_after is None:
+        return None
+    return info
+
+
+class TokenBucket:
+    """In-process token bucket using reservations.
+
+    ``_reserve`` takes a token immediately, letting the balance go negative,
+    and returns how long the caller must wait for it. Nothing awaits while
+    the state is updated, so one bucket can be shared by every event loop
+    and thread in the process.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: Optional[float] = None):
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self, cost: float = 1.0) -> float:
+        """Wait until a request may be sent; returns the seconds waited"""
+        wait = self._reserve(cost)
+        if wait > 0:
+            logger.debug(f"Rate limiter {self.name}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> Optional[QuotaInfo]:
+        """Retune the bucket from a response's quota headers"""
+        info = parse_quota_headers(headers)
+        if info is None:
+            return None
+
+        rate = capacity = None
+        if info.limit and info.window_seconds:
+            rate = info.limit / info.window_seconds
+            capacity = max(1.0, min(info.limit, rate))
+
+        block = 0.0
+        if info.remaining is not None and info.remaining <= 0:
+            block = info.reset_after or info.window_seconds or 1.0
+
+        self._apply(rate=rate, capacity=capacity, remaining=info.remaining, block_seconds=block)
+        return info
+
+    def penalize(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (after a 429)"""
+        self._apply(block_seconds=seconds)
+
+    def _reserve(self, cost: float) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if now > self.updated:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+            self.tokens -= cost
+            return max(0.0, self.updated - now) + max(0.0, -self.tokens) / self.rate
+
+    def _apply(self, rate: Optional[float] = None, capacity: Optional[float] = None,
+               remaining: Optional[float] = None, block_seconds: float = 0.0) -> None:
+        with self._lock:
+            if rate:
+                self.rate = rate
+            if capacity:
+                self.capacity = capacity
+                self.tokens = min(self.tokens, capacity)
+            if remaining is not None:
+                self.tokens = min(self.tokens, remaining)
+            if block_seconds > 0:
+                self.updated = max(self.updated, time.monotonic() + block_seconds)
+                self.tokens = min(self.tokens, 0.0)
+
+
+_RESERVE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'rate', 'capacity')
+local rate = tonumber(state[3]) or tonumber(ARGV[2])
+local capacity = tonumber(state[4]) or tonumber(ARGV[3])
+local tokens = tonumber(state[1]) or capacity
+local updated = tonumber(state[2]) or now
+if now > updated then
+    tokens = math.min(capacity, tokens + (now - updated) * rate)
+    updated = now
+end
+tokens = tokens - tonumber(ARGV[4])
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', updated, 'rate', rate, 'capacity', capacity)
+redis.call('EXPIRE', KEYS[1], 3600)
+return tostring((updated - now) + math.max(0, -tokens) / rate)
+"""
+
+_APPLY_SCRIPT = """
+local now = tonumber(ARGV[1])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated', 'rate', 'capacity')
+local rate = tonumber(ARGV[2]) or tonumber(state[3]) or tonumber(ARGV[6])
+local capacity = tonumber(ARGV[3]) or tonumber(state[4]) or tonumber(ARGV[7])
+local tokens = math.min(tonumber(state[1]) or capacity, capacity)
+local updated = tonumber(state[2]) or now
+local remaining = tonumber(ARGV[4])
+if remaining then tokens = math.min(tokens, remaining) end
+local block = tonumber(ARGV[5])
+if block > 0 then
+    updated = math.max(updated, now + block)
+    tokens = math.min(tokens, 0)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated', updated, 'rate', rate, 'capacity', capacity)
+redis.call('EXPIRE', KEYS[1], 3600)
+return 1
+"""
+
+
+class RedisTokenBucket(TokenBucket):
+    """Token bucket whose state is shared by every worker through Redis.
+
+    The scripts are called synchronously from ``acquire`` and
+    ``update_from_headers``, i.e. on the event loop. One EVALSHA against a
+    nearby Redis is well under a millisecond; a slow or unreachable server is
+    cut off after ``REDIS_SOCKET_TIMEOUT``, and the bucket then skips Redis
+    for ``REDIS_RETRY_AFTER`` seconds, so an outage costs at most one short
+    stall per interval instead of one per request.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: Optional[float] = None, redis_client=None):
+        super().__init__(name, rate, capacity)
+        self.key = f"ingestion:ratelimit:{name}"
+        self.redis = redis_client or self._connect()
+        self._reserve_script = self.redis.register_script(_RESERVE_SCRIPT)
+        self._apply_script = self.redis.register_script(_APPLY_SCRIPT)
+        self._redis_failed = False
+        self._redis_retry_at = 0.0
+
+    @staticmethod
+    def _connect():
+        import redis
+        url = getattr(settings, 'API_RATE_LIMIT_REDIS_URL', None) or getattr(settings, 'CELERY_BROKER_URL', None)
+        return redis.from_url(
+            url or 'redis://localhost:6379/0',
+            decode_responses=True,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+
+    def _use_redis(self) -> bool:
+        return time.monotonic() >= self._redis_retry_at
+
+    def _reserve(self, cost: float) -> float:
+        if not self._use_redis():
+            return super()._reserve(cost)
+        try:
+            wait = self._reserve_script(keys=[self.key], args=[time.time(), self.rate, self.capacity, cost])
+            self._redis_ok()
+            return max(0.0, float(wait))
+        except Exception as e:
+            self._redis_error(e)
+            return super()._reserve(cost)
+
+    def _apply(self, rate: Optional[float] = None, capacity: Optional[float] = None,
+               remaining: Optional[float] = None, block_seconds: float = 0.0) -> None:
+        super()._apply(rate, capacity, remaining, block_seconds)
+        if not self._use_redis():
+            return
+        try:
+            self._apply_script(keys=[self.key], args=[
+                time.time(),
+                rate if rate else '',
+                capacity if capacity else '',
+                remaining if remaining is not None else '',
+                block_seconds,
+                self.rate,
+                self.capacity,
+            ])
+            self._redis_ok()
+        except Exception as e:
+            self._redis_error(e)
+    
+    def _redis_ok(self) -> None:
+        if self._redis_failed:
+            logger.info(f"Rate limiter {self.name}: Redis reachable again, sharing the budget")
+            self._redis_failed = False
+    
+    def _redis_error(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_AFTER
+        if not self._redis_failed:
+            logger.warning(
+                f"Rate limiter {self.name}: Redis unavailable, pacing this process locally "
+                f"for {REDIS_RETRY_AFTER:.0f}s ({error})"
+            )
+            self._redis_failed = True
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """Return the process-wide bucket for one CRM, creating it on first use.
+
+    ``rate`` (requests per second) and ``capacity`` are only the starting
+    point; response headers retune them. ``API_RATE_LIMITS`` in settings can
+    override the starting rate per CRM name.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is not None:
+            return limiter
+
+        rate = getattr(settings, 'API_RATE_LIMITS', {}).get(name, rate)
+        backend = getattr(settings, 'API_RATE_LIMIT_BACKEND', 'local')
+        limiter = None
+        if backend == 'redis':
+            try:
+                limiter = RedisTokenBucket(name, rate, capacity)
+            except Exception as e:
+                logger.warning(f"Rate limiter {name}: Redis backend unavailable, using local bucket ({e})")
+        if limiter is None:
+            limiter = TokenBucket(name, rate, capacity)
+        _limiters[name] = limiter
+        return limiter
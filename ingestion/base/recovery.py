@@ -0,0 +1,155 @@
+"""
+Bisecting recovery for batches that fail to save in bulk.
+
+Instead of retrying a failed batch one record at a time, the batch is split
+in halves and each half is retried with the same bulk operation. Halves that
+succeed are written in one round trip; halves that fail are split again
+until the offending records are isolated, so ``k`` bad rows in a batch of
+``n`` cost ``O(k log n)`` bulk attempts instead of ``n`` single-row writes.
+
+Isolated records are stored in ``SyncQuarantinedRecord`` together with the
+error that rejected them so they can be inspected and replayed later.
+"""
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BisectOutcome:
+    """Merged result of all successful bulk attempts plus the isolated failures"""
+    results: Dict[str, Any] = field(default_factory=dict)
+    failures: List[Tuple[Any, Exception]] = field(default_factory=list)
+    attempts: int = 0
+
+    def add(self, counts: Optional[Dict[str, Any]]) -> None:
+        """Fold the counts returned by one attempt into ``results``"""
+        for key, value in (counts or {}).items():
+            if isinstance(value, list):
+                self.results.setdefault(key, []).extend(value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                self.results[key] = self.results.get(key, 0) + value
+
+    @property
+    def failed_records(self) -> List[Any]:
+        return [record for record, _ in self.failures]
+
+
+def _split(chunk: List[Any]) -> Tuple[List[Any], List[Any]]:
+    mid = len(chunk) // 2
+    return chunk[:mid], chunk[mid:]
+
+
+def bisect_batch(records: Sequence[Any], attempt: Callable[[List[Any]], Optional[Dict[str, Any]]],
+                 error: Optional[Exception] = None) -> BisectOutcome:
+    """Retry ``attempt`` on halves of ``records`` until every failing record is isolated.
+
+    ``error`` is the exception the whole batch already failed with; when given
+    the batch is split straight away instead of being attempted once more.
+    ``attempt`` must leave nothing behind when it raises (run it in
+    ``transaction.atomic()``), otherwise rows of a failed half are written twice.
+    """
+    outcome = BisectOutcome()
+    pending = [(list(records), error)]
+    while pending:
+        chunk, chunk_error = pending.pop()
+        if not chunk:
+            continue
+        if chunk_error is None:
+            outcome.attempts += 1
+            try:
+                outcome.add(attempt(chunk))
+                continue
+            except Exception as e:
+                chunk_error = e
+        if len(chunk) == 1:
+            outcome.failures.append((chunk[0], chunk_error))
+            continue
+        left, right = _split(chunk)
+        # Stack: push the right half first so records are retried in order
+        pending.append((right, None))
+        pending.append((left, None))
+    return outcome
+
+
+async def abisect_batch(records: Sequence[Any], attempt: Callable[[List[Any]], Awaitable[Optional[Dict[str, Any]]]],
+                        error: Optional[Exception] = None) -> BisectOutcome:
+    """Async variant of :func:`bisect_batch` for coroutine attempts"""
+    outcome = BisectOutcome()
+    pending = [(list(records), error)]
+    while pending:
+        chunk, chunk_error = pending.pop()
+        if not chunk:
+            continue
+        if chunk_error is None:
+            outcome.attempts += 1
+            try:
+                outcome.add(await attempt(chunk))
+                continue
+            except Exception as e:
+                chunk_error = e
+        if len(chunk) == 1:
+            outcome.failures.append((chunk[0], chunk_error))
+            continue
+        left, right = _split(chunk)
+        pending.append((right, None))
+        pending.append((left, None))
+    return outcome
+
+
+class _PayloadEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder that also takes read-only Mappings (``Row``) and stringifies the rest"""
+
+    def default(self, o):
+        if isinstance(o, Mapping):
+            return dict(o)
+        try:
+            return super().default(o)
+        except TypeError:
+            return str(o)
+
+
+def _payload(record: Any) -> Any:
+    """JSON-safe copy of a record (datetimes, decimals and model-ish values become strings)"""
+    return json.loads(json.dumps(record, cls=_PayloadEncoder))
+
+
+def quarantine_records(failures: Sequence[Tuple[Any, Exception]], crm_source: str, sync_type: str,
+                       sync_history=None, key_field: str = 'id') -> int:
+    """Store isolated failures in ``SyncQuarantinedRecord``; returns the number stored.
+
+    Quarantining is best effort: a failure here is logged and never fails the sync.
+    """
+    if not failures:
+        return 0
+    from ingestion.models.common import SyncQuarantinedRecord
+
+    rows = []
+    for record, error in failures:
+        key = record.get(key_field) if isinstance(record, Mapping) else None
+        rows.append(SyncQuarantinedRecord(
+            crm_source=crm_source,
+            sync_type=sync_type,
+            sync_history=sync_history,
+            record_key='' if key is None else str(key)[:255],
+            payload=_payload(record),
+            error_type=type(error).__name__[:100],
+            error_message=str(error),
+        ))
+    try:
+        SyncQuarantinedRecord.objects.bulk_create(rows, batch_size=500)
+    except Exception as e:
+        logger.error(f"Failed to quarantine {len(rows)} {crm_source}.{sync_type} records: {e}")
+        return 0
+    logger.warning(f"Quarantined {len(rows)} {crm_source}.{sync_type} records that could not be saved")
+    return len(rows)
+
+
+aquarantine_records = sync_to_async(quarantine_records)
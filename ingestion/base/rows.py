@@ -0,0 +1,102 @@
+"""
+Compact, read-only rows for the streaming sync paths.
+
+A page of source rows zipped into dicts costs a hash table per row, with the
+keys repeated in every one, so RSS on large pages is driven by that overhead
+rather than by the data. A ``Row`` keeps the values as a tuple and shares a
+single ``RowSchema`` (column name -> position) with every other row of the
+page. ``Row`` is a ``Mapping``: ``get``, ``in``, ``row[name]``, ``dict(row)``
+and ``Model(**row)`` work as they do for dicts, so rows can flow from
+clients through transforms into ``BulkUpserter`` unchanged. Code that needs
+to modify a record should build its own dict.
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+
+class RowSchema:
+    """Column names shared by the rows of one result set"""
+
+    __slots__ = ('names', 'positions')
+
+    def __init__(self, names: Sequence[str]):
+        self.names = tuple(names)
+        self.positions = {name: position for position, name in enumerate(self.names)}
+        if len(self.positions) != len(self.names):
+            raise ValueError(f"Duplicate column names in row schema: {self.names}")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RowSchema) and self.names == other.names
+
+    def __hash__(self) -> int:
+        return hash(self.names)
+
+    def __repr__(self) -> str:
+        return f"RowSchema({list(self.names)})"
+
+    def __reduce__(self):
+        return RowSchema, (self.names,)
+
+    def row(self, values: Sequence[Any]) -> 'Row':
+        """One row; ``values`` must be in column order"""
+        return Row(self, tuple(values))
+
+    def rows(self, value_rows: Iterable[Sequence[Any]]) -> List['Row']:
+        """A page of rows, copying list rows (e.g. Athena results) into tuples"""
+        return [Row(self, values if type(values) is tuple else tuple(values)) for values in value_rows]
+
+
+class Row(Mapping):
+    """Tuple-backed, read-only record keyed by its schema's column names"""
+
+    __slots__ = ('schema', 'values')
+
+    def __init__(self, schema: RowSchema, values: tuple):
+        if len(values) != len(schema.names):
+            raise ValueError(f"Row has {len(values)} values, schema has {len(schema.names)} columns")
+        self.schema = schema
+        self.values = values
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[self.schema.positions[name]]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        position = self.schema.positions.get(name)
+        return default if position is None else self.values[position]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.schema.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.schema.names)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def keys(self):
+        return self.schema.names
+
+    def items(self):
+        return list(zip(self.schema.names, self.values))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Row):
+            return self.schema == other.schema and self.values == other.values
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Row({dict(self.items())})"
+
+    def __reduce__(self):
+        return Row, (self.schema, self.values)
+
+
+def rows_from_columns(columns: Dict[str, List[Any]]) -> List[Row]:
+    """Zip ``{field: column values}`` into rows sharing one schema"""
+    schema = RowSchema(columns)
+    return [Row(schema, values) for values in zip(*columns.values())]
@@ -0,0 +1,177 @@
+"""
+Per-stage timing for sync runs.
+
+A ``StageTimer`` collects wall-clock samples for each pipeline stage of a run
+(waiting on the source, transform, validate, database save, checkpoint) plus
+bytes fetched and rows per batch. ``summary()`` reduces them to totals and
+percentiles that are stored in ``SyncHistory.performance_metrics`` so slow
+syncs can be attributed to the API, the transform code or the database.
+"""
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+# Stage names in pipeline order; the dashboard reports them in this order
+FETCH_WAIT = 'fetch_wait'
+TRANSFORM = 'transform'
+VALIDATE = 'validate'
+SAVE = 'save'
+# Transform and save together, for processors that interleave the two per batch
+PROCESS = 'process'
+CHECKPOINT = 'checkpoint'
+# Re-running a failed batch by bisection (transform, validate and save again)
+RECOVERY = 'recovery'
+STAGES = (FETCH_WAIT, TRANSFORM, VALIDATE, SAVE, PROCESS, CHECKPOINT, RECOVERY)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def distribution(values: List[float], unit: str) -> Dict[str, float]:
+    """Count, total, mean, p50/p95/p99 and max of ``values`` with ``unit``-suffixed keys"""
+    ordered = sorted(values)
+    total = sum(ordered)
+    return {
+        'count': len(ordered),
+        f'total_{unit}': total,
+        f'mean_{unit}': total / len(ordered) if ordered else 0.0,
+        f'p50_{unit}': percentile(ordered, 50),
+        f'p95_{unit}': percentile(ordered, 95),
+        f'p99_{unit}': percentile(ordered, 99),
+        f'max_{unit}': ordered[-1] if ordered else 0.0,
+    }
+
+
+class StageTimer:
+    """Wall-clock samples per stage, bytes fetched and rows per batch for one sync run"""
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = {}
+        self.batch_rows: List[int] = []
+        self.bytes_fetched = 0
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str):
+        """Time the enclosed block (including any awaits inside it) as one ``stage`` sample"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def count_batch(self, rows: int, nbytes: int = 0) -> None:
+        """Record the size of one fetched batch"""
+        self.batch_rows.append(rows)
+        self.bytes_fetched += nbytes
+
+    def timed_iter(self, iterable: Iterable[Any], stage: str = FETCH_WAIT) -> Iterator[Any]:
+        """Yield from ``iterable``, timing each ``next()`` as ``stage`` and counting batch rows"""
+        iterator = iter(iterable)
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.add(stage, time.perf_counter() - started)
+            self._count_item(item)
+            yield item
+
+    async def atimed_iter(self, iterable: AsyncIterable[Any], stage: str = FETCH_WAIT) -> AsyncIterator[Any]:
+        """Async counterpart of ``timed_iter`` for ``fetch_data`` generators"""
+        iterator = iterable.__aiter__()
+        while True:
+            started = time.perf_counter()
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            self.add(stage, time.perf_counter() - started)
+            self._count_item(item)
+            yield item
+
+    def _count_item(self, item: Any) -> None:
+        try:
+            self.count_batch(len(item))
+        except TypeError:
+            pass
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals and percentiles for ``performance_metrics``"""
+        ordered = [stage for stage in STAGES if stage in self.samples]
+        ordered += sorted(stage for stage in self.samples if stage not in STAGES)
+        return {
+            'stages': {stage: distribution(self.samples[stage], 'seconds') for stage in ordered},
+            'batches': distribution(self.batch_rows, 'rows'),
+            'bytes_fetched': self.bytes_fetched,
+        }
+
+
+def measure_stage(timer: Optional[StageTimer], stage: str):
+    """``timer.measure(stage)``, or a no-op when the caller was not given a timer"""
+    return timer.measure(stage) if timer is not None else nullcontext()
+
+
+class StageTimingMixin:
+    """Gives an engine a ``stage_timer`` and folds its summary into performance metrics"""
+
+    def reset_stage_timer(self) -> StageTimer:
+        self._stage_timer = StageTimer()
+        return self._stage_timer
+
+    @property
+    def stage_timer(self) -> StageTimer:
+        timer = getattr(self, '_stage_timer', None)
+        return timer if timer is not None else self.reset_stage_timer()
+
+    def with_stage_metrics(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """``metrics`` plus the current run's stage timings and the client's read counters, if any"""
+        client = getattr(self, 'client', None)
+        read_metrics = getattr(client, 'read_metrics', None)
+        if callable(read_metrics):
+            metrics = {**metrics, 'source_reads': read_metrics()}
+        timer = getattr(self, '_stage_timer', None)
+        if timer is None:
+            return metrics
+        client_bytes = getattr(client, 'bytes_fetched', 0)
+        if isinstance(client_bytes, int) and client_bytes > timer.bytes_fetched:
+            timer.bytes_fetched = client_bytes
+        if not timer.samples and not timer.batch_rows and not timer.bytes_fetched:
+            return metrics
+        return {**metrics, **timer.summary()}
+
+
+def stage_breakdown(performance_metrics: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Aggregate stage totals across runs with each stage's share of time and throughput.
+
+    ``records_per_second`` is rows fetched divided by the seconds spent in that
+    stage: the rate the sync could reach if that stage were the only cost. The
+    stage with the lowest rate is the bottleneck.
+    """
+    seconds: Dict[str, float] = {}
+    rows = 0
+    for metrics in performance_metrics:
+        if not isinstance(metrics, dict) or not metrics.get('stages'):
+            continue
+        rows += (metrics.get('batches') or {}).get('total_rows', 0)
+        for stage, stats in metrics['stages'].items():
+            seconds[stage] = seconds.get(stage, 0.0) + stats.get('total_seconds', 0.0)
+
+    timed = sum(seconds.values())
+    return {
+        stage: {
+            'total_seconds': total,
+            'share': total / timed if timed else 0.0,
+            'records_per_second': rows / total if total else 0.0,
+        }
+        for stage, total in seconds.items()
+    }
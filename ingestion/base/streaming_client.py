@@ -6,11 +6,17 @@ and provides streaming data processing with automatic garbage collection.
 """
 import gc
 import logging
+import time
 import psutil
-from typing import Iterator, List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime
 from django.conf import settings
-from django.db import connection, transaction
+from django.db import connection
+
+from ingestion.base.adaptive_batching import AIMDController, adaptive_batching_enabled, build_controller
+from ingestion.base.bulk_upsert import BulkUpserter
+from ingestion.base.rows import Row, RowSchema
+from ingestion.base.transform_pool import get_transform_executor, iter_transforms
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +36,10 @@ class MemoryGuard:
         except Exception:
             return 0.0
     
+    def memory_mb(self) -> float:
+        """Current RSS memory usage in MB (0 when it cannot be read)"""
+        return self._get_memory_mb()
+    
     def check_memory(self, operation: str = "operation") -> bool:
         """Check if memory usage is within limits"""
         current_memory = self._get_memory_mb()
@@ -58,6 +68,7 @@ class StreamingClient:
         self.page_size = getattr(settings, 'INGEST_PAGE_SIZE', 5000)
         self.bulk_batch_size = getattr(settings, 'DB_BULK_BATCH_SIZE', 1000)
         self.memory_guard = MemoryGuard()
+        self.page_controller: Optional[AIMDController] = None
         
         # Safety checks
         if self.page_size > 5000:
@@ -69,6 +80,14 @@ class StreamingClient:
             f"bulk_batch_size={self.bulk_batch_size}"
         )
     
+    def start_adaptive_paging(self, learned: Optional[int] = None) -> None:
+        """Resize pages between queries (see ingestion.base.adaptive_batching), up to the 5000 cap"""
+        if adaptive_batching_enabled():
+            self.page_controller = build_controller(
+                self.page_size, learned, maximum=5000, memory_guard=self.memory_guard
+            )
+            self.page_size = self.page_controller.size
+    
     def stream_records(
         self, 
         select_fields: List[str],
@@ -98,7 +117,11 @@ class StreamingClient:
             logger.info(f"Page {page_num}: Fetching records WHERE id > {last_id}")
             
             # Execute query with streaming cursor
+            page_size = self.page_size
+            started = time.perf_counter()
             records = self._execute_streaming_query(query)
+            if self.page_controller:
+                self.page_size = self.page_controller.observe(len(records), time.perf_counter() - started)
             
             if not records:
                 logger.info("No more records found, stream complete")
@@ -138,8 +161,8 @@ class StreamingClient:
             gc.collect()
             self.memory_guard.log_memory_usage(f"After page {page_num}")
             
-            # Break if we got fewer records than page_size (end of data)
-            if len(records) < self.page_size:
+            # Break if we got fewer records than were asked for (end of data)
+            if len(records) < page_size:
                 logger.info("Reached end of data stream")
                 break
     
@@ -190,6 +213,17 @@ class StreamingProcessor:
         self.model_class = model_class
         self.bulk_batch_size = bulk_batch_size or getattr(settings, 'DB_BULK_BATCH_SIZE', 1000)
         self.memory_guard = MemoryGuard()
+        self.upserter = BulkUpserter(model_class, unique_fields=['id'], skip_unchanged=True)
+        self._row_schema: Optional[Tuple[List[str], RowSchema]] = None
+        self.flush_controller: Optional[AIMDController] = None
+    
+    def start_adaptive_flushing(self, learned: Optional[int] = None) -> None:
+        """Resize bulk writes between flushes (see ingestion.base.adaptive_batching)"""
+        if adaptive_batching_enabled():
+            self.flush_controller = build_controller(
+                self.bulk_batch_size, learned, memory_guard=self.memory_guard
+            )
+            self.bulk_batch_size = self.flush_controller.size
         
     def process_stream(
         self,
@@ -197,42 +231,76 @@ class StreamingProcessor:
         field_mapping: List[str],
         transform_func: callable = None,
         force_overwrite: bool = False,
-        dry_run: bool = False
+        dry_run: bool = False,
+        page_transform_func: callable = None
     ) -> Dict[str, int]:
         """
         Process streaming records with memory-safe bulk operations
+        
+        ``page_transform_func(page, field_mapping)`` transforms a whole page at
+        once (e.g. a compiled column-wise plan) and takes precedence over the
+        per-record ``transform_func``. With ``SYNC_TRANSFORM_WORKERS`` set it
+        runs in worker processes, a few pages ahead of the writes, so it must
+        pickle.
+        
+        Records are buffered as tuple-backed ``Row``s sharing one schema
+        (``ingestion.base.rows``) when no per-record ``transform_func`` is
+        given, and go to the bulk writer without being turned into dicts or
+        model instances.
         """
-        stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
+        stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
         buffer = []
         
         self.memory_guard.log_memory_usage("Starting stream processing")
         
+        # Page transforms can run ahead in the transform pool (ingestion.base.transform_pool)
+        if page_transform_func:
+            pages = iter_transforms(page_transform_func, records_stream, field_mapping,
+                                    executor=get_transform_executor())
+        else:
+            pages = ((page, None) for page in records_stream)
+        
         try:
-            for page_records in records_stream:
-                # Process each record in the page
-                for record in page_records:
+            for page_records, transformed_page in pages:
+                if page_transform_func:
                     try:
-                        # Transform record if function provided
-                        if transform_func:
-                            processed_record = transform_func(record, field_mapping)
-                        else:
-                            processed_record = self._default_transform(record, field_mapping)
+                        buffer.extend(transformed_page())
+                    except Exception as e:
+                        logger.error(f"Error processing page: {e}")
+                        stats['errors'] += len(page_records)
+                    
+                    while len(buffer) >= self.bulk_batch_size:
+                        # The flush may resize bulk_batch_size for the next one
+                        size = self.bulk_batch_size
+                        batch_stats = self._flush_buffer(buffer[:size], force_overwrite, dry_run)
+                        self._update_stats(stats, batch_stats)
+                        del buffer[:size]
+                        gc.collect()
+                else:
+                    # Process each record in the page
+                    for record in page_records:
+                        try:
+                            # Transform record if function provided
+                            if transform_func:
+                                processed_record = transform_func(record, field_mapping)
+                            else:
+                                processed_record = self._default_transform(record, field_mapping)
                         
-                        if processed_record:
-                            buffer.append(processed_record)
+                            if processed_record:
+                                buffer.append(processed_record)
                         
-                        # Flush buffer when it reaches bulk_batch_size
-                        if len(buffer) >= self.bulk_batch_size:
-                            batch_stats = self._flush_buffer(
-                                buffer, force_overwrite, dry_run
-                            )
-                            self._update_stats(stats, batch_stats)
-                            buffer.clear()
-                            gc.collect()  # Force cleanup after each bulk operation
+                            # Flush buffer when it reaches bulk_batch_size
+                            if len(buffer) >= self.bulk_batch_size:
+                                batch_stats = self._flush_buffer(
+                                    buffer, force_overwrite, dry_run
+                                )
+                                self._update_stats(stats, batch_stats)
+                                buffer.clear()
+                                gc.collect()  # Force cleanup after each bulk operation
                     
-                    except Exception as e:
-                        logger.error(f"Error processing record: {e}")
-                        stats['errors'] += 1
+                        except Exception as e:
+                            logger.error(f"Error processing record: {e}")
+                            stats['errors'] += 1
                 
                 # Memory check after each page
                 if not self.memory_guard.check_memory("stream processing"):
@@ -257,13 +325,16 @@ class StreamingProcessor:
         
         return stats
     
-    def _default_transform(self, record: tuple, field_mapping: List[str]) -> Dict[str, Any]:
-        """Default record transformation"""
-        return dict(zip(field_mapping, record))
+    def _default_transform(self, record: tuple, field_mapping: List[str]) -> Row:
+        """Default record transformation: the raw tuple keyed by ``field_mapping``"""
+        # One schema per stream; the mapping list is the same object for every record
+        if self._row_schema is None or self._row_schema[0] is not field_mapping:
+            self._row_schema = (field_mapping, RowSchema(field_mapping))
+        return self._row_schema[1].row(record)
     
     def _flush_buffer(
         self, 
-        buffer: List[Dict[str, Any]], 
+        buffer: List[Mapping[str, Any]], 
         force_overwrite: bool, 
         dry_run: bool
     ) -> Dict[str, int]:
@@ -275,45 +346,40 @@ class StreamingProcessor:
                 'total_processed': len(buffer),
                 'created': len(buffer),
                 'updated': 0,
+                'skipped': 0,
                 'errors': 0
             }
         
         logger.info(f"Flushing {len(buffer)} records to database")
         
-        stats = {'total_processed': len(buffer), 'created': 0, 'updated': 0, 'errors': 0}
+        stats = {'total_processed': len(buffer), 'created': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+        started = time.perf_counter()
         
         try:
-            with transaction.atomic():
-                if force_overwrite:
-                    # Use bulk_create with update_conflicts for upsert
-                    objects = [self.model_class(**record) for record in buffer]
-                    created_objects = self.model_class.objects.bulk_create(
-                        objects,
-                        batch_size=self.bulk_batch_size,
-                        update_conflicts=True,
-                        update_fields=[f.name for f in self.model_class._meta.fields if f.name != 'id'],
-                        unique_fields=['id']
-                    )
-                    stats['updated'] = len(buffer)
-                else:
-                    # Use bulk_create with ignore_conflicts
-                    objects = [self.model_class(**record) for record in buffer]
-                    created_objects = self.model_class.objects.bulk_create(
-                        objects,
-                        batch_size=self.bulk_batch_size,
-                        ignore_conflicts=True
-                    )
-                    stats['created'] = len(created_objects)
+            if force_overwrite:
+                # COPY into a staging table, then INSERT ... ON CONFLICT DO UPDATE;
+                # rows whose content fingerprint is unchanged are not rewritten
+                counts = self.upserter.upsert(buffer, update=True)
+            else:
+                # Same path with ON CONFLICT DO NOTHING
+                counts = self.upserter.upsert(buffer, update=False)
+            stats['created'] = counts['created']
+            stats['updated'] = counts['updated']
+            stats['skipped'] = counts['skipped']
+            if self.flush_controller:
+                self.bulk_batch_size = self.flush_controller.observe(len(buffer), time.perf_counter() - started)
                     
         except Exception as e:
             logger.error(f"Bulk operation failed: {e}")
             stats['errors'] = len(buffer)
             stats['created'] = 0
             stats['updated'] = 0
+            if self.flush_controller:
+                self.bulk_batch_size = self.flush_controller.fail()
         
         return stats
     
     def _update_stats(self, total_stats: Dict[str, int], batch_stats: Dict[str, int]):
         """Update total statistics with batch results"""
-        for key in ['total_processed', 'created', 'updated', 'errors']:
-            total_stats[key] += batch_stats[key]
\ No newline at end of file
+        for key in ['total_processed', 'created', 'updated', 'skipped', 'errors']:
+            total_stats[key] += batch_stats.get(key, 0)
\ No newline at end of file
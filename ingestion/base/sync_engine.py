@@ -5,10 +5,22 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, AsyncGenerator
 import asyncio
 import logging
+import time
 from datetime import datetime
+from django.conf import settings
+from django.db import connection, transaction
 from django.utils import timezone
-from asgiref.sync import sync_to_async
-from ingestion.base.exceptions import SyncException, ValidationException
+from asgiref.sync import async_to_sync, sync_to_async
+from ingestion.base.exceptions import PartialSaveException, SyncException, ValidationException
+from ingestion.base.adaptive_batching import (
+    FLUSH, AIMDController, adaptive_batching_enabled, adaptive_summary, build_controller, learned_sizes,
+    memory_guard_from_settings,
+)
+from ingestion.base.checkpoint import SyncCheckpoint, load_resume_checkpoint
+from ingestion.base.recovery import abisect_batch, aquarantine_records
+from ingestion.base.stage_timing import CHECKPOINT, RECOVERY, SAVE, TRANSFORM, VALIDATE, StageTimingMixin
+from ingestion.base.streaming_client import MemoryGuard
+from ingestion.base.transform_pool import atransform_records, get_transform_executor
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +41,7 @@ async def ensure_connection_pools_initialized():
             logger.warning(f"Failed to initialize connection pools: {e}")
             # Don't fail the entire application if connection pools can't be initialized
 
-class BaseSyncEngine(ABC):
+class BaseSyncEngine(StageTimingMixin, ABC):
     """Universal base class for all CRM sync operations"""
     
     def __init__(self, crm_source: str, sync_type: str, **kwargs):
@@ -38,9 +50,21 @@ class BaseSyncEngine(ABC):
         self.batch_size = kwargs.get('batch_size', self.get_default_batch_size())
         self.dry_run = kwargs.get('dry_run', False)
         self.force_overwrite = kwargs.get('force_overwrite', False)
+        # Number of batches allowed in flight between fetch, transform and save
+        # stages. 0 keeps the classic sequential loop.
+        self.pipeline_depth = kwargs.get(
+            'pipeline_depth', getattr(settings, 'SYNC_PIPELINE_DEPTH', 0)
+        ) or 0
         self.sync_history = None
         self.client = None
         self.processor = None
+        # Continue from the checkpoint of an interrupted run (see ingestion.base.checkpoint)
+        self.resume = kwargs.get('resume', False)
+        self.resume_cursor = None
+        self.checkpoint = None
+        # Write size learned by AIMD (see ingestion.base.adaptive_batching); set up in run_sync
+        self.flush_controller: Optional[AIMDController] = None
+        self._learned_flush_size: Optional[int] = None
         
     @abstractmethod
     def get_default_batch_size(self) -> int:
@@ -62,6 +86,20 @@ class BaseSyncEngine(ABC):
         """Transform raw data to target format"""
         pass
         
+    async def transform_with_processor(self, raw_data: List[Dict], label: str = 'record',
+                                       method: str = 'transform_record') -> List[Dict]:
+        """Run ``self.processor.<method>`` over a batch, skipping records that fail.
+        
+        With ``SYNC_TRANSFORM_WORKERS`` set, large batches are split across
+        worker processes (see ingestion.base.transform_pool), so the processor
+        must pickle and its transform must not touch the database.
+        """
+        results, errors = await atransform_records(self.processor, raw_data, method, get_transform_executor())
+        for index, message in errors:
+            logger.error(f"Error transforming {label} {raw_data[index].get('id')}: {message}")
+        failed = {index for index, _ in errors}
+        return [result for index, result in enumerate(results) if index not in failed]
+    
     @abstractmethod
     async def validate_data(self, data: List[Dict]) -> List[Dict]:
         """Validate transformed data"""
@@ -77,6 +115,15 @@ class BaseSyncEngine(ABC):
         """Cleanup resources after sync"""
         pass
     
+    def get_stream_cursor(self) -> Optional[Dict[str, Any]]:
+        """Position in the source stream just past the most recently fetched batch.
+        
+        run_sync reads this right after each batch is fetched and checkpoints it
+        once that batch has been saved. Engines that can resume override it and
+        honour ``self.resume_cursor`` in fetch_data; None disables checkpoints.
+        """
+        return None
+    
     # Common sync workflow methods
     async def start_sync(self, **kwargs):
         """Start sync operation and create history record"""
@@ -85,6 +132,12 @@ class BaseSyncEngine(ABC):
         # Prepare configuration for JSON serialization
         config = kwargs.copy()
         
+        previous, self.resume_cursor = await sync_to_async(load_resume_checkpoint)(
+            self.crm_source, self.sync_type, kwargs.get('resume', self.resume)
+        )
+        if previous:
+            config['resumed_from'] = previous.id
+        
         # Convert datetime objects to strings for JSON serialization
         def serialize_datetime_objects(obj):
             """Recursively convert datetime objects to ISO strings for JSON serialization"""
@@ -107,6 +160,7 @@ class BaseSyncEngine(ABC):
             status='running',
             configuration=config
         )
+        self.checkpoint = SyncCheckpoint(self.sync_history)
         return self.sync_history
     
     async def complete_sync(self, results: Dict[str, int], error: Optional[str] = None):
@@ -118,8 +172,15 @@ class BaseSyncEngine(ABC):
             self.sync_history.records_created = results.get('created', 0)
             self.sync_history.records_updated = results.get('updated', 0)
             self.sync_history.records_failed = results.get('failed', 0)
+            self.sync_history.records_skipped = results.get('skipped', 0)
             self.sync_history.error_message = error
             
+            if self.checkpoint:
+                if error:
+                    await sync_to_async(self.checkpoint.flush)(results.get('processed', 0))
+                else:
+                    self.checkpoint.clear()
+            
             # Calculate performance metrics
             if self.sync_history.end_time and self.sync_history.start_time:
                 duration = (self.sync_history.end_time - self.sync_history.start_time).total_seconds()
@@ -128,10 +189,15 @@ class BaseSyncEngine(ABC):
                 duration = 0
                 records_per_second = 0
                 
-            self.sync_history.performance_metrics = {
+            # Per-stage timings, batch sizes and bytes fetched (see ingestion.base.stage_timing)
+            metrics = {
                 'duration_seconds': duration,
                 'records_per_second': records_per_second
             }
+            adaptive = adaptive_summary(**{FLUSH: self.flush_controller})
+            if adaptive:
+                metrics['adaptive_batching'] = adaptive
+            self.sync_history.performance_metrics = self.with_stage_metrics(metrics)
             
             await sync_to_async(self.sync_history.save)()
     
@@ -140,10 +206,12 @@ class BaseSyncEngine(ABC):
         from tqdm.asyncio import tqdm
         
         history = await self.start_sync(**kwargs)
-        results = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0}
+        results = {'processed': 0, 'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
+        timer = self.reset_stage_timer()
         show_progress = kwargs.get('show_progress', True)
         
         try:
+            await self.start_adaptive_flushing()
             await self.initialize_client()
             
             # Get estimated total count if possible
@@ -163,38 +231,30 @@ class BaseSyncEngine(ABC):
                 )
             
             try:
-                async for batch in self.fetch_data(**kwargs):
-                    batch_count += 1
-                    logger.info(f"Processing batch {batch_count} with {len(batch)} records")
-                    
-                    try:
-                        # Transform data
-                        transformed_batch = await self.transform_data(batch)
-                        
-                        # Validate data
-                        validated_batch = await self.validate_data(transformed_batch)
-                        
-                        # Save data using bulk operations
-                        if not self.dry_run:
-                            batch_results = await self.save_data_bulk(validated_batch)
-                            for key, value in batch_results.items():
-                                if key in results:
-                                    results[key] += value
+                pipeline_depth = kwargs.get('pipeline_depth', self.pipeline_depth)
+                if pipeline_depth and pipeline_depth > 0:
+                    await self._run_pipelined(results, progress_bar, pipeline_depth, **kwargs)
+                else:
+                    async for batch in timer.atimed_iter(self.fetch_data(**kwargs)):
+                        batch_count += 1
+                        cursor = self.get_stream_cursor()
+                        logger.info(f"Processing batch {batch_count} with {len(batch)} records")
                         
-                        results['processed'] += len(batch)
+                        try:
+                            # Transform data
+                            with timer.measure(TRANSFORM):
+                                transformed_batch = await self.transform_data(batch)
+                            
+                            # Validate data
+                            with timer.measure(VALIDATE):
+                                validated_batch = await self.validate_data(transformed_batch)
+                        except Exception as e:
+                            await self._record_batch_failure(batch, batch_count, e, results, progress_bar)
+                            await self._checkpoint(cursor, results)
+                            continue
                         
-                        # Update progress bar
-                        if progress_bar:
-                            progress_bar.update(len(batch))
-                        
-                        logger.info(f"Batch {batch_count} completed: {len(batch)} processed")
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing batch {batch_count}: {e}")
-                        results['failed'] += len(batch)
-                        if progress_bar:
-                            progress_bar.update(len(batch))
-                        await self.handle_batch_error(batch, e)
+                        await self._save_validated_batch(batch, validated_batch, batch_count, results, progress_bar)
+                        await self._checkpoint(cursor, results)
                 
             finally:
                 if progress_bar:
@@ -211,19 +271,261 @@ class BaseSyncEngine(ABC):
         
         return history
     
-    async def handle_batch_error(self, batch: List[Dict], error: Exception):
-        """Handle batch processing errors with fallback to individual processing"""
-        logger.warning(f"Attempting individual record processing for failed batch: {error}")
+    async def start_adaptive_flushing(self) -> None:
+        """Pick up the write size the last successful run of this sync ended on"""
+        self.flush_controller = None
+        self._learned_flush_size = None
+        if adaptive_batching_enabled():
+            learned = await sync_to_async(learned_sizes)(self.crm_source, self.sync_type)
+            self._learned_flush_size = learned.get(FLUSH)
+    
+    def _flush_memory_guard(self) -> Optional[MemoryGuard]:
+        """The engine's or its client's MemoryGuard, else one from SYNC_ADAPTIVE_MEMORY_LIMIT_MB"""
+        guard = getattr(self, 'memory_guard', None) or getattr(self.client, 'memory_guard', None)
+        if isinstance(guard, MemoryGuard):
+            return guard
+        return memory_guard_from_settings()
+    
+    async def _save_in_flushes(self, validated_batch: List[Dict]) -> Dict[str, int]:
+        """``save_data_bulk`` in writes of the AIMD-controlled size, with their counts summed.
         
-        for record in batch:
+        The controller starts at the learned size, or at the size of the first
+        batch on a first run, so writes only get split once a run has seen
+        smaller writes do better. Writes never span fetched batches, so a
+        controller size above the batch size just means one write per batch.
+        If the first write fails the error is raised as is and the whole batch
+        is recovered by ``handle_batch_error``; if a later one fails, a
+        ``PartialSaveException`` carries the counts written so far and the
+        records that were not.
+        """
+        if not validated_batch or not adaptive_batching_enabled():
+            with self.stage_timer.measure(SAVE):
+                return await self.save_data_bulk(validated_batch)
+        
+        if self.flush_controller is None:
+            self.flush_controller = build_controller(
+                len(validated_batch), self._learned_flush_size, memory_guard=self._flush_memory_guard()
+            )
+        totals: Dict[str, int] = {}
+        start = 0
+        while start < len(validated_batch):
+            chunk = validated_batch[start:start + self.flush_controller.size]
+            started = time.perf_counter()
             try:
-                transformed = await self.transform_data([record])
-                validated = await self.validate_data(transformed)
-                if not self.dry_run:
-                    await self.save_data(validated)
-            except Exception as individual_error:
-                logger.error(f"Individual record processing failed: {individual_error}")
-                pass
+                with self.stage_timer.measure(SAVE):
+                    chunk_results = await self.save_data_bulk(chunk)
+            except Exception as e:
+                self.flush_controller.fail()
+                if not start:
+                    raise
+                raise PartialSaveException(
+                    f"Write failed after {start} of {len(validated_batch)} records: {e}",
+                    written=totals, unwritten=validated_batch[start:], error=e,
+                ) from e
+            self.flush_controller.observe(len(chunk), time.perf_counter() - started)
+            for key, value in (chunk_results or {}).items():
+                if isinstance(value, int):
+                    totals[key] = totals.get(key, 0) + value
+            start += len(chunk)
+        return totals
+    
+    async def _save_validated_batch(self, batch: List[Dict], validated_batch: List[Dict], batch_count: int,
+                                    results: Dict[str, int], progress_bar=None) -> None:
+        """Save one validated batch and fold its counts into ``results``"""
+        try:
+            # Save data using bulk operations
+            if not self.dry_run:
+                try:
+                    batch_results = await self._save_in_flushes(validated_batch)
+                except PartialSaveException as e:
+                    await self._record_partial_save(batch, batch_count, e, results, progress_bar)
+                    return
+                for key, value in batch_results.items():
+                    if key in results:
+                        results[key] += value
+            
+            results['processed'] += len(batch)
+            
+            # Update progress bar
+            if progress_bar:
+                progress_bar.update(len(batch))
+            
+            logger.info(f"Batch {batch_count} completed: {len(batch)} processed")
+            
+        except Exception as e:
+            await self._record_batch_failure(batch, batch_count, e, results, progress_bar)
+    
+    async def _checkpoint(self, cursor: Optional[Dict[str, Any]], results: Dict[str, int]) -> None:
+        """Checkpoint the stream position once the batch it points past is done"""
+        if self.checkpoint and cursor is not None and not self.dry_run:
+            with self.stage_timer.measure(CHECKPOINT):
+                await self.checkpoint.aupdate(cursor, results['processed'])
+    
+    async def _record_batch_failure(self, batch: List[Dict], batch_count: int, error: Exception,
+                                    results: Dict[str, int], progress_bar=None) -> None:
+        """Hand a failed batch to the batch error handler and count what it recovered"""
+        logger.error(f"Error processing batch {batch_count}: {error}")
+        if progress_bar:
+            progress_bar.update(len(batch))
+        with self.stage_timer.measure(RECOVERY):
+            recovered = await self.handle_batch_error(batch, error)
+        if isinstance(recovered, dict):
+            for key, value in recovered.items():
+                if key in results:
+                    results[key] += value
+        else:
+            results['failed'] += len(batch)
+    
+    async def _record_partial_save(self, batch: List[Dict], batch_count: int, error: PartialSaveException,
+                                   results: Dict[str, int], progress_bar=None) -> None:
+        """Count the writes made before ``error`` and recover only the records that were not written"""
+        logger.error(f"Error processing batch {batch_count}: {error}")
+        if progress_bar:
+            progress_bar.update(len(batch))
+        with self.stage_timer.measure(RECOVERY):
+            recovered = await self._bisect_records(error.unwritten, self._save_attempt, error.error)
+        quarantined = len(error.unwritten) - recovered['processed']
+        counts = dict(error.written)
+        for key, value in recovered.items():
+            counts[key] = counts.get(key, 0) + value
+        counts['processed'] = len(batch) - quarantined
+        for key, value in counts.items():
+            if key in results:
+                results[key] += value
+    
+    async def _run_pipelined(self, results: Dict[str, int], progress_bar, depth: int, **kwargs) -> None:
+        """Run fetch, transform/validate and save as concurrent stages.
+        
+        Stages are connected by bounded queues of ``depth`` batches so the next
+        page is fetched while the previous one is being written. A full queue
+        blocks the upstream stage, which keeps memory bounded when the database
+        is slower than the API (and vice versa). Saves stay on a single
+        coroutine, so batches are written in fetch order. Stage timings
+        overlap here, so their sum can exceed the run's wall-clock duration.
+        """
+        timer = self.stage_timer
+        done = object()
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        prepared: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        
+        # A cancelled stage skips its end marker: cancellation means the save
+        # loop has stopped, and nobody drains a full queue any more
+        async def fetch_stage():
+            batch_count = 0
+            cancelled = False
+            try:
+                async for batch in timer.atimed_iter(self.fetch_data(**kwargs)):
+                    batch_count += 1
+                    logger.info(f"Fetched batch {batch_count} with {len(batch)} records")
+                    await fetched.put((batch_count, batch, self.get_stream_cursor()))
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    await fetched.put(done)
+        
+        async def transform_stage():
+            cancelled = False
+            try:
+                while True:
+                    item = await fetched.get()
+                    if item is done:
+                        break
+                    batch_count, batch, cursor = item
+                    try:
+                        with timer.measure(TRANSFORM):
+                            transformed_batch = await self.transform_data(batch)
+                        with timer.measure(VALIDATE):
+                            validated_batch = await self.validate_data(transformed_batch)
+                        await prepared.put((batch_count, batch, cursor, validated_batch, None))
+                    except Exception as e:
+                        await prepared.put((batch_count, batch, cursor, None, e))
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    await prepared.put(done)
+        
+        fetch_task = asyncio.create_task(fetch_stage())
+        transform_task = asyncio.create_task(transform_stage())
+        
+        try:
+            while True:
+                item = await prepared.get()
+                if item is done:
+                    break
+                batch_count, batch, cursor, validated_batch, error = item
+                if error is not None:
+                    await self._record_batch_failure(batch, batch_count, error, results, progress_bar)
+                else:
+                    await self._save_validated_batch(batch, validated_batch, batch_count, results, progress_bar)
+                await self._checkpoint(cursor, results)
+            
+            # Surface fetch/transform stage failures (e.g. API errors) to run_sync
+            await asyncio.gather(fetch_task, transform_task)
+        finally:
+            for task in (fetch_task, transform_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(fetch_task, transform_task, return_exceptions=True)
+    
+    async def handle_batch_error(self, batch: List[Dict], error: Exception) -> Dict[str, int]:
+        """Recover a failed batch by bisecting it (see ingestion.base.recovery).
+        
+        Halves are re-run through transform, validate and ``save_data_bulk``
+        (in a transaction, so a half that fails part-way leaves nothing
+        behind) until the bad records are isolated; those are quarantined
+        with their error. Returns the counts to fold into the sync results, with
+        ``processed`` for recovered records and ``failed`` for quarantined ones.
+        """
+        async def attempt(records: List[Dict]) -> Dict[str, int]:
+            validated = await self.validate_data(await self.transform_data(records))
+            return await self._save_attempt(validated)
+        
+        return await self._bisect_records(batch, attempt, error)
+    
+    async def _save_attempt(self, validated_data: List[Dict]) -> Dict[str, int]:
+        """One recovery write of already validated records"""
+        if self.dry_run:
+            return {}
+        return await sync_to_async(self._save_atomically)(validated_data)
+    
+    async def _bisect_records(self, records: List[Dict], attempt, error: Exception) -> Dict[str, int]:
+        """Bisect ``records`` with ``attempt``, quarantine what fails alone and return the counts"""
+        logger.warning(f"Bisecting failed batch of {len(records)} records: {error}")
+        outcome = await abisect_batch(records, attempt, error=error)
+        failed = len(outcome.failures)
+        logger.info(
+            f"Recovered {len(records) - failed}/{len(records)} records in {outcome.attempts} bulk attempts"
+        )
+        if failed and not self.dry_run:
+            await aquarantine_records(
+                outcome.failures, self.crm_source, self.sync_type, sync_history=self.sync_history
+            )
+        
+        counts = {key: value for key, value in outcome.results.items() if isinstance(value, int)}
+        counts['processed'] = len(records) - failed
+        counts['failed'] = counts.get('failed', 0) + failed
+        return counts
+    
+    def _save_atomically(self, validated_data: List[Dict]) -> Dict[str, int]:
+        """``save_data_bulk`` in one transaction that is rolled back if it raises.
+        
+        Called through ``sync_to_async``, so it holds the thread-sensitive
+        database thread for the whole write: the ``sync_to_async`` calls made
+        by ``save_data_bulk`` run on it inside the transaction, while database
+        calls of concurrent pipeline stages wait until it has committed or
+        rolled back.
+        """
+        with transaction.atomic():
+            result = async_to_sync(self.save_data_bulk)(validated_data)
+            # A database error swallowed without a savepoint leaves the
+            # transaction aborted; fail the attempt instead of reporting success
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+        return result
     
     async def estimate_total_records(self, **kwargs) -> int:
         """Estimate total number of records to be synced"""
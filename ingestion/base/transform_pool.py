@@ -0,0 +1,221 @@
+"""
+Process-pool executor for CPU-bound transforms.
+
+Pure-Python transforms (JSON parsing, timestamp and phone normalisation,
+column-wise plans) hold the GIL, so a sync only ever uses one core for them.
+With ``SYNC_TRANSFORM_WORKERS > 0`` batches are split into contiguous slices
+and transformed in worker processes; results come back in input order.
+
+Whatever is shipped to a worker must pickle: module-level functions, bound
+methods of picklable processors, ``TransformPlan``s or ``RecordTransform``.
+Workers run ``django.setup()`` so processors can reference models, but they
+must not query the database. Batches below ``SYNC_TRANSFORM_MIN_BATCH`` rows
+are transformed in-process, where pickling would cost more than it saves.
+"""
+import asyncio
+import atexit
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# (position in the batch, error message) of a record that failed to transform
+RecordError = Tuple[int, str]
+
+
+def _init_worker() -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'data_warehouse.settings')
+    import django
+    django.setup()
+
+
+class RecordTransform:
+    """Picklable per-record transform: ``processor.<method>(record)`` for each record
+
+    Returns ``(results, errors)``. ``results`` lines up with the input, with
+    None where a record failed; failures are returned rather than logged so
+    they reach the parent process's logs.
+    """
+
+    def __init__(self, processor: Any, method: str = 'transform_record'):
+        self.processor = processor
+        self.method = method
+
+    def __call__(self, records: Sequence[Any]) -> Tuple[List[Any], List[RecordError]]:
+        transform = getattr(self.processor, self.method)
+        results, errors = [], []
+        for index, record in enumerate(records):
+            try:
+                results.append(transform(record))
+            except Exception as e:
+                results.append(None)
+                errors.append((index, str(e)))
+        return results, errors
+
+
+def merge_record_results(parts: Iterable[Tuple[List[Any], List[RecordError]]],
+                         slice_sizes: Iterable[int]) -> Tuple[List[Any], List[RecordError]]:
+    """Concatenate per-slice ``RecordTransform`` results, re-basing error positions"""
+    results, errors, offset = [], [], 0
+    for (part_results, part_errors), size in zip(parts, slice_sizes):
+        results.extend(part_results)
+        errors.extend((offset + index, message) for index, message in part_errors)
+        offset += size
+    return results, errors
+
+
+class TransformExecutor:
+    """Ordered map of transforms over a lazily started process pool"""
+
+    def __init__(self, workers: int, min_batch: int = 500, start_method: str = 'forkserver'):
+        self.workers = workers
+        self.min_batch = min_batch
+        self.start_method = start_method
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                )
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _broken(self, error: BrokenProcessPool) -> None:
+        logger.error(f"Transform worker pool broke ({error}); restarting it")
+        self.shutdown()
+
+    def _submit(self, func: Callable[..., Any], *args) -> Future:
+        try:
+            return self.pool.submit(func, *args)
+        except BrokenProcessPool as e:
+            self._broken(e)
+            return self.pool.submit(func, *args)
+
+    def slices(self, records: Sequence[Any]) -> List[Sequence[Any]]:
+        """One contiguous slice per worker, or the whole batch if it is small"""
+        if len(records) < self.min_batch or self.workers < 2:
+            return [records]
+        size = -(-len(records) // self.workers)
+        return [records[start:start + size] for start in range(0, len(records), size)]
+
+    def map(self, func: Callable[..., Any], records: Sequence[Any], *args) -> List[Any]:
+        """``func(slice, *args)`` for each slice of ``records``, in order"""
+        slices = self.slices(records)
+        if len(slices) == 1:
+            return [func(records, *args)]
+        try:
+            futures = [self.pool.submit(func, part, *args) for part in slices]
+            return [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            self._broken(e)
+            return [func(part, *args) for part in slices]
+
+    async def amap(self, func: Callable[..., Any], records: Sequence[Any], *args) -> List[Any]:
+        """``map`` for the event loop: slices are awaited, not blocked on"""
+        slices = self.slices(records)
+        if len(slices) == 1:
+            return [func(records, *args)]
+        loop = asyncio.get_running_loop()
+        try:
+            return list(await asyncio.gather(*(
+                loop.run_in_executor(self.pool, functools.partial(func, part, *args)) for part in slices
+            )))
+        except BrokenProcessPool as e:
+            self._broken(e)
+            return [func(part, *args) for part in slices]
+
+    def imap(self, func: Callable[..., Any], items: Iterable[Any], *args,
+             window: Optional[int] = None) -> Iterator[Tuple[Any, Callable[[], Any]]]:
+        """Pair each item with a call returning ``func(item, *args)``, in input order
+
+        Up to ``window`` (default two per worker) items are transformed ahead
+        of the consumer. Errors surface when the consumer makes the call, so
+        it can handle them per item as if it had run ``func`` itself.
+        """
+        window = window or self.workers * 2
+        pending: deque = deque()
+
+        def result(item: Any, future: Future) -> Any:
+            try:
+                return future.result()
+            except BrokenProcessPool as e:
+                self._broken(e)
+                return func(item, *args)
+
+        for item in items:
+            pending.append((item, self._submit(func, item, *args)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, functools.partial(result, item, future)
+        while pending:
+            item, future = pending.popleft()
+            yield item, functools.partial(result, item, future)
+
+
+_executor: Optional[TransformExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_transform_executor() -> Optional[TransformExecutor]:
+    """The process-wide executor, or None when ``SYNC_TRANSFORM_WORKERS`` is 0"""
+    global _executor
+    workers = getattr(settings, 'SYNC_TRANSFORM_WORKERS', 0)
+    if workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = TransformExecutor(
+                workers,
+                min_batch=getattr(settings, 'SYNC_TRANSFORM_MIN_BATCH', 500),
+                start_method=getattr(settings, 'SYNC_TRANSFORM_START_METHOD', 'forkserver'),
+            )
+            atexit.register(_executor.shutdown)
+        return _executor
+
+
+def transform_records(processor: Any, records: Sequence[Any], method: str = 'transform_record',
+                      executor: Optional[TransformExecutor] = None) -> Tuple[List[Any], List[RecordError]]:
+    """Run ``RecordTransform(processor, method)`` over ``records``, in the pool if there is one"""
+    transform = RecordTransform(processor, method)
+    if executor is None:
+        return transform(records)
+    slices = executor.slices(records)
+    return merge_record_results(executor.map(transform, records), map(len, slices))
+
+
+async def atransform_records(processor: Any, records: Sequence[Any], method: str = 'transform_record',
+                             executor: Optional[TransformExecutor] = None) -> Tuple[List[Any], List[RecordError]]:
+    """``transform_records`` without blocking the event loop on worker results"""
+    transform = RecordTransform(processor, method)
+    if executor is None:
+        return transform(records)
+    slices = executor.slices(records)
+    return merge_record_results(await executor.amap(transform, records), map(len, slices))
+
+
+def iter_transforms(func: Callable[..., Any], items: Iterable[Any], *args,
+                    executor: Optional[TransformExecutor] = None) -> Iterator[Tuple[Any, Callable[[], Any]]]:
+    """``TransformExecutor.imap`` when there is an executor, otherwise the same calls in-process"""
+    if executor is not None:
+        return executor.imap(func, items, *args)
+    return ((item, functools.partial(func, item, *args)) for item in items)
@@ -91,6 +91,11 @@ class BaseHubSpotSyncCommand(BaseCommand):
             action="store_true",
             help="Disable progress bar display"
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an interrupted sync from its last checkpoint"
+        )
 
     def handle(self, *args, **options):
         """Main command handler"""
@@ -134,6 +139,10 @@ class BaseHubSpotSyncCommand(BaseCommand):
         """Get the name of the sync operation - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement get_sync_name")
     
+    def get_history_sync_type(self, **options) -> str:
+        """SyncHistory sync_type used to find the last successful sync"""
+        return self.get_sync_name()
+    
     async def run_sync(self, **options):
         """Run the sync operation"""
         # Determine last sync time
@@ -146,7 +155,8 @@ class BaseHubSpotSyncCommand(BaseCommand):
             'max_records': options.get('max_records', 0),
             'endpoint': self.get_sync_name(),
             'show_progress': not options.get('no_progress', False),
-            'force_overwrite': options.get('force', False)
+            'force_overwrite': options.get('force', False),
+            'resume': options.get('resume', False)
         }
         
         if options.get('debug'):
@@ -178,7 +188,7 @@ class BaseHubSpotSyncCommand(BaseCommand):
             # Use sync database access - this method is called from sync context
             last_sync_record = SyncHistory.objects.filter(
                 crm_source='hubspot',
-                sync_type=self.get_sync_name(),
+                sync_type=self.get_history_sync_type(**options),
                 status='success'
             ).order_by('-end_time').first()
             
@@ -224,7 +234,7 @@ class BaseHubSpotSyncCommand(BaseCommand):
             def get_last_sync_record():
                 return SyncHistory.objects.filter(
                     crm_source='hubspot',
-                    sync_type=self.get_sync_name(),
+                    sync_type=self.get_history_sync_type(**options),
                     status='success'
                 ).order_by('-end_time').first()
             
@@ -65,6 +65,11 @@ class BaseSalesProSyncCommand(BaseCommand):
             action="store_true",
             help="Disable progress bar display"
         )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue an interrupted sync from its last checkpoint"
+        )
         
     def get_sync_engine(self, **options):
         """Get the sync engine instance - must be implemented by subclasses"""
@@ -158,7 +163,8 @@ class BaseSalesProSyncCommand(BaseCommand):
                 dry_run=options['dry_run'],
                 batch_size=options['batch_size'],
                 max_records=options['max_records'],
-                show_progress=not options['no_progress']
+                show_progress=not options['no_progress'],
+                resume=options.get('resume', False)
             ))
             
             # Report results
@@ -185,6 +191,7 @@ class BaseSalesProSyncCommand(BaseCommand):
             'dry_run': kwargs.get('dry_run', False),
             'batch_size': kwargs.get('batch_size', 500),
             'max_records': kwargs.get('max_records', 0),
+            'resume': kwargs.get('resume', False),
         }
         
         # Run sync with enterprise features
@@ -0,0 +1,84 @@
+import asyncio
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ingestion.tests.benchmarks.harness import ResultStore, find_regressions, run_benchmark
+from ingestion.tests.benchmarks.scenarios import SCENARIOS
+
+LOCAL_DB_HOSTS = {'', 'localhost', '127.0.0.1', '::1'}
+DEFAULT_OUTPUT = Path(settings.BASE_DIR) / 'reports' / 'benchmarks' / 'sync_benchmarks.jsonl'
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark sync engines offline: serve synthetic paginated API responses from a local "
+        "server and report records/sec, peak RSS and query counts per engine."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "scenarios",
+            nargs="*",
+            help=f"Scenarios to run (default: all). Available: {', '.join(SCENARIOS)}",
+        )
+        parser.add_argument(
+            "--records",
+            type=int,
+            action="append",
+            help="Records served per scenario; repeat for several scales (default: 10000).",
+        )
+        parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every API response.")
+        parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra delay, 0..jitter per response.")
+        parser.add_argument("--output", default=str(DEFAULT_OUTPUT), help="JSON lines file results are appended to.")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.1,
+            help="Allowed relative change against the previous commit's result before it counts as a regression.",
+        )
+        parser.add_argument("--fail-on-regression", action="store_true", help="Exit non-zero if any regression is found.")
+        parser.add_argument(
+            "--allow-remote-db",
+            action="store_true",
+            help="Run even if the default database is not local (benchmarks write synthetic records).",
+        )
+
+    def handle(self, *args, **options):
+        names = options["scenarios"] or list(SCENARIOS)
+        unknown = [name for name in names if name not in SCENARIOS]
+        if unknown:
+            raise CommandError(f"Unknown scenario(s): {', '.join(unknown)}. Available: {', '.join(SCENARIOS)}")
+
+        db_host = settings.DATABASES["default"].get("HOST") or ""
+        if db_host not in LOCAL_DB_HOSTS and not options["allow_remote_db"]:
+            raise CommandError(
+                f"Refusing to benchmark against database host '{db_host}'; benchmarks write synthetic "
+                "records. Point DATABASES at a local Postgres or pass --allow-remote-db."
+            )
+
+        store = ResultStore(options["output"])
+        regressions = []
+        for records in options["records"] or [10000]:
+            for name in names:
+                self.stdout.write(f"Running {name} with {records:,} records...")
+                result = asyncio.run(
+                    run_benchmark(SCENARIOS[name], records, options["latency_ms"], options["jitter_ms"])
+                )
+                baseline = store.baseline(result)
+                store.append(result)
+
+                self.stdout.write(
+                    f"  {result.records_per_second:,.0f} records/s, {result.elapsed_seconds:.1f}s, "
+                    f"peak RSS {result.peak_rss_mb:.0f}MB, {result.queries:,} queries, "
+                    f"{result.requests:,} API requests"
+                )
+                found = find_regressions(result, baseline, options["tolerance"])
+                for message in found:
+                    self.stdout.write(self.style.WARNING(f"  REGRESSION {message}"))
+                regressions.extend(found)
+
+        self.stdout.write(self.style.SUCCESS(f"Results appended to {store.path}"))
+        if regressions and options["fail_on_regression"]:
+            raise CommandError(f"{len(regressions)} benchmark regression(s) against previous commits")
@@ -32,7 +32,8 @@ class Command(BaseCommand):
         now = timezone.now()
         cutoff = now - timezone.timedelta(minutes=threshold_minutes)
 
-        qs = SyncHistory.objects.filter(status="running", start_time__lt=cutoff)
+        # Checkpoint writes double as a heartbeat: long syncs still making progress are left alone
+        qs = SyncHistory.objects.filter(status="running", start_time__lt=cutoff).exclude(checkpoint_at__gte=cutoff)
         count = qs.count()
 
         if count == 0:
@@ -61,6 +62,8 @@ class Command(BaseCommand):
             sh.end_time = now
             msg = sh.error_message or ""
             suffix = " (auto-marked failed by cleanup_stale_syncs; no heartbeat for too long)"
+            if sh.checkpoint:
+                suffix += "; resumable from its last checkpoint with --resume"
             # Keep message concise
             sh.error_message = (msg + suffix) if suffix not in msg else msg
             sh.save(update_fields=["status", "end_time", "error_message"])
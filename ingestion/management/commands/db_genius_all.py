@@ -1,14 +1,19 @@
+import functools
 import logging
-from datetime import datetime
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
+from ingestion.base.orchestration import FAILED, SUCCESS, SyncDAG, SyncStep, child_history_totals
 from ingestion.models.common import SyncHistory
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
-    help = "Run all db_genius_* commands in order of model dependencies following CRM sync guide standards"
+    help = (
+        "Run all db_genius_* commands following CRM sync guide standards; commands whose "
+        "dependencies are done run concurrently"
+    )
 
     def add_arguments(self, parser):
         """Add universal command arguments following CRM sync guide standards"""
@@ -78,6 +83,33 @@ class Command(BaseCommand):
             help='DEPRECATED: Use --start-date instead. Sync records modified since this timestamp'
         )
 
+        # Orchestration
+        parser.add_argument(
+            '--max-parallel',
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MAX_PARALLEL', 1),
+            help='Commands to run at once when their dependencies allow (1 = one after another)'
+        )
+
+        parser.add_argument(
+            '--memory-budget-mb',
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MEMORY_BUDGET_MB', 0),
+            help='Do not start further commands while process RSS is above this (0 = no budget)'
+        )
+
+    def report_step(self, result):
+        """Print one finished command"""
+        if result.status == SUCCESS:
+            self.stdout.write(self.style.SUCCESS(
+                f"        ✅ Completed {result.name} ({result.duration_seconds:.1f}s)"
+            ))
+        elif result.status == FAILED:
+            self.stdout.write(self.style.ERROR(f"        ❌ Error running {result.name}: {result.error}"))
+            logger.error(f"db_genius_all: failed at {result.name}: {result.error}")
+        else:
+            self.stdout.write(self.style.WARNING(f"        ⏭️  Skipped {result.name}: {result.error}"))
+
     def handle(self, *args, **options):
         """Main command handler following CRM sync guide patterns with SyncHistory tracking"""
         
@@ -141,62 +173,77 @@ class Command(BaseCommand):
                     )
                 )
 
-            # Complete list of ALL db_genius_* commands in proper dependency order
-            # Following the CRM sync guide patterns for database-based sources
+            # Every db_genius_* command with the commands whose data it builds on.
+            # Commands without dependencies between them run concurrently.
             commands = [
-                # Level 1: Independent tables (no foreign keys)
-                {"name": "db_genius_division_groups", "description": "Division organizational groups", "options": {}},
-                {"name": "db_genius_user_titles", "description": "User title/role definitions", "options": {}},
-                {"name": "db_genius_services", "description": "Service catalog definitions", "options": {}},
-                {"name": "db_genius_appointment_types", "description": "Appointment type classifications", "options": {}},
-                {"name": "db_genius_appointment_outcome_types", "description": "Appointment outcome classifications", "options": {}},
-                {"name": "db_genius_appointment_outcomes", "description": "Appointment outcome records", "options": {}},
-                {"name": "db_genius_marketing_source_types", "description": "Marketing source type definitions", "options": {}},
-                {"name": "db_genius_marketsharp_sources", "description": "MarketSharp source integrations", "options": {}},
-                {"name": "db_genius_marketsharp_marketing_source_maps", "description": "MarketSharp source mappings", "options": {}},
-                {"name": "db_genius_job_statuses", "description": "Job status definitions", "options": {}},
-                {"name": "db_genius_job_financings", "description": "Job financing options", "options": {}},
-                {"name": "db_genius_job_change_order_types", "description": "Job change order type definitions", "options": {}},
-                {"name": "db_genius_job_change_order_statuses", "description": "Job change order status definitions", "options": {}},
-                {"name": "db_genius_job_change_order_reasons", "description": "Job change order reason codes", "options": {}},
-                {"name": "db_genius_integration_field_definitions", "description": "Integration field definition templates", "options": {}},
-                
-                # Level 2: Depends on division_groups
-                {"name": "db_genius_divisions", "description": "Organizational divisions", "options": {}},
-                {"name": "db_genius_division_regions", "description": "Division regional mappings", "options": {}},
-                
-                # Level 3: Depends on marketing_source_types
-                {"name": "db_genius_marketing_sources", "description": "Marketing source definitions", "options": {}},
-                
-                # Level 4: Depends on divisions and user_titles
-                {"name": "db_genius_user_data", "description": "System users", "options": {}},
-                
-                # Level 5: Depends on users and divisions and integration_field_definitions
-                {"name": "db_genius_user_associations", "description": "User organizational associations", "options": {}},
-                {"name": "db_genius_prospects", "description": "Prospect records", "options": {}},
-                {"name": "db_genius_leads", "description": "Lead records", "options": {}},
-                {"name": "db_genius_integration_fields", "description": "Integration field values", "options": {}},
-                
-                # Level 6: Depends on prospects and marketing_sources
-                {"name": "db_genius_prospect_sources", "description": "Prospect source attributions", "options": {}},
-                
-                # Level 7: Depends on prospects, appointment_types, and appointment_outcomes
-                {"name": "db_genius_appointments", "description": "Appointment records", "options": {}},
-                
-                # Level 8: Depends on prospects, appointments, services, and job_statuses
-                {"name": "db_genius_quotes", "description": "Quote records", "options": {}},
-                {"name": "db_genius_jobs", "description": "Job records", "options": {}},
-                
-                # Level 9: Depends on appointments and services
-                {"name": "db_genius_appointment_services", "description": "Appointment service associations", "options": {}},
-                
-                # Level 10: Depends on jobs and change order definitions
-                {"name": "db_genius_job_change_order_items", "description": "Job change order line items", "options": {}},
-                {"name": "db_genius_job_change_orders", "description": "Job change order records", "options": {}},
+                # Independent tables
+                ("db_genius_division_groups", "Division organizational groups", ()),
+                ("db_genius_user_titles", "User title/role definitions", ()),
+                ("db_genius_services", "Service catalog definitions", ()),
+                ("db_genius_appointment_types", "Appointment type classifications", ()),
+                ("db_genius_appointment_outcome_types", "Appointment outcome classifications", ()),
+                ("db_genius_marketing_source_types", "Marketing source type definitions", ()),
+                ("db_genius_marketsharp_sources", "MarketSharp source integrations", ()),
+                ("db_genius_job_statuses", "Job status definitions", ()),
+                ("db_genius_job_financings", "Job financing options", ()),
+                ("db_genius_job_change_order_types", "Job change order type definitions", ()),
+                ("db_genius_job_change_order_statuses", "Job change order status definitions", ()),
+                ("db_genius_job_change_order_reasons", "Job change order reason codes", ()),
+                ("db_genius_integration_field_definitions", "Integration field definition templates", ()),
+
+                ("db_genius_appointment_outcomes", "Appointment outcome records",
+                 ("db_genius_appointment_outcome_types",)),
+                ("db_genius_marketsharp_marketing_source_maps", "MarketSharp source mappings",
+                 ("db_genius_marketsharp_sources",)),
+                ("db_genius_divisions", "Organizational divisions", ("db_genius_division_groups",)),
+                ("db_genius_division_regions", "Division regional mappings", ("db_genius_division_groups",)),
+                ("db_genius_marketing_sources", "Marketing source definitions",
+                 ("db_genius_marketing_source_types",)),
+                ("db_genius_user_data", "System users", ("db_genius_divisions", "db_genius_user_titles")),
+                ("db_genius_user_associations", "User organizational associations",
+                 ("db_genius_user_data", "db_genius_divisions")),
+                ("db_genius_prospects", "Prospect records", ("db_genius_user_data", "db_genius_divisions")),
+                ("db_genius_leads", "Lead records", ("db_genius_user_data", "db_genius_divisions")),
+                ("db_genius_integration_fields", "Integration field values",
+                 ("db_genius_integration_field_definitions",)),
+                ("db_genius_prospect_sources", "Prospect source attributions",
+                 ("db_genius_prospects", "db_genius_marketing_sources")),
+                ("db_genius_appointments", "Appointment records",
+                 ("db_genius_prospects", "db_genius_appointment_types", "db_genius_appointment_outcomes")),
+                ("db_genius_quotes", "Quote records",
+                 ("db_genius_prospects", "db_genius_appointments", "db_genius_services", "db_genius_job_statuses")),
+                ("db_genius_jobs", "Job records",
+                 ("db_genius_prospects", "db_genius_appointments", "db_genius_services", "db_genius_job_statuses")),
+                ("db_genius_appointment_services", "Appointment service associations",
+                 ("db_genius_appointments", "db_genius_services")),
+                ("db_genius_job_change_orders", "Job change order records",
+                 ("db_genius_jobs", "db_genius_job_change_order_types",
+                  "db_genius_job_change_order_statuses", "db_genius_job_change_order_reasons")),
+                ("db_genius_job_change_order_items", "Job change order line items",
+                 ("db_genius_job_change_orders",)),
             ]
+            steps = [
+                SyncStep(
+                    name=name,
+                    run=functools.partial(call_command, name, **common_options),
+                    depends_on=depends_on,
+                    description=description,
+                )
+                for name, description, depends_on in commands
+            ]
+            dag = SyncDAG(
+                steps,
+                max_parallel=options['max_parallel'],
+                memory_budget_mb=options['memory_budget_mb'],
+                on_start=lambda step: self.stdout.write(self.style.NOTICE(f"🔄 Started {step.name}")),
+                on_finish=self.report_step,
+            )
 
             self.stdout.write(self.style.NOTICE('🚀 Starting comprehensive Genius DB import sequence...'))
-            self.stdout.write(self.style.NOTICE(f'📊 Total commands to execute: {len(commands)}'))
+            self.stdout.write(self.style.NOTICE(
+                f'📊 Total commands to execute: {len(steps)} '
+                f'({len(dag.levels())} dependency levels, up to {dag.max_parallel} at a time)'
+            ))
             
             if options.get('debug'):
                 self.stdout.write(self.style.SUCCESS('🔧 Supported flags passed to all commands:'))
@@ -204,39 +251,19 @@ class Command(BaseCommand):
                     self.stdout.write(f"   --{flag.replace('_', '-')}: {value}")
                 if unsupported_flags:
                     self.stdout.write(self.style.WARNING(f"   🚧 Unsupported flags (not passed): {', '.join(unsupported_flags)}"))
+                for level, names in enumerate(dag.levels(), 1):
+                    self.stdout.write(f"   Level {level}: {', '.join(names)}")
                 self.stdout.write("")
             
-            stats['total_commands'] = len(commands)
-            
-            for i, cmd in enumerate(commands, 1):
-                # Merge common options with command-specific options
-                cmd_options = {**common_options, **cmd["options"]}
-                
-                self.stdout.write(
-                    self.style.NOTICE(f"[{i:2d}/{len(commands)}] 🔄 {cmd['name']}")
-                )
-                if options.get('debug'):
-                    self.stdout.write(f"        📝 {cmd['description']}")
-                
-                try:
-                    call_command(cmd['name'], **cmd_options)
-                    self.stdout.write(self.style.SUCCESS(f"        ✅ Completed {cmd['name']}"))
-                    stats['successful_commands'] += 1
-                    
-                except Exception as e:
-                    error_msg = f"❌ Error running {cmd['name']}: {e}"
-                    self.stdout.write(self.style.ERROR(f"        {error_msg}"))
-                    logger.error(f"db_genius_all: failed at {cmd['name']}: {e}")
-                    stats['failed_commands'] += 1
-                    
-                    if not options.get('dry_run'):
-                        self.stdout.write(self.style.ERROR("🛑 Stopping execution due to error. Use --dry-run to test without stopping."))
-                        break
-                    else:
-                        self.stdout.write(self.style.WARNING("⚠️  Continuing with dry-run mode..."))
+            stats['total_commands'] = len(steps)
+            run = dag.run()
+            summary = run.summary()
+            stats['successful_commands'] = summary['successful_steps']
+            stats['failed_commands'] = summary['failed_steps']
+            stats['skipped_commands'] = summary['skipped_steps']
 
             # Update SyncHistory with results
-            if stats['successful_commands'] == stats['total_commands']:
+            if run.succeeded:
                 sync_record.status = 'success'
                 self.stdout.write(self.style.SUCCESS('🎉 All Genius DB commands executed successfully!'))
             else:
@@ -246,26 +273,31 @@ class Command(BaseCommand):
                         f'⚠️  Completed {stats["successful_commands"]}/{stats["total_commands"]} commands successfully.'
                     )
                 )
+                sync_record.error_message = '; '.join(
+                    f"{result.name}: {result.error}" for result in run.by_status(FAILED)
+                )
             
             sync_record.end_time = timezone.now()
-            sync_record.records_processed = stats['total_commands']
-            sync_record.records_created = stats['successful_commands']  
-            sync_record.records_failed = stats['failed_commands']
+            for field, value in child_history_totals('genius', sync_record.start_time, sync_record.id).items():
+                setattr(sync_record, field, value)
+            duration = (sync_record.end_time - sync_record.start_time).total_seconds()
             sync_record.performance_metrics = {
-                'duration_seconds': (sync_record.end_time - sync_record.start_time).total_seconds(),
-                'commands_per_minute': stats['total_commands'] / ((sync_record.end_time - sync_record.start_time).total_seconds() / 60) if stats['total_commands'] > 0 else 0,
-                'success_rate': (stats['successful_commands'] / stats['total_commands'] * 100) if stats['total_commands'] > 0 else 0
+                **summary,
+                'duration_seconds': duration,
+                'commands_per_minute': stats['total_commands'] / (duration / 60) if duration > 0 else 0,
             }
             sync_record.save()
 
             # Summary output
-            duration = (sync_record.end_time - sync_record.start_time).total_seconds()
             self.stdout.write("")
             self.stdout.write(self.style.NOTICE("📈 EXECUTION SUMMARY"))
-            self.stdout.write(f"   ⏱️  Duration: {duration:.1f} seconds")
+            self.stdout.write(f"   ⏱️  Duration: {duration:.1f} seconds "
+                              f"({summary['serial_seconds']:.1f}s of command time, "
+                              f"{summary['parallel_speedup']:.1f}x)")
             self.stdout.write(f"   ✅ Successful: {stats['successful_commands']}/{stats['total_commands']}")
             self.stdout.write(f"   ❌ Failed: {stats['failed_commands']}")
-            self.stdout.write(f"   📊 Success Rate: {sync_record.performance_metrics['success_rate']:.1f}%")
+            self.stdout.write(f"   ⏭️  Skipped: {stats['skipped_commands']}")
+            self.stdout.write(f"   📊 Success Rate: {summary['success_rate']:.1f}%")
             self.stdout.write(f"   🆔 SyncHistory ID: {sync_record.id}")
             
         except Exception as e:
@@ -70,6 +70,12 @@ class Command(BaseCommand):
             help='DEPRECATED: Use --full instead. Forces full sync ignoring timestamps.'
         )
 
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
+
     def parse_datetime_arg(self, date_str: str) -> Optional[datetime]:
         """Parse datetime string argument"""
         if not date_str:
@@ -146,7 +152,8 @@ class Command(BaseCommand):
                 force_overwrite=force_overwrite,
                 dry_run=options.get('dry_run', False),
                 max_records=options.get('max_records'),
-                full_sync=full_sync
+                full_sync=full_sync,
+                resume=options.get('resume', False)
             )
             
             # Display results
@@ -70,6 +70,12 @@ class Command(BaseCommand):
             help='Completely replace existing records (enables force overwrite mode)'
         )
 
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
+
     def parse_datetime_arg(self, date_str: str) -> Optional[datetime]:
         """Parse datetime string argument"""
         if not date_str:
@@ -111,7 +117,8 @@ class Command(BaseCommand):
                 since_date=since_date,
                 force_overwrite=options.get('force', False),
                 dry_run=options.get('dry_run', False),
-                max_records=options.get('max_records')
+                max_records=options.get('max_records'),
+                resume=options.get('resume', False)
             )
             self.stdout.write("✅ Sync completed successfully:")
             self.stdout.write(f"   🆔 Sync ID: {result.get('sync_id', 'N/A')}")
@@ -56,6 +56,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Completely replace existing records'
         )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
         parser.add_argument(
             '--start-date',
             type=str,
@@ -124,7 +129,8 @@ class Command(BaseCommand):
                 'max_records': options.get('max_records'),
                 'dry_run': options.get('dry_run', False),
                 'debug': options.get('debug', False),
-                'skip_validation': options.get('skip_validation', False)
+                'skip_validation': options.get('skip_validation', False),
+                'resume': options.get('resume', False)
             }
             
             # Add date parameters if provided
@@ -27,6 +27,12 @@ class Command(BaseCommand):
             action='store_true', 
             help='Force overwrite existing records (replace mode)'
         )
+
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
         parser.add_argument(
             '--since',
             type=str,
@@ -87,7 +93,8 @@ class Command(BaseCommand):
                 since_date=since_date,
                 force_overwrite=options['force'], 
                 dry_run=options['dry_run'],
-                max_records=options.get('max_records')
+                max_records=options.get('max_records'),
+                resume=options.get('resume', False)
             )
             
             # Display results
@@ -70,6 +70,12 @@ class Command(BaseCommand):
             help='Completely replace existing records (enables force overwrite mode)'
         )
 
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
+
     def parse_datetime_arg(self, date_str: str) -> Optional[datetime]:
         """Parse datetime string argument"""
         if not date_str:
@@ -112,7 +118,8 @@ class Command(BaseCommand):
                 force_overwrite=options.get('force', False),
                 dry_run=options.get('dry_run', False),
                 max_records=options.get('max_records'),
-                full_sync=full_sync
+                full_sync=full_sync,
+                resume=options.get('resume', False)
             )
             self.stdout.write("✅ Sync completed successfully:")
             self.stdout.write(f"   🆔 Sync ID: {result.get('sync_id', 'N/A')}")
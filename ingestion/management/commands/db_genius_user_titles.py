@@ -32,6 +32,12 @@ class Command(BaseCommand):
             action='store_true', 
             help='Completely replace existing records (enables force overwrite mode)'
         )
+
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Continue an interrupted sync from its last checkpoint'
+        )
         
         parser.add_argument(
             '--dry-run',
@@ -120,7 +126,8 @@ class Command(BaseCommand):
                 since_date=since_date,
                 force_overwrite=options.get('force', False),
                 dry_run=options.get('dry_run', False),
-                max_records=options.get('max_records')
+                max_records=options.get('max_records'),
+                resume=options.get('resume', False)
             )
             
             # Display results
@@ -3,6 +3,7 @@ SalesPro Credit Application sync from AWS Athena
 Following import_refactoring.md guidelines
 """
 import logging
+from collections.abc import Mapping
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -57,7 +58,7 @@ class SalesProCreditApplicationSyncEngine(SalesProBaseSyncEngine):
             transformed = {}
             
             # If record is a dict with proper keys, use them
-            if isinstance(record, dict) and 'leap_credit_app_id' in record:
+            if isinstance(record, Mapping) and 'leap_credit_app_id' in record:
                 leap_credit_app_id = record.get('leap_credit_app_id')
                 
                 # Apply field mappings with validation
@@ -129,7 +130,7 @@ class SalesProCreditApplicationSyncEngine(SalesProBaseSyncEngine):
             return transformed
             
         except Exception as e:
-            leap_credit_app_id = record.get('leap_credit_app_id', 'unknown') if isinstance(record, dict) else record[0] if isinstance(record, (list, tuple)) and len(record) > 0 else 'unknown'
+            leap_credit_app_id = record.get('leap_credit_app_id', 'unknown') if isinstance(record, Mapping) else record[0] if isinstance(record, (list, tuple)) and len(record) > 0 else 'unknown'
             logger.error(f"Error transforming credit application record {leap_credit_app_id}: {e}")
             return None
             
@@ -3,6 +3,7 @@ SalesPro Customer sync from AWS Athena
 Following import_refactoring.md guidelines
 """
 import logging
+from collections.abc import Mapping
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -57,7 +58,7 @@ class SalesProCustomerSyncEngine(SalesProBaseSyncEngine):
             transformed = {}
             
             # If record is a dict with proper keys, use them
-            if isinstance(record, dict) and 'customer_id' in record:
+            if isinstance(record, Mapping) and 'customer_id' in record:
                 customer_id = record.get('customer_id')
                 
                 # Apply field mappings with validation
@@ -116,7 +117,7 @@ class SalesProCustomerSyncEngine(SalesProBaseSyncEngine):
             return transformed
             
         except Exception as e:
-            customer_id = record.get('customer_id', 'unknown') if isinstance(record, dict) else record[0] if isinstance(record, (list, tuple)) and len(record) > 0 else 'unknown'
+            customer_id = record.get('customer_id', 'unknown') if isinstance(record, Mapping) else record[0] if isinstance(record, (list, tuple)) and len(record) > 0 else 'unknown'
             logger.error(f"Error transforming customer record {customer_id}: {e}")
             return None
             
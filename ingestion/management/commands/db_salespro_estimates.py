@@ -3,6 +3,7 @@ SalesPro Estimate sync from AWS Athena
 Following import_refactoring.md guidelines
 """
 import logging
+from collections.abc import Mapping
 import uuid
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -49,7 +50,7 @@ class SalesProEstimateSyncEngine(SalesProBaseSyncEngine):
             logger.debug(f"Record keys: {list(record.keys()) if record else 'None'}")
             
             # If record is a dict with proper keys, use them
-            if isinstance(record, dict) and 'estimate_id' in record:
+            if isinstance(record, Mapping) and 'estimate_id' in record:
                 estimate_id = record.get('estimate_id')
             else:
                 # If record is a tuple/list (raw from Athena), map by position
@@ -3,10 +3,14 @@ Main management command to sync all CallRail data
 """
 import logging
 import asyncio
+import functools
 import os
 from django.core.management.base import CommandError
 from django.conf import settings
+from django.utils import timezone
 from ingestion.base.commands import BaseSyncCommand
+from ingestion.base.orchestration import FAILED, SUCCESS, SyncDAG, SyncStep
+from ingestion.models.common import SyncHistory
 from ingestion.sync.callrail.engines.accounts import AccountsSyncEngine
 from ingestion.sync.callrail.engines.companies import CompaniesSyncEngine
 from ingestion.sync.callrail.engines.calls import CallsSyncEngine
@@ -18,6 +22,22 @@ from ingestion.sync.callrail.engines.users import UsersSyncEngine
 
 logger = logging.getLogger(__name__)
 
+# Engine class and sync method per entity
+ENTITY_ENGINES = {
+    'accounts': (AccountsSyncEngine, 'sync_accounts'),
+    'companies': (CompaniesSyncEngine, 'sync_companies'),
+    'calls': (CallsSyncEngine, 'sync_calls'),
+    'trackers': (TrackersSyncEngine, 'sync_trackers'),
+    'form_submissions': (FormSubmissionsSyncEngine, 'sync_form_submissions'),
+    'text_messages': (TextMessagesSyncEngine, 'sync_text_messages'),
+    'tags': (TagsSyncEngine, 'sync_tags'),
+    'users': (UsersSyncEngine, 'sync_users'),
+}
+ENTITY_ICONS = {
+    'accounts': '🏢', 'companies': '📋', 'calls': '☎️', 'trackers': '📞',
+    'form_submissions': '📝', 'text_messages': '💬', 'tags': '🏷️', 'users': '👥',
+}
+
 
 class Command(BaseSyncCommand):
     help = 'Sync all CallRail data (accounts, companies, calls, trackers, form_submissions, text_messages, tags, users)'
@@ -44,11 +64,25 @@ class Command(BaseSyncCommand):
             help='Filter by specific company ID'
         )
         
-        # Add parallel processing option
+        # Add parallel processing options
         parser.add_argument(
             '--parallel',
             action='store_true',
-            help='Run entity syncs in parallel (experimental)'
+            help='Run all entity syncs at once (same as --max-parallel with the number of entities)'
+        )
+        
+        parser.add_argument(
+            '--max-parallel',
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MAX_PARALLEL', 1),
+            help='Entity syncs to run at once (1 = one after another)'
+        )
+        
+        parser.add_argument(
+            '--memory-budget-mb',
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MEMORY_BUDGET_MB', 0),
+            help='Do not start further entity syncs while process RSS is above this (0 = no budget)'
         )
     
     def handle(self, *args, **options):
@@ -85,20 +119,15 @@ class Command(BaseSyncCommand):
                 )
             
             # Run the sync
-            if parallel:
-                sync_results = asyncio.run(
-                    self._run_parallel_sync(
-                        entities, full_sync, dry_run, 
-                        company_id, start_date, end_date
-                    )
-                )
-            else:
-                sync_results = asyncio.run(
-                    self._run_sequential_sync(
-                        entities, full_sync, dry_run,
-                        company_id, start_date, end_date
-                    )
-                )
+            run = self._run_entity_syncs(
+                entities, full_sync, company_id, start_date, end_date,
+                max_parallel=len(entities) if parallel else options['max_parallel'],
+                memory_budget_mb=options['memory_budget_mb'],
+            )
+            sync_results = {
+                name: result.result if result.status == SUCCESS else {'error': result.error}
+                for name, result in run.results.items()
+            }
             
             # Display consolidated results
             self._display_consolidated_results(sync_results)
@@ -107,270 +136,86 @@ class Command(BaseSyncCommand):
             logger.error(f"CallRail sync failed: {e}")
             raise CommandError(f"Sync failed: {e}")
     
-    async def _run_sequential_sync(
-        self, entities, full_sync, dry_run, 
-        company_id, start_date, end_date
-    ):
-        """Run entity syncs sequentially"""
-        sync_results = {}
-        
-        # Sync accounts first (foundation data)
-        if 'accounts' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n🏢 Starting accounts sync...')
-            )
-            try:
-                accounts_engine = AccountsSyncEngine()
-                accounts_params = {}
-                if full_sync:
-                    accounts_params['force'] = True
-                accounts_result = await accounts_engine.sync_accounts(**accounts_params)
-                sync_results['accounts'] = accounts_result
-                self._display_entity_summary('accounts', accounts_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Accounts sync failed: {e}')
-                )
-                sync_results['accounts'] = {'error': str(e)}
-        
-        # Sync companies second (dependencies for other entities)
-        if 'companies' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n📋 Starting companies sync...')
-            )
-            try:
-                companies_engine = CompaniesSyncEngine()
-                companies_params = {}
-                if full_sync:
-                    companies_params['force'] = True
-                companies_result = await companies_engine.sync_companies(**companies_params)
-                sync_results['companies'] = companies_result
-                self._display_entity_summary('companies', companies_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Companies sync failed: {e}')
-                )
-                sync_results['companies'] = {'error': str(e)}
-        
-        # Sync trackers
-        if 'trackers' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n📞 Starting trackers sync...')
-            )
-            try:
-                trackers_engine = TrackersSyncEngine()
-                trackers_params = {}
-                if company_id:
-                    trackers_params['company_id'] = company_id
-                if full_sync:
-                    trackers_params['force'] = True
-                
-                trackers_result = await trackers_engine.sync_trackers(**trackers_params)
-                sync_results['trackers'] = trackers_result
-                self._display_entity_summary('trackers', trackers_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Trackers sync failed: {e}')
-                )
-                sync_results['trackers'] = {'error': str(e)}
-        
-        # Sync calls last (largest dataset)
-        if 'calls' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n☎️ Starting calls sync...')
-            )
-            try:
-                calls_engine = CallsSyncEngine()
-                
-                # Prepare calls sync parameters
-                calls_params = {}
-                if company_id:
-                    calls_params['company_id'] = company_id
-                if start_date:
-                    calls_params['start_date'] = start_date
-                if end_date:
-                    calls_params['end_date'] = end_date
-                if full_sync:
-                    calls_params['force'] = True
-                
-                calls_result = await calls_engine.sync_calls(**calls_params)
-                sync_results['calls'] = calls_result
-                self._display_entity_summary('calls', calls_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Calls sync failed: {e}')
-                )
-                sync_results['calls'] = {'error': str(e)}
-        
-        # Sync form submissions
-        if 'form_submissions' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n📝 Starting form submissions sync...')
-            )
-            try:
-                form_submissions_engine = FormSubmissionsSyncEngine()
-                form_submissions_params = {}
-                if full_sync:
-                    form_submissions_params['force'] = True
-                form_submissions_result = await form_submissions_engine.sync_form_submissions(**form_submissions_params)
-                sync_results['form_submissions'] = form_submissions_result
-                self._display_entity_summary('form_submissions', form_submissions_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Form submissions sync failed: {e}')
-                )
-                sync_results['form_submissions'] = {'error': str(e)}
+    async def _sync_entity(self, entity, full_sync, company_id, start_date, end_date):
+        """Run one entity's engine"""
+        params = {}
+        if full_sync:
+            params['force'] = True
+        if company_id and entity in ('trackers', 'calls'):
+            params['company_id'] = company_id
+        if entity == 'calls':
+            if start_date:
+                params['start_date'] = start_date
+            if end_date:
+                params['end_date'] = end_date
         
-        # Sync text messages
-        if 'text_messages' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n💬 Starting text messages sync...')
-            )
-            try:
-                text_messages_engine = TextMessagesSyncEngine()
-                text_messages_params = {}
-                if full_sync:
-                    text_messages_params['force'] = True
-                text_messages_result = await text_messages_engine.sync_text_messages(**text_messages_params)
-                sync_results['text_messages'] = text_messages_result
-                self._display_entity_summary('text_messages', text_messages_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Text messages sync failed: {e}')
-                )
-                sync_results['text_messages'] = {'error': str(e)}
+        engine_class, method = ENTITY_ENGINES[entity]
+        return await getattr(engine_class(), method)(**params)
+    
+    def _run_entity_syncs(
+        self, entities, full_sync, company_id, start_date, end_date,
+        max_parallel=1, memory_budget_mb=0
+    ):
+        """Run entity syncs concurrently, each on its own event loop
         
-        # Sync tags
-        if 'tags' in entities:
-            self.stdout.write(
-                self.style.HTTP_INFO('\n🏷️ Starting tags sync...')
+        CallRail entities are fetched straight from the API and share no
+        database dependencies, so the DAG has no edges; the shared rate limiter
+        for the CallRail API host keeps concurrent engines within the API quota.
+        """
+        steps = [
+            SyncStep(
+                name=entity,
+                run=functools.partial(
+                    self._run_entity, entity, full_sync, company_id, start_date, end_date
+                ),
             )
-            try:
-                tags_engine = TagsSyncEngine()
-                tags_params = {}
-                if full_sync:
-                    tags_params['force'] = True
-                tags_result = await tags_engine.sync_tags(**tags_params)
-                sync_results['tags'] = tags_result
-                self._display_entity_summary('tags', tags_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Tags sync failed: {e}')
-                )
-                sync_results['tags'] = {'error': str(e)}
-        
-        # Sync users
-        if 'users' in entities:
+            for entity in dict.fromkeys(entities)
+        ]
+        dag = SyncDAG(
+            steps,
+            max_parallel=max_parallel,
+            memory_budget_mb=memory_budget_mb,
+            on_start=lambda step: self.stdout.write(
+                self.style.HTTP_INFO(f"\n{ENTITY_ICONS[step.name]} Starting {step.name.replace('_', ' ')} sync...")
+            ),
+            on_finish=self._report_entity,
+        )
+        sync_record = SyncHistory.objects.create(
+            crm_source='callrail',
+            sync_type='all',
+            status='running',
+            start_time=timezone.now(),
+            configuration={'entities': entities, 'full_sync': full_sync, 'max_parallel': dag.max_parallel},
+        )
+        run = dag.run()
+
+        sync_record.end_time = timezone.now()
+        sync_record.status = 'success' if run.succeeded else (
+            'partial' if run.by_status(SUCCESS) else 'failed'
+        )
+        entity_results = [result.result or {} for result in run.by_status(SUCCESS)]
+        sync_record.records_processed = sum(result.get('total_processed', 0) for result in entity_results)
+        sync_record.records_created = sum(result.get('total_created', 0) for result in entity_results)
+        sync_record.records_updated = sum(result.get('total_updated', 0) for result in entity_results)
+        sync_record.records_failed = sum(result.get('total_errors', 0) for result in entity_results)
+        sync_record.error_message = '; '.join(
+            f"{result.name}: {result.error}" for result in run.by_status(FAILED)
+        ) or None
+        sync_record.performance_metrics = run.summary()
+        sync_record.save()
+        return run
+
+    def _run_entity(self, entity, full_sync, company_id, start_date, end_date):
+        return asyncio.run(self._sync_entity(entity, full_sync, company_id, start_date, end_date))
+
+    def _report_entity(self, result):
+        if result.status == SUCCESS:
+            self._display_entity_summary(result.name, result.result)
+        else:
             self.stdout.write(
-                self.style.HTTP_INFO('\n👥 Starting users sync...')
+                self.style.ERROR(f"❌ {result.name.replace('_', ' ').capitalize()} sync failed: {result.error}")
             )
-            try:
-                users_engine = UsersSyncEngine()
-                users_params = {}
-                if full_sync:
-                    users_params['force'] = True
-                users_result = await users_engine.sync_users(**users_params)
-                sync_results['users'] = users_result
-                self._display_entity_summary('users', users_result)
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'❌ Users sync failed: {e}')
-                )
-                sync_results['users'] = {'error': str(e)}
-        
-        return sync_results
-    
-    async def _run_parallel_sync(
-        self, entities, full_sync, dry_run,
-        company_id, start_date, end_date
-    ):
-        """Run entity syncs in parallel (experimental)"""
-        self.stdout.write(
-            self.style.WARNING('⚠️ Parallel sync is experimental')
-        )
-        
-        tasks = []
-        
-        if 'accounts' in entities:
-            accounts_engine = AccountsSyncEngine()
-            accounts_params = {}
-            if full_sync:
-                accounts_params['force'] = True
-            tasks.append(('accounts', accounts_engine.sync_accounts(**accounts_params)))
-        
-        if 'companies' in entities:
-            companies_engine = CompaniesSyncEngine()
-            companies_params = {}
-            if full_sync:
-                companies_params['force'] = True
-            tasks.append(('companies', companies_engine.sync_companies(**companies_params)))
-        
-        if 'trackers' in entities:
-            trackers_engine = TrackersSyncEngine()
-            trackers_params = {}
-            if company_id:
-                trackers_params['company_id'] = company_id
-            if full_sync:
-                trackers_params['force'] = True
-                
-            tasks.append(('trackers', trackers_engine.sync_trackers(**trackers_params)))
-        
-        if 'calls' in entities:
-            calls_engine = CallsSyncEngine()
-            calls_params = {}
-            if company_id:
-                calls_params['company_id'] = company_id
-            if start_date:
-                calls_params['start_date'] = start_date
-            if end_date:
-                calls_params['end_date'] = end_date
-            if full_sync:
-                calls_params['force'] = True
-            
-            tasks.append(('calls', calls_engine.sync_calls(**calls_params)))
-        
-        if 'form_submissions' in entities:
-            form_submissions_engine = FormSubmissionsSyncEngine()
-            form_submissions_params = {}
-            if full_sync:
-                form_submissions_params['force'] = True
-            tasks.append(('form_submissions', form_submissions_engine.sync_form_submissions(**form_submissions_params)))
-        
-        if 'text_messages' in entities:
-            text_messages_engine = TextMessagesSyncEngine()
-            text_messages_params = {}
-            if full_sync:
-                text_messages_params['force'] = True
-            tasks.append(('text_messages', text_messages_engine.sync_text_messages(**text_messages_params)))
-        
-        if 'tags' in entities:
-            tags_engine = TagsSyncEngine()
-            tags_params = {}
-            if full_sync:
-                tags_params['force'] = True
-            tasks.append(('tags', tags_engine.sync_tags(**tags_params)))
-        
-        if 'users' in entities:
-            users_engine = UsersSyncEngine()
-            users_params = {}
-            if full_sync:
-                users_params['force'] = True
-            tasks.append(('users', users_engine.sync_users(**users_params)))
-        
-        # Run all tasks in parallel
-        results = await asyncio.gather(*[task[1] for task in tasks], return_exceptions=True)
-        
-        # Map results back to entities
-        sync_results = {}
-        for i, (entity_name, _) in enumerate(tasks):
-            result = results[i]
-            if isinstance(result, Exception):
-                sync_results[entity_name] = {'error': str(result)}
-            else:
-                sync_results[entity_name] = result
-        
-        return sync_results
-    
+
     def _display_entity_summary(self, entity_name, result):
         """Display a brief summary for an entity sync"""
         if 'error' in result:
@@ -66,6 +66,7 @@ class Command(BaseSyncCommand):
                 force_overwrite=force_overwrite,
                 max_records=max_records
             )
+            engine.force_full_sync = options.get('full', False)
             
             # Test connection only
             if options.get('test_connection'):
@@ -91,6 +92,7 @@ class Command(BaseSyncCommand):
             self.stdout.write(f"Configuration:")
             self.stdout.write(f"  - Dry run: {dry_run}")
             self.stdout.write(f"  - Force sync: {force_overwrite}")
+            self.stdout.write(f"  - Incremental: {engine.incremental}")
             self.stdout.write(f"  - Batch size: {batch_size}")
             if max_records > 0:
                 self.stdout.write(f"  - Max records: {max_records}")
@@ -1,11 +1,13 @@
 """
 New HubSpot all sync command using the unified architecture
 """
-import asyncio
+import functools
 import logging
+from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
 from django.utils import timezone
+from ingestion.base.orchestration import FAILED, SUCCESS, SyncDAG, SyncStep
 from ingestion.models.common import SyncHistory
 
 logger = logging.getLogger(__name__)
@@ -69,12 +71,25 @@ class Command(BaseCommand):
             action="store_true",
             help="Skip association syncs"
         )
+        parser.add_argument(
+            "--max-parallel",
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MAX_PARALLEL', 1),
+            help="Syncs to run at once when their dependencies allow (1 = one after another)"
+        )
+        parser.add_argument(
+            "--memory-budget-mb",
+            type=int,
+            default=getattr(settings, 'SYNC_ALL_MEMORY_BUDGET_MB', 0),
+            help="Do not start further syncs while process RSS is above this (0 = no budget)"
+        )
     
     def handle(self, *args, **options):
         """Main command handler"""
         start_time = timezone.now()
         
-        # Define sync commands in order of execution
+        # Sync commands with the syncs whose records they link; the rest are
+        # independent and run concurrently
         sync_commands = [
             ('divisions', 'sync_hubspot_divisions'),
             ('contacts', 'sync_hubspot_contacts'),
@@ -90,11 +105,11 @@ class Command(BaseCommand):
         if not options.get('skip_associations'):
             sync_commands.extend([
                 ('contact-deal associations', 'sync_hubspot_associations', 
-                 ['--from-object', 'contacts', '--to-object', 'deals']),
+                 ['--from-object', 'contacts', '--to-object', 'deals'], ('contacts', 'deals')),
                 ('contact-appointment associations', 'sync_hubspot_associations', 
-                 ['--from-object', 'contacts', '--to-object', '0-421']),
+                 ['--from-object', 'contacts', '--to-object', '0-421'], ('contacts', 'appointments')),
                 ('division-contact associations', 'sync_hubspot_associations', 
-                 ['--from-object', '2-37778609', '--to-object', 'contacts']),
+                 ['--from-object', '2-37778609', '--to-object', 'contacts'], ('divisions', 'contacts')),
             ])
         
         # Common arguments for all commands
@@ -110,78 +125,116 @@ class Command(BaseCommand):
         if options.get('batch_size'):
             common_args.extend(['--batch-size', str(options['batch_size'])])
         
-        # Track results
-        results = []
-        total_processed = 0
-        total_created = 0
-        total_updated = 0
-        total_failed = 0
-        
-        self.stdout.write(self.style.NOTICE('Starting comprehensive HubSpot sync using new architecture...'))
-        
-        # Execute each sync command
+        steps = []
         for command_info in sync_commands:
-            command_name = command_info[0]
-            command_cmd = command_info[1]
+            command_name, command_cmd = command_info[0], command_info[1]
             command_args = command_info[2] if len(command_info) > 2 else []
-            
-            self.stdout.write(self.style.NOTICE(f"\n🔄 Running {command_name} sync..."))
-            
-            try:
-                # Build command arguments
-                cmd_args = common_args + command_args
-                
-                # Execute the command
-                call_command(command_cmd, *cmd_args)
-                
-                # Get the latest sync history for this command
-                sync_type = command_name.split()[0]  # Get first word as sync type
-                history = SyncHistory.objects.filter(
-                    crm_source='hubspot',
-                    sync_type=sync_type,
-                    start_time__gte=start_time
-                ).order_by('-start_time').first()
-                
-                if history:
-                    results.append({
-                        'command': command_name,
-                        'status': history.status,
-                        'processed': history.records_processed,
-                        'created': history.records_created,
-                        'updated': history.records_updated,
-                        'failed': history.records_failed,
-                        'duration': history.performance_metrics.get('duration_seconds', 0) if history.performance_metrics else 0
-                    })
-                    
-                    # Accumulate totals
-                    total_processed += history.records_processed
-                    total_created += history.records_created
-                    total_updated += history.records_updated
-                    total_failed += history.records_failed
-                
-                self.stdout.write(self.style.SUCCESS(f"✓ Completed {command_name} sync"))
-                
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"✗ Error running {command_name} sync: {e}"))
-                logger.error(f"sync_hubspot_all_new: failed at {command_name}: {e}")
-                
+            depends_on = command_info[3] if len(command_info) > 3 else ()
+            steps.append(SyncStep(
+                name=command_name,
+                run=functools.partial(
+                    self.run_sync_command, command_name, command_cmd, common_args + command_args, start_time
+                ),
+                depends_on=depends_on,
+            ))
+        dag = SyncDAG(
+            steps,
+            max_parallel=options['max_parallel'],
+            memory_budget_mb=options['memory_budget_mb'],
+            on_start=lambda step: self.stdout.write(self.style.NOTICE(f"\n🔄 Running {step.name} sync...")),
+            on_finish=self.report_step,
+        )
+        
+        sync_record = SyncHistory.objects.create(
+            crm_source='hubspot',
+            sync_type='all',
+            status='running',
+            start_time=start_time,
+            configuration={key: value for key, value in options.items() if key not in ('stdout', 'stderr')},
+        )
+        
+        self.stdout.write(self.style.NOTICE(
+            f'Starting comprehensive HubSpot sync using new architecture '
+            f'({len(steps)} syncs, up to {dag.max_parallel} at a time)...'
+        ))
+        run = dag.run()
+        
+        # Track results
+        results = []
+        for result in run.results.values():
+            if result.status == SUCCESS:
+                if result.result:
+                    results.append(result.result)
+            else:
                 results.append({
-                    'command': command_name,
+                    'command': result.name,
                     'status': 'failed',
-                    'error': str(e),
+                    'error': result.error,
                     'processed': 0,
                     'created': 0,
                     'updated': 0,
                     'failed': 0,
-                    'duration': 0
+                    'duration': result.duration_seconds,
                 })
-                
-                # Continue with other commands rather than break
-                continue
+        total_processed = sum(result['processed'] for result in results)
+        total_created = sum(result['created'] for result in results)
+        total_updated = sum(result['updated'] for result in results)
+        total_failed = sum(result['failed'] for result in results)
+        
+        sync_record.end_time = timezone.now()
+        sync_record.status = 'success' if run.succeeded else (
+            'partial' if run.by_status(SUCCESS) else 'failed'
+        )
+        sync_record.records_processed = total_processed
+        sync_record.records_created = total_created
+        sync_record.records_updated = total_updated
+        sync_record.records_failed = total_failed
+        sync_record.error_message = '; '.join(
+            f"{result.name}: {result.error}" for result in run.by_status(FAILED)
+        ) or None
+        sync_record.performance_metrics = {
+            **run.summary(),
+            'duration_seconds': (sync_record.end_time - start_time).total_seconds(),
+        }
+        sync_record.save()
         
         # Generate final report
         self.generate_final_report(results, total_processed, total_created, total_updated, total_failed, start_time)
     
+    def run_sync_command(self, command_name, command_cmd, cmd_args, start_time):
+        """Run one sync command and return its results from the SyncHistory row it wrote"""
+        call_command(command_cmd, *cmd_args)
+        
+        # Get the latest sync history for this command
+        sync_type = command_name.split()[0]  # Get first word as sync type
+        history = SyncHistory.objects.filter(
+            crm_source='hubspot',
+            sync_type=sync_type,
+            start_time__gte=start_time
+        ).order_by('-start_time').first()
+        
+        if not history:
+            return None
+        return {
+            'command': command_name,
+            'status': history.status,
+            'processed': history.records_processed,
+            'created': history.records_created,
+            'updated': history.records_updated,
+            'failed': history.records_failed,
+            'duration': history.performance_metrics.get('duration_seconds', 0) if history.performance_metrics else 0
+        }
+    
+    def report_step(self, result):
+        """Print one finished sync"""
+        if result.status == SUCCESS:
+            self.stdout.write(self.style.SUCCESS(f"✓ Completed {result.name} sync"))
+        elif result.status == FAILED:
+            self.stdout.write(self.style.ERROR(f"✗ Error running {result.name} sync: {result.error}"))
+            logger.error(f"sync_hubspot_all_new: failed at {result.name}: {result.error}")
+        else:
+            self.stdout.write(self.style.WARNING(f"⏭ Skipped {result.name} sync: {result.error}"))
+    
     def generate_final_report(self, results, total_processed, total_created, total_updated, total_failed, start_time):
         """Generate and display the final sync report"""
         end_time = timezone.now()
@@ -80,10 +80,14 @@ This ensures all association data is replaced with the latest from HubSpot."""
         """Get the sync operation name"""
         return "associations"
     
+    def get_history_sync_type(self, **options) -> str:
+        """The engine records history per association type"""
+        return f"associations_{options.get('association_type', 'contact_appointment')}"
+    
     async def run_sync(self, **options):
         """Run the association sync with enhanced parameters"""
         # Determine last sync time
-        last_sync = self.get_last_sync_time(**options)
+        last_sync = await self.get_last_sync_time_async(**options)
         
         # Get association type
         association_type = options.get('association_type', 'contact_appointment')
@@ -3,6 +3,7 @@ import os
 import aiohttp
 import asyncio
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.management.base import CommandError
 from ingestion.base.commands import BaseSyncCommand
 from ingestion.marketsharp.marketsharp_api import MarketSharpAPI  # Updated import path
@@ -40,8 +41,8 @@ class Command(BaseSyncCommand):
         parser.add_argument(
             '--concurrent',
             type=int,
-            default=1,
-            help='Number of concurrent tasks to run (default: 1).'
+            default=None,
+            help='Number of pages to fetch ahead concurrently (default: MARKETSHARP_PREFETCH_PAGES).'
         )
 
     async def get_latest_update(self, endpoint):
@@ -72,7 +73,7 @@ class Command(BaseSyncCommand):
             logging.basicConfig(level=logging.INFO)
             
         endpoint = options.get('endpoint')
-        concurrent = options.get('concurrent', 1)
+        concurrent = options.get('concurrent')
         
         self.stdout.write(
             self.style.SUCCESS('Starting MarketSharp data sync...')
@@ -130,49 +131,37 @@ class Command(BaseSyncCommand):
         dry_run = options.get('dry_run', False) if options else False
         max_records = options.get('max_records', 0) if options else 0
 
+        model = self.registry.models[endpoint]
+        batch_size = options.get('batch_size', BATCH_SIZE) if options else BATCH_SIZE
+        prefetch = (options.get('concurrent') if options else None) or getattr(settings, 'MARKETSHARP_PREFETCH_PAGES', 3)
+        total_records_processed = 0
+
         async with aiohttp.ClientSession() as session:
-            skip = 0
-            total_records_processed = 0
-            batch_size = options.get('batch_size', BATCH_SIZE) if options else BATCH_SIZE
+            # Pages download `prefetch` ahead and are parsed as they stream in;
+            # entries go to the processor in page order
+            pages = ms_api.iter_entry_pages(session, url, data_processor, latest_update, prefetch=prefetch)
+            try:
+                async for entries in pages:
+                    if max_records > 0:
+                        entries = entries[:max_records - total_records_processed]
+
+                    if dry_run:
+                        num_records = len(entries)
+                        self._logger.info(f"DRY RUN: Would process {num_records} records for endpoint: {endpoint}")
+                    else:
+                        num_records = await processor.process_entries(
+                            entries, model, processor.field_mappings, batch_size
+                        )
+                    total_records_processed += num_records
+                    self._logger.info(f"Processed {num_records} records for endpoint: {endpoint}. Total processed: {total_records_processed}")
 
-            while True:
-                try:
-                    # Check max_records limit
                     if max_records > 0 and total_records_processed >= max_records:
                         self._logger.info(f"Reached max records limit ({max_records}) for endpoint: {endpoint}")
                         break
-                        
-                    self._logger.info(f"Fetching batch starting at record {skip}...")
-                    xml_data = await ms_api.get_data(session, url, latest_update, skip=skip)
-                    
-                    if xml_data:
-                        # Adjust batch size if approaching max_records limit
-                        effective_batch_size = batch_size
-                        if max_records > 0:
-                            remaining = max_records - total_records_processed
-                            effective_batch_size = min(batch_size, remaining)
-                        
-                        if dry_run:
-                            # In dry-run mode, just count records without processing
-                            num_records = min(effective_batch_size, len(xml_data))  
-                            self._logger.info(f"DRY RUN: Would process {num_records} records for endpoint: {endpoint}")
-                        else:
-                            num_records = await processor.process_objects(xml_data, effective_batch_size)
-                            
-                        total_records_processed += num_records
-                        self._logger.info(f"Processed {num_records} records for endpoint: {endpoint}. Total processed: {total_records_processed}")
-
-                        if num_records < effective_batch_size:
-                            self._logger.info(f"All records processed for endpoint: {endpoint}.")
-                            break
-
-                        skip += effective_batch_size
-                    else:
-                        self._logger.warning(f"No data returned for endpoint: {endpoint}.")
-                        break
-                except Exception as e:
-                    self._logger.error(f"Error occurred while processing endpoint {endpoint}: {e}")
-                    break
+            except Exception as e:
+                self._logger.error(f"Error occurred while processing endpoint {endpoint}: {e}")
+            finally:
+                await pages.aclose()
 
         duration = DateTime.now() - start_time
         self._logger.info(f"Finished processing endpoint: {endpoint}. Total records processed: {total_records_processed}. Duration: {duration}.")
@@ -9,6 +9,8 @@ from enum import Enum
 from dataclasses import dataclass
 from functools import lru_cache
 
+from ingestion.base.bulk_upsert import BulkUpserter
+
 class FieldType(Enum):
     UUID = 'uuid'
     DATETIME = 'datetime'
@@ -161,7 +163,6 @@ class BaseProcessor:
 
         try:
             valid_records: List[Tuple[UUID, Dict[str, Any]]] = []
-            record_ids: List[UUID] = []
               # Find primary key mapping with error handling
             try:
                 pk_key, pk_model_field = self.find_primary_key_mapping(field_mappings)
@@ -177,30 +178,24 @@ class BaseProcessor:
                     
                     if object_id and data:
                         valid_records.append((object_id, data))
-                        record_ids.append(object_id)
                     else:
                         result.failed += 1
 
             if not valid_records:
                 return result.successful
 
-            # Fetch existing records using the correct primary key field
-            filter_kwargs = {f"{pk_model_field}__in": record_ids}
-            existing_records = await sync_to_async(lambda: set(
-                model.objects.filter(**filter_kwargs).values_list(pk_model_field, flat=True)
-            ))()            # Prepare records for database operations
-            records_to_insert = []
-            records_to_update = []
-
+            records = []
             for object_id, data in valid_records:
                 data[pk_model_field] = object_id  # Use the correct primary key field
-                if object_id in existing_records:
-                    records_to_update.append(model(**data))
-                else:
-                    records_to_insert.append(model(**data))
-
-            # Perform database operations
-            await self.bulk_operations(model, records_to_insert, records_to_update, batch_size)
+                records.append(data)
+
+            # One bulk upsert on the primary key instead of an existence query
+            # plus separate inserts and updates
+            counts = await self.bulk_upsert(model, pk_model_field, records)
+            self.logger.info(
+                f"Upserted {len(records)} {model.__name__} records "
+                f"({counts['created']} created, {counts['updated']} updated)"
+            )
             result.successful = len(valid_records)
 
         except Exception as e:
@@ -211,22 +206,8 @@ class BaseProcessor:
         return result.successful
 
     @sync_to_async
-    def bulk_operations(self, model, records_to_insert, records_to_update, batch_size):
-        """Perform bulk database operations with improved error handling."""
+    def bulk_upsert(self, model, pk_model_field: str, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Write records with one INSERT ... ON CONFLICT on the primary key field."""
+        upserter = BulkUpserter(model, unique_fields=[pk_model_field])
         with transaction.atomic():
-            if records_to_insert:
-                self.logger.info(f"Inserting {len(records_to_insert)} new records")
-                model.objects.bulk_create(
-                    records_to_insert,
-                    batch_size=batch_size,
-                    ignore_conflicts=True
-                )
-
-            if records_to_update:
-                self.logger.info(f"Updating {len(records_to_update)} existing records")
-                fields_to_update = list(self.get_model_fields(model))
-                model.objects.bulk_update(
-                    records_to_update,
-                    fields=fields_to_update,
-                    batch_size=batch_size
-                )
\ No newline at end of file
+            return upserter.upsert(records)
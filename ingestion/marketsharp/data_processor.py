@@ -1,6 +1,70 @@
+import codecs
 import xml.etree.ElementTree as ET
 import re
 from functools import cached_property
+from typing import Callable, Dict, List, Optional, Union
+
+ATOM_ENTRY = '{http://www.w3.org/2005/Atom}entry'
+ODATA_PROPERTIES = '{http://schemas.microsoft.com/ado/2007/08/dataservices/metadata}properties'
+
+
+class EntryStream:
+    """
+    Incremental parser for an OData Atom feed.
+
+    Response chunks are fed as they arrive and each finished ``<entry>`` is
+    returned as a ``{property: text}`` dict and dropped from the tree, so only
+    the entry being read is ever held as elements.
+    """
+
+    def __init__(self, sanitize: Callable[[str], str]):
+        self._sanitize = sanitize
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._tail = ''
+        self._root = None
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Dict[str, Optional[str]]]:
+        """Parse one chunk and return the entries it completed"""
+        text = self._tail + (self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        # Hold back a trailing entity or character reference cut by the chunk boundary
+        cut = text.rfind('&')
+        if cut != -1 and ';' not in text[cut:]:
+            text, self._tail = text[:cut], text[cut:]
+        else:
+            self._tail = ''
+        if text:
+            self._parser.feed(self._sanitize(text))
+        return self._read_entries()
+
+    def close(self) -> List[Dict[str, Optional[str]]]:
+        """Finish the document, raising ``ET.ParseError`` if it was malformed"""
+        text = self._tail + self._decoder.decode(b'', final=True)
+        self._tail = ''
+        if text:
+            self._parser.feed(self._sanitize(text))
+        self._parser.close()
+        return self._read_entries()
+
+    def _read_entries(self) -> List[Dict[str, Optional[str]]]:
+        entries = []
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag != ATOM_ENTRY:
+                continue
+            record = {}
+            for properties in element.iter(ODATA_PROPERTIES):
+                for prop in properties:
+                    record[prop.tag.split('}')[1]] = prop.text
+            entries.append(record)
+            try:
+                self._root.remove(element)
+            except ValueError:
+                element.clear()
+        return entries
 
 
 class DataProcessor:
@@ -32,20 +96,18 @@ class DataProcessor:
         # Substitute invalid characters with an empty string
         return invalid_xml_char_pattern.sub('', xml_data)
 
+    def entry_stream(self) -> EntryStream:
+        """Incremental parser for one OData page (see EntryStream)"""
+        return EntryStream(self.sanitize_xml)
+
     def parse_xml(self, xml_data: str):
         """
         Parse the given XML data and return a list of dictionaries representing the records.
         """
         try:
-            sanitized_xml_data = self.sanitize_xml(xml_data)
-            root = ET.fromstring(sanitized_xml_data)
-            entries = []
-            for entry in root.findall(".//{http://www.w3.org/2005/Atom}entry"):
-                record = {}
-                for prop in entry.findall(".//m:properties/*", namespaces=self.nsmap):
-                    tag_name = prop.tag.split("}")[1]  # Remove namespace
-                    record[tag_name] = prop.text
-                entries.append(record)
+            stream = self.entry_stream()
+            entries = stream.feed(xml_data)
+            entries.extend(stream.close())
             self._logger.info(f"Parsed {len(entries)} records from the XML data.")
             return entries
         except ET.ParseError as e:
@@ -71,12 +133,3 @@ class DataProcessor:
         except ValueError:
             self._logger.warning(f"Could not convert '{text_value}' to float for tag '{tag_name}'")
             return None
-
-    async def process_objects(self, xml_data, batch_size):
-        """
-        Process the XML data and perform necessary operations.
-        This is a placeholder implementation. Replace with actual logic.
-        """
-        self._logger.info(f"Processing {len(xml_data)} records in batches of {batch_size}.")
-        # ...process the data...
-        return len(xml_data)  # Return the number of processed records
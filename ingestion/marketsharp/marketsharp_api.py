@@ -3,12 +3,18 @@ import asyncio
 import hmac
 import hashlib
 from base64 import b64decode, b64encode
+from collections import deque
+from contextlib import asynccontextmanager
 from time import time
 import logging
 
 MAX_RETRIES = 5
 RETRY_DELAY = 10  # seconds to wait before retrying after a 503 error
 RECORDS_PER_PAGE = 5000
+# Transient statuses worth retrying; other 4xx responses (bad filter, unknown
+# entity set) fail the same way on every attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+CHUNK_SIZE = 64 * 1024
 
 logger = logging.getLogger(__name__)
 
@@ -51,40 +57,108 @@ class MarketSharpAPI:
         h = hmac.new(secret_key, msg, hashlib.sha256).digest()
         return b64encode(h).decode('utf-8')
 
-    async def get_data(self, session, url, last_update=None, skip=0):
-        headers = self._get_headers()
+    def _page_url(self, url, last_update=None, skip=0, top=RECORDS_PER_PAGE):
+        paginated_url = f"{url}?$top={top}&$skip={skip}"
         if last_update:
             # Format last_update to OData compatible string
             last_update_str = f"datetime'{last_update.strftime('%Y-%m-%dT%H:%M:%S')}'"
-            filter_query = f"lastUpdate gt {last_update_str}"
-        else:
-            filter_query = ''
-        paginated_url = f"{url}?$top={RECORDS_PER_PAGE}&$skip={skip}"
-        if filter_query:
-            paginated_url += f"&$filter={filter_query}&$orderby=lastUpdate asc"
-        attempts = 0
-        while attempts < MAX_RETRIES:
+            paginated_url += f"&$filter=lastUpdate gt {last_update_str}&$orderby=lastUpdate asc"
+        return paginated_url
+
+    @asynccontextmanager
+    async def _open(self, session, url):
+        """Yield the 200 response for ``url``, retrying transient failures.
+
+        429 and 5xx responses and network errors are retried up to MAX_RETRIES
+        times with a doubling delay (or the server's Retry-After); any other
+        status raises at once.
+        """
+        for attempt in range(MAX_RETRIES):
+            delay = RETRY_DELAY * 2 ** attempt
+            self._logger.info(f"Fetching URL: {url} (attempt {attempt + 1} of {MAX_RETRIES})")
             try:
-                self._logger.info(f"Attempt {attempts + 1} of {MAX_RETRIES}")
-                self._logger.info(f"Fetching URL: {paginated_url}")
-                async with session.get(paginated_url, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.text()
-                    elif response.status == 503:
-                        self._logger.warning(f"503 Service Unavailable. Retrying after {RETRY_DELAY} seconds...")
-                        await asyncio.sleep(RETRY_DELAY)
-                    elif response.status in (400, 404):
-                        self._logger.warning(f"{response.status}: The server encountered an error. Retrying after {RETRY_DELAY} seconds...")
-                        await asyncio.sleep(RETRY_DELAY)
-                    else:
-                        self._logger.error(f"Error {response.status}: {await response.text()}")
-                        raise Exception(f"Server error {response.status}: {await response.text()}")
+                # The signature embeds a timestamp, so sign every attempt afresh
+                response = await session.get(url, headers=self._get_headers())
             except aiohttp.ClientError as e:
-                self._logger.error(f"Network error: {e}")
-                raise Exception(f"Network error while fetching MarketSharp data: {e}")
-            attempts += 1
+                if attempt + 1 == MAX_RETRIES:
+                    raise Exception(f"Network error while fetching MarketSharp data: {e}")
+                self._logger.warning(f"Network error: {e}. Retrying after {delay} seconds...")
+                await asyncio.sleep(delay)
+                continue
+
+            try:
+                if response.status == 200:
+                    yield response
+                    return
+                body = await response.text()
+                if response.status not in RETRY_STATUSES:
+                    self._logger.error(f"Error {response.status}: {body}")
+                    raise Exception(f"Server error {response.status}: {body}")
+                retry_after = response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = int(retry_after)
+                self._logger.warning(f"{response.status} from MarketSharp. Retrying after {delay} seconds...")
+            finally:
+                response.release()
+            await asyncio.sleep(delay)
 
         raise Exception(f"Failed to fetch data from MarketSharp after {MAX_RETRIES} attempts.")
+
+    async def get_data(self, session, url, last_update=None, skip=0):
+        async with self._open(session, self._page_url(url, last_update, skip)) as response:
+            return await response.text()
+
+    async def get_entries(self, session, url, data_processor, last_update=None, skip=0,
+                          top=RECORDS_PER_PAGE):
+        """Fetch one page, parsing entries while the response body downloads.
+
+        The page is never held as text or as a DOM; only its entry dicts are
+        returned.
+        """
+        async with self._open(session, self._page_url(url, last_update, skip, top)) as response:
+            stream = data_processor.entry_stream()
+            entries = []
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                entries.extend(stream.feed(chunk))
+            entries.extend(stream.close())
+        self._logger.info(f"Parsed {len(entries)} records from page at {skip}")
+        return entries
+
+    async def iter_entry_pages(self, session, url, data_processor, last_update=None,
+                               prefetch=1, top=RECORDS_PER_PAGE):
+        """Yield each page's entries in order, fetching up to ``prefetch`` pages ahead.
+
+        Pages are yielded in ``$skip`` order even though they download
+        concurrently, so an incremental run ordered by lastUpdate writes its
+        records in that order. Iteration ends at the first short page; pages
+        fetched past it are cancelled.
+        """
+        prefetch = max(1, prefetch)
+        pending = deque()
+        next_skip = 0
+
+        def schedule():
+            nonlocal next_skip
+            pending.append(asyncio.ensure_future(
+                self.get_entries(session, url, data_processor, last_update, next_skip, top)
+            ))
+            next_skip += top
+
+        try:
+            for _ in range(prefetch):
+                schedule()
+            while pending:
+                entries = await pending.popleft()
+                if len(entries) < top:
+                    if entries:
+                        yield entries
+                    return
+                schedule()
+                yield entries
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
     
     async def get_related_data(self, session, url, record_id, relation):
         related_url = f"{url}('{record_id}')/{relation}"
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-16 20:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0198_googlesheetmarketinglead_event_field_marketer_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncRecordFingerprint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100)),
+                ('record_key', models.CharField(max_length=255)),
+                ('content_hash', models.CharField(max_length=32)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Sync Record Fingerprint',
+                'verbose_name_plural': 'Sync Record Fingerprints',
+                'db_table': '"orchestration"."sync_record_fingerprint"',
+                'db_table_comment': 'Content fingerprints of synced records for change detection',
+                'managed': True,
+            },
+        ),
+        migrations.AddField(
+            model_name='synchistory',
+            name='records_skipped',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddConstraint(
+            model_name='syncrecordfingerprint',
+            constraint=models.UniqueConstraint(fields=('model_label', 'record_key'), name='sync_fingerprint_record_uniq'),
+        ),
+    ]
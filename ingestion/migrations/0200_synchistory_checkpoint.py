@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0199_syncrecordfingerprint_synchistory_records_skipped'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='synchistory',
+            name='checkpoint',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='synchistory',
+            name='checkpoint_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingestion', '0200_synchistory_checkpoint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyncQuarantinedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('crm_source', models.CharField(max_length=50)),
+                ('sync_type', models.CharField(max_length=100)),
+                ('record_key', models.CharField(blank=True, default='', max_length=255)),
+                ('payload', models.JSONField(default=dict)),
+                ('error_type', models.CharField(max_length=100)),
+                ('error_message', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sync_history', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='quarantined_records', to='ingestion.synchistory')),
+            ],
+            options={
+                'verbose_name': 'Sync Quarantined Record',
+                'verbose_name_plural': 'Sync Quarantined Records',
+                'db_table': '"orchestration"."sync_quarantined_record"',
+                'db_table_comment': 'Records rejected by a sync write, isolated by batch bisection',
+                'managed': True,
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['crm_source', 'sync_type'], name='sync_quarantine_source_idx'), models.Index(fields=['created_at'], name='sync_quarantine_created_idx')],
+            },
+        ),
+    ]
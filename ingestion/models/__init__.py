@@ -1,5 +1,5 @@
 # Import common models
-from .common import SyncHistory, SyncConfiguration, APICredential, SyncSchedule
+from .common import SyncHistory, SyncConfiguration, APICredential, SyncSchedule, SyncRecordFingerprint, SyncQuarantinedRecord
 
 # Import Genius models
 from .genius import (
@@ -93,7 +93,7 @@ __all__ = [
     'SyncSchedule',
     
     # Common models
-    'SyncHistory', 'SyncConfiguration', 'APICredential',
+    'SyncHistory', 'SyncConfiguration', 'APICredential', 'SyncRecordFingerprint', 'SyncQuarantinedRecord',
     
     # Genius models
     'Genius_DivisionGroup', 'Genius_Division', 'Genius_UserData', 'Genius_UserTitle',
@@ -30,6 +30,7 @@ class SyncHistory(models.Model):
     records_created = models.IntegerField(default=0)
     records_updated = models.IntegerField(default=0)
     records_failed = models.IntegerField(default=0)
+    records_skipped = models.IntegerField(default=0)  # unchanged content, write skipped
     
     # Error handling
     error_message = models.TextField(null=True, blank=True)
@@ -38,6 +39,10 @@ class SyncHistory(models.Model):
     configuration = models.JSONField(default=dict)
     performance_metrics = models.JSONField(default=dict)
     
+    # Resume support: last persisted stream cursor of a running sync
+    checkpoint = models.JSONField(null=True, blank=True)
+    checkpoint_at = models.DateTimeField(null=True, blank=True)
+    
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
     
@@ -85,6 +90,64 @@ class SyncHistory(models.Model):
         
         return last_sync.end_time if last_sync else None
 
+class SyncRecordFingerprint(models.Model):
+    """Content hash of the last version of a record written by a sync.
+    
+    Compared in bulk before writing so unchanged records can be skipped.
+    """
+    
+    model_label = models.CharField(max_length=100)  # e.g. 'ingestion.Hubspot_Contact'
+    record_key = models.CharField(max_length=255)
+    content_hash = models.CharField(max_length=32)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        # Use quoting hack so Django emits "orchestration"."sync_record_fingerprint" for PostgreSQL
+        db_table = '"orchestration"."sync_record_fingerprint"'
+        managed = True
+        db_table_comment = 'Content fingerprints of synced records for change detection'
+        constraints = [
+            models.UniqueConstraint(fields=['model_label', 'record_key'], name='sync_fingerprint_record_uniq'),
+        ]
+        verbose_name = 'Sync Record Fingerprint'
+        verbose_name_plural = 'Sync Record Fingerprints'
+    
+    def __str__(self):
+        return f"{self.model_label}:{self.record_key}"
+
+class SyncQuarantinedRecord(models.Model):
+    """Record a sync could not write, kept with the error that rejected it.
+
+    Filled by the bisecting batch recovery (ingestion.base.recovery).
+    """
+
+    crm_source = models.CharField(max_length=50)
+    sync_type = models.CharField(max_length=100)
+    sync_history = models.ForeignKey(
+        SyncHistory, null=True, blank=True, on_delete=models.SET_NULL, related_name='quarantined_records'
+    )
+    record_key = models.CharField(max_length=255, blank=True, default='')
+    payload = models.JSONField(default=dict)
+    error_type = models.CharField(max_length=100)
+    error_message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # Use quoting hack so Django emits "orchestration"."sync_quarantined_record" for PostgreSQL
+        db_table = '"orchestration"."sync_quarantined_record"'
+        managed = True
+        db_table_comment = 'Records rejected by a sync write, isolated by batch bisection'
+        indexes = [
+            models.Index(fields=['crm_source', 'sync_type'], name='sync_quarantine_source_idx'),
+            models.Index(fields=['created_at'], name='sync_quarantine_created_idx'),
+        ]
+        verbose_name = 'Sync Quarantined Record'
+        verbose_name_plural = 'Sync Quarantined Records'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.crm_source} {self.sync_type}:{self.record_key} ({self.error_type})"
+
 class SyncSchedule(models.Model):
     """Defines scheduled syncs (moved next to SyncHistory)."""
 
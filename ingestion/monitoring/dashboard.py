@@ -19,6 +19,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from ingestion.models.common import SyncHistory
 from ingestion.base.performance import PerformanceMonitor, PerformanceMetrics
+from ingestion.base.stage_timing import stage_breakdown
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,9 @@ class DashboardMetrics:
     total_records_processed: int = 0
     avg_memory_usage: float = 0.0
     avg_cpu_usage: float = 0.0
+    # Seconds, share of time and records/sec per sync stage (fetch_wait, transform, save, ...)
+    stage_breakdown: Dict[str, Dict] = None
+    stage_breakdown_by_crm: Dict[str, Dict] = None
     
     # Quality metrics
     data_quality_score: float = 0.0
@@ -56,6 +60,10 @@ class DashboardMetrics:
             self.top_errors = []
         if self.error_trends is None:
             self.error_trends = []
+        if self.stage_breakdown is None:
+            self.stage_breakdown = {}
+        if self.stage_breakdown_by_crm is None:
+            self.stage_breakdown_by_crm = {}
 
 class MonitoringDashboard:
     """Enterprise monitoring dashboard"""
@@ -98,7 +106,7 @@ class MonitoringDashboard:
             start_time__gte=start_time,
             start_time__lt=end_time,
             status__in=['success', 'partial']
-        ).values('performance_metrics', 'records_processed'))
+        ).values('crm_source', 'performance_metrics', 'records_processed'))
     
     @sync_to_async
     def get_quality_data(self, start_time: datetime, end_time: datetime) -> List[Dict]:
@@ -169,11 +177,13 @@ class MonitoringDashboard:
         total_duration = 0
         memory_usage_samples = []
         cpu_usage_samples = []
+        stage_metrics_by_crm = defaultdict(list)
         
         # sync_histories is already a list from the sync_to_async wrapper
         for history in sync_histories:
-            metrics = history.get('performance_metrics', {})
+            metrics = history.get('performance_metrics') or {}
             records = history.get('records_processed', 0)
+            stage_metrics_by_crm[history.get('crm_source')].append(metrics)
             
             total_records += records
             
@@ -195,7 +205,15 @@ class MonitoringDashboard:
             'avg_processing_speed': avg_processing_speed,
             'total_records_processed': total_records,
             'avg_memory_usage': avg_memory_usage,
-            'avg_cpu_usage': avg_cpu_usage
+            'avg_cpu_usage': avg_cpu_usage,
+            'stage_breakdown': stage_breakdown(
+                metrics for runs in stage_metrics_by_crm.values() for metrics in runs
+            ),
+            'stage_breakdown_by_crm': {
+                crm_source: breakdown
+                for crm_source, runs in stage_metrics_by_crm.items()
+                if (breakdown := stage_breakdown(runs))
+            },
         }
     
     async def get_quality_metrics(self, start_time: datetime, end_time: datetime) -> Dict:
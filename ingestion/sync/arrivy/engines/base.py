@@ -14,6 +14,7 @@ from django.utils import timezone
 from django.db import transaction
 
 from ingestion.base.sync_engine import BaseSyncEngine
+from ingestion.base.bulk_upsert import BulkUpserter
 from ingestion.base.exceptions import SyncException, ValidationException
 from ingestion.models.common import SyncHistory
 from ..clients.base import ArrivyBaseClient
@@ -184,6 +185,7 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
             'records_created': metrics.get('created', 0),
             'records_updated': metrics.get('updated', 0),
             'records_failed': metrics.get('failed', 0),
+            'records_skipped': metrics.get('skipped', 0),
             'performance_metrics': {
                 'duration_seconds': metrics.get('duration_seconds', 0),
                 'records_per_second': metrics.get('records_per_second', 0),
@@ -327,6 +329,7 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
             'created': 0,
             'updated': 0,
             'failed': 0,
+            'skipped': 0,
             'api_calls': 0,
             'batches_processed': 0
         }
@@ -363,6 +366,7 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
                 metrics['created'] += batch_results.get('created', 0)
                 metrics['updated'] += batch_results.get('updated', 0) 
                 metrics['failed'] += batch_results.get('failed', 0)
+                metrics['skipped'] += batch_results.get('skipped', 0)
                 metrics['batches_processed'] += 1
                 
                 logger.debug(f"Batch {batch_count} results: {batch_results}")
@@ -406,7 +410,7 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
     
     async def _bulk_upsert_records(self, batch: List[Dict], model_class) -> Dict[str, int]:
         """
-        Perform bulk upsert with conflict resolution using Django's bulk_create with update_conflicts
+        Perform bulk upsert with conflict resolution through the shared COPY/staging-table backend
         
         Args:
             batch: Batch of records to upsert
@@ -415,7 +419,7 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
         Returns:
             Upsert results
         """
-        results = {'created': 0, 'updated': 0, 'failed': 0}
+        results = {'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
         if not batch:
             return results
             
@@ -425,52 +429,14 @@ class ArrivyBaseSyncEngine(BaseSyncEngine):
             # Get unique field name for this model (usually 'id' but could be different)
             unique_field = self.processor.get_unique_field_name() if hasattr(self.processor, 'get_unique_field_name') else 'id'
             
-            # Check existing records to calculate created vs updated counts
-            existing_ids = set()
-            unique_values = [record.get(unique_field) for record in batch if record.get(unique_field)]
-            if unique_values:
-                existing_ids = set(await sync_to_async(list)(
-                    model_class.objects.filter(
-                        **{f"{unique_field}__in": unique_values}
-                    ).values_list(unique_field, flat=True)
-                ))
-            
-            # Prepare model objects for bulk_create
-            model_objects = []
-            for record in batch:
-                try:
-                    model_objects.append(model_class(**record))
-                except Exception as e:
-                    logger.warning(f"Failed to create model object for record {record.get(unique_field)}: {e}")
-                    results['failed'] += 1
-            
-            if not model_objects:
-                return results
-            
-            # Get all updatable fields (exclude auto fields and primary key)
-            update_fields = []
-            for field in model_class._meta.fields:
-                # Skip auto fields, primary key, and auto_now_add fields
-                if (not field.auto_created and 
-                    not field.primary_key and 
-                    not getattr(field, 'auto_now_add', False)):
-                    update_fields.append(field.name)
-            
-            # Perform bulk upsert
-            await sync_to_async(model_class.objects.bulk_create)(
-                model_objects,
-                batch_size=self.batch_size,
-                update_conflicts=True,
-                update_fields=update_fields,
-                unique_fields=[unique_field]
-            )
-            
-            # Calculate results based on existing vs new records
-            total_success = len(model_objects)
-            results['updated'] = len(existing_ids.intersection(set(unique_values)))
-            results['created'] = total_success - results['updated']
+            upserter = BulkUpserter(model_class, unique_fields=[unique_field], skip_unchanged=True)
+            counts = await sync_to_async(upserter.upsert)(batch)
+            results['created'] = counts['created']
+            results['updated'] = counts['updated']
+            results['skipped'] = counts['skipped']
             
-            logger.info(f"Bulk upsert completed: {results['created']} created, {results['updated']} updated, {results['failed']} failed")
+            logger.info(f"Bulk upsert completed: {results['created']} created, {results['updated']} updated, "
+                        f"{results['skipped']} unchanged, {results['failed']} failed")
             
         except Exception as e:
             logger.error(f"Bulk upsert failed: {e}")
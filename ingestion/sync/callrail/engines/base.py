@@ -6,6 +6,7 @@ from typing import Dict, Any, List, Optional
 from django.db import transaction
 from asgiref.sync import sync_to_async
 from ingestion.base.sync_engine import BaseSyncEngine
+from ingestion.base.recovery import bisect_batch, quarantine_records
 
 logger = logging.getLogger(__name__)
 
@@ -82,8 +83,8 @@ class CallRailBaseSyncEngine(BaseSyncEngine):
         try:
             return self._efficient_bulk_save(records, model_class, primary_key)
         except Exception as e:
-            logger.warning(f"Bulk operations failed, falling back to individual saves: {e}")
-            return self._individual_save_fallback(records, model_class, primary_key)
+            logger.warning(f"Bulk operations failed, bisecting the batch to isolate bad records: {e}")
+            return self._bisect_save_fallback(records, model_class, primary_key, e)
     
     def _efficient_bulk_save(self, records: List[Dict], model_class, primary_key: str) -> Dict[str, int]:
         """Efficient bulk save using Django bulk_create and bulk_update"""
@@ -182,47 +183,21 @@ class CallRailBaseSyncEngine(BaseSyncEngine):
             'error_details': error_details
         }
     
-    def _individual_save_fallback(self, records: List[Dict], model_class, primary_key: str) -> Dict[str, int]:
-        """Fallback to individual saves if bulk operations fail"""
-        created_count = 0
-        updated_count = 0
-        error_count = 0
-        error_details = []
-        
-        logger.warning(f"Using individual save fallback for {len(records)} records")
-        
-        with transaction.atomic():
-            for record in records:
-                if not record.get(primary_key):
-                    error_count += 1
-                    error_details.append(f"Missing primary key {primary_key}")
-                    continue
-                    
-                try:
-                    # Try to get existing record
-                    existing = model_class.objects.filter(**{primary_key: record[primary_key]}).first()
-                    
-                    if existing:
-                        # Update existing record
-                        for field, value in record.items():
-                            if hasattr(existing, field):
-                                setattr(existing, field, value)
-                        existing.save()
-                        updated_count += 1
-                    else:
-                        # Create new record
-                        model_class.objects.create(**record)
-                        created_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error saving record {record.get(primary_key)}: {e}")
-                    error_count += 1
-                    error_details.append(f"Record {record.get(primary_key)}: {str(e)}")
-                    continue
-        
+    def _bisect_save_fallback(self, records: List[Dict], model_class, primary_key: str,
+                              error: Exception) -> Dict[str, int]:
+        """Retry halves of a failed batch in bulk until the bad records are isolated and quarantined"""
+        outcome = bisect_batch(
+            records, lambda chunk: self._efficient_bulk_save(chunk, model_class, primary_key), error=error
+        )
+        quarantine_records(
+            outcome.failures, self.crm_source, model_class._meta.model_name,
+            sync_history=getattr(self, 'sync_history', None), key_field=primary_key
+        )
         return {
-            'created': created_count, 
-            'updated': updated_count,
-            'errors': error_count,
-            'error_details': error_details
+            'created': outcome.results.get('created', 0),
+            'updated': outcome.results.get('updated', 0),
+            'errors': outcome.results.get('errors', 0) + len(outcome.failures),
+            'error_details': outcome.results.get('error_details', []) + [
+                f"Record {record.get(primary_key)}: {failure}" for record, failure in outcome.failures
+            ],
         }
@@ -3,9 +3,11 @@ Base Five9 API Client
 Handles WSDL connections and authentication for Five9 Web Services
 """
 import os
+import threading
 import requests
 import zeep
 from zeep import Transport
+from zeep.wsdl import Document
 from requests.auth import HTTPBasicAuth
 from django.conf import settings
 from typing import Optional, Dict, Any
@@ -15,6 +17,12 @@ from ....config.five9_config import Five9Config
 
 logger = logging.getLogger(__name__)
 
+# Parsed WSDL documents by URL, shared by every client in the process. Parsing
+# the Admin/Supervisor WSDLs is the slow part of connecting; the per-session
+# state (auth, cookies) lives on each client's transport, not the document.
+_wsdl_documents: Dict[str, Document] = {}
+_wsdl_lock = threading.Lock()
+
 
 class BaseFive9Client:
     """Base Five9 API Client with WSDL connection management"""
@@ -46,18 +54,35 @@ class BaseFive9Client:
         session.auth = self.auth
         return Transport(session=session)
     
-    def connect(self) -> bool:
-        """Connect to Five9 Web Services"""
+    def _wsdl_document(self, wsdl_url: str) -> Document:
+        """Parsed WSDL for ``wsdl_url``, parsed once per process"""
+        with _wsdl_lock:
+            document = _wsdl_documents.get(wsdl_url)
+            if document is None:
+                document = Document(wsdl_url, self.transport, settings=zeep.Settings())
+                _wsdl_documents[wsdl_url] = document
+            return document
+    
+    def connect(self, supervisor: bool = True) -> bool:
+        """Connect to Five9 Web Services
+        
+        Args:
+            supervisor: Also connect the Supervisor service (list extraction
+                worker sessions only need the Admin service)
+        """
         logger.info("Connecting to Five9 Web Services...")
         
         try:
             # Connect to Admin Service
-            admin_client = zeep.Client(self.admin_wsdl, transport=self.transport)
+            admin_client = zeep.Client(self._wsdl_document(self.admin_wsdl), transport=self.transport)
             self.admin_service = admin_client.service
             logger.info("Admin Web Service connected successfully")
             
+            if not supervisor:
+                return True
+            
             # Connect to Supervisor Service
-            supervisor_client = zeep.Client(self.supervisor_wsdl, transport=self.transport)
+            supervisor_client = zeep.Client(self._wsdl_document(self.supervisor_wsdl), transport=self.transport)
             self.supervisor_service = supervisor_client.service
             
             # Set session parameters using config
@@ -2,10 +2,12 @@
 Five9 Contacts API Client
 Handles contact list retrieval and contact record extraction
 """
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Iterable, Iterator
 from datetime import datetime
 import logging
+from django.conf import settings
 from .base import BaseFive9Client
+from .parallel import SessionPool, fetch_unordered
 from ....config.five9_config import Five9Config, DELTA_SYNC_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -203,40 +205,84 @@ class ContactsClient(BaseFive9Client):
         Returns:
             Dictionary mapping list_name to list of contact records
         """
+        return dict(self.iter_all_contact_records(max_records_per_list))
+    
+    def iter_all_contact_records(self, max_records_per_list: int = 100,
+                                 concurrency: Optional[int] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Stream ``(list_name, records)`` for every non-empty list as each download completes
+        
+        Args:
+            max_records_per_list: Maximum records to retrieve per list
+            concurrency: Parallel Five9 sessions (defaults to FIVE9_LIST_CONCURRENCY)
+        """
         logger.info("Retrieving contact records from all available lists...")
         
         lists = self.get_contact_lists()
         if not lists:
             logger.error("No contact lists found")
-            return {}
-        
-        all_records = {}
+            return
         
-        # Process each list that has records
-        for i, contact_list in enumerate(lists):
-            list_name = contact_list.get('name')
-            list_size = contact_list.get('size', 0)
-            
-            if list_size > 0:  # Only try lists with records
-                logger.info(f"Processing list {i+1}/{len(lists)}: {list_name} ({list_size} records)")
-                
-                try:
-                    records, _ = self.get_contact_records(list_name, max_records_per_list)
-                    if records:
-                        all_records[list_name] = records
-                        logger.info(f"Successfully retrieved {len(records)} records from {list_name}")
-                    else:
-                        logger.warning(f"No records retrieved from {list_name}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing list {list_name}: {e}")
-                    continue
+        list_names = []
+        for contact_list in lists:
+            if contact_list.get('size', 0) > 0:  # Only try lists with records
+                list_names.append(contact_list.get('name'))
             else:
-                logger.debug(f"Skipping empty list: {list_name}")
+                logger.debug(f"Skipping empty list: {contact_list.get('name')}")
         
-        logger.info(f"Successfully retrieved records from {len(all_records)} lists")
-        return all_records
-
+        yield from self.iter_list_records(list_names, concurrency, max_records_per_list)
+    
+    def iter_list_records(self, list_names: Iterable[str], concurrency: Optional[int] = None,
+                          max_records: int = 0) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Download contact lists in parallel, yielding ``(list_name, records)`` as each completes
+        
+        Each worker thread opens its own Five9 Admin session (reusing the
+        cached WSDL) and keeps it for every list it downloads; the sessions
+        are closed when the stream ends. Lists that fail or return no records
+        are logged and skipped.
+        
+        Args:
+            list_names: Contact lists to download
+            concurrency: Parallel sessions, capped at Five9Config.CONCURRENT_REQUESTS
+                (defaults to FIVE9_LIST_CONCURRENCY; 1 uses this client's session)
+            max_records: Maximum records per list (0 means no limit)
+        """
+        if concurrency is None:
+            concurrency = getattr(settings, 'FIVE9_LIST_CONCURRENCY', 4)
+        concurrency = max(1, min(concurrency, Five9Config.CONCURRENT_REQUESTS))
+        
+        if concurrency == 1:
+            pool = SessionPool(lambda: self, lambda session: None)
+        else:
+            pool = SessionPool(self._open_worker_session, lambda session: session.close_sessions())
+        
+        def download(list_name: str) -> Optional[List[Dict]]:
+            records, _ = pool.get().get_contact_records(list_name, max_records)
+            return records
+        
+        lists_retrieved = 0
+        try:
+            for list_name, records, error in fetch_unordered(list_names, download, concurrency):
+                if error is not None:
+                    logger.error(f"Error processing list {list_name}: {error}")
+                elif not records:
+                    logger.warning(f"No records retrieved from {list_name}")
+                else:
+                    lists_retrieved += 1
+                    logger.info(f"Successfully retrieved {len(records)} records from {list_name}")
+                    yield list_name, records
+        finally:
+            pool.close_all()
+            logger.info(f"Successfully retrieved records from {lists_retrieved} lists")
+    
+    def _open_worker_session(self) -> 'ContactsClient':
+        """Authenticated Admin-only session for a list download worker"""
+        worker = ContactsClient(self.username, self.password)
+        if not worker.connect(supervisor=False):
+            raise ConnectionError("Failed to open Five9 worker session")
+        return worker
+    
     def get_contact_records_from_list(self, list_name: str) -> List[Dict]:
         """
         Get contact records from a specific list
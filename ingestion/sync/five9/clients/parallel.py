@@ -0,0 +1,82 @@
+"""
+Parallel Five9 list extraction helpers
+
+Five9 SOAP calls are blocking and each contact list download is a separate
+round trip, so a sync over many lists is bound by one request after another.
+Lists are downloaded on a bounded thread pool instead, each worker thread
+holding its own authenticated session, and results are handed back as each
+list completes.
+"""
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+Item = TypeVar('Item')
+
+
+class SessionPool:
+    """One session per worker thread, opened on first use and closed together"""
+
+    def __init__(self, open_session: Callable[[], Any], close_session: Callable[[Any], None]):
+        self.open_session = open_session
+        self.close_session = close_session
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[Any] = []
+
+    def get(self) -> Any:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self.open_session()
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            try:
+                self.close_session(session)
+            except Exception as e:
+                logger.warning(f"Error closing Five9 worker session: {e}")
+
+
+def fetch_unordered(items: Iterable[Item], fetch: Callable[[Item], Any], concurrency: int
+                    ) -> Iterator[Tuple[Item, Any, Optional[BaseException]]]:
+    """Run ``fetch(item)`` on ``concurrency`` threads, yielding ``(item, result, error)``.
+
+    Results come back in completion order. At most ``concurrency`` fetches are
+    submitted at a time, so finished results never pile up ahead of the
+    consumer. Closing the generator early drops the items not yet started and
+    waits for the running ones.
+    """
+    pending_items = iter(items)
+    concurrency = max(1, concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='five9-list')
+    running = {}
+
+    def submit_next() -> bool:
+        for item in pending_items:
+            running[executor.submit(fetch, item)] = item
+            return True
+        return False
+
+    try:
+        while len(running) < concurrency and submit_next():
+            pass
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = running.pop(future)
+                submit_next()
+                error = future.exception()
+                yield item, None if error else future.result(), error
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True)
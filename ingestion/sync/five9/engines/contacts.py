@@ -77,78 +77,81 @@ class ContactsSyncEngine(BaseSyncEngine):
                 since = None
                 logger.info("Full sync requested; fetching all lists without delta filter")
 
-            # Process each list individually to avoid memory overload
-            for i, (list_name, record_count) in enumerate(contact_lists.items(), 1):
-                try:
-                    # Skip empty lists
-                    if record_count == 0:
-                        logger.debug(f"Skipping empty list: {list_name}")
-                        continue
-                    
-                    # Limit records per list if specified
-                    actual_records_to_fetch = min(record_count, max_records_per_list) if max_records_per_list > 0 else record_count
-                    
-                    logger.info(f"Processing list {i}/{len(contact_lists)}: {list_name} ({actual_records_to_fetch} records)")
-                    
-                    # Fetch contacts for this specific list
-                    list_contacts = await sync_to_async(self.client.get_contact_records_from_list)(list_name)
-                    
-                    if not list_contacts:
-                        logger.warning(f"No contacts found in list: {list_name}")
-                        continue
-                    
-                    # Add list_name to each contact
-                    for contact in list_contacts:
-                        contact['list_name'] = list_name
-                    
-                    # Optional local delta filtering by timestamp fields
-                    if since:
-                        ts_fields = [
-                            DELTA_SYNC_CONFIG.get('timestamp_field', 'sys_last_disposition_time'),
-                            *DELTA_SYNC_CONFIG.get('fallback_timestamp_fields', [])
-                        ]
-                        filtered = []
-                        for rec in list_contacts:
-                            ts_val = None
-                            for f in ts_fields:
-                                if f in rec and rec[f]:
-                                    ts_val = rec[f]
-                                    break
-                            if not ts_val:
-                                continue
-                            try:
-                                # Accept ISO or epoch-like strings
-                                if isinstance(ts_val, str):
-                                    try:
-                                        parsed = timezone.datetime.fromisoformat(ts_val)
-                                    except ValueError:
+            # Download lists in parallel sessions and process each one as it arrives
+            list_names = []
+            for list_name, record_count in contact_lists.items():
+                if record_count == 0:
+                    logger.debug(f"Skipping empty list: {list_name}")
+                else:
+                    list_names.append(list_name)
+            logger.info(f"Downloading {len(list_names)} non-empty lists")
+            
+            list_stream = self.client.iter_list_records(list_names, max_records=max_records_per_list)
+            next_list = sync_to_async(next)
+            try:
+                while True:
+                    item = await next_list(list_stream, None)
+                    if item is None:
+                        break
+                    list_name, list_contacts = item
+                    try:
+                        logger.info(f"Processing list {list_name} ({len(list_contacts)} records, "
+                                    f"{contact_lists.get(list_name, 0)} listed)")
+                        
+                        # Add list_name to each contact
+                        for contact in list_contacts:
+                            contact['list_name'] = list_name
+                        
+                        # Optional local delta filtering by timestamp fields
+                        if since:
+                            ts_fields = [
+                                DELTA_SYNC_CONFIG.get('timestamp_field', 'sys_last_disposition_time'),
+                                *DELTA_SYNC_CONFIG.get('fallback_timestamp_fields', [])
+                            ]
+                            filtered = []
+                            for rec in list_contacts:
+                                ts_val = None
+                                for f in ts_fields:
+                                    if f in rec and rec[f]:
+                                        ts_val = rec[f]
+                                        break
+                                if not ts_val:
+                                    continue
+                                try:
+                                    # Accept ISO or epoch-like strings
+                                    if isinstance(ts_val, str):
+                                        try:
+                                            parsed = timezone.datetime.fromisoformat(ts_val)
+                                        except ValueError:
+                                            parsed = None
+                                    elif isinstance(ts_val, datetime):
+                                        parsed = ts_val
+                                    else:
                                         parsed = None
-                                elif isinstance(ts_val, datetime):
-                                    parsed = ts_val
-                                else:
-                                    parsed = None
-                                if parsed and timezone.is_naive(parsed):
-                                    parsed = timezone.make_aware(parsed)
-                                if parsed and parsed >= since:
-                                    filtered.append(rec)
-                            except Exception:
-                                continue
-                        logger.info(f"Delta-filtered {len(filtered)}/{len(list_contacts)} records in {list_name}")
-                        list_contacts = filtered
-
-                    # Yield contacts from this list in batches immediately
-                    batch_size = min(self.batch_size, 500)
-                    logger.info(f"Successfully retrieved {len(list_contacts)} records from {list_name}")
-                    
-                    for j in range(0, len(list_contacts), batch_size):
-                        batch = list_contacts[j:j + batch_size]
-                        logger.debug(f"Yielding batch from {list_name}: {len(batch)} contacts")
-                        yield batch
+                                    if parsed and timezone.is_naive(parsed):
+                                        parsed = timezone.make_aware(parsed)
+                                    if parsed and parsed >= since:
+                                        filtered.append(rec)
+                                except Exception:
+                                    continue
+                            logger.info(f"Delta-filtered {len(filtered)}/{len(list_contacts)} records in {list_name}")
+                            list_contacts = filtered
                         
-                except Exception as e:
-                    logger.error(f"Error processing list {list_name}: {e}")
-                    continue
+                        # Yield contacts from this list in batches immediately
+                        batch_size = min(self.batch_size, 500)
+                        logger.info(f"Successfully retrieved {len(list_contacts)} records from {list_name}")
                         
+                        for j in range(0, len(list_contacts), batch_size):
+                            batch = list_contacts[j:j + batch_size]
+                            logger.debug(f"Yielding batch from {list_name}: {len(batch)} contacts")
+                            yield batch
+                    
+                    except Exception as e:
+                        logger.error(f"Error processing list {list_name}: {e}")
+                        continue
+            finally:
+                await sync_to_async(list_stream.close)()
+
         except Exception as e:
             logger.error(f"Error fetching Five9 contact data: {e}")
             raise
@@ -45,112 +45,28 @@ class GeniusAppointmentServicesClient(GeniusBaseClient):
         logger.info(f"Executing query: {query}")
         return self.execute_query(query)
     
-    def get_chunked_appointment_services(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> List[tuple]:
-        """Get appointment services data in chunks for large-scale processing (legacy method)"""
-        
-        where_clause = ""
-        if since_date:
-            where_clause = f"WHERE aps.updated_at >= '{since_date}'"
-        
-        query = f"""
-            SELECT
-                aps.appointment_id,
-                aps.service_id,
-                aps.created_at,
-                aps.updated_at
-            FROM {self.table_name} aps
-            {where_clause}
-            ORDER BY aps.appointment_id, aps.service_id
-            LIMIT {chunk_size} OFFSET {offset}
-        """
-        
-        logger.debug(f"Executing chunked query: {query}")
-        return self.execute_query(query)
-    
-    def get_cursor_based_appointment_services(self, chunk_size: int, 
-                                            last_cursor: Optional[Dict] = None,
-                                            since_date: Optional[datetime] = None) -> tuple:
-        """
-        Get appointment services using cursor-based pagination for optimal performance.
-        Returns (data, next_cursor) tuple.
-        """
-        where_clause = ""
-        cursor_clause = ""
-        params = []
-        
-        # Build since_date filter
-        if since_date:
-            where_clause = "WHERE aps.updated_at >= %s"
-            params.append(since_date)
-        
-        # Build cursor-based pagination
-        if last_cursor:
-            cursor_conditions = []
-            if 'appointment_id' in last_cursor and 'service_id' in last_cursor:
-                cursor_conditions.append(
-                    "(aps.appointment_id > %s OR "
-                    "(aps.appointment_id = %s AND aps.service_id > %s))"
-                )
-                params.extend([
-                    last_cursor['appointment_id'],
-                    last_cursor['appointment_id'], 
-                    last_cursor['service_id']
-                ])
-            
-            if cursor_conditions:
-                if where_clause:
-                    where_clause += " AND " + " AND ".join(cursor_conditions)
-                else:
-                    where_clause = "WHERE " + " AND ".join(cursor_conditions)
-        
-        # Build optimized query
-        query = f"""
-            SELECT
-                aps.appointment_id,
-                aps.service_id,
-                aps.created_at,
-                aps.updated_at
-            FROM {self.table_name} aps
-            {where_clause}
-            ORDER BY aps.appointment_id, aps.service_id
-            LIMIT {chunk_size + 1}
-        """
-        
-        logger.debug(f"Executing cursor-based query: {query}")
-        result = self.execute_query(query, tuple(params) if params else None)
-        
-        # Check if there are more records
-        has_more = len(result) > chunk_size
-        data = result[:chunk_size] if has_more else result
-        
-        # Prepare next cursor
-        next_cursor = None
-        if has_more and data:
-            last_record = data[-1]
-            next_cursor = {
-                'appointment_id': last_record[0],  # appointment_id
-                'service_id': last_record[1]       # service_id
-            }
-        
-        return data, next_cursor
-    
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> str:
-        """Return the chunked query string for logging purposes"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"WHERE aps.updated_at >= '{since_date}'"
-        
-        return f"""
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of appointment services using keyset pagination"""
+        return self.iter_keyset_chunks(
+            f"""
             SELECT
                 aps.appointment_id,
                 aps.service_id,
                 aps.created_at,
                 aps.updated_at
             FROM {self.table_name} aps
-            {where_clause}
-            ORDER BY aps.appointment_id, aps.service_id
-            LIMIT {chunk_size} OFFSET {offset}
-        """
+            """,
+            id_column=('aps.appointment_id', 'aps.service_id'),
+            id_index=(0, 1),
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='aps.updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=3,
+        )
     
     def get_total_count(self, since_date: Optional[datetime] = None) -> int:
         """Get total count of records for progress tracking"""
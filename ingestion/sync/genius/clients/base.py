@@ -1,13 +1,28 @@
 """
 Base client for Genius CRM database access with performance optimizations
+
+Chunked reads come in two modes (``GENIUS_READ_MODE``):
+
+- ``'stream'`` runs one ordered query on an unbuffered cursor over a
+  dedicated connection and hands out ``fetchmany`` pages. A background
+  thread reads up to ``GENIUS_STREAM_PREFETCH`` pages ahead, so MySQL
+  transfer overlaps the Postgres writes of the previous page while memory
+  stays at a few pages whatever the table size.
+- ``'keyset'`` issues one ``LIMIT`` query per chunk on pooled connections.
 """
 import logging
-from typing import Optional, Dict, Any, List, AsyncGenerator, Tuple
+import queue
+import threading
+import time
+from typing import Optional, Dict, Any, List, AsyncGenerator, Tuple, Callable, Iterator, Sequence, Union
 from datetime import datetime
+from django.conf import settings
 from ingestion.utils import get_mysql_connection
 
 logger = logging.getLogger(__name__)
 
+_END = object()
+
 # Try to import connection pooling, fall back gracefully if not available
 try:
     import mysql.connector.pooling
@@ -16,14 +31,71 @@ except ImportError:
     logger.warning("MySQL connection pooling not available, using individual connections")
     POOLING_AVAILABLE = False
 
+def prefetch(iterator: Iterator[Any], depth: int) -> Iterator[Any]:
+    """Run ``iterator`` on a background thread, at most ``depth`` items ahead of the consumer
+    
+    Exceptions are re-raised in the consumer. If the consumer stops early the
+    producer closes ``iterator`` on its own thread, so generator cleanup runs
+    where the generator ran.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, depth))
+    stop = threading.Event()
+    
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def produce():
+        end = (_END, None)
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    break
+        except BaseException as error:
+            end = (_END, error)
+        finally:
+            close = getattr(iterator, 'close', None)
+            if close:
+                close()
+        put(end)
+    
+    thread = threading.Thread(target=produce, name='genius-prefetch', daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
 class GeniusBaseClient:
     """Base client for accessing Genius CRM database with connection pooling and optimized queries"""
     
     # Class-level connection pool
     _connection_pool = None
+    _connection_pool_lock = threading.Lock()
+    # Instances read GENIUS_READ_MODE
+    read_mode = 'keyset'
+    # Rows read by streamed queries and the seconds spent waiting on MySQL for them
+    rows_fetched = 0
+    fetch_seconds = 0.0
     
     def __init__(self):
         self.connection = None
+        # Keyset cursor of the last chunk yielded by iter_keyset_chunks
+        self.keyset_position = None
+        self.read_mode = getattr(settings, 'GENIUS_READ_MODE', 'stream')
         # Initialize connection pool if not already done
         if not self._connection_pool:
             self._init_connection_pool()
@@ -31,38 +103,43 @@ class GeniusBaseClient:
     @classmethod
     def _init_connection_pool(cls):
         """Initialize the connection pool for better performance"""
-        if not POOLING_AVAILABLE:
-            cls._connection_pool = None
-            return
+        # Clients are created on several threads; only one of them builds the pool
+        with cls._connection_pool_lock:
+            if cls._connection_pool:
+                return
+            if not POOLING_AVAILABLE:
+                cls._connection_pool = None
+                return
             
-        try:
-            import os
-            db_host = os.getenv("GENIUS_DB_HOST")
-            db_name = os.getenv("GENIUS_DB_NAME") 
-            db_user = os.getenv("GENIUS_DB_USER")
-            db_password = os.getenv("GENIUS_DB_PASSWORD")
-            db_port = int(os.getenv("GENIUS_DB_PORT", 3306))
+            try:
+                import os
+                db_host = os.getenv("GENIUS_DB_HOST")
+                db_name = os.getenv("GENIUS_DB_NAME") 
+                db_user = os.getenv("GENIUS_DB_USER")
+                db_password = os.getenv("GENIUS_DB_PASSWORD")
+                db_port = int(os.getenv("GENIUS_DB_PORT", 3306))
             
-            pool_config = {
-                'pool_name': 'genius_pool',
-                'pool_size': 5,  # Number of connections in pool
-                'pool_reset_session': True,
-                'host': db_host,
-                'database': db_name,
-                'user': db_user,
-                'password': db_password,
-                'port': db_port,
-                'connection_timeout': 10,
-                'autocommit': True,
-                'charset': 'utf8mb4',
-                'collation': 'utf8mb4_unicode_ci'
-            }
+                pool_config = {
+                    'pool_name': 'genius_pool',
+                    # Streamed reads use their own connections, the pool serves short queries
+                    'pool_size': getattr(settings, 'GENIUS_DB_POOL_SIZE', 5),
+                    'pool_reset_session': True,
+                    'host': db_host,
+                    'database': db_name,
+                    'user': db_user,
+                    'password': db_password,
+                    'port': db_port,
+                    'connection_timeout': 10,
+                    'autocommit': True,
+                    'charset': 'utf8mb4',
+                    'collation': 'utf8mb4_unicode_ci'
+                }
             
-            cls._connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
-            logger.info("Connection pool initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to initialize connection pool, falling back to individual connections: {e}")
-            cls._connection_pool = None
+                cls._connection_pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
+                logger.info("Connection pool initialized successfully")
+            except Exception as e:
+                logger.warning(f"Failed to initialize connection pool, falling back to individual connections: {e}")
+                cls._connection_pool = None
     
     def get_connection(self):
         """Get a connection from the pool or create a new one"""
@@ -98,6 +175,73 @@ class GeniusBaseClient:
             if connection:
                 connection.close()  # Returns to pool if using pooled connection
     
+    def execute_query_dict(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+        """Execute SQL query and return results as dictionaries"""
+        connection = None
+        cursor = None
+        
+        try:
+            connection = self.get_connection()
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+            return [dict(zip(columns, row)) for row in rows]
+        finally:
+            if cursor:
+                cursor.close()
+            if connection:
+                connection.close()  # Returns to pool if using pooled connection
+    
+    def open_stream_cursor(self) -> Tuple[Any, Any]:
+        """Dedicated connection and unbuffered cursor for one streamed query
+        
+        The connection is held for the whole read, so it is not taken from the
+        pool. The server blocks while the consumer writes a page to Postgres;
+        ``net_write_timeout`` is raised so it does not drop the stream meanwhile.
+        """
+        connection = get_mysql_connection()
+        cursor = connection.cursor(buffered=False)
+        cursor.execute(
+            "SET SESSION net_write_timeout = %s",
+            (getattr(settings, 'GENIUS_STREAM_NET_WRITE_TIMEOUT', 600),)
+        )
+        return connection, cursor
+    
+    def _read_pages(self, query: str, params: tuple, page_size: int, dict_rows: bool) -> Iterator[List[Any]]:
+        connection, cursor = self.open_stream_cursor()
+        try:
+            cursor.execute(query, params or ())
+            columns = [desc[0] for desc in cursor.description] if dict_rows else None
+            while True:
+                started = time.perf_counter()
+                rows = cursor.fetchmany(page_size)
+                self.fetch_seconds += time.perf_counter() - started
+                if not rows:
+                    break
+                self.rows_fetched += len(rows)
+                yield [dict(zip(columns, row)) for row in rows] if dict_rows else rows
+        finally:
+            # Close the connection rather than the cursor, which refuses to
+            # close while an abandoned unbuffered result still has rows
+            connection.close()
+    
+    def stream_query(self, query: str, params: tuple = None, page_size: int = 5000,
+                     dict_rows: bool = False) -> Iterator[List[Any]]:
+        """Yield the query's rows in pages of ``page_size`` without buffering the result set"""
+        pages = self._read_pages(query, params, page_size, dict_rows)
+        depth = getattr(settings, 'GENIUS_STREAM_PREFETCH', 1)
+        return prefetch(pages, depth) if depth > 0 else pages
+    
+    def read_metrics(self) -> Dict[str, Any]:
+        """Streamed read counters for the sync's performance metrics"""
+        return {
+            'read_mode': self.read_mode,
+            'rows_fetched': self.rows_fetched,
+            'fetch_seconds': round(self.fetch_seconds, 3),
+            'rows_fetched_per_second': self.rows_fetched / self.fetch_seconds if self.fetch_seconds > 0 else 0,
+        }
+    
     def execute_query_with_cursor(self, query: str, params: tuple = None) -> Tuple[Any, Any]:
         """Execute query and return cursor and connection for streaming results"""
         connection = self.get_connection()
@@ -117,62 +261,155 @@ class GeniusBaseClient:
         result = self.execute_query(query)
         return result[0][0] if result else 0
     
-    def get_cursor_based_chunk(self, table_name: str, chunk_size: int, 
-                              last_cursor: Optional[Dict] = None, 
-                              where_clause: str = "",
-                              order_fields: List[str] = None) -> Tuple[List[tuple], Optional[Dict]]:
-        """
-        Get data chunk using cursor-based pagination for better performance
-        Returns (data, next_cursor) tuple
+    @staticmethod
+    def _keyset_condition(columns: Sequence[str], values: Sequence[Any]) -> Tuple[str, List[Any]]:
+        """Build ``(c1, c2, ...) > (v1, v2, ...)`` as an index-friendly OR chain"""
+        branches = []
+        params = []
+        for position, column in enumerate(columns):
+            terms = [f"{previous} = %s" for previous in columns[:position]]
+            terms.append(f"{column} > %s")
+            branches.append("(" + " AND ".join(terms) + ")")
+            params.extend(values[:position])
+            params.append(values[position])
+        return "(" + " OR ".join(branches) + ")", params
+    
+    def iter_keyset_chunks(self, select_sql: str, id_column: Union[str, Sequence[str]], chunk_size: int,
+                           since_date: Optional[datetime] = None,
+                           timestamp_column: Optional[str] = None,
+                           conditions: Optional[List[str]] = None,
+                           params: Sequence[Any] = (),
+                           max_records: Optional[int] = None,
+                           id_index: Union[int, Sequence[int]] = 0,
+                           timestamp_index: Optional[int] = None,
+                           row_key: Optional[Callable[[Any], tuple]] = None,
+                           execute: Optional[Callable[..., List[Any]]] = None,
+                           start_key: Optional[Sequence[Any]] = None,
+                           dict_rows: bool = False) -> Iterator[List[Any]]:
         """
-        if not order_fields:
-            order_fields = ['id']  # Default ordering field
-        
-        # Build cursor WHERE clause
-        cursor_clause = ""
-        if last_cursor:
-            conditions = []
-            for field in order_fields:
-                if field in last_cursor:
-                    conditions.append(f"{field} > %({field})s")
-            if conditions:
-                cursor_clause = "AND (" + " OR ".join(conditions) + ")"
-        
-        # Combine WHERE clauses
-        full_where = where_clause
-        if cursor_clause:
-            if full_where:
-                full_where += f" {cursor_clause}"
-            else:
-                full_where = f"WHERE {cursor_clause[4:]}"  # Remove 'AND '
-        
-        # Build query
-        order_by = ", ".join(order_fields)
-        query = f"""
-            SELECT * FROM {table_name} 
-            {full_where}
-            ORDER BY {order_by}
-            LIMIT {chunk_size + 1}
+        Yield chunks of rows using keyset pagination instead of LIMIT/OFFSET.
+        
+        Full syncs walk the unique key (``id > last_id``). Incremental syncs
+        (``since_date`` together with ``timestamp_column``) walk
+        ``(timestamp, id)``, so rows updated while the sync is running move
+        past the cursor instead of shifting later pages. Every chunk is an
+        index range read, and all values are bound as query parameters.
+        
+        With ``read_mode == 'stream'`` the same ordered walk is one query
+        streamed in pages of at most ``GENIUS_STREAM_PAGE_SIZE`` rows instead
+        of one query per chunk (unless a custom ``execute`` is given).
+        
+        Args:
+            select_sql: ``SELECT ... FROM ... [JOIN ...]`` part of the query
+            id_column: Unique, sortable column(s) of the row (e.g. ``p.id``)
+            chunk_size: Rows per chunk
+            since_date: Only return rows with timestamp after this value
+            timestamp_column: Timestamp column or expression used for incremental syncs
+            conditions: Extra WHERE conditions with ``%s`` placeholders
+            params: Parameters for ``conditions``
+            max_records: Stop after this many rows
+            id_index: Position(s) of the id column(s) in a fetched row
+            timestamp_index: Position of the timestamp column in a fetched row
+            row_key: Returns the cursor key of a row, overriding the indexes
+            execute: Query function, defaults to ``execute_query``
+            start_key: Resume after this key (a previous ``keyset_position``)
+            dict_rows: Return rows as column-name dictionaries
+        
+        Before each chunk is yielded ``keyset_position`` is set to the key of
+        its last row, so callers can checkpoint the walk.
         """
+        stream = self.read_mode == 'stream' and execute is None
+        execute = execute or (self.execute_query_dict if dict_rows else self.execute_query)
+        id_columns = [id_column] if isinstance(id_column, str) else list(id_column)
+        id_indexes = [id_index] if isinstance(id_index, int) else list(id_index)
+        incremental = since_date is not None and timestamp_column is not None
+        
+        base_conditions = list(conditions or [])
+        base_params = list(params)
+        if incremental:
+            base_conditions.append(f"{timestamp_column} > %s")
+            base_params.append(since_date)
+            key_columns = [timestamp_column] + id_columns
+        else:
+            key_columns = id_columns
+        
+        if row_key is None:
+            if incremental and timestamp_index is None:
+                raise ValueError("timestamp_index or row_key is required for incremental keyset pagination")
+            key_indexes = ([timestamp_index] if incremental else []) + id_indexes
+            row_key = lambda row: tuple(row[index] for index in key_indexes)
         
-        # Execute with cursor parameters
-        params = last_cursor if last_cursor else {}
-        result = self.execute_query(query, tuple(params.values()) if params else None)
+        last_key = tuple(start_key) if start_key else None
+        self.keyset_position = list(last_key) if last_key else None
+        if stream:
+            yield from self._stream_keyset_walk(
+                select_sql, key_columns, base_conditions, base_params, last_key,
+                chunk_size, max_records, row_key, dict_rows,
+            )
+            return
         
-        # Determine if there's a next page and prepare cursor
-        has_more = len(result) > chunk_size
-        data = result[:chunk_size] if has_more else result
+        fetched = 0
+        while True:
+            limit = chunk_size
+            if max_records:
+                limit = min(chunk_size, max_records - fetched)
+                if limit <= 0:
+                    break
+            
+            where = list(base_conditions)
+            query_params = list(base_params)
+            if last_key is not None:
+                # row_key may return (timestamp, *ids); full scans only compare the ids
+                key = last_key[-len(key_columns):]
+                condition, condition_params = self._keyset_condition(key_columns, key)
+                where.append(condition)
+                query_params.extend(condition_params)
+            
+            query = select_sql
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            query += f" ORDER BY {', '.join(key_columns)} LIMIT %s"
+            query_params.append(limit)
+            
+            logger.debug(f"Keyset query (after: {last_key}, limit: {limit}): {query}")
+            rows = execute(query, tuple(query_params))
+            if not rows:
+                break
+            
+            fetched += len(rows)
+            last_key = row_key(rows[-1])
+            self.keyset_position = list(last_key)
+            yield rows
+            
+            if len(rows) < limit:
+                break
+    
+    def _stream_keyset_walk(self, select_sql: str, key_columns: List[str], conditions: List[str],
+                            params: List[Any], last_key: Optional[tuple], chunk_size: int,
+                            max_records: Optional[int], row_key: Callable[[Any], tuple],
+                            dict_rows: bool) -> Iterator[List[Any]]:
+        """``iter_keyset_chunks`` as a single streamed query"""
+        where = list(conditions)
+        query_params = list(params)
+        if last_key is not None:
+            key = last_key[-len(key_columns):]
+            condition, condition_params = self._keyset_condition(key_columns, key)
+            where.append(condition)
+            query_params.extend(condition_params)
         
-        next_cursor = None
-        if has_more and data:
-            # Create cursor from last record
-            last_record = data[-1]
-            next_cursor = {}
-            for i, field in enumerate(order_fields):
-                if i < len(last_record):
-                    next_cursor[field] = last_record[i]
+        query = select_sql
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += f" ORDER BY {', '.join(key_columns)}"
+        if max_records:
+            query += " LIMIT %s"
+            query_params.append(max_records)
         
-        return data, next_cursor
+        page_size = min(chunk_size, getattr(settings, 'GENIUS_STREAM_PAGE_SIZE', 5000))
+        logger.debug(f"Streamed keyset query (after: {last_key}, page size: {page_size}): {query}")
+        for rows in self.stream_query(query, tuple(query_params), page_size, dict_rows):
+            self.keyset_position = list(row_key(rows[-1]))
+            yield rows
     
     def build_where_clause(self, since_date: Optional[datetime], table_name: str) -> str:
         """Build WHERE clause for incremental sync"""
@@ -45,57 +45,35 @@ class GeniusDivisionsClient(GeniusBaseClient):
             
         return base_query
 
-    def get_chunked_divisions(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> List[Tuple]:
-        """Fetch divisions data in chunks for large datasets"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        query = f"""
-        SELECT 
-            d.id,
-            d.group_id,
-            d.region_id,
-            d.label,
-            d.abbreviation,
-            d.is_utility,
-            d.is_corp,
-            d.is_omniscient,
-            d.is_inactive,
-            d.account_scheduler_id,
-            d.created_at,
-            d.updated_at
-        FROM division d
-        """
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        query += f" ORDER BY d.id LIMIT {chunk_size} OFFSET {offset}"
-        return self.execute_query(query)
-
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> str:
-        """Get the chunked query for logging purposes"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        query = f"""
-        SELECT 
-            d.id,
-            d.group_id,
-            d.region_id,
-            d.label,
-            d.abbreviation,
-            d.is_utility,
-            d.is_corp,
-            d.is_omniscient,
-            d.is_inactive,
-            d.account_scheduler_id,
-            d.created_at,
-            d.updated_at
-        FROM division d
-        """
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        query += f" ORDER BY d.id LIMIT {chunk_size} OFFSET {offset}"
-        return query
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of divisions using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
+            SELECT 
+                d.id,
+                d.group_id,
+                d.region_id,
+                d.label,
+                d.abbreviation,
+                d.is_utility,
+                d.is_corp,
+                d.is_omniscient,
+                d.is_inactive,
+                d.account_scheduler_id,
+                d.created_at,
+                d.updated_at
+            FROM division d
+            """,
+            id_column='d.id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='d.updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=11,
+        )
     
     def get_total_count(self, where_clause: str = "") -> int:
         """Get total count of records matching criteria"""
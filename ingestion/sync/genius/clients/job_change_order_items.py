@@ -50,12 +50,9 @@ class GeniusJobChangeOrderItemClient(GeniusBaseClient):
         ]
 
     def get_job_change_order_items_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of job change order items to handle large datasets efficiently"""
-        offset = 0
-        
-        while True:
-            # Base query with all required fields  
-            query = """
+        """Generator that yields chunks of job change order items using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 jcoi.id,
                 jcoi.change_order_id,
@@ -64,29 +61,13 @@ class GeniusJobChangeOrderItemClient(GeniusBaseClient):
                 jcoi.created_at,
                 jcoi.updated_at
             FROM job_change_order_item jcoi
-            """
-            
-            # Add WHERE clause for incremental sync
-            where_clause = self.build_where_clause(since_date, self.table_name)
-            if where_clause:
-                query += f" {where_clause}"
-            
-            # Add ordering and pagination
-            query += f" ORDER BY jcoi.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                break
-            
-            yield chunk_results
-            offset += chunk_size
-            
-            # If we got less than chunk_size records, we're at the end
-            if len(chunk_results) < chunk_size:
-                break
+            """,
+            id_column='jcoi.id',
+            chunk_size=chunk_size,
+            since_date=since_date,
+            timestamp_column='jcoi.updated_at',
+            timestamp_index=5,
+        )
 
     def get_chunked_items(self, chunk_size: int = 1000, since: Optional[datetime] = None):
         """
@@ -49,7 +49,7 @@ class GeniusJobChangeOrderStatusClient(GeniusBaseClient):
         ]
 
     def get_job_change_order_statuses_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of job change order statuses to handle large datasets efficiently
+        """Generator that yields chunks of job change order statuses using keyset pagination
         
         Args:
             since_date: Not used for this table (no timestamp fields)
@@ -58,26 +58,17 @@ class GeniusJobChangeOrderStatusClient(GeniusBaseClient):
         Yields:
             List of tuples containing job change order status data
         """
-        offset = 0
-        while True:
-            query = f"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 jcos.id,
                 jcos.label,
                 jcos.is_selectable
             FROM job_change_order_status jcos
-            ORDER BY jcos.id
-            LIMIT {chunk_size} OFFSET {offset}
-            """
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk = self.execute_query(query)
-            
-            if not chunk:
-                break
-                
-            yield chunk
-            offset += chunk_size
+            """,
+            id_column='jcos.id',
+            chunk_size=chunk_size,
+        )
 
     def count_records(self, since_date: Optional[datetime] = None) -> int:
         """Count total records available for sync"""
@@ -47,35 +47,18 @@ class GeniusJobChangeOrderTypeClient(GeniusBaseClient):
         ]
 
     def get_job_change_order_types_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of job change order types to handle large datasets efficiently
+        """Generator that yields chunks of job change order types using keyset pagination
         
         Note: This table does not have updated_at field, so delta sync is not supported.
         Always performs full sync regardless of since_date parameter.
         """
-        offset = 0
-        
-        while True:
-            # Base query with all required fields
-            query = """
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 jcot.id,
                 jcot.label
             FROM job_change_order_type jcot
-            """
-            
-            # Add ordering and pagination
-            query += f" ORDER BY jcot.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                break
-            
-            yield chunk_results
-            offset += chunk_size
-            
-            # If we got less than chunk_size records, we're at the end
-            if len(chunk_results) < chunk_size:
-                break
\ No newline at end of file
+            """,
+            id_column='jcot.id',
+            chunk_size=chunk_size,
+        )
@@ -136,131 +136,6 @@ class GeniusJobClient(GeniusBaseClient):
         logger.info(f"Executing query: {query}")
         return self.execute_query(query)
     
-    def get_chunked_jobs(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> List[tuple]:
-        """Fetch jobs data in chunks for large datasets"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        query = self.get_chunked_query(offset, chunk_size, since_date)
-        return self.execute_query(query)
-
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> str:
-        """Get the chunked query for logging purposes"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        # Use same comprehensive field list as main query
-        query = f"""
-        SELECT
-            j.id,
-            j.client_cid,
-            j.prospect_id,
-            j.division_id,
-            j.user_id,
-            j.production_user_id,
-            j.project_coordinator_user_id,
-            j.production_month,
-            j.subcontractor_id,
-            j.subcontractor_status_id,
-            j.subcontractor_confirmed,
-            j.status,
-            j.is_in_progress,
-            j.ready_status,
-            j.prep_status_id,
-            j.prep_status_set_date,
-            j.prep_status_is_reset,
-            j.prep_status_notes,
-            j.prep_issue_id,
-            j.service_id,
-            j.is_lead_pb,
-            j.contract_number,
-            j.contract_date,
-            j.contract_amount,
-            j.contract_amount_difference,
-            j.contract_hours,
-            j.contract_file_id,
-            j.job_value,
-            j.deposit_amount,
-            j.deposit_type_id,
-            j.is_financing,
-            j.sales_tax_rate,
-            j.is_sales_tax_exempt,
-            j.commission_payout,
-            j.accrued_commission_payout,
-            j.sold_user_id,
-            j.sold_date,
-            j.start_request_date,
-            j.deadline_date,
-            j.ready_date,
-            j.jsa_sent,
-            j.start_date,
-            j.end_date,
-            j.add_user_id,
-            j.add_date,
-            j.cancel_date,
-            j.cancel_user_id,
-            j.cancel_reason_id,
-            j.is_refund,
-            j.refund_date,
-            j.refund_user_id,
-            j.finish_date,
-            j.is_earned_not_paid,
-            j.materials_arrival_date,
-            j.measure_date,
-            j.measure_time,
-            j.measure_user_id,
-            j.time_format,
-            j.materials_estimated_arrival_date,
-            j.materials_ordered,
-            j.install_date,
-            j.install_time,
-            j.install_time_format,
-            j.price_level,
-            j.price_level_goal,
-            j.price_level_commission,
-            j.price_level_commission_reduction,
-            j.is_reviewed,
-            j.reviewed_by,
-            j.pp_id_updated,
-            j.hoa,
-            j.hoa_approved,
-            j.materials_ordered_old,
-            j.start_month_old,
-            j.cogs_report_month,
-            j.is_cogs_report_month_updated,
-            j.forecast_month,
-            j.coc_sent_on,
-            j.coc_sent_by,
-            j.company_cam_link,
-            j.pm_finished_on,
-            j.estimate_job_duration,
-            j.payment_not_finalized_reason,
-            j.reasons_other,
-            j.payment_type,
-            j.payment_amount,
-            j.is_payment_finalized,
-            j.is_company_cam,
-            j.is_five_star_review,
-            j.projected_end_date,
-            j.is_company_cam_images_correct,
-            j.post_pm_closeout_date,
-            j.pre_pm_closeout_date,
-            j.actual_install_date,
-            j.in_progress_substatus_id,
-            j.is_loan_document_uptodate,
-            j.is_labor_adjustment_correct,
-            j.is_change_order_correct,
-            j.is_coc_pdf_attached,
-            j.updated_at
-        FROM {self.table_name} j
-        """
-        if where_clause:
-            query += f" WHERE {where_clause}"
-        query += f" ORDER BY j.id LIMIT {chunk_size} OFFSET {offset}"
-        return query
-    
     def get_field_mapping(self) -> Dict[str, int]:
         """Return field mapping for processor (field_name -> column_index)"""
         return {
@@ -58,12 +58,9 @@ class GeniusMarketingSourceTypeClient(GeniusBaseClient):
         ]
     
     def get_marketing_source_types_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of marketing source types to handle large datasets efficiently"""
-        offset = 0
-        
-        while True:
-            # Base query with all required fields matching the model
-            query = """
+        """Generator that yields chunks of marketing source types using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 mst.id,
                 mst.label,
@@ -73,27 +70,11 @@ class GeniusMarketingSourceTypeClient(GeniusBaseClient):
                 mst.created_at,
                 mst.updated_at
             FROM `marketing_source_type` mst
-            """
-            
-            # Add WHERE clause for incremental sync - handle both updated_at and created_at
-            if since_date:
-                since_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                query += f" WHERE (mst.updated_at > '{since_str}' OR (mst.updated_at IS NULL AND mst.created_at > '{since_str}'))"
-            
-            # Add ordering and pagination
-            query += f" ORDER BY mst.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                break
-            
-            yield chunk_results
-            
-            # If we got less than chunk_size records, we've reached the end
-            if len(chunk_results) < chunk_size:
-                break
-            
-            offset += chunk_size
+            """,
+            id_column='mst.id',
+            chunk_size=chunk_size,
+            since_date=since_date,
+            # Rows without updated_at fall back to created_at for delta syncs
+            timestamp_column='COALESCE(mst.updated_at, mst.created_at)',
+            row_key=lambda row: (row[6] or row[5], row[0]),
+        )
@@ -50,12 +50,9 @@ class GeniusMarketingSourceClient(GeniusBaseClient):
         return self.execute_query(query)
     
     def get_marketing_sources_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of marketing sources to handle large datasets efficiently"""
-        offset = 0
-        
-        while True:
-            # Base query with all required fields that match the actual database structure
-            query = """
+        """Generator that yields chunks of marketing sources using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 ms.id,
                 ms.type_id,
@@ -69,29 +66,13 @@ class GeniusMarketingSourceClient(GeniusBaseClient):
                 ms.is_allow_lead_modification,
                 ms.updated_at
             FROM marketing_source ms
-            """
-            
-            # Add WHERE clause for incremental sync
-            where_clause = self.build_where_clause(since_date, self.table_name)
-            if where_clause:
-                query += f" {where_clause}"
-            
-            # Add ordering and pagination
-            query += f" ORDER BY ms.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                break
-            
-            yield chunk_results
-            offset += chunk_size
-            
-            # If we got less than chunk_size records, we're at the end
-            if len(chunk_results) < chunk_size:
-                break
+            """,
+            id_column='ms.id',
+            chunk_size=chunk_size,
+            since_date=since_date,
+            timestamp_column='ms.updated_at',
+            timestamp_index=10,
+        )
     
     def get_field_mapping(self) -> List[str]:
         """Get field mapping for transformation"""
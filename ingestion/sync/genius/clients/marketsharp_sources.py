@@ -56,12 +56,9 @@ class GeniusMarketSharpSourceClient(GeniusBaseClient):
         ]
 
     def get_marketsharp_sources_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of marketsharp sources to handle large datasets efficiently"""
-        offset = 0
-        
-        while True:
-            # Base query with all required fields matching the actual database schema
-            query = """
+        """Generator that yields chunks of marketsharp sources using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 mss.id,
                 mss.marketsharp_id,
@@ -70,26 +67,11 @@ class GeniusMarketSharpSourceClient(GeniusBaseClient):
                 mss.created_at,
                 mss.updated_at
             FROM marketsharp_source mss
-            """
-            
-            # Add WHERE clause for incremental sync
-            where_clause = self.build_where_clause(since_date, self.table_name)
-            if where_clause:
-                query += f" {where_clause}"
-            
-            # Add ordering and pagination
-            query += f" ORDER BY mss.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                break
-            
-            yield chunk_results
-            offset += chunk_size
-            
-            # If we got less than chunk_size records, we're at the end
-            if len(chunk_results) < chunk_size:
-                break
+            """,
+            id_column='mss.id',
+            chunk_size=chunk_size,
+            since_date=since_date,
+            timestamp_column='mss.updated_at',
+            timestamp_index=5,
+        )
+    
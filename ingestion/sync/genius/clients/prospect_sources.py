@@ -48,16 +48,9 @@ class GeniusProspectSourceClient(GeniusBaseClient):
         return self.execute_query(query)
     
     def get_prospect_sources_chunked(self, since_date: Optional[datetime] = None, chunk_size: int = 1000):
-        """Generator that yields chunks of prospect sources to handle large datasets efficiently
-        
-        Follows CRM sync guide patterns with safety limits to prevent infinite loops.
-        """
-        offset = 0
-        iteration_limit = 10000  # Safety limit to prevent infinite loops (10M records max)
-        
-        for iteration in range(iteration_limit):
-            # Base query with all required fields matching the model schema
-            query = """
+        """Generator that yields chunks of prospect sources using keyset pagination"""
+        return self.iter_keyset_chunks(
+            """
             SELECT 
                 ps.id,
                 ps.prospect_id,
@@ -69,36 +62,14 @@ class GeniusProspectSourceClient(GeniusBaseClient):
                 ps.updated_at,
                 ps.source_user_id
             FROM prospect_source ps
-            """
-            
-            # Add WHERE clause for incremental sync - handle both updated_at and add_date
-            if since_date:
-                since_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                query += f" WHERE (ps.updated_at > '{since_str}' OR (ps.updated_at IS NULL AND ps.add_date > '{since_str}'))"
-            
-            # Add ordering and pagination
-            query += f" ORDER BY ps.id LIMIT {chunk_size} OFFSET {offset}"
-            
-            logger.info(f"Executing chunked query (iteration: {iteration+1}, offset: {offset}, chunk_size: {chunk_size})")
-            chunk_results = self.execute_query(query)
-            
-            if not chunk_results:
-                # No more records, break the loop
-                logger.info(f"No more records found after {iteration+1} iterations, ending chunked fetch")
-                break
-            
-            yield chunk_results
-            
-            # If we got less than chunk_size records, we've reached the end
-            if len(chunk_results) < chunk_size:
-                logger.info(f"Received {len(chunk_results)} records (less than chunk_size {chunk_size}), ending chunked fetch")
-                break
-            
-            offset += chunk_size
-        
-        # Safety warning if we hit the iteration limit
-        if iteration == iteration_limit - 1:
-            logger.warning(f"Hit iteration limit of {iteration_limit}, sync may be incomplete. Consider increasing limit or investigating data issues.")
+            """,
+            id_column='ps.id',
+            chunk_size=chunk_size,
+            since_date=since_date,
+            # Rows without updated_at fall back to add_date for delta syncs
+            timestamp_column='COALESCE(ps.updated_at, ps.add_date)',
+            row_key=lambda row: (row[7] or row[6], row[0]),
+        )
     
     def get_field_mapping(self) -> List[str]:
         """Get field mapping for transformation matching the model schema"""
@@ -24,16 +24,9 @@ class GeniusProspectsClient(GeniusBaseClient):
             'third_party_source_id', 'updated_at', 'hubspot_contact_id'
         ]
     
-    def get_prospects(self, since_date: Optional[datetime] = None, limit: Optional[int] = None) -> List[tuple]:
-        """Get prospects data for processing (legacy method for limited records)"""
-        
-        where_clause = ""
-        if since_date:
-            where_clause = f"WHERE p.updated_at >= '{since_date}'" 
-            
-        limit_clause = f"LIMIT {limit}" if limit else ""
-        
-        query = f"""
+    @property
+    def select_sql(self) -> str:
+        return f"""
             SELECT
                 p.id,
                 p.division_id,
@@ -65,111 +58,46 @@ class GeniusProspectsClient(GeniusBaseClient):
               ON tps.id = p.third_party_source_id
             LEFT JOIN third_party_source_type AS tpst 
               ON tpst.id = tps.third_party_source_type_id AND tpst.label = 'hubspot'
-            {where_clause}
-            ORDER BY p.id
-            {limit_clause}
         """
-        
-        return self.execute_query(query)
     
-    def get_chunked_prospects(self, offset: int, chunk_size: int, 
-                             since_date: Optional[datetime] = None) -> List[tuple]:
-        """Get prospects data in chunks for large dataset processing"""
-        
-        where_clause = ""
+    def get_prospects(self, since_date: Optional[datetime] = None, limit: Optional[int] = None) -> List[tuple]:
+        """Get prospects data for processing (legacy method for limited records)"""
+        query = self.select_sql
+        params = []
         if since_date:
-            where_clause = f"WHERE p.updated_at >= '{since_date}'"
-            
-        query = f"""
-            SELECT
-                p.id,
-                p.division_id,
-                p.user_id,
-                p.first_name,
-                p.last_name,
-                p.alt_first_name,
-                p.alt_last_name,
-                p.address1,
-                p.address2,
-                p.city,
-                p.county,
-                p.state,
-                p.zip,
-                p.year_built,
-                p.phone1,
-                p.phone2,
-                p.email,
-                p.notes,
-                p.add_user_id,
-                p.add_date,
-                p.marketsharp_id,
-                p.leap_customer_id,
-                p.third_party_source_id,
-                p.updated_at,
-                tps.third_party_id AS hubspot_contact_id
-            FROM {self.table_name} p
-            LEFT JOIN third_party_source AS tps 
-              ON tps.id = p.third_party_source_id
-            LEFT JOIN third_party_source_type AS tpst 
-              ON tpst.id = tps.third_party_source_type_id AND tpst.label = 'hubspot'
-            {where_clause}
-            ORDER BY p.id LIMIT {chunk_size} OFFSET {offset}
-        """
+            query += " WHERE p.updated_at > %s"
+            params.append(since_date)
         
-        return self.execute_query(query)
-    
-    def get_chunked_query(self, offset: int, chunk_size: int, 
-                         since_date: Optional[datetime] = None) -> str:
-        """Get the query string for chunked processing (for logging)"""
+        query += " ORDER BY p.id"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
         
-        where_clause = ""
-        if since_date:
-            where_clause = f" WHERE p.updated_at >= '{since_date}'"
-            
-        return f"""
-            SELECT
-                p.id,
-                p.division_id,
-                p.user_id,
-                p.first_name,
-                p.last_name,
-                p.alt_first_name,
-                p.alt_last_name,
-                p.address1,
-                p.address2,
-                p.city,
-                p.county,
-                p.state,
-                p.zip,
-                p.year_built,
-                p.phone1,
-                p.phone2,
-                p.email,
-                p.notes,
-                p.add_user_id,
-                p.add_date,
-                p.marketsharp_id,
-                p.leap_customer_id,
-                p.third_party_source_id,
-                p.updated_at,
-                tps.third_party_id AS hubspot_contact_id
-            FROM {self.table_name} p
-            LEFT JOIN third_party_source AS tps 
-              ON tps.id = p.third_party_source_id
-            LEFT JOIN third_party_source_type AS tpst 
-              ON tpst.id = tps.third_party_source_type_id AND tpst.label = 'hubspot'
-            {where_clause}
-             ORDER BY p.id LIMIT {chunk_size} OFFSET {offset}
-        """
+        return self.execute_query(query, tuple(params))
+    
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of prospects using keyset pagination"""
+        return self.iter_keyset_chunks(
+            self.select_sql,
+            id_column='p.id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='p.updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=23,
+        )
     
     def get_record_count(self, since_date: Optional[datetime] = None) -> int:
         """Get total count of prospect records for the sync"""
         
-        where_clause = ""
+        query = f"SELECT COUNT(*) FROM {self.table_name} p"
+        params = ()
         if since_date:
-            where_clause = f"WHERE p.updated_at >= '{since_date}'"
-            
-        query = f"SELECT COUNT(*) FROM {self.table_name} p {where_clause}"
+            query += " WHERE p.updated_at > %s"
+            params = (since_date,)
         
-        result = self.execute_query(query)
+        result = self.execute_query(query, params)
         return result[0][0] if result else 0
@@ -44,27 +44,20 @@ class GeniusQuoteClient(GeniusBaseClient):
         logger.info(f"Executing query: {query}")
         return self.execute_query(query)
     
-    def get_chunked_quotes(self, since_date: Optional[datetime] = None, offset: int = 0, chunk_size: int = 100000) -> List[tuple]:
-        """Fetch chunked quotes for large dataset processing"""
-        
-        query = self.get_chunked_query(since_date, offset, chunk_size)
-        logger.info(query)
-        return self.execute_query(query)
-    
-    def get_chunked_query(self, since_date: Optional[datetime] = None, offset: int = 0, chunk_size: int = 100000) -> str:
-        """Build chunked query for large dataset processing"""
-        
-        query = self._get_base_query()
-        
-        # Add WHERE clause for incremental sync
-        where_clause = self.build_where_clause(since_date, self.table_name)
-        if where_clause:
-            query += f" {where_clause}"
-        
-        # Add ordering and chunking
-        query += f" ORDER BY q.id LIMIT {chunk_size} OFFSET {offset}"
-        
-        return query
+    def get_chunked_items(self, chunk_size: int = 100000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of quotes using keyset pagination"""
+        return self.iter_keyset_chunks(
+            self._get_base_query(),
+            id_column='q.id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='q.updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=15,
+        )
     
     def _get_base_query(self) -> str:
         """Get the base query for quotes"""
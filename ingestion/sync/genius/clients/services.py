@@ -48,39 +48,12 @@ class GeniusServicesClient(GeniusBaseClient):
         
         return self.execute_query(query)
     
-    def get_chunked_services(self, offset: int, chunk_size: int, 
-                            since_date: Optional[datetime] = None) -> List[tuple]:
-        """Get services data in chunks for large dataset processing"""
-        
-        where_clause = ""
-        if since_date:
-            where_clause = f"WHERE s.updated_at >= '{since_date}'"
-            
-        query = f"""
-            SELECT
-                s.id,
-                s.label,
-                s.is_active,
-                s.is_lead_required,
-                s.order_number,
-                s.created_at,
-                s.updated_at
-            FROM {self.table_name} s
-            {where_clause}
-            ORDER BY s.id LIMIT {chunk_size} OFFSET {offset}
-        """
-        
-        return self.execute_query(query)
-    
-    def get_chunked_query(self, offset: int, chunk_size: int, 
-                         since_date: Optional[datetime] = None) -> str:
-        """Get the query string for chunked processing (for logging)"""
-        
-        where_clause = ""
-        if since_date:
-            where_clause = f" WHERE s.updated_at >= '{since_date}'"
-            
-        return f"""
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of services using keyset pagination"""
+        return self.iter_keyset_chunks(
+            f"""
             SELECT
                 s.id,
                 s.label,
@@ -90,9 +63,15 @@ class GeniusServicesClient(GeniusBaseClient):
                 s.created_at,
                 s.updated_at
             FROM {self.table_name} s
-            {where_clause}
-         ORDER BY s.id LIMIT {chunk_size} OFFSET {offset}
-        """
+            """,
+            id_column='s.id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='s.updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=6,
+        )
     
     def get_record_count(self, since_date: Optional[datetime] = None) -> int:
         """Get total count of service records for the sync"""
@@ -2,7 +2,7 @@
 User associations client for Genius CRM data access
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from .base import GeniusBaseClient
@@ -28,41 +28,39 @@ class GeniusUserAssociationsClient(GeniusBaseClient):
             List of user associations records
         """
         base_query = self._build_base_query()
-        where_clause = self._build_where_clause(since_date)
+        where_clause, params = self._build_where_clause(since_date)
         
         query = f"{base_query} {where_clause} ORDER BY updated_at, id"
         
         if limit:
-            query += f" LIMIT {limit}"
+            query += " LIMIT %s"
+            params.append(limit)
             
         logger.info(f"Executing user associations query: {query}")
-        return self.execute_query(query)
+        return self.execute_query(query, tuple(params))
     
-    def get_chunked_user_associations(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[datetime] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
         """
-        Fetch a chunk of user associations data for large dataset processing
+        Generator that yields chunks of user associations using keyset pagination
         
         Args:
-            offset: Starting offset for the chunk
-            chunk_size: Number of records to fetch in this chunk
-            since_date: Optional datetime to fetch records modified since
-            
-        Returns:
-            List of user associations records for this chunk
+            chunk_size: Number of records to fetch per chunk
+            since: Optional datetime to fetch records modified since
+            max_records: Stop after this many records
+            start_key: Resume the keyset walk after this key
         """
-        base_query = self._build_base_query()
-        where_clause = self._build_where_clause(since_date)
-        
-        query = f"{base_query} {where_clause} ORDER BY updated_at, id LIMIT {chunk_size} OFFSET {offset}"
-        
-        return self.execute_query(query)
-    
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[datetime] = None) -> str:
-        """Get the chunked query string for logging purposes"""
-        base_query = self._build_base_query()
-        where_clause = self._build_where_clause(since_date)
-        
-        return f"{base_query} {where_clause} ORDER BY updated_at, id LIMIT {chunk_size} OFFSET {offset}"
+        return self.iter_keyset_chunks(
+            self._build_base_query(),
+            id_column='id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column='updated_at',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=3,
+        )
     
     def _build_base_query(self) -> str:
         """Build the base SELECT query for user associations"""
@@ -75,17 +73,19 @@ class GeniusUserAssociationsClient(GeniusBaseClient):
         FROM {self.table_name}
         """
     
-    def _build_where_clause(self, since_date: Optional[datetime] = None) -> str:
-        """Build WHERE clause based on parameters"""
+    def _build_where_clause(self, since_date: Optional[datetime] = None) -> Tuple[str, List[Any]]:
+        """Build a parameterized WHERE clause based on parameters"""
         conditions = []
+        params = []
         
         if since_date:
-            conditions.append(f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'")
+            conditions.append("updated_at > %s")
+            params.append(since_date)
         
         if conditions:
-            return "WHERE " + " AND ".join(conditions)
+            return "WHERE " + " AND ".join(conditions), params
         
-        return ""
+        return "", params
     
     def get_field_mapping(self) -> Dict[str, str]:
         """Get field mapping for user associations data transformation"""
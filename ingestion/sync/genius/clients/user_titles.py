@@ -64,65 +64,35 @@ class GeniusUserTitlesClient(GeniusBaseClient):
         
         return self.fetch_data(where_clause, limit)
     
-    def get_chunked_user_titles(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> List[Tuple]:
-        """Fetch user titles data in chunks for large datasets"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        query = f"""
-        SELECT 
-            id,
-            title,
-            abbreviation,
-            roles,
-            type_id,
-            section_id,
-            sort,
-            pay_component_group_id,
-            is_active,
-            is_unique_per_division,
-            created_at,
-            updated_at
-        FROM {self.table_name}
-        """
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-            
-        query += f" ORDER BY id LIMIT {chunk_size} OFFSET {offset}"
-        
-        return self.execute_query(query)
-    
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> str:
-        """Get the chunked query for logging purposes"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        query = f"""
-        SELECT 
-            id,
-            title,
-            abbreviation,
-            roles,
-            type_id,
-            section_id,
-            sort,
-            pay_component_group_id,
-            is_active,
-            is_unique_per_division,
-            created_at,
-            updated_at
-        FROM {self.table_name}
-        """
-        
-        if where_clause:
-            query += f" WHERE {where_clause}"
-            
-        query += f" ORDER BY id LIMIT {chunk_size} OFFSET {offset}"
-        
-        return query
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[Any] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of user titles using keyset pagination"""
+        return self.iter_keyset_chunks(
+            f"""
+            SELECT 
+                id,
+                title,
+                abbreviation,
+                roles,
+                type_id,
+                section_id,
+                sort,
+                pay_component_group_id,
+                is_active,
+                is_unique_per_division,
+                created_at,
+                updated_at
+            FROM {self.table_name}
+            """,
+            id_column='id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column=self.timestamp_field,
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=11,
+        )
     
     def get_field_mapping(self) -> Dict[str, int]:
         """Return field mapping for processor (field_name -> column_index)"""
@@ -56,87 +56,48 @@ class GeniusUsersClient(GeniusBaseClient):
             
         return base_query
 
-    def get_chunked_users(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> List[Tuple]:
-        """Fetch user data in chunks for large datasets"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"u.updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        query = f"""
-        SELECT
-            u.user_id,
-            u.division_id,
-            u.title_id,
-            u.manager_user_id,
-            u.first_name,
-            u.first_name_alt,
-            u.last_name,
-            u.email,
-            u.personal_email,
-            u.birth_date,
-            u.gender_id,
-            u.marital_status_id,
-            u.time_zone_name,
-            u.hired_on,
-            u.start_date,
-            u.add_user_id,
-            u.add_datetime,
-            u.updated_at,
-            u.is_inactive,
-            u.inactive_on,
-            u.inactive_reason_id,
-            u.inactive_reason_other,
-            ua.primary_user_id,
-            u.inactive_transfer_division_id
-        FROM {self.table_name} u
-        LEFT JOIN users_userassociations ua ON ua.id = u.user_associations_id
-        {where_clause and f'WHERE {where_clause}' or ''}
-        ORDER BY u.user_id 
-        LIMIT {chunk_size} OFFSET {offset}
-        """
-        
-        return self.execute_query(query)
-
-    def get_chunked_query(self, offset: int, chunk_size: int, since_date: Optional[Any] = None) -> str:
-        """Get the chunked query for logging purposes"""
-        where_clause = ""
-        if since_date:
-            where_clause = f"u.updated_at >= '{since_date.strftime('%Y-%m-%d %H:%M:%S')}'"
-        
-        query = f"""
-        SELECT
-            u.user_id,
-            u.division_id,
-            u.title_id,
-            u.manager_user_id,
-            u.first_name,
-            u.first_name_alt,
-            u.last_name,
-            u.email,
-            u.personal_email,
-            u.birth_date,
-            u.gender_id,
-            u.marital_status_id,
-            u.time_zone_name,
-            u.hired_on,
-            u.start_date,
-            u.add_user_id,
-            u.add_datetime,
-            u.updated_at,
-            u.is_inactive,
-            u.inactive_on,
-            u.inactive_reason_id,
-            u.inactive_reason_other,
-            ua.primary_user_id,
-            u.inactive_transfer_division_id
-        FROM {self.table_name} u
-        LEFT JOIN users_userassociations ua ON ua.id = u.user_associations_id
-        {where_clause and f'WHERE {where_clause}' or ''}
-        ORDER BY u.user_id 
-        LIMIT {chunk_size} OFFSET {offset}
-        """
-        
-        return query
+    def get_chunked_items(self, chunk_size: int = 10000, since: Optional[Any] = None,
+                          max_records: Optional[int] = None,
+                          start_key: Optional[list] = None):
+        """Generator that yields chunks of users using keyset pagination"""
+        return self.iter_keyset_chunks(
+            f"""
+            SELECT
+                u.user_id,
+                u.division_id,
+                u.title_id,
+                u.manager_user_id,
+                u.first_name,
+                u.first_name_alt,
+                u.last_name,
+                u.email,
+                u.personal_email,
+                u.birth_date,
+                u.gender_id,
+                u.marital_status_id,
+                u.time_zone_name,
+                u.hired_on,
+                u.start_date,
+                u.add_user_id,
+                u.add_datetime,
+                u.updated_at,
+                u.is_inactive,
+                u.inactive_on,
+                u.inactive_reason_id,
+                u.inactive_reason_other,
+                ua.primary_user_id,
+                u.inactive_transfer_division_id
+            FROM {self.table_name} u
+            LEFT JOIN users_userassociations ua ON ua.id = u.user_associations_id
+            """,
+            id_column='u.user_id',
+            chunk_size=chunk_size,
+            since_date=since,
+            timestamp_column=f'u.{self.timestamp_field}',
+            max_records=max_records,
+            start_key=start_key,
+            timestamp_index=17,
+        )
     
     def get_total_count(self, since_date: Optional[Any] = None) -> int:
         """Get total count of records matching criteria"""
@@ -196,83 +157,6 @@ class GeniusUsersClient(GeniusBaseClient):
             'inactive_transfer_division_id': 23
         }
     
-    def get_cursor_based_users(self, chunk_size: int, 
-                              last_cursor: Optional[Dict] = None,
-                              since_date: Optional[Any] = None) -> tuple:
-        """
-        Get users using cursor-based pagination for optimal performance.
-        Returns (data, next_cursor) tuple.
-        """
-        where_conditions = []
-        cursor_conditions = []
-        params = []
-        
-        # Build since_date filter
-        if since_date:
-            where_conditions.append("u.updated_at >= %s")
-            params.append(since_date)
-        
-        # Build cursor-based pagination
-        if last_cursor and 'user_id' in last_cursor:
-            cursor_conditions.append("u.user_id > %s")
-            params.append(last_cursor['user_id'])
-        
-        # Combine all conditions
-        all_conditions = where_conditions + cursor_conditions
-        where_clause = ""
-        if all_conditions:
-            where_clause = "WHERE " + " AND ".join(all_conditions)
-        
-        # Build optimized query
-        query = f"""
-        SELECT
-            u.user_id,
-            u.division_id,
-            u.title_id,
-            u.manager_user_id,
-            u.first_name,
-            u.first_name_alt,
-            u.last_name,
-            u.email,
-            u.personal_email,
-            u.birth_date,
-            u.gender_id,
-            u.marital_status_id,
-            u.time_zone_name,
-            u.hired_on,
-            u.start_date,
-            u.add_user_id,
-            u.add_datetime,
-            u.updated_at,
-            u.is_inactive,
-            u.inactive_on,
-            u.inactive_reason_id,
-            u.inactive_reason_other,
-            ua.primary_user_id,
-            u.inactive_transfer_division_id
-        FROM {self.table_name} u
-        LEFT JOIN users_userassociations ua ON ua.id = u.user_associations_id
-        {where_clause}
-        ORDER BY u.user_id
-        LIMIT {chunk_size + 1}
-        """
-        
-        result = self.execute_query(query, tuple(params) if params else None)
-        
-        # Check if there are more records
-        has_more = len(result) > chunk_size
-        data = result[:chunk_size] if has_more else result
-        
-        # Prepare next cursor
-        next_cursor = None
-        if has_more and data:
-            last_record = data[-1]
-            next_cursor = {
-                'user_id': last_record[0]  # user_id is first column
-            }
-        
-        return data, next_cursor
-    
     def get_recommended_indexes(self) -> List[str]:
         """Return recommended database indexes for optimal performance"""
         return [
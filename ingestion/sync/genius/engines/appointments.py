@@ -8,11 +8,13 @@ from django.utils import timezone
 
 from ..clients.appointments import GeniusAppointmentsClient
 from ..processors.appointments import GeniusAppointmentsProcessor
+from .base import GeniusKeysetCheckpointMixin
+from ingestion.base.stage_timing import PROCESS
 from ingestion.models.common import SyncHistory
 
 logger = logging.getLogger(__name__)
 
-class GeniusAppointmentsSyncEngine:
+class GeniusAppointmentsSyncEngine(GeniusKeysetCheckpointMixin):
     """Sync engine for Genius appointments data with chunked processing"""
     
     def __init__(self):
@@ -68,7 +70,7 @@ class GeniusAppointmentsSyncEngine:
         sync_record.records_created = stats.get('created', 0)
         sync_record.records_updated = stats.get('updated', 0)
         sync_record.records_failed = stats.get('errors', 0)
-        sync_record.performance_metrics = stats
+        sync_record.performance_metrics = self.with_stage_metrics(stats)
         
         if error_message:
             sync_record.status = 'failed'
@@ -82,7 +84,8 @@ class GeniusAppointmentsSyncEngine:
                          force_overwrite: bool = False, 
                          dry_run: bool = False,
                          max_records: Optional[int] = None,
-                         full_sync: bool = False) -> Dict[str, Any]:
+                         full_sync: bool = False,
+                         resume: bool = False) -> Dict[str, Any]:
         """
         Sync appointments data with chunked processing
         
@@ -92,6 +95,7 @@ class GeniusAppointmentsSyncEngine:
             dry_run: Whether to perform a dry run without database changes
             max_records: Maximum number of records to process (for testing)
             full_sync: Whether to perform a full sync (ignoring last sync timestamp)
+            resume: Continue an interrupted sync from its checkpoint
             
         Returns:
             Dictionary containing sync statistics
@@ -107,6 +111,12 @@ class GeniusAppointmentsSyncEngine:
         logger.info(f"Starting appointments sync - since_date: {since_date}, force_overwrite: {force_overwrite}, "
                    f"dry_run: {dry_run}, max_records: {max_records}")
         
+        # Continue an interrupted keyset walk from its checkpoint
+        resume_from = self.get_keyset_resume_point(resume)
+        if resume_from:
+            since_date = resume_from['since']
+            logger.info(f"Resuming sync {resume_from['sync_id']} (since_date: {since_date}, after key: {self.resume_key})")
+        
         # Create SyncHistory record
         configuration = {
             'since_date': since_date.isoformat() if since_date else None,
@@ -114,7 +124,10 @@ class GeniusAppointmentsSyncEngine:
             'dry_run': dry_run,
             'max_records': max_records
         }
+        if resume_from:
+            configuration['resumed_from'] = resume_from['sync_id']
         sync_record = self.create_sync_record(configuration)
+        self.start_checkpoint(sync_record, dry_run=dry_run)
         
         try:
             stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
@@ -131,6 +144,7 @@ class GeniusAppointmentsSyncEngine:
             logger.info(f"Appointments sync completed - Stats: {stats}")
             
             # Complete sync record with success
+            self.finish_checkpoint()
             self.complete_sync_record(sync_record, stats)
             
             # Return stats with sync_id for compatibility
@@ -141,6 +155,7 @@ class GeniusAppointmentsSyncEngine:
         except Exception as e:
             # Complete sync record with error
             error_stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 1}
+            self.finish_checkpoint(failed=True)
             self.complete_sync_record(sync_record, error_stats, error_message=str(e))
             raise
     
@@ -149,40 +164,12 @@ class GeniusAppointmentsSyncEngine:
                                   stats: Dict[str, Any]) -> Dict[str, Any]:
         """Process appointments data in chunks for large datasets"""
         
-        # Get total count first
-        total_count = self.client.get_appointments_count(since=since_date)
-        logger.info(f"Total appointments to process: {total_count}")
-        
-        if max_records:
-            total_count = min(total_count, max_records)
-            
-        # Process in chunks using limit and offset simulation
         processed = 0
-        chunk_num = 1
-        
-        while processed < total_count:
-            # Calculate chunk size
-            current_chunk_size = min(self.chunk_size, total_count - processed)
-            
-            if current_chunk_size <= 0:
-                break
-                
-            logger.info(f"Processing chunk {chunk_num}: records {processed + 1} to {processed + current_chunk_size}")
-            
-            # Fetch chunk data (the client will handle pagination internally)
-            chunk_data = self.client.get_appointments(since=since_date, limit=current_chunk_size)
-            
-            if not chunk_data:
-                logger.info("No more data to process")
-                break
-                
-            # Skip already processed records if this isn't the first chunk
-            if processed > 0:
-                chunk_data = chunk_data[processed:]
-                
-            # Limit to current chunk size
-            chunk_data = chunk_data[:current_chunk_size]
-                
+        chunks = self.timed_chunks(self.client.get_chunked_items(
+            chunk_size=self.chunk_size, since=since_date, max_records=max_records,
+            start_key=self.resume_key
+        ))
+        for chunk_num, chunk_data in enumerate(chunks, 1):
             logger.info(f"Processing chunk {chunk_num}: {len(chunk_data)} records")
             
             # Process this chunk
@@ -191,9 +178,9 @@ class GeniusAppointmentsSyncEngine:
             # Update stats
             stats = chunk_stats
             processed += len(chunk_data)
-            chunk_num += 1
+            self.checkpoint_chunk(since_date, stats['total_processed'])
             
-            logger.info(f"Chunk {chunk_num - 1} completed - "
+            logger.info(f"Chunk {chunk_num} completed - "
                        f"Created: {chunk_stats.get('created', 0)}, "
                        f"Updated: {chunk_stats.get('updated', 0)}, "
                        f"Total processed: {processed}")
@@ -221,12 +208,13 @@ class GeniusAppointmentsSyncEngine:
             
             try:
                 # Process batch through processor
-                batch_stats = self.processor.process_batch(
-                    batch_data, 
-                    field_mapping, 
-                    force_overwrite=force_overwrite,
-                    dry_run=dry_run
-                )
+                with self.stage_timer.measure(PROCESS):
+                    batch_stats = self.processor.process_batch(
+                        batch_data, 
+                        field_mapping, 
+                        force_overwrite=force_overwrite,
+                        dry_run=dry_run
+                    )
                 
                 # Update cumulative stats
                 for key, value in batch_stats.items():
@@ -5,13 +5,16 @@ import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from asgiref.sync import sync_to_async
 
+from ingestion.base.checkpoint import SyncCheckpoint, load_resume_checkpoint
+from ingestion.base.stage_timing import CHECKPOINT, StageTimingMixin
 from ingestion.models.common import SyncHistory
 
 logger = logging.getLogger(__name__)
 
-class GeniusBaseSyncEngine:
+class GeniusBaseSyncEngine(StageTimingMixin):
     """Base sync engine for all Genius CRM entities"""
     
     def __init__(self, entity_type: str):
@@ -37,6 +40,7 @@ class GeniusBaseSyncEngine:
     @sync_to_async
     def create_sync_record(self, configuration: Dict[str, Any]) -> SyncHistory:
         """Create SyncHistory record at sync start"""
+        self.reset_stage_timer()
         return SyncHistory.objects.create(
             crm_source=self.crm_source,
             sync_type=self.entity_type,
@@ -70,11 +74,11 @@ class GeniusBaseSyncEngine:
         total_processed = stats.get('total_processed', 0)
         success_rate = ((total_processed - stats.get('errors', 0)) / total_processed) if total_processed > 0 else 0
         
-        sync_record.performance_metrics = {
+        sync_record.performance_metrics = self.with_stage_metrics({
             'duration_seconds': duration,
             'records_per_second': total_processed / duration if duration > 0 else 0,
             'success_rate': success_rate
-        }
+        })
         
         print(f"DEBUG: About to save sync record {sync_record.id}")
         logger.info(f"Saving sync record {sync_record.id}: processed={sync_record.records_processed}, created={sync_record.records_created}")
@@ -148,3 +152,56 @@ class GeniusBaseSyncEngine:
                                    error_message: str = None) -> None:
         """Complete sync record asynchronously using the proper status logic"""
         self.complete_sync_record(sync_record, stats, error_message)
+
+
+class GeniusKeysetCheckpointMixin(StageTimingMixin):
+    """Checkpoint/resume support for engines that walk ``client.get_chunked_items``
+    
+    After each processed chunk the client's keyset position, together with the
+    ``since`` filter the walk was started with, is checkpointed on the running
+    SyncHistory row. A resumed run restores both and continues the walk.
+    
+    It also times the walk: waits on ``get_chunked_items`` and checkpoint
+    writes are recorded on ``stage_timer`` (see ingestion.base.stage_timing).
+    """
+    checkpoint = None
+    resume_key = None
+    
+    def get_keyset_resume_point(self, resume: bool = False) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint of an interrupted run; sets ``resume_key`` for the chunk walk"""
+        previous, cursor = load_resume_checkpoint(self.crm_source, self.entity_type, resume)
+        if previous is None:
+            self.resume_key = None
+            return None
+        
+        # JSON turned timestamp key parts into ISO strings
+        self.resume_key = [
+            (parse_datetime(value) or value) if isinstance(value, str) else value
+            for value in cursor.get('last_key') or []
+        ] or None
+        since = cursor.get('since')
+        return {'sync_id': previous.id, 'since': parse_datetime(since) if since else None}
+    
+    def start_checkpoint(self, sync_record: SyncHistory, dry_run: bool = False) -> None:
+        self.checkpoint = None if dry_run else SyncCheckpoint(sync_record)
+        self.reset_stage_timer()
+    
+    def timed_chunks(self, chunks):
+        """Iterate ``chunks`` recording each wait on the source as ``fetch_wait``"""
+        return self.stage_timer.timed_iter(chunks)
+    
+    def checkpoint_chunk(self, since_date: Optional[datetime], records_processed: int) -> None:
+        """Record the keyset position after a chunk has been saved"""
+        position = getattr(self.client, 'keyset_position', None)
+        if self.checkpoint and position:
+            with self.stage_timer.measure(CHECKPOINT):
+                self.checkpoint.update({'since': since_date, 'last_key': position}, records_processed)
+    
+    def finish_checkpoint(self, failed: bool = False) -> None:
+        """Flush the last position of a failed run, or drop it after a successful one"""
+        if not self.checkpoint:
+            return
+        if failed:
+            self.checkpoint.flush()
+        else:
+            self.checkpoint.clear()
@@ -13,11 +13,23 @@ from django.utils import timezone
 from ..clients.jobs import GeniusJobsClient
 from ..processors.jobs import GeniusJobsProcessor
 from ingestion.models.common import SyncHistory
+from ..processors.plan import TransformPlanMixin, parse_string_datetime, to_int
+from ingestion.base.adaptive_batching import FLUSH, PAGE, adaptive_summary, learned_sizes
 from ingestion.base.streaming_client import StreamingClient, StreamingProcessor
 
 logger = logging.getLogger(__name__)
 
 
+def to_amount(value: Any) -> Optional[float]:
+    """Money column as float; unparsable amounts become 0.0"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 0.0
+
+
 class StreamingGeniusJobsClient(StreamingClient):
     """Streaming client for Genius jobs with keyset pagination"""
     
@@ -67,9 +79,28 @@ class StreamingGeniusJobsClient(StreamingClient):
         )
 
 
-class StreamingGeniusJobsProcessor(StreamingProcessor):
+class StreamingGeniusJobsProcessor(TransformPlanMixin, StreamingProcessor):
     """Memory-safe processor for jobs with bulk operations"""
     
+    # Same conversions as transform_job_record, compiled once and applied per page.
+    # The streamed columns are kept even where the model names them differently.
+    plan_model_fields_only = False
+    plan_converters = {
+        'total_amount': to_amount,
+        'deposit_amount': to_amount,
+        'prospect_id': to_int,
+        'appointment_id': to_int,
+        'service_id': to_int,
+        'status_id': to_int,
+        'sales_rep_id': to_int,
+        'crew_leader_id': to_int,
+        'add_user_id': to_int,
+        'start_date': parse_string_datetime,
+        'completion_date': parse_string_datetime,
+        'add_date': parse_string_datetime,
+        'updated_at': parse_string_datetime,
+    }
+    
     def __init__(self):
         from ingestion.models.genius import Genius_Job
         super().__init__(Genius_Job)
@@ -167,6 +198,7 @@ class StreamingGeniusJobsSyncEngine:
         sync_record.records_created = stats.get('created', 0)
         sync_record.records_updated = stats.get('updated', 0)
         sync_record.records_failed = stats.get('errors', 0)
+        sync_record.records_skipped = stats.get('skipped', 0)
         
         # Store performance metrics
         if sync_record.start_time:
@@ -174,7 +206,11 @@ class StreamingGeniusJobsSyncEngine:
             sync_record.performance_metrics = {
                 'duration_seconds': duration.total_seconds(),
                 'stats': stats,
-                'streaming_mode': True
+                'streaming_mode': True,
+                'adaptive_batching': adaptive_summary(**{
+                    PAGE: self.client.page_controller,
+                    FLUSH: self.processor.flush_controller,
+                }),
             }
         
         if error_message:
@@ -211,6 +247,11 @@ class StreamingGeniusJobsSyncEngine:
             f"max_records: {max_records}"
         )
         
+        # Start page and write sizes where the last run's controllers ended
+        learned = learned_sizes(self.crm_source, self.entity_type)
+        self.client.start_adaptive_paging(learned.get(PAGE))
+        self.processor.start_adaptive_flushing(learned.get(FLUSH))
+        
         # Create SyncHistory record
         configuration = {
             'since_date': since_date.isoformat() if since_date else None,
@@ -237,7 +278,7 @@ class StreamingGeniusJobsSyncEngine:
             stats = self.processor.process_stream(
                 records_stream=jobs_stream,
                 field_mapping=self.client.get_field_mapping(),
-                transform_func=self.processor.transform_job_record,
+                page_transform_func=self.processor.transform_page,
                 force_overwrite=force_overwrite,
                 dry_run=dry_run
             )
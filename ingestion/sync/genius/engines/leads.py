@@ -8,11 +8,13 @@ from django.utils import timezone
 
 from ..clients.leads import GeniusLeadClient
 from ..processors.leads import GeniusLeadProcessor
+from .base import GeniusKeysetCheckpointMixin
+from ingestion.base.stage_timing import PROCESS
 from ingestion.models.common import SyncHistory
 
 logger = logging.getLogger(__name__)
 
-class GeniusLeadsSyncEngine:
+class GeniusLeadsSyncEngine(GeniusKeysetCheckpointMixin):
     """Sync engine for Genius leads data with chunked processing"""
     
     def __init__(self):
@@ -63,6 +65,7 @@ class GeniusLeadsSyncEngine:
         sync_record.successful_count = stats.get('created', 0) + stats.get('updated', 0)
         sync_record.error_count = stats.get('errors', 0)
         sync_record.statistics = stats
+        sync_record.performance_metrics = self.with_stage_metrics(sync_record.performance_metrics or {})
         
         if error_message:
             sync_record.status = 'failed'
@@ -75,7 +78,8 @@ class GeniusLeadsSyncEngine:
     def sync_leads(self, since_date: Optional[datetime] = None, 
                   force_overwrite: bool = False, 
                   dry_run: bool = False,
-                  max_records: Optional[int] = None) -> Dict[str, Any]:
+                  max_records: Optional[int] = None,
+                  resume: bool = False) -> Dict[str, Any]:
         """
         Sync leads data with chunked processing
         
@@ -84,6 +88,7 @@ class GeniusLeadsSyncEngine:
             force_overwrite: Whether to force overwrite existing records
             dry_run: Whether to perform a dry run without database changes
             max_records: Maximum number of records to process (for testing)
+            resume: Continue an interrupted sync from its checkpoint
             
         Returns:
             Dictionary containing sync statistics
@@ -100,6 +105,12 @@ class GeniusLeadsSyncEngine:
         logger.info(f"Starting leads sync - since_date: {since_date}, force_overwrite: {force_overwrite}, "
                    f"dry_run: {dry_run}, max_records: {max_records}")
         
+        # Continue an interrupted keyset walk from its checkpoint
+        resume_from = self.get_keyset_resume_point(resume)
+        if resume_from:
+            since_date = resume_from['since']
+            logger.info(f"Resuming sync {resume_from['sync_id']} (since_date: {since_date}, after key: {self.resume_key})")
+        
         # Create SyncHistory record
         configuration = {
             'since_date': since_date.isoformat() if since_date else None,
@@ -108,7 +119,10 @@ class GeniusLeadsSyncEngine:
             'max_records': max_records,
             'auto_determined_since': original_since_date is None and since_date is not None
         }
+        if resume_from:
+            configuration['resumed_from'] = resume_from['sync_id']
         sync_record = self.create_sync_record(configuration)
+        self.start_checkpoint(sync_record, dry_run=dry_run)
         
         try:
             stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
@@ -125,6 +139,7 @@ class GeniusLeadsSyncEngine:
             logger.info(f"Leads sync completed - Stats: {stats}")
             
             # Complete sync record with success
+            self.finish_checkpoint()
             self.complete_sync_record(sync_record, stats)
             
             # Return stats with sync_id for compatibility
@@ -135,6 +150,7 @@ class GeniusLeadsSyncEngine:
         except Exception as e:
             # Complete sync record with error
             error_stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 1}
+            self.finish_checkpoint(failed=True)
             self.complete_sync_record(sync_record, error_stats, error_message=str(e))
             raise
     
@@ -143,33 +159,13 @@ class GeniusLeadsSyncEngine:
                            stats: Dict[str, Any]) -> Dict[str, Any]:
         """Process leads data in chunks for large datasets"""
         
-        offset = 0
-        total_processed = 0
-        
-        while True:
-            # Apply max_records limit to chunk size if specified
-            current_chunk_size = self.chunk_size
-            if max_records:
-                remaining = max_records - total_processed
-                if remaining <= 0:
-                    break
-                current_chunk_size = min(self.chunk_size, remaining)
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {current_chunk_size})")
-            
-            # Get chunked query for logging
-            query = self.client.get_chunked_query(offset, current_chunk_size, since_date)
-            logger.info(query)
-            
-            # Fetch chunk data
-            chunk_data = self.client.get_chunked_leads(offset, current_chunk_size, since_date)
-            
-            if not chunk_data:
-                logger.info("No more data to process")
-                break
-                
-            logger.info(f"Processing chunk {(offset // self.chunk_size) + 1}: "
-                       f"{len(chunk_data)} records (total processed so far: {total_processed + len(chunk_data)})")
+        chunks = self.timed_chunks(self.client.get_chunked_items(
+            chunk_size=self.chunk_size, since=since_date, max_records=max_records,
+            start_key=self.resume_key
+        ))
+        for chunk_num, chunk_data in enumerate(chunks, 1):
+            logger.info(f"Processing chunk {chunk_num}: "
+                       f"{len(chunk_data)} records (total processed so far: {stats['total_processed'] + len(chunk_data)})")
             
             # Process this chunk
             chunk_stats = self._process_leads_batch(chunk_data, force_overwrite, dry_run, stats)
@@ -177,20 +173,10 @@ class GeniusLeadsSyncEngine:
             # Update running totals
             for key in ['total_processed', 'created', 'updated', 'errors']:
                 stats[key] = chunk_stats[key]
+            self.checkpoint_chunk(since_date, stats['total_processed'])
             
-            total_processed = stats['total_processed']
-            
-            logger.info(f"Chunk {(offset // self.chunk_size) + 1} completed - "
-                       f"Created: {chunk_stats['created'] - (stats['created'] - len([r for r in chunk_data if r]))}, "
-                       f"Updated: {chunk_stats['updated'] - (stats['updated'] - len([r for r in chunk_data if r]))}, "
+            logger.info(f"Chunk {chunk_num} completed - "
                        f"Running totals: {stats['created']} created, {stats['updated']} updated")
-            
-            # Move to next chunk
-            offset += current_chunk_size
-            
-            # Break if we got less data than requested (end of data)
-            if len(chunk_data) < current_chunk_size:
-                break
         
         return stats
     
@@ -215,12 +201,13 @@ class GeniusLeadsSyncEngine:
             
             try:
                 # Process batch through processor
-                batch_stats = self.processor.process_batch(
-                    batch_data, 
-                    field_mapping, 
-                    force_overwrite=force_overwrite,
-                    dry_run=dry_run
-                )
+                with self.stage_timer.measure(PROCESS):
+                    batch_stats = self.processor.process_batch(
+                        batch_data, 
+                        field_mapping, 
+                        force_overwrite=force_overwrite,
+                        dry_run=dry_run
+                    )
                 
                 # Update cumulative stats
                 for key, value in batch_stats.items():
@@ -8,11 +8,13 @@ from django.utils import timezone
 
 from ..clients.prospects import GeniusProspectsClient
 from ..processors.prospects import GeniusProspectsProcessor
+from .base import GeniusKeysetCheckpointMixin
+from ingestion.base.stage_timing import PROCESS
 from ingestion.models.common import SyncHistory
 
 logger = logging.getLogger(__name__)
 
-class GeniusProspectsSyncEngine:
+class GeniusProspectsSyncEngine(GeniusKeysetCheckpointMixin):
     """Sync engine for Genius prospects data with chunked processing"""
     
     def __init__(self):
@@ -67,10 +69,10 @@ class GeniusProspectsSyncEngine:
         sync_record.records_created = stats.get('created', 0)
         sync_record.records_updated = stats.get('updated', 0)
         sync_record.records_failed = stats.get('errors', 0)
-        sync_record.performance_metrics = {
+        sync_record.performance_metrics = self.with_stage_metrics({
             'duration_seconds': (sync_record.end_time - sync_record.start_time).total_seconds() if sync_record.end_time and sync_record.start_time else 0,
             'records_per_second': stats.get('total_processed', 0) / max(1, (sync_record.end_time - sync_record.start_time).total_seconds()) if sync_record.end_time and sync_record.start_time else 0
-        }
+        })
         
         if error_message:
             sync_record.status = 'failed'
@@ -83,7 +85,8 @@ class GeniusProspectsSyncEngine:
     def sync_prospects_async(self, sync_mode: str = 'incremental', batch_size: int = 500,
                            max_records: Optional[int] = None, dry_run: bool = False,
                            debug: bool = False, skip_validation: bool = False,
-                           start_date: Optional[datetime] = None, **kwargs) -> Dict[str, Any]:
+                           start_date: Optional[datetime] = None, resume: bool = False,
+                           **kwargs) -> Dict[str, Any]:
         """
         Sync prospects data with CRM sync guide compliance
         
@@ -95,6 +98,7 @@ class GeniusProspectsSyncEngine:
             debug: Enable debug logging
             skip_validation: Skip data validation steps
             start_date: Manual sync start date
+            resume: Continue an interrupted sync from its checkpoint
             
         Returns:
             Dictionary containing sync statistics
@@ -113,6 +117,12 @@ class GeniusProspectsSyncEngine:
         # Update batch size configuration
         self.batch_size = batch_size
         
+        # Continue an interrupted keyset walk from its checkpoint
+        resume_from = self.get_keyset_resume_point(resume)
+        if resume_from:
+            since_date = resume_from['since']
+            logger.info(f"Resuming sync {resume_from['sync_id']} (since_date: {since_date}, after key: {self.resume_key})")
+        
         # Create SyncHistory record
         configuration = {
             'sync_mode': sync_mode,
@@ -124,7 +134,10 @@ class GeniusProspectsSyncEngine:
             'debug': debug,
             'skip_validation': skip_validation
         }
+        if resume_from:
+            configuration['resumed_from'] = resume_from['sync_id']
         sync_record = self.create_sync_record(configuration)
+        self.start_checkpoint(sync_record, dry_run=dry_run)
         
         try:
             stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0, 'skipped': 0}
@@ -141,6 +154,7 @@ class GeniusProspectsSyncEngine:
             logger.info(f"Prospects sync completed - Stats: {stats}")
             
             # Complete sync record with success
+            self.finish_checkpoint()
             self.complete_sync_record(sync_record, stats)
             
             # Return stats with sync_record_id for CRM guide compliance
@@ -151,6 +165,7 @@ class GeniusProspectsSyncEngine:
         except Exception as e:
             # Complete sync record with error
             error_stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 1, 'skipped': 0}
+            self.finish_checkpoint(failed=True)
             self.complete_sync_record(sync_record, error_stats, error_message=str(e))
             raise
     
@@ -159,33 +174,13 @@ class GeniusProspectsSyncEngine:
                                stats: Dict[str, Any]) -> Dict[str, Any]:
         """Process prospects data in chunks for large datasets"""
         
-        offset = 0
-        total_processed = 0
-        
-        while True:
-            # Apply max_records limit to chunk size if specified
-            current_chunk_size = self.chunk_size
-            if max_records:
-                remaining = max_records - total_processed
-                if remaining <= 0:
-                    break
-                current_chunk_size = min(self.chunk_size, remaining)
-            
-            logger.info(f"Executing chunked query (offset: {offset}, chunk_size: {current_chunk_size})")
-            
-            # Get chunked query for logging
-            query = self.client.get_chunked_query(offset, current_chunk_size, since_date)
-            logger.info(query)
-            
-            # Fetch chunk data
-            chunk_data = self.client.get_chunked_prospects(offset, current_chunk_size, since_date)
-            
-            if not chunk_data:
-                logger.info("No more data to process")
-                break
-                
-            logger.info(f"Processing chunk {(offset // self.chunk_size) + 1}: "
-                       f"{len(chunk_data)} records (total processed so far: {total_processed + len(chunk_data)})")
+        chunks = self.timed_chunks(self.client.get_chunked_items(
+            chunk_size=self.chunk_size, since=since_date, max_records=max_records,
+            start_key=self.resume_key
+        ))
+        for chunk_num, chunk_data in enumerate(chunks, 1):
+            logger.info(f"Processing chunk {chunk_num}: "
+                       f"{len(chunk_data)} records (total processed so far: {stats['total_processed'] + len(chunk_data)})")
             
             # Process this chunk
             chunk_stats = self._process_prospects_batch(chunk_data, force_overwrite, dry_run, stats)
@@ -193,20 +188,10 @@ class GeniusProspectsSyncEngine:
             # Update running totals
             for key in ['total_processed', 'created', 'updated', 'errors']:
                 stats[key] = chunk_stats[key]
+            self.checkpoint_chunk(since_date, stats['total_processed'])
             
-            total_processed = stats['total_processed']
-            
-            logger.info(f"Chunk {(offset // self.chunk_size) + 1} completed - "
-                       f"Created: {chunk_stats['created'] - (stats['created'] - len([r for r in chunk_data if r]))}, "
-                       f"Updated: {chunk_stats['updated'] - (stats['updated'] - len([r for r in chunk_data if r]))}, "
+            logger.info(f"Chunk {chunk_num} completed - "
                        f"Running totals: {stats['created']} created, {stats['updated']} updated")
-            
-            # Move to next chunk
-            offset += current_chunk_size
-            
-            # Break if we got less data than requested (end of data)
-            if len(chunk_data) < current_chunk_size:
-                break
         
         return stats
     
@@ -231,12 +216,13 @@ class GeniusProspectsSyncEngine:
             
             try:
                 # Process batch through processor
-                batch_stats = self.processor.process_batch(
-                    batch_data, 
-                    field_mapping, 
-                    force_overwrite=force_overwrite,
-                    dry_run=dry_run
-                )
+                with self.stage_timer.measure(PROCESS):
+                    batch_stats = self.processor.process_batch(
+                        batch_data, 
+                        field_mapping, 
+                        force_overwrite=force_overwrite,
+                        dry_run=dry_run
+                    )
                 
                 # Update cumulative stats
                 for key, value in batch_stats.items():
@@ -13,6 +13,8 @@ from django.utils import timezone
 from ..clients.prospects import GeniusProspectsClient  
 from ..processors.prospects import GeniusProspectsProcessor
 from ingestion.models.common import SyncHistory
+from ..processors.plan import TransformPlanMixin, parse_string_datetime, to_float, to_int
+from ingestion.base.adaptive_batching import FLUSH, PAGE, adaptive_summary, learned_sizes
 from ingestion.base.streaming_client import StreamingClient, StreamingProcessor
 
 logger = logging.getLogger(__name__)
@@ -67,9 +69,23 @@ class StreamingGeniusProspectsClient(StreamingClient):
         )
 
 
-class StreamingGeniusProspectsProcessor(StreamingProcessor):
+class StreamingGeniusProspectsProcessor(TransformPlanMixin, StreamingProcessor):
     """Memory-safe processor for prospects with bulk operations"""
     
+    # Same conversions as transform_prospect_record, compiled once and applied per page.
+    # The streamed columns are kept even where the model names them differently.
+    plan_model_fields_only = False
+    plan_converters = {
+        'latitude': to_float,
+        'longitude': to_float,
+        'lead_source_id': to_int,
+        'status_id': to_int,
+        'sales_rep_id': to_int,
+        'add_user_id': to_int,
+        'add_date': parse_string_datetime,
+        'updated_at': parse_string_datetime,
+    }
+    
     def __init__(self):
         from ingestion.models.genius import Genius_Prospect
         super().__init__(Genius_Prospect)
@@ -167,6 +183,7 @@ class StreamingGeniusProspectsSyncEngine:
         sync_record.records_created = stats.get('created', 0)
         sync_record.records_updated = stats.get('updated', 0)
         sync_record.records_failed = stats.get('errors', 0)
+        sync_record.records_skipped = stats.get('skipped', 0)
         
         # Store performance metrics
         if sync_record.start_time:
@@ -174,7 +191,11 @@ class StreamingGeniusProspectsSyncEngine:
             sync_record.performance_metrics = {
                 'duration_seconds': duration.total_seconds(),
                 'stats': stats,
-                'streaming_mode': True
+                'streaming_mode': True,
+                'adaptive_batching': adaptive_summary(**{
+                    PAGE: self.client.page_controller,
+                    FLUSH: self.processor.flush_controller,
+                }),
             }
         
         if error_message:
@@ -227,6 +248,11 @@ class StreamingGeniusProspectsSyncEngine:
         elif start_date:
             since_date = start_date
         
+        # Start page and write sizes where the last run's controllers ended
+        learned = learned_sizes(self.crm_source, self.entity_type)
+        self.client.start_adaptive_paging(learned.get(PAGE))
+        self.processor.start_adaptive_flushing(learned.get(FLUSH))
+        
         # Create SyncHistory record
         configuration = {
             'sync_mode': sync_mode,
@@ -255,7 +281,7 @@ class StreamingGeniusProspectsSyncEngine:
             stats = self.processor.process_stream(
                 records_stream=prospects_stream,
                 field_mapping=self.client.get_field_mapping(),
-                transform_func=self.processor.transform_prospect_record,
+                page_transform_func=self.processor.transform_page,
                 force_overwrite=force_overwrite,
                 dry_run=dry_run
             )
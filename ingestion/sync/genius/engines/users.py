@@ -8,11 +8,13 @@ from django.utils import timezone
 
 from ..clients.users import GeniusUsersClient
 from ..processors.users import GeniusUsersProcessor
+from .base import GeniusKeysetCheckpointMixin
+from ingestion.base.stage_timing import PROCESS
 
 logger = logging.getLogger(__name__)
 
 
-class GeniusUsersSyncEngine:
+class GeniusUsersSyncEngine(GeniusKeysetCheckpointMixin):
     """Sync engine for Genius users data with chunked processing"""
     
     def __init__(self):
@@ -72,17 +74,18 @@ class GeniusUsersSyncEngine:
         total_processed = stats.get('total_processed', 0)
         success_rate = ((total_processed - stats.get('errors', 0)) / total_processed) if total_processed > 0 else 0
         
-        sync_record.performance_metrics = {
+        sync_record.performance_metrics = self.with_stage_metrics({
             'duration_seconds': duration,
             'records_per_second': total_processed / duration if duration > 0 else 0,
             'success_rate': success_rate
-        }
+        })
         
         sync_record.save()
     
     def sync_users(self, since_date: Optional[datetime] = None, force_overwrite: bool = False, 
                    dry_run: bool = False, max_records: Optional[int] = None, 
-                   full_sync: bool = False) -> Dict[str, Any]:
+                   full_sync: bool = False,
+                   resume: bool = False) -> Dict[str, Any]:
         """Sync users data with chunked processing"""
         
         # Determine sync strategy based on parameters
@@ -104,6 +107,12 @@ class GeniusUsersSyncEngine:
         
         logger.info(f"Starting users sync - since_date: {since_date}, force_overwrite: {force_overwrite}, dry_run: {dry_run}, max_records: {max_records}")
         
+        # Continue an interrupted keyset walk from its checkpoint
+        resume_from = self.get_keyset_resume_point(resume)
+        if resume_from:
+            since_date = resume_from['since']
+            logger.info(f"Resuming sync {resume_from['sync_id']} (since_date: {since_date}, after key: {self.resume_key})")
+        
         # Create SyncHistory record
         configuration = {
             'since_date': since_date.isoformat() if since_date else None,
@@ -111,7 +120,10 @@ class GeniusUsersSyncEngine:
             'dry_run': dry_run,
             'max_records': max_records
         }
+        if resume_from:
+            configuration['resumed_from'] = resume_from['sync_id']
         sync_record = self.create_sync_record(configuration)
+        self.start_checkpoint(sync_record, dry_run=dry_run)
         
         try:
             stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
@@ -128,6 +140,7 @@ class GeniusUsersSyncEngine:
             logger.info(f"Users sync completed - Stats: {stats}")
             
             # Complete sync record with success
+            self.finish_checkpoint()
             self.complete_sync_record(sync_record, stats)
             
             # Return stats with sync_id for compatibility
@@ -138,54 +151,25 @@ class GeniusUsersSyncEngine:
         except Exception as e:
             # Complete sync record with error
             error_stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 1}
+            self.finish_checkpoint(failed=True)
             self.complete_sync_record(sync_record, error_stats, error_message=str(e))
             raise
     
     def _sync_chunked_users(self, since_date: Optional[datetime], force_overwrite: bool, 
                            dry_run: bool, max_records: Optional[int], 
                            stats: Dict[str, Any]) -> Dict[str, Any]:
-        """Process users data in chunks using cursor-based pagination for better performance"""
+        """Process users data in chunks using keyset pagination for better performance"""
         
-        cursor = None
         chunk_num = 0
-        total_processed = 0
+        logger.info("🚀 Using keyset pagination for better performance")
         
-        logger.info("🚀 Using optimized cursor-based pagination for better performance")
-        
-        while True:
-            chunk_num += 1
-            
-            # Apply max_records limit to chunk size if specified
-            current_chunk_size = self.chunk_size
-            if max_records:
-                remaining = max_records - total_processed
-                if remaining <= 0:
-                    break
-                current_chunk_size = min(self.chunk_size, remaining)
-            
-            logger.info(f"📦 Fetching chunk {chunk_num} with cursor-based pagination (chunk_size: {current_chunk_size})")
-            
-            # Fetch chunk data using cursor-based pagination
-            try:
-                chunk_data, next_cursor = self.client.get_cursor_based_users(
-                    chunk_size=current_chunk_size,
-                    last_cursor=cursor,
-                    since_date=since_date
-                )
-            except Exception as e:
-                logger.warning(f"Cursor-based pagination failed for chunk {chunk_num}: {e}")
-                logger.info("⚠️ Falling back to OFFSET-based pagination")
-                # Fallback to offset-based method
-                offset = (chunk_num - 1) * self.chunk_size
-                chunk_data = self.client.get_chunked_users(offset, current_chunk_size, since_date)
-                next_cursor = None if len(chunk_data) < current_chunk_size else True
-            
-            if not chunk_data:
-                logger.info("✅ No more data to process")
-                break
-                
+        chunks = self.timed_chunks(self.client.get_chunked_items(
+            chunk_size=self.chunk_size, since=since_date, max_records=max_records,
+            start_key=self.resume_key
+        ))
+        for chunk_num, chunk_data in enumerate(chunks, 1):
             logger.info(f"⚙️  Processing chunk {chunk_num}: {len(chunk_data)} records "
-                       f"(total processed so far: {total_processed + len(chunk_data)})")
+                       f"(total processed so far: {stats['total_processed'] + len(chunk_data)})")
             
             # Process this chunk
             chunk_stats = self._process_users_batch(chunk_data, force_overwrite, dry_run, stats)
@@ -193,24 +177,15 @@ class GeniusUsersSyncEngine:
             # Update running totals
             for key in ['total_processed', 'created', 'updated', 'errors']:
                 stats[key] = chunk_stats[key]
-            
-            total_processed = stats['total_processed']
+            self.checkpoint_chunk(since_date, stats['total_processed'])
             
             logger.info(f"✅ Chunk {chunk_num} completed - "
                        f"Processed: {len(chunk_data)}, "
                        f"Running totals: {stats['created']} created, {stats['updated']} updated, "
                        f"{stats['errors']} errors")
-            
-            # Update cursor for next iteration
-            cursor = next_cursor
-            
-            # Break if no more data (cursor is None)
-            if cursor is None:
-                logger.info("🏁 Reached end of data (cursor is None)")
-                break
         
         logger.info(f"🎯 Completed chunked processing: {chunk_num} chunks processed, "
-                   f"{total_processed} total records")
+                   f"{stats['total_processed']} total records")
         return stats
     
     def _process_users_batch(self, users_data: list, force_overwrite: bool, 
@@ -234,12 +209,13 @@ class GeniusUsersSyncEngine:
             
             try:
                 # Process batch through processor
-                batch_stats = self.processor.process_batch(
-                    batch_data, 
-                    field_mapping, 
-                    force_overwrite=force_overwrite,
-                    dry_run=dry_run
-                )
+                with self.stage_timer.measure(PROCESS):
+                    batch_stats = self.processor.process_batch(
+                        batch_data, 
+                        field_mapping, 
+                        force_overwrite=force_overwrite,
+                        dry_run=dry_run
+                    )
                 
                 # Update cumulative stats
                 for key, value in batch_stats.items():
@@ -9,12 +9,15 @@ from django.db import transaction
 from django.utils import timezone
 
 from ingestion.models import Genius_AppointmentService
+from .base import count_created_updated, upsert_in_place
 
 logger = logging.getLogger(__name__)
 
 class GeniusAppointmentServicesProcessor:
     """Processor for transforming and loading appointment services data"""
     
+    UNIQUE_FIELDS = ('appointment_id', 'service_id')
+    
     def __init__(self, model_class=None):
         self.model_class = model_class or Genius_AppointmentService
         
@@ -75,7 +78,7 @@ class GeniusAppointmentServicesProcessor:
         if not transformed_records or dry_run:
             if dry_run:
                 logger.info(f"DRY RUN: Would process {len(transformed_records)} appointment services records")
-                stats['created'] = len(transformed_records)  # Simulate creation for dry run
+                stats.update(count_created_updated(self.model_class, transformed_records, self.UNIQUE_FIELDS))
             return stats
         
         # Bulk create/update operations with performance tracking
@@ -384,27 +387,12 @@ class GeniusAppointmentServicesProcessor:
         return stats
     
     def _bulk_force_update(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Perform bulk force update - delete and recreate all records"""
-        stats = {'created': 0, 'updated': 0}
-        
-        # Get all appointment_ids and service_ids to delete
-        appointment_ids = [r['appointment_id'] for r in records]
-        service_ids = [r['service_id'] for r in records]
-        
-        with transaction.atomic():
-            # Delete existing records
-            deleted_count, _ = self.model_class.objects.filter(
-                appointment_id__in=appointment_ids,
-                service_id__in=service_ids
-            ).delete()
-            
-            # Bulk create all records as new
-            create_objects = [
-                self.model_class(**record) for record in records
-            ]
-            self.model_class.objects.bulk_create(create_objects, batch_size=500)
-            
-            stats['created'] = len(records)
-            logger.info(f"Force update: deleted {deleted_count}, created {len(records)} appointment services records")
-        
+        """Perform bulk force update - overwrite existing records in place"""
+        stats = upsert_in_place(
+            self.model_class,
+            [self.model_class(**record) for record in records],
+            unique_fields=self.UNIQUE_FIELDS,
+            batch_size=500
+        )
+        logger.info(f"Force update: created {stats['created']}, overwrote {stats['updated']} appointment services records")
         return stats
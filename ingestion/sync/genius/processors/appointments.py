@@ -4,20 +4,46 @@ Handles transformation and validation of appointments data
 """
 import logging
 from datetime import datetime, time, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from django.db import transaction
 from django.utils import timezone
 
+from .base import count_created_updated, upsert_in_place
+from .plan import TransformPlanMixin, records_from_columns
 from ingestion.models import Genius_Appointment, Genius_Prospect, Genius_ProspectSource, Genius_AppointmentType, Genius_AppointmentOutcome
 
 logger = logging.getLogger(__name__)
 
 
-class GeniusAppointmentsProcessor:
+class GeniusAppointmentsProcessor(TransformPlanMixin):
     """Processor for transforming and loading appointments data"""
     
+    model_class = Genius_Appointment
+    
+    # Keys produced by transform_record, in order
+    APPOINTMENT_FIELDS = (
+        'id', 'prospect_id', 'prospect_source_id', 'user_id', 'type_id', 'date', 'time', 'duration',
+        'address1', 'address2', 'city', 'state', 'zip', 'email', 'notes', 'add_user_id', 'add_date',
+        'assign_date', 'confirm_user_id', 'confirm_date', 'confirm_with', 'spouses_present',
+        'is_complete', 'complete_outcome_id', 'complete_user_id', 'complete_date', 'marketsharp_id',
+        'marketsharp_appt_type', 'leap_estimate_id', 'hubspot_appointment_id', 'updated_at',
+    )
+    
     def __init__(self):
         self.batch_size = 500
+        # Converters for the compiled column-wise transform plan
+        self.plan_converters = {
+            'date': self._convert_date,
+            'time': self._convert_time,
+            'duration': self._convert_duration,
+            'add_date': self._convert_datetime,
+            'assign_date': self._convert_datetime,
+            'confirm_date': self._convert_datetime,
+            'complete_date': self._convert_datetime,
+            'updated_at': self._convert_datetime,
+            'spouses_present': self._convert_boolean,
+            'is_complete': self._convert_boolean,
+        }
     
     def process_batch(self, records: List[Dict[str, Any]], field_mapping: List[str], force_overwrite: bool = False, dry_run: bool = False) -> Dict[str, int]:
         """
@@ -55,35 +81,15 @@ class GeniusAppointmentsProcessor:
         """Process a single batch of records synchronously using bulk operations for performance"""
         stats = {'created': 0, 'updated': 0, 'errors': 0}
         
+        # Transform all records first
+        transformed_records, stats['errors'] = self._transform_records(records)
+        
         if dry_run:
-            # For dry run, just validate transformations
-            for record in records:
-                try:
-                    transformed = self.transform_record(record)
-                    if transformed:
-                        # Check if record exists for dry run stats
-                        exists = Genius_Appointment.objects.filter(id=record['id']).exists()
-                        if force_overwrite or not exists:
-                            stats['created'] += 1
-                        else:
-                            stats['updated'] += 1
-                except Exception as e:
-                    stats['errors'] += 1
+            # For dry run, count what the write would do with one lookup for the batch
+            stats.update(count_created_updated(Genius_Appointment, transformed_records))
             return stats
         
-        # Transform all records first
-        appointment_instances = []
-        for record in records:
-            try:
-                transformed = self.transform_record(record)
-                if transformed:
-                    appointment_instances.append(Genius_Appointment(**transformed))
-                else:
-                    stats['errors'] += 1
-            except Exception as e:
-                record_id = record.get('id', 'Unknown')
-                logger.error(f"Error transforming appointment record ID {record_id}: {e}")
-                stats['errors'] += 1
+        appointment_instances = [Genius_Appointment(**transformed) for transformed in transformed_records]
         
         if not appointment_instances:
             return stats
@@ -94,18 +100,10 @@ class GeniusAppointmentsProcessor:
                 logger.info(f"Bulk processing {len(appointment_instances)} appointment records (force_overwrite={force_overwrite})")
                 
                 if force_overwrite:
-                    # Force mode: Delete existing records first, then create new ones
-                    appointment_ids = [appt.id for appt in appointment_instances]
-                    deleted_count, _ = Genius_Appointment.objects.filter(id__in=appointment_ids).delete()
-                    logger.info(f"Force mode: Deleted {deleted_count} existing appointment records")
-                    
-                    # Create all records as new (don't use update_conflicts in force mode)
-                    created_appointments = Genius_Appointment.objects.bulk_create(
-                        appointment_instances,
-                        batch_size=self.batch_size
-                    )
-                    stats['created'] = len(created_appointments)
-                    stats['updated'] = 0
+                    # Force mode: overwrite existing rows in place instead of delete + re-insert
+                    stats.update(upsert_in_place(
+                        Genius_Appointment, appointment_instances, batch_size=self.batch_size
+                    ))
                 else:
                     # Normal mode: Use bulk_create with update_conflicts for upsert
                     # Define fields to update on conflict
@@ -120,17 +118,10 @@ class GeniusAppointmentsProcessor:
                         'updated_at'
                     ]
                     
-                    created_appointments = Genius_Appointment.objects.bulk_create(
-                        appointment_instances,
-                        update_conflicts=True,
-                        update_fields=update_fields,
-                        unique_fields=['id']
-                    )
-                    
-                    # Count results - bulk_create returns all instances but _state.adding indicates new records
-                    batch_created = sum(1 for appt in created_appointments if appt._state.adding)
-                    stats['created'] = batch_created
-                    stats['updated'] = len(appointment_instances) - batch_created
+                    # Created/updated counts come from one key lookup, as in dry runs
+                    stats.update(upsert_in_place(
+                        Genius_Appointment, appointment_instances, update_fields=update_fields
+                    ))
                 
                 logger.info(f"Bulk upsert completed - Created: {stats['created']}, Updated: {stats['updated']}")
                 
@@ -140,6 +131,44 @@ class GeniusAppointmentsProcessor:
         
         return stats
     
+    def _transform_records(self, records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+        """Transform a batch column-wise, falling back to record by record if that fails.
+        
+        Returns the transformed records and the number of records that could not be transformed.
+        """
+        try:
+            return self.transform_appointments_page(records), 0
+        except Exception as e:
+            logger.warning(f"Column-wise transform failed ({e}); transforming {len(records)} appointments one by one")
+        
+        transformed_records = []
+        errors = 0
+        for record in records:
+            try:
+                transformed = self.transform_record(record)
+            except Exception as e:
+                logger.error(f"Error transforming appointment record ID {record.get('id', 'Unknown')}: {e}")
+                transformed = None
+            if transformed:
+                transformed_records.append(transformed)
+            else:
+                errors += 1
+        return transformed_records, errors
+    
+    def transform_appointments_page(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Column-wise equivalent of ``transform_record`` for a whole batch"""
+        if not records:
+            return []
+        columns = self.get_transform_plan(self.APPOINTMENT_FIELDS).columns(records)
+        
+        # If add_date is null or empty, use the appointment date as fallback
+        columns['add_date'] = [
+            add_date if add_date is not None or day is None
+            else timezone.make_aware(datetime.combine(day, time.min))
+            for add_date, day in zip(columns['add_date'], columns['date'])
+        ]
+        return records_from_columns(columns)
+    
     def transform_record(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Transform raw database record to model-compatible format"""
         record_id = record.get('id', 'Unknown')
@@ -2,14 +2,88 @@
 Base processor for Genius CRM data transformation
 """
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Sequence
 from datetime import datetime
 from django.utils import timezone
 
+from .plan import TransformPlanMixin
+
 logger = logging.getLogger(__name__)
 
-class GeniusBaseProcessor:
-    """Base processor for Genius CRM data transformation and validation"""
+
+def _record_key(record: Any, fields: Sequence[str]) -> Any:
+    """Scalar key for single-field keys, tuple for composite keys; works on dicts and model instances"""
+    if isinstance(record, dict):
+        values = [record.get(name) for name in fields]
+    else:
+        values = [getattr(record, name, None) for name in fields]
+    return values[0] if len(values) == 1 else tuple(values)
+
+
+def existing_keys(model_class, records: Iterable[Any], unique_fields: Sequence[str] = ('id',)) -> set:
+    """Keys of ``records`` already in the table, found with one set-based query per batch"""
+    fields = list(unique_fields)
+    keys = {_record_key(record, fields) for record in records}
+    keys.discard(None)
+    if not keys:
+        return set()
+    if len(fields) == 1:
+        return set(
+            model_class.objects.filter(**{f'{fields[0]}__in': keys}).values_list(fields[0], flat=True)
+        )
+    # Composite keys: narrow by each column, then keep exact matches only
+    filters = {f'{name}__in': {key[i] for key in keys} for i, name in enumerate(fields)}
+    return keys.intersection(map(tuple, model_class.objects.filter(**filters).values_list(*fields)))
+
+
+def count_created_updated(model_class, records: Sequence[Any],
+                          unique_fields: Sequence[str] = ('id',)) -> Dict[str, int]:
+    """Created/updated split a write of ``records`` will produce; used by real and dry runs alike"""
+    fields = list(unique_fields)
+    existing = existing_keys(model_class, records, fields)
+    updated = sum(1 for record in records if _record_key(record, fields) in existing)
+    return {'created': len(records) - updated, 'updated': updated}
+
+
+def replace_fields(model_class, unique_fields: Sequence[str] = ('id',)) -> List[str]:
+    """Every column a fresh insert would set, minus the keys and creation stamps"""
+    return [
+        field.name for field in model_class._meta.concrete_fields
+        if not field.primary_key and field.name not in unique_fields
+        and not getattr(field, 'auto_now_add', False)
+    ]
+
+
+def upsert_in_place(model_class, instances: Sequence[Any], unique_fields: Sequence[str] = ('id',),
+                    update_fields: Optional[Sequence[str]] = None,
+                    batch_size: Optional[int] = None) -> Dict[str, int]:
+    """Force-mode write: overwrite existing rows with INSERT ... ON CONFLICT DO UPDATE.
+
+    Replaces delete + re-insert, which rewrote every index entry (and the WAL
+    for it) twice. ``update_fields`` defaults to every column, so existing rows
+    end up as a fresh insert would leave them.
+    """
+    fields = list(unique_fields)
+    # ON CONFLICT cannot touch the same row twice in one statement; the last copy wins
+    instances = list({_record_key(instance, fields): instance for instance in instances}.values())
+    counts = count_created_updated(model_class, instances, fields)
+    model_class.objects.bulk_create(
+        instances,
+        update_conflicts=True,
+        unique_fields=fields,
+        update_fields=list(update_fields or replace_fields(model_class, fields)),
+        batch_size=batch_size,
+    )
+    return counts
+
+
+class GeniusBaseProcessor(TransformPlanMixin):
+    """Base processor for Genius CRM data transformation and validation.
+    
+    Whole pages are transformed with ``transform_page``, which applies a
+    compiled column-wise plan (see ``plan.py``); ``transform_record`` remains
+    for single rows.
+    """
     
     def __init__(self, model_class):
         self.model_class = model_class
@@ -4,7 +4,7 @@ Job Change Order processor for Genius CRM data transformation
 import logging
 from typing import Dict, Any, List
 
-from .base import GeniusBaseProcessor
+from .base import GeniusBaseProcessor, count_created_updated, upsert_in_place
 from ..validators import GeniusValidator, GeniusRecordValidator, GeniusFieldValidator
 
 logger = logging.getLogger(__name__)
@@ -123,7 +123,7 @@ class GeniusJobChangeOrderProcessor(GeniusBaseProcessor):
         
         if dry_run:
             logger.info(f"DRY RUN: Would process {len(validated_records)} job change orders")
-            stats['created'] = len(validated_records)
+            stats.update(count_created_updated(self.model_class, validated_records))
             return stats
         
         # Perform bulk operations
@@ -137,14 +137,8 @@ class GeniusJobChangeOrderProcessor(GeniusBaseProcessor):
                 model_instances = [self.model_class(**record) for record in validated_records]
                 
                 if force_overwrite:
-                    # Delete existing records first, then create new ones
-                    existing_ids = [record['id'] for record in validated_records]
-                    deleted_count = self.model_class.objects.filter(id__in=existing_ids).delete()[0]
-                    logger.info(f"Deleted {deleted_count} existing records")
-                    
-                    # Create all records as new
-                    created_objects = self.model_class.objects.bulk_create(model_instances)
-                    stats['created'] = len(created_objects)
+                    # Overwrite existing rows in place instead of delete + re-insert
+                    stats.update(upsert_in_place(self.model_class, model_instances))
                     
                 else:
                     # Use bulk_create with update_conflicts for upsert behavior
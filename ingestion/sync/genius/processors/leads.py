@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Dict, Any, List
 
 from .base import GeniusBaseProcessor
+from .plan import records_from_columns, to_aware_datetime, to_int, to_str
 from ..validators import GeniusValidator, GeniusRecordValidator
 
 logger = logging.getLogger(__name__)
@@ -14,6 +15,36 @@ logger = logging.getLogger(__name__)
 class GeniusLeadProcessor(GeniusBaseProcessor):
     """Processor for Genius lead data transformation and validation"""
     
+    # Compiled transform plan: source column -> model field, and per-field converters
+    plan_renames = {
+        'phone': 'phone1',
+        'address': 'address1',
+        'zip_code': 'zip',
+        'prospect_source_id': 'source',
+        'user_id': 'added_by',
+        'converted_to_prospect_id': 'copied_to_id',
+        'created_at': 'added_on',
+    }
+    plan_converters = {
+        'lead_id': to_int,
+        'first_name': to_str,
+        'last_name': to_str,
+        'email': to_str,
+        'phone1': to_str,
+        'address1': to_str,
+        'city': to_str,
+        'state': to_str,
+        'zip': to_str,
+        'source': to_int,
+        'added_by': to_int,
+        'division_id': to_int,
+        'notes': to_str,
+        'status': to_str,
+        'copied_to_id': to_int,
+        'added_on': to_aware_datetime,
+        'updated_at': to_aware_datetime,
+    }
+    
     def __init__(self, model_class):
         super().__init__(model_class)
         
@@ -89,6 +120,38 @@ class GeniusLeadProcessor(GeniusBaseProcessor):
             logger.error(f"Error processing lead record: {e}")
             return None
     
+    def transform_leads_page(self, batch_data: List[tuple], field_mapping: List[str]) -> List[Dict[str, Any]]:
+        """Column-wise equivalent of ``validate_record`` for a whole page of rows.
+        
+        Rows without a ``lead_id`` are dropped; raises ValueError when the rows
+        do not match ``field_mapping``.
+        """
+        if not batch_data:
+            return []
+        columns = self.get_transform_plan(field_mapping).columns(batch_data)
+        
+        # Required datetime fields fall back to the sync time
+        from django.utils import timezone
+        now = timezone.now()
+        for name in ('updated_at', 'added_on'):
+            if name in columns:
+                columns[name] = [now if value is None else value for value in columns[name]]
+        columns['sync_updated_at'] = [self.convert_timezone_aware(datetime.now())] * len(batch_data)
+        
+        records = [record for record in records_from_columns(columns) if record.get('lead_id')]
+        if len(records) < len(batch_data):
+            logger.warning(f"Skipping {len(batch_data) - len(records)} records with missing lead_id")
+        
+        # Track validation issues for batch summary (don't log individual warnings)
+        self.validation_stats['processed_count'] += len(records)
+        self.validation_stats['missing_names'] += sum(
+            1 for record in records if not record.get('first_name') and not record.get('last_name')
+        )
+        self.validation_stats['missing_contact_info'] += sum(
+            1 for record in records if not record.get('email') and not record.get('phone1')
+        )
+        return records
+    
     def process_batch(self, batch_data: List[tuple], field_mapping: List[str], 
                      force_overwrite: bool = False, dry_run: bool = False) -> Dict[str, int]:
         """Process a batch of leads data using bulk operations"""
@@ -96,45 +159,17 @@ class GeniusLeadProcessor(GeniusBaseProcessor):
         stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
         
         try:
-            # Transform batch data to model instances  
-            model_instances = []
-            for raw_row in batch_data:
-                try:
-                    # Validate and transform record
-                    record_data = self.validate_record(raw_row, field_mapping)
-                    
-                    if record_data is None:
-                        stats['errors'] += 1
-                        continue
-                    
-                    # Create model instance
-                    instance = self.model_class(
-                        lead_id=record_data['lead_id'],
-                        first_name=record_data.get('first_name'),
-                        last_name=record_data.get('last_name'),
-                        email=record_data.get('email'),
-                        phone1=record_data.get('phone1'),
-                        address1=record_data.get('address1'),
-                        city=record_data.get('city'),
-                        state=record_data.get('state'),
-                        zip=record_data.get('zip'),
-                        source=record_data.get('source'),
-                        added_by=record_data.get('added_by'),
-                        division_id=record_data.get('division_id'),
-                        notes=record_data.get('notes'),
-                        status=record_data.get('status'),
-                        copied_to_id=record_data.get('copied_to_id'),
-                        added_on=record_data.get('added_on'),
-                        updated_at=record_data.get('updated_at'),
-                        sync_updated_at=record_data.get('sync_updated_at')
-                    )
-                    
-                    model_instances.append(instance)
-                    stats['total_processed'] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error transforming lead record {raw_row[0] if raw_row else 'unknown'}: {e}")
-                    stats['errors'] += 1
+            # Transform the whole page column-wise with the compiled plan
+            try:
+                records = self.transform_leads_page(batch_data, field_mapping)
+            except ValueError as e:
+                logger.error(f"Cannot transform lead batch: {e}")
+                stats['errors'] = len(batch_data)
+                return stats
+            
+            stats['errors'] += len(batch_data) - len(records)
+            model_instances = [self.model_class(**record) for record in records]
+            stats['total_processed'] += len(model_instances)
             
             if not model_instances:
                 logger.warning("No valid model instances to process")
@@ -0,0 +1,204 @@
+"""
+Precompiled column-wise transform plans for Genius MySQL rows.
+
+Genius clients return pages of plain tuples in ``get_field_mapping()`` order.
+Instead of zipping every row into a dict and looking up a converter per field
+per row, a ``TransformPlan`` is compiled once per field mapping: a tuple of
+column positions, target field names and converters derived from the model's
+field types (plus processor overrides). Applying it transposes the page, maps
+each converter over its whole column and zips the columns back into
+tuple-backed ``Row``s sharing one schema (``ingestion.base.rows``), so the
+per-row work left in Python is building a single small object.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from dateutil.parser import parse as parse_date
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ingestion.base.rows import Row, rows_from_columns
+
+logger = logging.getLogger(__name__)
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def to_int(value: Any) -> Optional[int]:
+    """Integer or None for empty and unparsable values"""
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        logger.debug(f"Could not convert '{value}' to integer")
+        return None
+
+
+def to_float(value: Any) -> Optional[float]:
+    """Float or None for empty and unparsable values"""
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def to_str(value: Any) -> Optional[str]:
+    """Stripped string, None for empty values"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def to_aware_datetime(value: Any) -> Optional[datetime]:
+    """Timezone-aware datetime; naive values are taken in the current timezone"""
+    if value is None or value == '':
+        return None
+    if not isinstance(value, datetime):
+        try:
+            value = parse_date(str(value))
+        except (ValueError, TypeError, OverflowError):
+            logger.debug(f"Could not convert '{value}' to datetime")
+            return None
+    if value.tzinfo is None:
+        return timezone.make_aware(value, timezone.get_current_timezone())
+    return value
+
+
+def parse_string_datetime(value: Any) -> Any:
+    """Parse ISO datetime strings; other values (including naive datetimes) pass through"""
+    if isinstance(value, str):
+        try:
+            return parse_datetime(value)
+        except ValueError:
+            return value
+    return value
+
+
+def to_bool(value: Any) -> Optional[bool]:
+    """MySQL tinyint/bit flags to bool"""
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return value != b'\x00'
+    return bool(value)
+
+
+# Converters picked from the model field type when a processor has no override.
+# The MySQL driver already returns ints, floats, Decimals, strings and dates in
+# their final Python type, so only columns that need real work get a converter;
+# everything else is passed through untouched.
+FIELD_TYPE_CONVERTERS: Dict[str, Converter] = {
+    'DateTimeField': to_aware_datetime,
+    'BooleanField': to_bool,
+}
+
+
+class TransformPlan:
+    """Column positions, target names and converters for one field mapping"""
+
+    def __init__(self, width: int, positions: Sequence[int], names: Sequence[str],
+                 converters: Sequence[Converter], sources: Optional[Sequence[str]] = None):
+        self.width = width
+        self.positions = tuple(positions)
+        # Source column names, used to read rows that arrive as dicts
+        self.sources = tuple(sources) if sources is not None else tuple(names)
+        self.names = tuple(names)
+        self.converters = tuple(converters)
+
+    @classmethod
+    def compile(cls, field_mapping: Sequence[str], model_class=None,
+                renames: Optional[Dict[str, str]] = None,
+                converters: Optional[Dict[str, Converter]] = None,
+                model_fields_only: bool = True) -> 'TransformPlan':
+        """Build a plan for rows in ``field_mapping`` order.
+
+        ``renames`` maps source columns to model fields, ``converters`` overrides
+        the type-derived converter per target field. With ``model_fields_only``
+        columns the model does not have are dropped.
+        """
+        renames = renames or {}
+        converters = converters or {}
+        model_fields = {}
+        if model_class is not None:
+            for field in model_class._meta.concrete_fields:
+                model_fields[field.name] = field
+                model_fields.setdefault(field.attname, field)
+
+        positions, sources, names, plan_converters = [], [], [], []
+        for position, column in enumerate(field_mapping):
+            name = renames.get(column, column)
+            field = model_fields.get(name)
+            if field is None and model_class is not None and model_fields_only and name not in converters:
+                continue
+            if name in converters:
+                converter = converters[name]
+            elif field is not None:
+                converter = FIELD_TYPE_CONVERTERS.get(field.get_internal_type())
+            else:
+                converter = None
+            positions.append(position)
+            sources.append(column)
+            names.append(name)
+            plan_converters.append(converter)
+        return cls(len(field_mapping), positions, names, plan_converters, sources)
+
+    def columns(self, rows: Sequence[Any]) -> Dict[str, List[Any]]:
+        """Convert a page of tuple (or dict) rows into ``{field: column values}``"""
+        if not rows:
+            return {name: [] for name in self.names}
+        if isinstance(rows[0], Mapping):
+            raw = [[row.get(source) for row in rows] for source in self.sources]
+        else:
+            widths = set(map(len, rows))
+            if widths != {self.width}:
+                raise ValueError(f"Rows have {sorted(widths)} columns, expected {self.width}")
+            transposed = list(zip(*rows))
+            raw = [transposed[position] for position in self.positions]
+        return {
+            name: list(map(converter, values)) if converter else list(values)
+            for name, converter, values in zip(self.names, self.converters, raw)
+        }
+
+    def records(self, rows: Sequence[Sequence[Any]]) -> List[Row]:
+        """Convert a page of rows into read-only records"""
+        return rows_from_columns(self.columns(rows))
+
+
+def records_from_columns(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Zip ``{field: column values}`` back into one dict per row"""
+    names = tuple(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+
+class TransformPlanMixin:
+    """Per-processor cache of compiled plans, keyed by field mapping.
+
+    Subclasses tune compilation with ``plan_renames``, ``plan_converters`` and
+    ``plan_model_fields_only``; ``self.model_class`` supplies the field types.
+    """
+
+    plan_renames: Dict[str, str] = {}
+    plan_converters: Dict[str, Converter] = {}
+    plan_model_fields_only: bool = True
+
+    def get_transform_plan(self, field_mapping: Sequence[str]) -> TransformPlan:
+        plans = self.__dict__.setdefault('_transform_plans', {})
+        key = tuple(field_mapping)
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = TransformPlan.compile(
+                key, getattr(self, 'model_class', None),
+                renames=self.plan_renames,
+                converters=self.plan_converters,
+                model_fields_only=self.plan_model_fields_only,
+            )
+        return plan
+
+    def transform_page(self, rows: Sequence[tuple], field_mapping: Sequence[str]) -> List[Row]:
+        """Transform a whole page of raw tuples with the compiled plan"""
+        return self.get_transform_plan(field_mapping).records(rows)
@@ -7,9 +7,11 @@ from datetime import datetime
 from django.utils import timezone
 from django.db import IntegrityError, transaction
 
+from .plan import TransformPlanMixin
+
 logger = logging.getLogger(__name__)
 
-class GeniusProspectsProcessor:
+class GeniusProspectsProcessor(TransformPlanMixin):
     """Processor for Genius prospects data with bulk operations"""
     
     def __init__(self, model_class):
@@ -65,48 +67,30 @@ class GeniusProspectsProcessor:
         stats = {'total_processed': 0, 'created': 0, 'updated': 0, 'errors': 0}
         
         try:
-            # Transform batch data to model instances  
+            # Transform the whole page column-wise with the compiled plan
+            try:
+                records = self.transform_page(batch_data, field_mapping)
+            except ValueError as e:
+                logger.error(f"Field mapping length ({len(field_mapping)}) doesn't match data: {e}")
+                stats['errors'] = len(batch_data)
+                return stats
+            
+            # Check for required ID field (allow ID = 0, but not None or empty)
             model_instances = []
-            for raw_row in batch_data:
-                try:
-                    # Transform and validate record
-                    record_data = self.transform_record(raw_row, field_mapping)
-                    record_data = self.validate_record(record_data)
-                    
-                    # Create model instance (excluding third_party_source_id which isn't in the model)
-                    instance = self.model_class(
-                        id=record_data['id'],
-                        division_id=record_data['division_id'],
-                        user_id=record_data.get('user_id'),
-                        first_name=record_data.get('first_name'),
-                        last_name=record_data.get('last_name'),
-                        alt_first_name=record_data.get('alt_first_name'),
-                        alt_last_name=record_data.get('alt_last_name'),
-                        address1=record_data.get('address1'),
-                        address2=record_data.get('address2'),
-                        city=record_data.get('city'),
-                        county=record_data.get('county'),
-                        state=record_data.get('state'),
-                        zip=record_data.get('zip'),
-                        year_built=record_data.get('year_built'),
-                        phone1=record_data.get('phone1'),
-                        phone2=record_data.get('phone2'),
-                        email=record_data.get('email'),
-                        notes=record_data.get('notes'),
-                        add_user_id=record_data.get('add_user_id'),
-                        add_date=record_data.get('add_date'),
-                        marketsharp_id=record_data.get('marketsharp_id'),
-                        leap_customer_id=record_data.get('leap_customer_id'),
-                        updated_at=record_data.get('updated_at'),
-                        hubspot_contact_id=record_data.get('hubspot_contact_id')
-                    )
-                    
-                    model_instances.append(instance)
-                    stats['total_processed'] += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error transforming prospect record {raw_row[0] if raw_row else 'unknown'}: {e}")
+            for record_data in records:
+                if record_data.get('id') is None or record_data.get('id') == '':
+                    logger.error(f"Prospect record missing required ID field")
                     stats['errors'] += 1
+                    continue
+                model_instances.append(self.model_class(**record_data))
+            stats['total_processed'] += len(model_instances)
+            
+            missing_division = sum(1 for instance in model_instances if not instance.division_id)
+            if missing_division:
+                logger.warning(f"{missing_division} prospects missing division_id")
+            missing_updated_at = sum(1 for instance in model_instances if not instance.updated_at)
+            if missing_updated_at:
+                logger.warning(f"{missing_updated_at} prospects missing updated_at timestamp")
             
             if not model_instances:
                 logger.warning("No valid model instances to process")
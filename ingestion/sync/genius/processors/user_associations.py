@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional
 from django.utils import timezone
 from django.db import transaction
 
-from .base import GeniusBaseProcessor
+from .base import GeniusBaseProcessor, count_created_updated, upsert_in_place
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +38,12 @@ class GeniusUserAssociationsProcessor(GeniusBaseProcessor):
         
         # Transform all records first
         transformed_records = []
-        record_ids = []
         
         for raw_record in batch_data:
             try:
                 transformed_record = self.transform_record(raw_record, field_mapping)
                 if transformed_record:
                     transformed_records.append(transformed_record)
-                    record_ids.append(transformed_record['id'])
                     
             except Exception as e:
                 logger.error(f"Error transforming user association record: {e}")
@@ -53,6 +51,7 @@ class GeniusUserAssociationsProcessor(GeniusBaseProcessor):
         
         if dry_run:
             stats['total_processed'] = len(transformed_records)
+            stats.update(count_created_updated(self.model_class, transformed_records))
             logger.info(f"DRY RUN: Would process {len(transformed_records)} user associations")
             return stats
         
@@ -60,12 +59,10 @@ class GeniusUserAssociationsProcessor(GeniusBaseProcessor):
         try:
             with transaction.atomic():
                 if force_overwrite:
-                    # Delete existing records and bulk create
-                    self.model_class.objects.filter(id__in=record_ids).delete()
-                    self.model_class.objects.bulk_create([
-                        self.model_class(**record) for record in transformed_records
-                    ])
-                    stats['created'] = len(transformed_records)
+                    # Overwrite existing rows in place instead of delete + re-insert
+                    stats.update(upsert_in_place(
+                        self.model_class, [self.model_class(**record) for record in transformed_records]
+                    ))
                 else:
                     # Use bulk_create with update_conflicts for upsert behavior  
                     created_objects = self.model_class.objects.bulk_create(
@@ -5,6 +5,7 @@ import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from django.conf import settings
 from django.utils import timezone
 
 from ingestion.base.sync_engine import BaseSyncEngine
@@ -27,6 +28,59 @@ class BaseGoogleSheetsSyncEngine(BaseSyncEngine):
         
         # Configuration should be defined in subclasses as hardcoded values
         self.sheet_config = None
+        
+        # --full: clear the table and re-import every row
+        self.force_full_sync = False
+    
+    @property
+    def incremental(self) -> bool:
+        """Write only changed rows (see ingestion.sync.gsheet.row_fingerprints)"""
+        return (
+            getattr(settings, 'GSHEET_INCREMENTAL_SYNC', True)
+            and not self.force_overwrite
+            and not self.force_full_sync
+        )
+    
+    def sheet_unchanged_since_last_sync(self, client, sheet_id: str, sync_type: str) -> bool:
+        """True when Drive reports no edit since the last clean, complete, non-dry-run sync started"""
+        from ingestion.models.common import SyncHistory
+        
+        last_start = SyncHistory.objects.filter(
+            crm_source='gsheet',
+            sync_type=sync_type,
+            status='success',
+            records_failed=0,
+        ).exclude(configuration__dry_run=True).exclude(
+            configuration__max_records__gt=0
+        ).order_by('-start_time').values_list('start_time', flat=True).first()
+        if not last_start:
+            return False
+        modified = client.get_sheet_modification_time(sheet_id)
+        return modified is not None and modified <= last_start
+    
+    def process_changed_rows(self, raw_data: List[Dict[str, Any]], delta, fingerprints,
+                             process_chunk) -> Dict[str, int]:
+        """Run ``process_chunk(rows, start_index)`` over the changed row ranges only.
+        
+        A chunk's row hashes are stored once it was written without failures;
+        rows of a chunk with failures are picked up again on the next run.
+        """
+        stats = {
+            'records_processed': 0,
+            'records_created': 0,
+            'records_updated': 0,
+            'records_failed': 0
+        }
+        chunk_size = min(self.batch_size, 1000)  # Max 1000 rows per chunk
+        for start, end in delta.ranges:
+            for chunk_start in range(start, end, chunk_size):
+                chunk_end = min(chunk_start + chunk_size, end)
+                chunk_stats = process_chunk(raw_data[chunk_start:chunk_end], chunk_start)
+                for key in stats:
+                    stats[key] += chunk_stats.get(key, 0)
+                if not self.dry_run and not chunk_stats.get('records_failed'):
+                    fingerprints.remember(delta, chunk_start, chunk_end)
+        return stats
     
     def get_default_batch_size(self) -> int:
         """Return default batch size for Google Sheets sync"""
@@ -10,11 +10,13 @@ from datetime import datetime
 from typing import Dict, Any, Optional, List
 
 from django.utils import timezone
+from ingestion.base.transform_pool import get_transform_executor, transform_records
 from ingestion.models.common import SyncHistory  # Use global SyncHistory table
 from ingestion.models.gsheet import GoogleSheetMarketingLead
 from ingestion.sync.gsheet.clients.marketing_leads import MarketingLeadsClient
 from ingestion.sync.gsheet.processors.marketing_leads import MarketingLeadsProcessor
 from ingestion.sync.gsheet.engines.base import BaseGoogleSheetsSyncEngine
+from ingestion.sync.gsheet.row_fingerprints import SheetRowFingerprints
 
 logger = logging.getLogger(__name__)
 
@@ -219,7 +221,7 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
             sync_type='marketing_leads_full_refresh',
             endpoint='multiple_sheets_2024_2025',
             configuration={
-                'operation': 'full_table_refresh',
+                'operation': 'incremental' if self.incremental else 'full_table_refresh',
                 'sheets': [config['year'] for config in self.sheet_configs],
                 'model': self.model.__name__,
                 'batch_size': self.batch_size,
@@ -243,8 +245,11 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
         }
         
         try:
-            # STEP 1: Clear the entire table first (unless dry run)
-            if not self.dry_run:
+            # STEP 1: Clear the entire table first (unless dry run or incremental)
+            if self.incremental:
+                logger.info("Incremental sync: writing only changed sheet rows")
+                overall_stats['records_deleted'] = 0
+            elif not self.dry_run:
                 logger.info("🗑️  Clearing entire GoogleSheetMarketingLead table...")
                 deleted_count = self.model.objects.all().delete()[0]
                 logger.info(f"✅ Cleared {deleted_count:,} existing records from table")
@@ -273,6 +278,8 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
                         overall_stats['records_created'] += result.get('records_created', 0)
                         overall_stats['records_updated'] += result.get('records_updated', 0)
                         overall_stats['records_failed'] += result.get('records_failed', 0)
+                        if self.incremental:
+                            overall_stats['records_deleted'] += result.get('records_deleted', 0)
                         overall_stats['sheets_processed'] += 1
                         
                         overall_stats['sheet_results'].append({
@@ -384,6 +391,12 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
             Dict: Sync result with status and statistics
         """
         try:
+            year = sheet_config['year']
+            fingerprints = SheetRowFingerprints(self.model, scope=year)
+            if not self.incremental and not self.dry_run:
+                # The table was cleared, so every row is written again
+                fingerprints.clear()
+            
             # Create client for this specific sheet
             client = MarketingLeadsClient(
                 sheet_id=sheet_config['sheet_id'],
@@ -392,64 +405,60 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
             
             # Test connection
             if not client.test_connection():
-                raise Exception(f"Google Sheets API connection failed for {sheet_config['year']} sheet")
-            
-            # Fetch data from Google Sheets
-            logger.info(f"Fetching data from {sheet_config['year']} Google Sheet...")
-            raw_data = client.fetch_sheet_data_sync()
-            logger.info(f"Fetched {len(raw_data)} rows from {sheet_config['year']} Google Sheet")
+                raise Exception(f"Google Sheets API connection failed for {year} sheet")
             
-            if not raw_data:
-                logger.info(f"No data found in {sheet_config['year']} Google Sheet")
+            if self.incremental and self.sheet_unchanged_since_last_sync(
+                client, sheet_config['sheet_id'], f'marketing_leads_{year}'
+            ):
+                logger.info(f"{year} Google Sheet not modified since last sync - skipping download")
                 return {
                     'status': 'success',
                     'records_processed': 0,
                     'records_created': 0,
                     'records_updated': 0,
                     'records_failed': 0,
-                    'message': f'No data found in {sheet_config["year"]} sheet'
+                    'records_unchanged': 0,
+                    'message': f'{year} sheet not modified since last sync'
                 }
             
-            # Initialize statistics
-            stats = {
-                'records_processed': 0,
-                'records_created': 0,
-                'records_updated': 0,
-                'records_failed': 0
-            }
+            # Fetch data from Google Sheets
+            logger.info(f"Fetching data from {year} Google Sheet...")
+            raw_data = client.fetch_sheet_data_sync()
+            logger.info(f"Fetched {len(raw_data)} rows from {year} Google Sheet")
             
-            # Process data in chunks
-            chunk_size = min(self.batch_size, 1000)  # Max 1000 rows per chunk
-            total_chunks = (len(raw_data) + chunk_size - 1) // chunk_size
+            # Rows whose cells changed since the last sync, in contiguous ranges
+            if self.incremental:
+                present_rows = {
+                    int(record_id.rsplit('-', 1)[1])
+                    for record_id in self.model.objects.filter(id__startswith=f"{year}-").values_list('id', flat=True)
+                }
+                delta = fingerprints.diff(raw_data, present_rows=present_rows)
+            else:
+                delta = fingerprints.diff(raw_data, stored={})
+            logger.info(
+                f"{year} sheet: {delta.changed} changed or new rows in {len(delta.ranges)} ranges, "
+                f"{delta.unchanged} unchanged, {len(delta.removed_rows)} removed"
+            )
             
-            logger.info(f"Processing {len(raw_data)} rows from {sheet_config['year']} sheet in {total_chunks} chunks of {chunk_size} rows each")
+            stats = self.process_changed_rows(
+                raw_data, delta, fingerprints,
+                lambda chunk_data, start_index: self._process_data_chunk(chunk_data, start_index, year)
+            )
+            stats['records_unchanged'] = delta.unchanged
             
-            for chunk_index in range(total_chunks):
-                start_index = chunk_index * chunk_size
-                end_index = min(start_index + chunk_size, len(raw_data))
-                chunk_data = raw_data[start_index:end_index]
-                
-                logger.info(f"Processing {sheet_config['year']} chunk {chunk_index + 1}/{total_chunks} (rows {start_index + 1}-{end_index})")
-                
-                # Process chunk with year information
-                chunk_stats = self._process_data_chunk(chunk_data, start_index, sheet_config['year'])
-                
-                # Update overall statistics
-                stats['records_processed'] += chunk_stats['records_processed']
-                stats['records_created'] += chunk_stats['records_created']
-                stats['records_updated'] += chunk_stats['records_updated']
-                stats['records_failed'] += chunk_stats['records_failed']
-                
-                # Log progress
-                if (chunk_index + 1) % 10 == 0 or chunk_index + 1 == total_chunks:
-                    logger.info(f"{sheet_config['year']} Progress: {chunk_index + 1}/{total_chunks} chunks completed. "
-                              f"Created: {stats['records_created']}, Updated: {stats['records_updated']}, Failed: {stats['records_failed']}")
+            # Rows past the end of the sheet no longer exist there
+            stats['records_deleted'] = 0
+            if delta.removed_rows and not self.dry_run:
+                stats['records_deleted'] = self.model.objects.filter(
+                    id__in=[f"{year}-{number}" for number in delta.removed_rows]
+                ).delete()[0]
+                fingerprints.forget(delta.removed_rows)
             
-            logger.info(f"{sheet_config['year']} sync completed: {stats}")
+            logger.info(f"{year} sync completed: {stats}")
             return {
                 'status': 'success',
                 **stats,
-                'message': f'{sheet_config["year"]} sync completed: {stats["records_created"]} created, {stats["records_updated"]} updated, {stats["records_failed"]} failed'
+                'message': f'{year} sync completed: {stats["records_created"]} created, {stats["records_updated"]} updated, {stats["records_failed"]} failed'
             }
             
         except Exception as e:
@@ -476,29 +485,22 @@ class MarketingLeadsSyncEngine(BaseGoogleSheetsSyncEngine):
         }
         
         try:
-            # Process rows and collect valid data
-            processed_rows = []
-            
+            # Add row metadata with year information
             for i, row_data in enumerate(chunk_data):
-                try:
-                    # Add row metadata with year information
-                    sheet_row_number = start_index + i + 2  # +2 for header row and 0-based index
-                    row_data['sheet_row_number'] = sheet_row_number
-                    row_data['year'] = year
-                    
-                    # Process the row using the processor
-                    processed_data = self.processor.process_row_sync(row_data)
-                    
-                    if processed_data:
-                        processed_rows.append(processed_data)
-                        chunk_stats['records_processed'] += 1
-                    else:
-                        chunk_stats['records_failed'] += 1
-                        
-                except Exception as e:
-                    logger.error(f"Failed to process {year} row {start_index + i + 2}: {e}")
-                    chunk_stats['records_failed'] += 1
-                    continue
+                row_data['sheet_row_number'] = start_index + i + 2  # +2 for header row and 0-based index
+                row_data['year'] = year
+            
+            # Process the rows using the processor, across the transform pool if configured
+            results, errors = transform_records(
+                self.processor, chunk_data, 'process_row_sync', get_transform_executor()
+            )
+            for i, message in errors:
+                logger.error(f"Failed to process {year} row {start_index + i + 2}: {message}")
+            
+            # Collect valid data
+            processed_rows = [processed_data for processed_data in results if processed_data]
+            chunk_stats['records_processed'] += len(processed_rows)
+            chunk_stats['records_failed'] += len(results) - len(processed_rows)
             
             # Batch database operations if not dry run
             if not self.dry_run and processed_rows:
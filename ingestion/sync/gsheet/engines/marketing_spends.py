@@ -14,6 +14,7 @@ from ingestion.models.gsheet import GoogleSheetMarketingSpend
 from ingestion.sync.gsheet.clients.marketing_spends import MarketingSpendsClient
 from ingestion.sync.gsheet.processors.marketing_spends import MarketingSpendsProcessor
 from ingestion.sync.gsheet.engines.base import BaseGoogleSheetsSyncEngine
+from ingestion.sync.gsheet.row_fingerprints import SheetRowFingerprints
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +96,8 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
                 'batch_size': self.batch_size,
                 'dry_run': self.dry_run,
                 'force_overwrite': self.force_overwrite,
+                'operation': 'incremental' if self.incremental else 'full_table_refresh',
+                'max_records': self.max_records,
             }
         )
         
@@ -195,22 +198,52 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
     def sync_sync(self) -> Dict[str, Any]:
         """
         Synchronous version of sync for management commands with chunking and batching
-        Performs full refresh by clearing table first, then importing all data
+        Incremental by default: only rows whose cells changed since the last sync
+        are written. Full refresh (--full / --force) clears the table first.
         """
         # Create SyncHistory record for tracking
         sync_record = self.create_sync_history_record('running')
         sync_start_time = timezone.now()
+        fingerprints = SheetRowFingerprints(
+            GoogleSheetMarketingSpend, scope=self.SHEET_CONFIG['tab_name'],
+            first_row_number=self.SHEET_CONFIG['data_start_row']
+        )
         
         try:
             # Test connection
             if not self.client.test_connection():
                 raise Exception("Google Sheets API connection failed")
             
+            if self.incremental and self.sheet_unchanged_since_last_sync(
+                self.client, self.SHEET_CONFIG['sheet_id'], 'marketing_spends'
+            ):
+                logger.info("Marketing spends sheet not modified since last sync - skipping download")
+                final_stats = {
+                    'records_processed': 0,
+                    'records_created': 0,
+                    'records_updated': 0,
+                    'records_failed': 0,
+                    'records_deleted': 0
+                }
+                self.update_sync_history_record(sync_record, 'success', final_stats)
+                return {
+                    'status': 'success',
+                    **final_stats,
+                    'records_unchanged': 0,
+                    'message': 'Sheet not modified since last sync',
+                    'sync_id': sync_record.id
+                }
+            
             # Clear existing records first (full refresh)
-            if not self.dry_run:
+            records_deleted = 0
+            if self.incremental:
+                logger.info("Incremental sync: writing only changed sheet rows")
+            elif not self.dry_run:
                 existing_count = GoogleSheetMarketingSpend.objects.count()
                 logger.info(f"🗑️  Clearing existing marketing spends records: {existing_count:,}")
                 GoogleSheetMarketingSpend.objects.all().delete()
+                fingerprints.clear()
+                records_deleted = existing_count
                 logger.info("✅ Table cleared successfully")
             else:
                 existing_count = GoogleSheetMarketingSpend.objects.count()
@@ -222,22 +255,23 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
             logger.info(f"Fetched {len(raw_data)} rows from Google Sheets")
             
             # Apply max_records limit if specified
+            truncated = False
             if self.max_records and self.max_records > 0:
                 original_count = len(raw_data)
                 raw_data = raw_data[:self.max_records]
+                truncated = len(raw_data) < original_count
                 logger.info(f"Limited to {len(raw_data)} records (max_records={self.max_records}, original={original_count})")
             
-            if not raw_data:
-                logger.info("No data found in Google Sheet")
-                return {
-                    'status': 'success',
-                    'records_processed': 0,
-                    'records_created': 0,
-                    'records_updated': 0,
-                    'records_failed': 0,
-                    'records_deleted': existing_count if not self.dry_run else 0,
-                    'message': 'No data found in sheet'
-                }
+            # Rows whose cells changed since the last sync, in contiguous ranges
+            if self.incremental:
+                present_rows = set(GoogleSheetMarketingSpend.objects.values_list('sheet_row_number', flat=True))
+                delta = fingerprints.diff(raw_data, present_rows=present_rows, complete=not truncated)
+            else:
+                delta = fingerprints.diff(raw_data, stored={})
+            logger.info(
+                f"{delta.changed} changed or new rows in {len(delta.ranges)} ranges, "
+                f"{delta.unchanged} unchanged, {len(delta.removed_rows)} removed"
+            )
             
             # Initialize statistics
             stats = {
@@ -248,31 +282,21 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
                 'errors': []
             }
             
-            # Process data in chunks for memory efficiency
-            chunk_size = min(self.batch_size, 1000)
-            total_chunks = (len(raw_data) + chunk_size - 1) // chunk_size
-            
-            logger.info(f"Processing {len(raw_data)} records in {total_chunks} chunks of {chunk_size}")
+            try:
+                chunk_stats = self.process_changed_rows(raw_data, delta, fingerprints, self._process_data_chunk)
+                for key in ['records_processed', 'records_created', 'records_updated', 'records_failed']:
+                    stats[key] += chunk_stats.get(key, 0)
+            except Exception as e:
+                logger.error(f"Error processing changed rows: {e}")
+                stats['records_failed'] += delta.changed - stats['records_processed']
+                stats['errors'].append(str(e))
             
-            for chunk_index in range(0, len(raw_data), chunk_size):
-                chunk_data = raw_data[chunk_index:chunk_index + chunk_size]
-                chunk_number = (chunk_index // chunk_size) + 1
-                
-                logger.info(f"Processing chunk {chunk_number}/{total_chunks} ({len(chunk_data)} records)")
-                
-                try:
-                    chunk_stats = self._process_data_chunk(chunk_data, chunk_index)
-                    
-                    # Aggregate statistics
-                    for key in ['records_processed', 'records_created', 'records_updated', 'records_failed']:
-                        stats[key] += chunk_stats.get(key, 0)
-                    
-                    logger.info(f"Chunk {chunk_number} completed: {chunk_stats}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing chunk {chunk_number}: {e}")
-                    stats['records_failed'] += len(chunk_data)
-                    stats['errors'].append(f"Chunk {chunk_number}: {str(e)}")
+            # Rows past the end of the sheet no longer exist there
+            if delta.removed_rows and not self.dry_run:
+                records_deleted += GoogleSheetMarketingSpend.objects.filter(
+                    sheet_row_number__in=delta.removed_rows
+                ).delete()[0]
+                fingerprints.forget(delta.removed_rows)
             
             # Get sheet info for response
             try:
@@ -288,7 +312,8 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
                 'records_created': stats['records_created'],
                 'records_updated': stats['records_updated'],
                 'records_failed': stats['records_failed'],
-                'records_deleted': existing_count if not self.dry_run else 0,
+                'records_deleted': records_deleted,
+                'records_unchanged': delta.unchanged,
                 'sheet_info': sheet_info,
                 'sync_id': sync_record.id
             }
@@ -302,7 +327,7 @@ class MarketingSpendsSyncEngine(BaseGoogleSheetsSyncEngine):
                 'records_created': stats['records_created'],
                 'records_updated': stats['records_updated'],
                 'records_failed': stats['records_failed'],
-                'records_deleted': existing_count if not self.dry_run else 0
+                'records_deleted': records_deleted
             }
             self.update_sync_history_record(sync_record, 'success', final_stats)
             
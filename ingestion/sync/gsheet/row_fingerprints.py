@@ -0,0 +1,139 @@
+"""
+Per-row fingerprints for incremental Google Sheets syncs.
+
+Every synced worksheet row gets a content hash of its raw cell values, stored
+in ``SyncRecordFingerprint`` under the target model's label plus ``#rows`` and
+keyed ``"{scope}:{row_number}"`` (the scope is the sheet year, or the tab for
+single-sheet syncs). On the next run the stored hashes for the scope are
+loaded in one query and only rows whose hash differs, or that are new, are
+transformed and written, grouped into contiguous row ranges. Stored or
+present rows past the end of the sheet are reported as removed.
+
+Row numbers are positional, matching the ``year-row`` IDs the engines
+already assign, so inserting a row shifts (and re-writes) everything below it.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from ingestion.base.fingerprint import record_fingerprint
+
+logger = logging.getLogger(__name__)
+
+ROW_NAMESPACE_SUFFIX = '#rows'
+
+
+def row_fingerprint(row: Mapping[str, Any]) -> str:
+    """Hash of a raw sheet row's cells, ignoring ``_``-prefixed sync metadata"""
+    return record_fingerprint(row, sorted(name for name in row if not name.startswith('_')))
+
+
+def contiguous_ranges(indexes: Iterable[int]) -> List[Tuple[int, int]]:
+    """Group sorted row indexes into ``[start, end)`` ranges"""
+    ranges = []
+    for index in indexes:
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    return [(start, end) for start, end in ranges]
+
+
+@dataclass
+class RowDelta:
+    """Rows of one worksheet that need writing, by position in the fetched data"""
+    ranges: List[Tuple[int, int]] = field(default_factory=list)
+    hashes: Dict[int, str] = field(default_factory=dict)
+    removed_rows: List[int] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> int:
+        return sum(end - start for start, end in self.ranges)
+
+
+class SheetRowFingerprints:
+    """Stored row hashes for one worksheet (``scope``) of a target model"""
+
+    def __init__(self, model_class, scope: Any, first_row_number: int = 2, using: str = 'default'):
+        self.model_label = f"{model_class._meta.label}{ROW_NAMESPACE_SUFFIX}"
+        self.prefix = f"{scope}:"
+        self.first_row_number = first_row_number
+        self.using = using
+
+    def _queryset(self):
+        from ingestion.models.common import SyncRecordFingerprint
+
+        return SyncRecordFingerprint.objects.using(self.using).filter(
+            model_label=self.model_label, record_key__startswith=self.prefix
+        )
+
+    def row_number(self, index: int) -> int:
+        return self.first_row_number + index
+
+    def load(self) -> Dict[int, str]:
+        """Stored hashes by sheet row number"""
+        return {
+            int(key[len(self.prefix):]): digest
+            for key, digest in self._queryset().values_list('record_key', 'content_hash')
+        }
+
+    def diff(self, rows: List[Mapping[str, Any]], stored: Optional[Dict[int, str]] = None,
+             present_rows: Optional[Set[int]] = None, complete: bool = True) -> RowDelta:
+        """Compare fetched rows with the stored hashes.
+
+        Args:
+            rows: Raw rows in sheet order
+            stored: Stored hashes (loaded when omitted; pass ``{}`` to treat every row as changed)
+            present_rows: Row numbers that exist in the target table; a matching
+                hash only counts as unchanged if its row is still there
+            complete: False when ``rows`` was truncated, so missing rows are not reported as removed
+        """
+        if stored is None:
+            stored = self.load()
+        delta = RowDelta()
+        changed = []
+        for index, row in enumerate(rows):
+            digest = row_fingerprint(row)
+            number = self.row_number(index)
+            if stored.get(number) == digest and (present_rows is None or number in present_rows):
+                delta.unchanged += 1
+            else:
+                changed.append(index)
+                delta.hashes[index] = digest
+        delta.ranges = contiguous_ranges(changed)
+        if complete:
+            last_row = self.row_number(len(rows) - 1)
+            known_rows = set(stored) | (present_rows or set())
+            delta.removed_rows = sorted(number for number in known_rows if number > last_row)
+        return delta
+
+    def remember(self, delta: RowDelta, start: int, end: int) -> None:
+        """Persist hashes for rows ``[start, end)`` after they were written"""
+        from ingestion.base.bulk_upsert import BulkUpserter
+        from ingestion.models.common import SyncRecordFingerprint
+
+        records = [
+            {
+                'model_label': self.model_label,
+                'record_key': f"{self.prefix}{self.row_number(index)}",
+                'content_hash': delta.hashes[index],
+            }
+            for index in range(start, end) if index in delta.hashes
+        ]
+        if records:
+            BulkUpserter(
+                SyncRecordFingerprint,
+                unique_fields=['model_label', 'record_key'],
+                update_fields=['content_hash', 'updated_at'],
+                using=self.using,
+            ).upsert(records)
+
+    def forget(self, row_numbers: Iterable[int]) -> None:
+        keys = [f"{self.prefix}{number}" for number in row_numbers]
+        if keys:
+            self._queryset().filter(record_key__in=keys).delete()
+
+    def clear(self) -> int:
+        """Drop every stored hash for this worksheet (after a full refresh clears the table)"""
+        return self._queryset().delete()[0]
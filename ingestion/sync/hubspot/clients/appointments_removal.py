@@ -16,8 +16,11 @@ class HubSpotAppointmentsRemovalClient(HubSpotBaseClient):
             "properties": ["hs_object_id"]
         }
         logger.debug(f"Sending batch_check_appointments payload: {payload}")
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.headers, json=payload, timeout=60) as response:
+        async with self.pooled_session() as session:
+            await self.acquire_rate_limit()
+            async with session.post(url, headers=self.headers, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=60)) as response:
+                self.record_rate_limit_headers(response.headers)
                 logger.debug(f"HubSpot batch_check_appointments response status: {response.status}")
                 raw = await response.text()
                 logger.debug(f"HubSpot batch_check_appointments raw response: {raw}")
@@ -29,10 +32,13 @@ class HubSpotAppointmentsRemovalClient(HubSpotBaseClient):
     async def check_individual_appointments(self, appointment_ids):
         await self.authenticate()
         existing_ids = []
-        async with aiohttp.ClientSession() as session:
+        async with self.pooled_session() as session:
             for apt_id in appointment_ids:
                 url = f"{self.base_url}/crm/v3/objects/0-421/{apt_id}"
-                async with session.get(url, headers=self.headers, timeout=30) as response:
+                await self.acquire_rate_limit()
+                async with session.get(url, headers=self.headers,
+                                       timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    self.record_rate_limit_headers(response.headers)
                     if response.status == 200:
                         existing_ids.append(apt_id)
         return existing_ids
@@ -40,20 +46,22 @@ class HubSpotAppointmentsRemovalClient(HubSpotBaseClient):
     async def _get_missing_appointments_async(self, local_appointments, batch_size=100, stdout=None):
         local_ids = [apt['id'] for apt in local_appointments]
         missing_appointments = []
-        for i in range(0, len(local_ids), batch_size):
-            batch_ids = local_ids[i:i + batch_size]
-            if stdout:
-                stdout.write(f"Checking batch {i//batch_size + 1}: {len(batch_ids)} appointments...")
-            try:
-                existing_in_hubspot = await self.batch_check_appointments(batch_ids)
-            except Exception:
-                existing_in_hubspot = await self.check_individual_appointments(batch_ids)
-            existing_ids = set(existing_in_hubspot)
-            missing_ids = set(batch_ids) - existing_ids
-            missing_in_batch = [apt for apt in local_appointments if apt['id'] in missing_ids]
-            missing_appointments.extend(missing_in_batch)
-            if stdout:
-                stdout.write(f"Batch {i//batch_size + 1}: {len(missing_in_batch)} appointments not found in HubSpot")
+        # Hold one pooled session so every batch reuses the same connections
+        async with self.pooled_session():
+            for i in range(0, len(local_ids), batch_size):
+                batch_ids = local_ids[i:i + batch_size]
+                if stdout:
+                    stdout.write(f"Checking batch {i//batch_size + 1}: {len(batch_ids)} appointments...")
+                try:
+                    existing_in_hubspot = await self.batch_check_appointments(batch_ids)
+                except Exception:
+                    existing_in_hubspot = await self.check_individual_appointments(batch_ids)
+                existing_ids = set(existing_in_hubspot)
+                missing_ids = set(batch_ids) - existing_ids
+                missing_in_batch = [apt for apt in local_appointments if apt['id'] in missing_ids]
+                missing_appointments.extend(missing_in_batch)
+                if stdout:
+                    stdout.write(f"Batch {i//batch_size + 1}: {len(missing_in_batch)} appointments not found in HubSpot")
         return missing_appointments
 
     def get_missing_appointments(self, local_appointments, batch_size=100, stdout=None):
@@ -2,10 +2,12 @@
 HubSpot associations API client
 Following import_refactoring.md enterprise architecture standards
 """
+import asyncio
 import logging
 from datetime import datetime
 from typing import List, Dict, Any, Optional, AsyncGenerator, Tuple
 from enum import Enum
+from django.conf import settings
 from .base import HubSpotBaseClient
 from ingestion.base.exceptions import APIException, ValidationException, RateLimitException
 
@@ -49,7 +51,8 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
                 if not inputs:
                     break
                 # Call batch endpoint
-                results = await self._fetch_associations_page("contacts", "0-421", [inp["id"] for inp in inputs])
+                results = await self._fetch_associations_page("contacts", "0-421", [inp["id"] for inp in inputs],
+                                                              after={cid: a for cid, a in paging_map.items() if a})
                 # Map from id to association result
                 id_to_result = {r.get("from", {}).get("id"): r for r in results}
                 for inp in inputs:
@@ -102,7 +105,12 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
     
     # Batch processing limits per HubSpot API
     DEFAULT_BATCH_SIZE = 100
-    MAX_BATCH_SIZE = 100
+    # v4 batch association reads accept up to 1000 inputs per request
+    MAX_BATCH_SIZE = 1000
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read_concurrency = max(1, getattr(settings, 'HUBSPOT_ASSOCIATION_CONCURRENCY', 4))
     
     async def fetch_contact_appointment_associations(self, contact_ids: List[str], 
                                                    batch_size: Optional[int] = None,
@@ -146,6 +154,7 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
     
     async def fetch_contact_appointment_associations_batch(self, batch_size: Optional[int] = None,
                                                          max_records: Optional[int] = None,
+                                                         since: Optional[datetime] = None,
                                                          **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """
         Fetch all contact-appointment associations in batches
@@ -153,6 +162,7 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
         Args:
             batch_size: Size of each batch (default: 100)
             max_records: Maximum number of records to fetch (0 for unlimited)
+            since: Only re-read contacts/appointments modified since this time
             
         Yields:
             Batches of association records
@@ -161,12 +171,14 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
             AssociationType.CONTACT_TO_APPOINTMENT,
             batch_size or self.DEFAULT_BATCH_SIZE,
             max_records or 0,
+            since=since,
             **kwargs
         ):
             yield batch
     
     async def fetch_contact_division_associations_batch(self, batch_size: Optional[int] = None,
                                                       max_records: Optional[int] = None,
+                                                      since: Optional[datetime] = None,
                                                       **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """
         Fetch all contact-division associations in batches
@@ -174,6 +186,7 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
         Args:
             batch_size: Size of each batch (default: 100)
             max_records: Maximum number of records to fetch (0 for unlimited)
+            since: Only re-read contacts modified since this time
             
         Yields:
             Batches of association records
@@ -182,6 +195,7 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
             AssociationType.CONTACT_TO_DIVISION,
             batch_size or self.DEFAULT_BATCH_SIZE,
             max_records or 0,
+            since=since,
             **kwargs
         ):
             yield batch
@@ -196,7 +210,7 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
         Args:
             association_type: Type of association to fetch
             object_ids: List of object IDs to fetch associations for
-            batch_size: Batch size for API calls (default: 100)
+            batch_size: Batch size for API calls (default: MAX_BATCH_SIZE)
             
         Returns:
             List of flattened association records ready for database storage
@@ -204,140 +218,125 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
         if not object_ids:
             return []
         
-        batch_size = min(batch_size or self.DEFAULT_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        batch_size = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
         from_object_type, to_object_type = association_type.value
         
         all_associations = []
         
-        # Process object IDs in batches
-        for i in range(0, len(object_ids), batch_size):
-            batch_ids = object_ids[i:i + batch_size]
-            
-            try:
-                # Use HubSpot associations batch API
-                associations = await self._fetch_associations_page(
-                    from_object_type=from_object_type,
-                    to_object_type=to_object_type,
-                    object_ids=batch_ids
-                )
-                
-                logger.info(f"Raw associations from API: {len(associations)} records")
-                
-                # Flatten associations for database storage
-                flattened = self._flatten_associations(associations, association_type)
-                logger.info(f"After flattening: {len(flattened)} records")
-                all_associations.extend(flattened)
-                
-            except Exception as e:
-                logger.error(f"Error fetching associations batch for {association_type.name}: {e}")
-                # Continue with next batch
-                continue
+        for results in await self._read_association_chunks(
+            from_object_type, to_object_type,
+            [object_ids[i:i + batch_size] for i in range(0, len(object_ids), batch_size)]
+        ):
+            all_associations.extend(self._flatten_associations(results, association_type))
         
         return all_associations
     
     async def _fetch_all_associations_by_type(self, association_type: AssociationType,
                                             batch_size: int,
                                             max_records: int,
+                                            since: Optional[datetime] = None,
                                             **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """
-        Fetch all associations of a specific type by first getting all source object IDs
+        Fetch all associations of a specific type by first getting the source object IDs
+        
+        Source IDs are read in MAX_BATCH_SIZE requests, read_concurrency at a
+        time, and the flattened associations are re-batched to batch_size.
         
         Args:
             association_type: Type of association to fetch
-            batch_size: Batch size for processing
+            batch_size: Batch size for yielded records
             max_records: Maximum number of records to fetch (0 for unlimited)
+            since: Only re-read objects modified since this time (None for all)
             
         Yields:
             Batches of association records
         """
         from_object_type, to_object_type = association_type.value
         
-        # Get all source object IDs based on association type
-        if association_type in [AssociationType.CONTACT_TO_APPOINTMENT, AssociationType.CONTACT_TO_DIVISION]:
-            source_ids = await self._get_all_contact_ids()
-        elif association_type == AssociationType.APPOINTMENT_TO_CONTACT:
-            source_ids = await self._get_all_appointment_ids()
-        elif association_type == AssociationType.DIVISION_TO_CONTACT:
-            source_ids = await self._get_all_division_ids()
-        else:
-            raise APIException(f"Unsupported association type: {association_type}")
+        source_ids = await self._get_source_ids(association_type, since)
         
         if not source_ids:
-            logger.warning(f"No source IDs found for {association_type.name}")
+            logger.warning(f"No source IDs found for {association_type.name}"
+                           + (f" modified since {since}" if since else ""))
             return
         
-        logger.info(f"Found {len(source_ids)} source objects for {association_type.name}")
+        logger.info(f"Found {len(source_ids)} source objects for {association_type.name}"
+                    + (f" modified since {since}" if since else ""))
         
+        chunks = [source_ids[i:i + self.MAX_BATCH_SIZE] for i in range(0, len(source_ids), self.MAX_BATCH_SIZE)]
         records_fetched = 0
+        association_batch = []
         
-        # Process source IDs in batches
-        for i in range(0, len(source_ids), batch_size):
-            if max_records > 0 and records_fetched >= max_records:
-                break
+        # Each round keeps read_concurrency batch reads in flight
+        for round_start in range(0, len(chunks), self.read_concurrency):
+            round_chunks = chunks[round_start:round_start + self.read_concurrency]
+            logger.info(f"Reading associations for source chunks {round_start + 1}-{round_start + len(round_chunks)} "
+                        f"of {len(chunks)}")
             
-            batch_ids = source_ids[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}: {len(batch_ids)} source IDs")
+            for results in await self._read_association_chunks(from_object_type, to_object_type, round_chunks):
+                association_batch.extend(self._flatten_associations(results, association_type))
             
-            try:
-                # Process contact IDs in smaller sub-batches for association fetching
-                sub_batch_size = min(10, len(batch_ids))  # Process 10 contacts at a time
-                association_batch = []
-                
-                for j in range(0, len(batch_ids), sub_batch_size):
-                    if max_records > 0 and records_fetched >= max_records:
-                        break
-                        
-                    sub_batch_ids = batch_ids[j:j + sub_batch_size]
-                    
-                    # Fetch associations for this sub-batch of contacts
-                    sub_associations = await self._fetch_associations_by_type(
-                        association_type,
-                        sub_batch_ids,
-                        sub_batch_size
-                    )
-                    
-                    logger.info(f"Sub-batch {j//sub_batch_size + 1}: got {len(sub_associations)} associations from {len(sub_batch_ids)} contacts")
-                    
-                    # Add to current batch
-                    association_batch.extend(sub_associations)
-                    
-                    # Yield when we reach the desired batch size or have collected enough
-                    if len(association_batch) >= batch_size or (max_records > 0 and records_fetched + len(association_batch) >= max_records):
-                        # Limit to max_records if specified
-                        if max_records > 0:
-                            remaining = max_records - records_fetched
-                            if len(association_batch) > remaining:
-                                association_batch = association_batch[:remaining]
-                        
-                        if association_batch:
-                            records_fetched += len(association_batch)
-                            logger.info(f"Yielding batch with {len(association_batch)} associations (total fetched: {records_fetched})")
-                            yield association_batch
-                            association_batch = []  # Reset for next batch
-                            
-                            if max_records > 0 and records_fetched >= max_records:
-                                break
-                
-                # Yield any remaining associations in the final batch
-                if association_batch:
-                    # Limit to max_records if specified
-                    if max_records > 0:
-                        remaining = max_records - records_fetched
-                        if len(association_batch) > remaining:
-                            association_batch = association_batch[:remaining]
-                    
-                    if association_batch:
-                        records_fetched += len(association_batch)
-                        logger.info(f"Yielding final batch with {len(association_batch)} associations (total fetched: {records_fetched})")
-                        yield association_batch
-                        
-            except Exception as e:
-                logger.error(f"Error fetching associations batch: {e}")
-                # Continue with next batch
-                continue
+            while len(association_batch) >= batch_size:
+                batch, association_batch = association_batch[:batch_size], association_batch[batch_size:]
+                if max_records > 0:
+                    batch = batch[:max_records - records_fetched]
+                records_fetched += len(batch)
+                yield batch
+                if max_records > 0 and records_fetched >= max_records:
+                    return
+        
+        if association_batch:
+            if max_records > 0:
+                association_batch = association_batch[:max_records - records_fetched]
+            if association_batch:
+                records_fetched += len(association_batch)
+                yield association_batch
+        
+        logger.info(f"Fetched {records_fetched} {association_type.name} associations")
+    
+    async def _read_association_chunks(self, from_object_type: str, to_object_type: str,
+                                       chunks: List[List[str]]) -> List[List[Dict[str, Any]]]:
+        """Read several ID chunks concurrently, returning results in chunk order.
+        
+        A failed chunk is logged and contributes no results, matching the
+        sequential behaviour this replaces.
+        """
+        semaphore = asyncio.Semaphore(self.read_concurrency)
+        
+        async def read(chunk: List[str]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._read_all_association_pages(from_object_type, to_object_type, chunk)
+        
+        outcomes = await asyncio.gather(*(read(chunk) for chunk in chunks), return_exceptions=True)
+        results = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Error fetching associations for {len(chunk)} {from_object_type} IDs: {outcome}")
+                outcome = []
+            results.append(outcome)
+        return results
+    
+    async def _read_all_association_pages(self, from_object_type: str, to_object_type: str,
+                                          object_ids: List[str]) -> List[Dict[str, Any]]:
+        """Batch read associations, following per-object paging for objects with many associations"""
+        results = []
+        after = {}
+        pending = list(object_ids)
+        while pending:
+            page = await self._fetch_associations_page(from_object_type, to_object_type, pending, after=after)
+            results.extend(page)
+            after = {}
+            for result in page:
+                next_after = result.get("paging", {}).get("next", {}).get("after")
+                from_id = result.get("from", {}).get("id")
+                if next_after and from_id:
+                    after[str(from_id)] = next_after
+            pending = list(after)
+        return results
     
     async def _fetch_associations_page(self, from_object_type: str, to_object_type: str,
-                                     object_ids: List[str]) -> List[Dict[str, Any]]:
+                                     object_ids: List[str],
+                                     after: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """
         Fetch a single page of associations using HubSpot batch read API
         
@@ -345,17 +344,23 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
             from_object_type: Source object type (e.g., 'contacts')
             to_object_type: Target object type (e.g., '0-421', '2-37778609')
             object_ids: List of source object IDs
+            after: Paging cursors keyed by source object ID
             
         Returns:
             Raw API response with association data
         """
+        after = after or {}
         try:
             # Use HubSpot associations v4 batch read endpoint
             endpoint = f"crm/v4/associations/{from_object_type}/{to_object_type}/batch/read"
             
-            payload = {
-                "inputs": [{"id": obj_id} for obj_id in object_ids]
-            }
+            inputs = []
+            for obj_id in object_ids:
+                item = {"id": obj_id}
+                if after.get(str(obj_id)):
+                    item["after"] = after[str(obj_id)]
+                inputs.append(item)
+            payload = {"inputs": inputs}
             
             response_data = await self.make_request("POST", endpoint, json=payload)
             results = response_data.get("results", [])
@@ -447,6 +452,19 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
         logger.info(f"Flattening complete: {len(flattened)} records created")
         return flattened
     
+    async def _get_source_ids(self, association_type: AssociationType,
+                              since: Optional[datetime] = None) -> List[str]:
+        """Source object IDs whose associations should be read"""
+        if association_type in [AssociationType.CONTACT_TO_APPOINTMENT, AssociationType.CONTACT_TO_DIVISION]:
+            if since:
+                return await self._get_modified_contact_ids(association_type, since)
+            return await self._get_all_contact_ids()
+        elif association_type == AssociationType.APPOINTMENT_TO_CONTACT:
+            return await self._get_all_appointment_ids(since)
+        elif association_type == AssociationType.DIVISION_TO_CONTACT:
+            return await self._get_all_division_ids(since)
+        raise APIException(f"Unsupported association type: {association_type}")
+    
     async def _get_all_contact_ids(self) -> List[str]:
         """Get all contact IDs from database"""
         from asgiref.sync import sync_to_async
@@ -456,22 +474,60 @@ class HubSpotAssociationsClient(HubSpotBaseClient):
             lambda: list(Hubspot_Contact.objects.values_list('id', flat=True))
         )()
     
-    async def _get_all_appointment_ids(self) -> List[str]:
+    async def _get_modified_contact_ids(self, association_type: AssociationType, since: datetime) -> List[str]:
+        """Contacts modified since `since`, plus contacts of appointments modified since then.
+        
+        An association change does not always bump the contact's
+        lastmodifieddate, so for contact-appointment associations the
+        contacts linked to recently modified appointments (by hscontact_id or
+        an already stored association) are re-read as well.
+        """
+        from asgiref.sync import sync_to_async
+        from ingestion.models.hubspot import (
+            Hubspot_Appointment, Hubspot_AppointmentContactAssociation, Hubspot_Contact
+        )
+        
+        def query() -> List[str]:
+            contact_ids = set(
+                Hubspot_Contact.objects.filter(lastmodifieddate__gte=since).values_list('id', flat=True)
+            )
+            if association_type == AssociationType.CONTACT_TO_APPOINTMENT:
+                appointments = Hubspot_Appointment.objects.filter(hs_lastmodifieddate__gte=since)
+                contact_ids.update(
+                    appointments.exclude(hscontact_id__isnull=True).exclude(hscontact_id='')
+                    .values_list('hscontact_id', flat=True)
+                )
+                contact_ids.update(
+                    Hubspot_AppointmentContactAssociation.objects.filter(
+                        appointment_id__in=appointments.values('id')
+                    ).exclude(contact_id__isnull=True).values_list('contact_id', flat=True)
+                )
+            return sorted(contact_ids)
+        
+        return await sync_to_async(query)()
+    
+    async def _get_all_appointment_ids(self, since: Optional[datetime] = None) -> List[str]:
         """Get all appointment IDs from database"""
         from asgiref.sync import sync_to_async
         from ingestion.models.hubspot import Hubspot_Appointment
         
+        queryset = Hubspot_Appointment.objects.all()
+        if since:
+            queryset = queryset.filter(hs_lastmodifieddate__gte=since)
         return await sync_to_async(
-            lambda: list(Hubspot_Appointment.objects.values_list('id', flat=True))
+            lambda: list(queryset.values_list('id', flat=True))
         )()
     
-    async def _get_all_division_ids(self) -> List[str]:
+    async def _get_all_division_ids(self, since: Optional[datetime] = None) -> List[str]:
         """Get all division IDs from database"""
         from asgiref.sync import sync_to_async
         from ingestion.models.hubspot import Hubspot_Division
         
+        queryset = Hubspot_Division.objects.all()
+        if since:
+            queryset = queryset.filter(hs_lastmodifieddate__gte=since)
         return await sync_to_async(
-            lambda: list(Hubspot_Division.objects.values_list('id', flat=True))
+            lambda: list(queryset.values_list('id', flat=True))
         )()
     
     # Legacy method for backward compatibility
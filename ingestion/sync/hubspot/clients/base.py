@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 class HubSpotBaseClient(BaseAPIClient):
     """Base HubSpot API client with common functionality"""
     
+    # Private apps start at 100 requests per 10 seconds; headers retune this
+    rate_limit_name = 'hubspot'
+    default_rate_limit = 10.0
+    
     def __init__(self, api_token=None):
         super().__init__(base_url="https://api.hubapi.com", timeout=60)
         self.api_token = api_token or settings.HUBSPOT_API_TOKEN
@@ -59,5 +63,8 @@ class HubSpotBaseClient(BaseAPIClient):
             'X-HubSpot-RateLimit-Daily': 'X-HubSpot-RateLimit-Daily',
             'X-HubSpot-RateLimit-Daily-Remaining': 'X-HubSpot-RateLimit-Daily-Remaining',
             'X-HubSpot-RateLimit-Secondly': 'X-HubSpot-RateLimit-Secondly',
-            'X-HubSpot-RateLimit-Secondly-Remaining': 'X-HubSpot-RateLimit-Secondly-Remaining'
+            'X-HubSpot-RateLimit-Secondly-Remaining': 'X-HubSpot-RateLimit-Secondly-Remaining',
+            'X-HubSpot-RateLimit-Max': 'X-HubSpot-RateLimit-Max',
+            'X-HubSpot-RateLimit-Remaining': 'X-HubSpot-RateLimit-Remaining',
+            'X-HubSpot-RateLimit-Interval-Milliseconds': 'X-HubSpot-RateLimit-Interval-Milliseconds'
         }
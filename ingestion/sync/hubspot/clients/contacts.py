@@ -2,7 +2,7 @@
 HubSpot contacts API client
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone as dt_timezone
 from typing import Optional, Tuple, List, Dict, Any, AsyncGenerator
 from .base import HubSpotBaseClient
 
@@ -11,9 +11,17 @@ logger = logging.getLogger(__name__)
 class HubSpotContactsClient(HubSpotBaseClient):
     """HubSpot API client for contacts"""
     
+    # The search API refuses to page past this many results for one query
+    SEARCH_RESULT_CAP = 10000
+    SEARCH_PAGE_LIMIT = 200
+    # Windows narrower than this are not split further
+    MIN_SEARCH_WINDOW = timedelta(seconds=1)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.base_endpoint = "crm/v3/objects/0-1"  # Custom object endpoint for contacts
+        # Where fetch_contacts would continue after the batch it last yielded
+        self.stream_cursor: Optional[Dict[str, Any]] = None
     
     def _get_contact_properties(self) -> List[str]:
         """Get contact properties that match the HubSpot Contact model fields"""
@@ -125,8 +133,13 @@ class HubSpotContactsClient(HubSpotBaseClient):
     
     async def fetch_contacts(self, last_sync: Optional[datetime] = None, 
                            limit: int = 100, appointment_id: Optional[int] = None,
-                           contact_id: Optional[str] = None, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
-        """Fetch contacts from HubSpot API with pagination and filtering support"""
+                           contact_id: Optional[str] = None, after: Optional[str] = None,
+                           **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Fetch contacts from HubSpot API with pagination and filtering support
+        
+        ``after`` starts a full listing at a paging token saved in
+        ``stream_cursor`` by an earlier run.
+        """
         
         # If specific appointment_id or contact_id is provided, fetch single contact
         if appointment_id or contact_id:
@@ -135,20 +148,26 @@ class HubSpotContactsClient(HubSpotBaseClient):
                 yield [contact]
             return
         
-        # Otherwise, fetch paginated contacts
-        page_token = None
+        # Incremental syncs let HubSpot filter on lastmodifieddate
+        if last_sync:
+            async for contacts in self._search_modified_contacts(last_sync, limit=limit):
+                yield contacts
+            return
+        
+        # Full syncs list every contact through the objects endpoint
+        page_token = after
         
         while True:
             try:
                 contacts, next_token = await self._fetch_contacts_page(
-                    last_sync=last_sync,
                     page_token=page_token,
                     limit=limit
                 )
                 
                 if not contacts:
                     break
-                    
+                
+                self.stream_cursor = {'mode': 'list', 'after': next_token}
                 yield contacts
                 
                 if not next_token:
@@ -160,6 +179,82 @@ class HubSpotContactsClient(HubSpotBaseClient):
                 logger.error(f"Error fetching contacts: {e}")
                 break
     
+    async def _search_modified_contacts(self, last_sync: datetime, until: Optional[datetime] = None,
+                                        limit: int = 100) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Yield contacts modified in [last_sync, until) using the search API.
+        
+        A search query can only be paged through its first SEARCH_RESULT_CAP
+        results, so a window reporting a larger total is split in half and
+        each half is searched on its own until every window fits.
+        """
+        start = self._as_utc(last_sync)
+        end = self._as_utc(until) if until else datetime.now(dt_timezone.utc)
+        if start >= end:
+            return
+        
+        contacts, next_token, total = await self._search_contacts_page(start, end, limit=limit)
+        
+        if total > self.SEARCH_RESULT_CAP:
+            if end - start > self.MIN_SEARCH_WINDOW:
+                middle = start + (end - start) / 2
+                logger.info(f"Splitting contact search window {start.isoformat()} - {end.isoformat()} "
+                            f"({total} results exceed the {self.SEARCH_RESULT_CAP} cap)")
+                for window_start, window_end in ((start, middle), (middle, end)):
+                    async for batch in self._search_modified_contacts(window_start, window_end, limit=limit):
+                        yield batch
+                return
+            logger.warning(f"Contact search window {start.isoformat()} - {end.isoformat()} holds {total} results; "
+                           f"only the first {self.SEARCH_RESULT_CAP} can be retrieved")
+        
+        if total:
+            logger.info(f"Fetching {total} contacts modified between {start.isoformat()} and {end.isoformat()}")
+        fetched = 0
+        while contacts:
+            contacts = contacts[:self.SEARCH_RESULT_CAP - fetched]
+            # Results are sorted by lastmodifieddate, so the last one bounds what has been seen
+            modified = contacts[-1].get("properties", {}).get("lastmodifieddate") or contacts[-1].get("updatedAt")
+            if modified:
+                self.stream_cursor = {'mode': 'search', 'modified_since': modified}
+            yield contacts
+            fetched += len(contacts)
+            if not next_token or fetched >= self.SEARCH_RESULT_CAP:
+                break
+            contacts, next_token, _ = await self._search_contacts_page(start, end, after=next_token, limit=limit)
+    
+    async def _search_contacts_page(self, start: datetime, end: datetime, after: Optional[str] = None,
+                                    limit: int = 100) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+        """Fetch one search page of contacts modified in [start, end)"""
+        payload = {
+            "filterGroups": [{
+                "filters": [
+                    {"propertyName": "lastmodifieddate", "operator": "GTE", "value": self._epoch_millis(start)},
+                    {"propertyName": "lastmodifieddate", "operator": "LT", "value": self._epoch_millis(end)},
+                ]
+            }],
+            "sorts": [{"propertyName": "lastmodifieddate", "direction": "ASCENDING"}],
+            "properties": self._get_contact_properties(),
+            "limit": min(limit, self.SEARCH_PAGE_LIMIT)
+        }
+        if after:
+            payload["after"] = after
+        
+        response_data = await self.make_request("POST", f"{self.base_endpoint}/search", json=payload)
+        
+        results = response_data.get("results", [])
+        next_page = response_data.get("paging", {}).get("next", {}).get("after")
+        return results, next_page, response_data.get("total", len(results))
+    
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Treat naive datetimes as UTC"""
+        if value.tzinfo is None:
+            return value.replace(tzinfo=dt_timezone.utc)
+        return value.astimezone(dt_timezone.utc)
+    
+    @staticmethod
+    def _epoch_millis(value: datetime) -> str:
+        return str(int(value.timestamp() * 1000))
+    
     async def _fetch_single_contact(self, appointment_id: Optional[int] = None, 
                                    contact_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Fetch a single contact by appointment ID or contact ID"""
@@ -199,17 +294,15 @@ class HubSpotContactsClient(HubSpotBaseClient):
             logger.error(f"Error fetching single contact (appointment_id={appointment_id}, contact_id={contact_id}): {e}")
             return None
     
-    async def _fetch_contacts_page(self, last_sync: Optional[datetime] = None,
-                                 page_token: Optional[str] = None,
+    async def _fetch_contacts_page(self, page_token: Optional[str] = None,
                                  limit: int = 100) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-        """Fetch a single page of contacts"""
+        """Fetch a single page of all contacts from the objects endpoint"""
         
         # Define properties to retrieve
         properties = self._get_contact_properties()
         
         try:
-            # Always use the regular endpoint to avoid the 10,000 result limit
-            # Filter by lastmodifieddate locally for incremental syncs
+            # The objects endpoint has no result cap, so full syncs use it
             endpoint = self.base_endpoint
             params = {
                 "limit": str(limit),
@@ -225,56 +318,6 @@ class HubSpotContactsClient(HubSpotBaseClient):
             paging = response_data.get("paging", {})
             next_page = paging.get("next", {}).get("after")
             
-            # Filter results locally if last_sync is provided (incremental sync)
-            if last_sync and results:
-                filtered_results = []
-                for contact in results:
-                    # Parse the lastmodifieddate from the contact
-                    props = contact.get("properties", {})
-                    lastmodified_str = props.get("lastmodifieddate")
-                    
-                    if lastmodified_str:
-                        try:
-                            # HubSpot can return timestamps in different formats:
-                            # 1. ISO format: "2025-10-08T04:00:42.602Z"
-                            # 2. Milliseconds since epoch: "1728361242602"
-                            
-                            if 'T' in lastmodified_str and 'Z' in lastmodified_str:
-                                # ISO format - parse as datetime
-                                from datetime import datetime
-                                # Remove microseconds if present and parse
-                                if '.' in lastmodified_str:
-                                    # Handle microseconds: 2025-10-08T04:00:42.602Z
-                                    dt_part, _ = lastmodified_str.split('.')
-                                    tz_part = 'Z'
-                                    clean_str = f"{dt_part}Z"
-                                else:
-                                    clean_str = lastmodified_str
-                                
-                                lastmodified_dt = datetime.fromisoformat(clean_str.replace('Z', '+00:00'))
-                                # Convert to naive datetime for comparison (remove timezone info)
-                                lastmodified_dt = lastmodified_dt.replace(tzinfo=None)
-                            else:
-                                # Timestamp format - convert from milliseconds
-                                lastmodified_timestamp = int(lastmodified_str)
-                                lastmodified_dt = datetime.fromtimestamp(lastmodified_timestamp / 1000)
-                            
-                            # Include contacts modified since last_sync
-                            # Ensure both datetimes are naive for comparison
-                            last_sync_naive = last_sync.replace(tzinfo=None) if last_sync.tzinfo else last_sync
-                            if lastmodified_dt >= last_sync_naive:
-                                filtered_results.append(contact)
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"Failed to parse lastmodifieddate '{lastmodified_str}' for contact {contact.get('id')}: {e}")
-                            # Include the contact if we can't parse the date to be safe
-                            filtered_results.append(contact)
-                    else:
-                        # Include contacts without lastmodifieddate to be safe
-                        filtered_results.append(contact)
-                
-                logger.info(f"Fetched {len(results)} contacts from HubSpot, {len(filtered_results)} modified since {last_sync}")
-                return filtered_results, next_page
-            
             logger.info(f"Fetched {len(results)} contacts from HubSpot")
             return results, next_page
             
@@ -21,8 +21,11 @@ class HubSpotContactsRemovalClient(HubSpotBaseClient):
         }
         logger.debug(f"Sending batch_check_contacts payload: {payload}")
         # print(f"[DEBUG] Sending batch_check_contacts payload: {payload}")
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, headers=self.headers, json=payload, timeout=60) as response:
+        async with self.pooled_session() as session:
+            await self.acquire_rate_limit()
+            async with session.post(url, headers=self.headers, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=60)) as response:
+                self.record_rate_limit_headers(response.headers)
                 logger.debug(f"HubSpot batch_check_contacts response status: {response.status}")
                 raw = await response.text()
                 # print(f"[DEBUG] HubSpot batch_check_contacts response status: {response.status}")
@@ -37,10 +40,13 @@ class HubSpotContactsRemovalClient(HubSpotBaseClient):
     async def check_individual_contacts(self, contact_ids):
         await self.authenticate()
         existing_ids = []
-        async with aiohttp.ClientSession() as session:
+        async with self.pooled_session() as session:
             for contact_id in contact_ids:
                 url = f"{self.base_url}/crm/v3/objects/contacts/{contact_id}"
-                async with session.get(url, headers=self.headers, timeout=30) as response:
+                await self.acquire_rate_limit()
+                async with session.get(url, headers=self.headers,
+                                       timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    self.record_rate_limit_headers(response.headers)
                     if response.status == 200:
                         existing_ids.append(contact_id)
         return existing_ids
@@ -48,20 +54,22 @@ class HubSpotContactsRemovalClient(HubSpotBaseClient):
     async def _get_missing_contacts_async(self, local_contacts, batch_size=100, stdout=None):
         local_ids = [contact['id'] for contact in local_contacts]
         missing_contacts = []
-        for i in range(0, len(local_ids), batch_size):
-            batch_ids = local_ids[i:i + batch_size]
-            if stdout:
-                stdout.write(f"Checking batch {i//batch_size + 1}: {len(batch_ids)} contacts...")
-            try:
-                existing_in_hubspot = await self.batch_check_contacts(batch_ids)
-            except Exception:
-                existing_in_hubspot = await self.check_individual_contacts(batch_ids)
-            existing_ids = set(existing_in_hubspot)
-            missing_ids = set(batch_ids) - existing_ids
-            missing_in_batch = [contact for contact in local_contacts if contact['id'] in missing_ids]
-            missing_contacts.extend(missing_in_batch)
-            if stdout:
-                stdout.write(f"Batch {i//batch_size + 1}: {len(missing_in_batch)} contacts not found in HubSpot")
+        # Hold one pooled session so every batch reuses the same connections
+        async with self.pooled_session():
+            for i in range(0, len(local_ids), batch_size):
+                batch_ids = local_ids[i:i + batch_size]
+                if stdout:
+                    stdout.write(f"Checking batch {i//batch_size + 1}: {len(batch_ids)} contacts...")
+                try:
+                    existing_in_hubspot = await self.batch_check_contacts(batch_ids)
+                except Exception:
+                    existing_in_hubspot = await self.check_individual_contacts(batch_ids)
+                existing_ids = set(existing_in_hubspot)
+                missing_ids = set(batch_ids) - existing_ids
+                missing_in_batch = [contact for contact in local_contacts if contact['id'] in missing_ids]
+                missing_contacts.extend(missing_in_batch)
+                if stdout:
+                    stdout.write(f"Batch {i//batch_size + 1}: {len(missing_in_batch)} contacts not found in HubSpot")
         return missing_contacts
 
     def get_missing_contacts(self, local_contacts, batch_size=100, stdout=None):
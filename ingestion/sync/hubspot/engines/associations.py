@@ -74,6 +74,8 @@ class HubSpotAssociationSyncEngine(HubSpotBaseSyncEngine):
         """Fetch association data from HubSpot based on association type"""
         limit = kwargs.get('limit', self.batch_size)
         max_records = kwargs.get('max_records', 0)
+        # Incremental runs only re-read objects modified since the last successful sync
+        last_sync = kwargs.get('last_sync')
         
         if not self.client:
             raise SyncException("Client not initialized")
@@ -92,7 +94,8 @@ class HubSpotAssociationSyncEngine(HubSpotBaseSyncEngine):
             if self.association_type == "contact_appointment":
                 async for batch in self.client.fetch_contact_appointment_associations_batch(
                     batch_size=limit,
-                    max_records=max_records
+                    max_records=max_records,
+                    since=last_sync
                 ):
                     if max_records > 0 and records_fetched >= max_records:
                         break
@@ -106,7 +109,8 @@ class HubSpotAssociationSyncEngine(HubSpotBaseSyncEngine):
             elif self.association_type == "contact_division":
                 async for batch in self.client.fetch_contact_division_associations_batch(
                     batch_size=limit,
-                    max_records=max_records
+                    max_records=max_records,
+                    since=last_sync
                 ):
                     if max_records > 0 and records_fetched >= max_records:
                         break
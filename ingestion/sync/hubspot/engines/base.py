@@ -2,7 +2,6 @@
 Base sync engine for HubSpot entities
 """
 import logging
-import aiohttp
 from typing import Dict, Any, Optional
 from django.utils import timezone
 from ingestion.base.sync_engine import BaseSyncEngine
@@ -93,21 +92,8 @@ class HubSpotBaseSyncEngine(BaseSyncEngine):
         # First authenticate to set up headers
         await client.authenticate()
         
-        # Create session through connection pool if available
-        if self.connection_pool:
-            try:
-                session = await self.connection_pool.get_session()
-                session._default_headers = client.headers
-                client.session = session
-                return
-            except Exception as e:
-                logger.warning(f"Failed to use connection pool, falling back to regular session: {e}")
-        
-        # Fallback to regular session creation
-        client.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=client.timeout),
-            headers=client.headers
-        )
+        # Lease the process-wide keep-alive session for the HubSpot API host
+        await client.open_shared_session()
         
     async def estimate_total_records(self, **kwargs) -> int:
         """Estimate total number of records for progress tracking"""
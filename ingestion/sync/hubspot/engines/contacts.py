@@ -4,7 +4,9 @@ HubSpot contacts sync engine
 import logging
 from typing import Dict, Any, List, Optional, AsyncGenerator
 from asgiref.sync import sync_to_async
+from django.utils.dateparse import parse_datetime
 from ingestion.base.exceptions import SyncException, ValidationException
+from ingestion.base.bulk_upsert import BulkUpserter
 from ingestion.sync.hubspot.clients.contacts import HubSpotContactsClient
 from ingestion.sync.hubspot.processors.contacts import HubSpotContactProcessor
 from ingestion.sync.hubspot.engines.base import HubSpotBaseSyncEngine
@@ -27,21 +29,36 @@ class HubSpotContactSyncEngine(HubSpotBaseSyncEngine):
         self.client = HubSpotContactsClient()
         await self.create_authenticated_session(self.client)
         self.processor = HubSpotContactProcessor()
+    
+    def get_stream_cursor(self) -> Optional[Dict[str, Any]]:
+        """Paging token (full syncs) or last lastmodifieddate (incremental syncs) fetched so far"""
+        return self.client.stream_cursor if self.client else None
         
     async def fetch_data(self, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """Fetch contact data from HubSpot with enterprise monitoring"""
         last_sync = kwargs.get('last_sync')
         limit = kwargs.get('limit', self.batch_size)
         max_records = kwargs.get('max_records', 0)
+        after = None
         
         if not self.client:
             raise SyncException("Client not initialized")
         
+        # Continue an interrupted run where its last saved batch ended
+        cursor = self.resume_cursor or {}
+        if cursor.get('mode') == 'list' and cursor.get('after'):
+            after, last_sync = cursor['after'], None
+            logger.info(f"Resuming full contact listing after paging token {after}")
+        elif cursor.get('mode') == 'search' and cursor.get('modified_since'):
+            last_sync = parse_datetime(cursor['modified_since']) or last_sync
+            logger.info(f"Resuming incremental contact sync from lastmodifieddate {last_sync}")
+        
         try:
             records_fetched = 0
             async for batch in self.client.fetch_contacts(
                 last_sync=last_sync,
-                limit=limit
+                limit=limit,
+                after=after
             ):
                 # If max_records is set, limit the records returned
                 if max_records > 0:
@@ -74,16 +91,7 @@ class HubSpotContactSyncEngine(HubSpotBaseSyncEngine):
         if not self.processor:
             raise SyncException("Processor not initialized")
         
-        transformed_data = []
-        for record in raw_data:
-            try:
-                transformed = self.processor.transform_record(record)
-                transformed_data.append(transformed)
-            except Exception as e:
-                logger.error(f"Error transforming contact record {record.get('id')}: {e}")
-                # Continue processing other records
-                
-        return transformed_data
+        return await self.transform_with_processor(raw_data, 'contact record')
         
     async def validate_data(self, data: List[Dict]) -> List[Dict]:
         """Validate contact data"""
@@ -127,18 +135,16 @@ class HubSpotContactSyncEngine(HubSpotBaseSyncEngine):
         return results
     
     async def _bulk_save_contacts(self, validated_data: List[Dict]) -> Dict[str, int]:
-        """True bulk upsert for contacts using bulk_create with update_conflicts=True"""
-        results = {'created': 0, 'updated': 0, 'failed': 0}
+        """True bulk upsert for contacts through the COPY/staging-table upsert backend"""
+        results = {'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
         if not validated_data:
             return results
 
-        # Prepare objects
-        contact_objects = [Hubspot_Contact(**record) for record in validated_data]
         try:
-            created_contacts = await sync_to_async(Hubspot_Contact.objects.bulk_create)(
-                contact_objects,
-                batch_size=self.batch_size,
-                update_conflicts=True,
+            upserter = BulkUpserter(
+                Hubspot_Contact,
+                unique_fields=["id"],
+                skip_unchanged=True,
                 update_fields=[
                     # Core fields
                     "address", "adgroupid", "ap_leadid", "campaign_content", "campaign_name", "city", 
@@ -201,11 +207,12 @@ class HubSpotContactSyncEngine(HubSpotBaseSyncEngine):
                     
                     # Metadata fields
                     "archived"
-                ],
-                unique_fields=["id"]
+                ]
             )
-            results['created'] = len([obj for obj in created_contacts if obj._state.adding])
-            results['updated'] = len(validated_data) - results['created']
+            counts = await sync_to_async(upserter.upsert)(validated_data)
+            results['created'] = counts['created']
+            results['updated'] = counts['updated']
+            results['skipped'] = counts['skipped']
         except Exception as e:
             logger.error(f"Bulk upsert failed: {e}")
             results['failed'] = len(validated_data)
@@ -267,48 +274,23 @@ class HubSpotContactSyncEngine(HubSpotBaseSyncEngine):
         return results
     
     async def _force_overwrite_contacts(self, validated_data: List[Dict]) -> Dict[str, int]:
-        """Force overwrite all contacts using bulk operations, ignoring timestamps"""
-        results = {'created': 0, 'updated': 0, 'failed': 0}
+        """Force overwrite all contacts using bulk operations, ignoring timestamps.
+        
+        Every column is rewritten in place from the HubSpot payload, except for
+        contacts whose content fingerprint matches the last synced version.
+        """
+        results = {'created': 0, 'updated': 0, 'failed': 0, 'skipped': 0}
         if not validated_data:
             return results
 
-        # Get all existing contact IDs that we're about to process
-        contact_ids = [record['id'] for record in validated_data if record.get('id')]
-        
         try:
-            # Get existing contacts to determine which are updates vs creates
-            existing_contacts = await sync_to_async(list)(
-                Hubspot_Contact.objects.filter(id__in=contact_ids).values_list('id', flat=True)
-            )
-            existing_contact_set = set(existing_contacts)
-            
-            # Separate new vs existing records
-            new_records = [record for record in validated_data if record.get('id') not in existing_contact_set]
-            update_records = [record for record in validated_data if record.get('id') in existing_contact_set]
-            
-            # Force create new records
-            if new_records:
-                new_contact_objects = [Hubspot_Contact(**record) for record in new_records]
-                await sync_to_async(Hubspot_Contact.objects.bulk_create)(
-                    new_contact_objects,
-                    batch_size=self.batch_size
-                )
-                results['created'] = len(new_records)
-                logger.info(f"Force created {results['created']} new contacts")
-            
-            # Force update existing records - delete and recreate for true overwrite
-            if update_records:
-                # Delete existing records first
-                await sync_to_async(Hubspot_Contact.objects.filter(id__in=[r['id'] for r in update_records]).delete)()
-                
-                # Recreate with new data
-                update_contact_objects = [Hubspot_Contact(**record) for record in update_records]
-                await sync_to_async(Hubspot_Contact.objects.bulk_create)(
-                    update_contact_objects,
-                    batch_size=self.batch_size
-                )
-                results['updated'] = len(update_records)
-                logger.info(f"Force overwritten {results['updated']} existing contacts")
+            upserter = BulkUpserter(Hubspot_Contact, unique_fields=["id"], skip_unchanged=True)
+            counts = await sync_to_async(upserter.upsert)(validated_data)
+            results['created'] = counts['created']
+            results['updated'] = counts['updated']
+            results['skipped'] = counts['skipped']
+            logger.info(f"Force overwrite: {results['created']} created, {results['updated']} overwritten, "
+                        f"{results['skipped']} unchanged")
                 
         except Exception as e:
             logger.error(f"Force bulk overwrite failed: {e}")
@@ -74,16 +74,7 @@ class HubSpotDivisionSyncEngine(HubSpotBaseSyncEngine):
         if not self.processor:
             raise SyncException("Processor not initialized")
         
-        transformed_data = []
-        for record in raw_data:
-            try:
-                transformed = self.processor.transform_record(record)
-                transformed_data.append(transformed)
-            except Exception as e:
-                logger.error(f"Error transforming division record {record.get('id')}: {e}")
-                # Continue processing other records
-                
-        return transformed_data
+        return await self.transform_with_processor(raw_data, 'division record')
         
     async def validate_data(self, data: List[Dict]) -> List[Dict]:
         """Validate division data"""
@@ -88,16 +88,7 @@ class HubSpotGeniusUsersSyncEngine(BaseSyncEngine):
         if not self.processor:
             raise SyncException("Processor not initialized")
         
-        transformed_data = []
-        for record in raw_data:
-            try:
-                transformed = self.processor.transform_record(record)
-                transformed_data.append(transformed)
-            except Exception as e:
-                logger.error(f"Error transforming genius user record {record.get('id')}: {e}")
-                # Continue processing other records
-                
-        return transformed_data
+        return await self.transform_with_processor(raw_data, 'genius user record')
 
     async def validate_data(self, data):
         """Validate genius users data"""
@@ -15,9 +15,13 @@ from django.conf import settings
 
 from ingestion.base.client import BaseAPIClient
 from ingestion.base.exceptions import APIException, RateLimitException
+from .sharding import BoundaryDeduper, merge_window_pages, shard_windows
 
 logger = logging.getLogger(__name__)
 
+# 429s in a row on one page before the walk gives up
+MAX_RATE_LIMITED_RETRIES = 5
+
 
 class LeadConduitBaseClient(BaseAPIClient):
     """
@@ -30,6 +34,8 @@ class LeadConduitBaseClient(BaseAPIClient):
     - Memory-efficient async generators
     """
     
+    rate_limit_name = 'leadconduit'
+    
     def __init__(self, api_key: str = None, api_secret: str = None, 
                  base_url: str = None, timeout: int = 60, **kwargs):
         # LeadConduit API configuration - use correct endpoint from reference
@@ -49,6 +55,14 @@ class LeadConduitBaseClient(BaseAPIClient):
         # Rate limiting configuration
         self.rate_limit = kwargs.get('rate_limit', 100)  # requests per minute
         self.request_delay = 60 / self.rate_limit if self.rate_limit > 0 else 0
+        if self.rate_limit > 0:
+            self.default_rate_limit = self.rate_limit / 60
+        
+        # Time-sharded event extraction (see fetch_events_sharded)
+        self.shard_hours = kwargs.get('shard_hours') or getattr(settings, 'LEADCONDUIT_SHARD_HOURS', 6)
+        self.shard_concurrency = max(
+            1, kwargs.get('shard_concurrency') or getattr(settings, 'LEADCONDUIT_SHARD_CONCURRENCY', 4)
+        )
         
         # Initialize authentication headers
         self._setup_authentication()
@@ -127,7 +141,62 @@ class LeadConduitBaseClient(BaseAPIClient):
             List[Dict]: Batches of event records
         """
         logger.info(f"Fetching LeadConduit events from {start_date} to {end_date}")
+        async for events in self._walk_events(start_date, end_date, batch_size):
+            yield events
+    
+    async def fetch_events_sharded(self,
+                                   start_date: datetime,
+                                   end_date: datetime,
+                                   batch_size: int = 1000,
+                                   shard_hours: Optional[float] = None,
+                                   concurrency: Optional[int] = None) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """
+        Fetch LeadConduit events with one ``after_id`` cursor per time shard
+        
+        The range is split into ``shard_hours`` windows that are walked
+        ``concurrency`` at a time under the shared LeadConduit rate limiter.
+        Pages are yielded as they arrive, so batches are not in event order;
+        events returned by two neighbouring windows are yielded once (see
+        ``BoundaryDeduper``).
+        
+        Args:
+            start_date: Start date in UTC
+            end_date: End date in UTC
+            batch_size: Records per API request
+            shard_hours: Window width (defaults to LEADCONDUIT_SHARD_HOURS)
+            concurrency: Windows walked at once (defaults to LEADCONDUIT_SHARD_CONCURRENCY)
+            
+        Yields:
+            List[Dict]: Batches of event records
+        """
+        shard_hours = self.shard_hours if shard_hours is None else shard_hours
+        concurrency = self.shard_concurrency if concurrency is None else concurrency
+        windows = shard_windows(start_date, end_date, shard_hours)
+        logger.info(
+            f"Fetching LeadConduit events from {start_date} to {end_date} "
+            f"in {len(windows)} shards ({concurrency} concurrent)"
+        )
         
+        deduper = BoundaryDeduper(windows)
+        total_fetched = 0
+        def walk(start: datetime, end: datetime):
+            return self._walk_events(start, end, batch_size)
+        
+        async for events in merge_window_pages(windows, walk, concurrency):
+            fresh = [event for event in events if not deduper.is_duplicate(event)]
+            total_fetched += len(fresh)
+            if fresh:
+                yield fresh
+        
+        logger.info(f"Sharded fetch complete. Total fetched: {total_fetched}")
+    
+    async def _walk_events(self, start_date: datetime, end_date: datetime,
+                           batch_size: int = 1000) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Page through one window of events with its own ``after_id`` cursor.
+        
+        A 429 backs off the shared rate limiter (see ``handle_rate_limit``) and
+        retries the page, so one throttled shard does not abort the others.
+        """
         # Format dates for LeadConduit API
         start_str = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
         end_str = end_date.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -135,6 +204,7 @@ class LeadConduitBaseClient(BaseAPIClient):
         # Use ID-based pagination for better performance
         last_id = None
         total_fetched = 0
+        rate_limited = 0
         
         while True:
             try:
@@ -150,39 +220,47 @@ class LeadConduitBaseClient(BaseAPIClient):
                 if last_id:
                     params['after_id'] = last_id
                 
-                # Make API request with rate limiting
-                await self._apply_rate_limit()
+                # Make API request with rate limiting (a retry after a 429 always waits on the limiter)
+                if rate_limited:
+                    await self.acquire_rate_limit()
+                else:
+                    await self._apply_rate_limit()
                 
                 url = f"{self.base_url}/events"
                 async with self.session.get(url, params=params) as response:
+                    self.record_rate_limit_headers(response.headers)
+                    if response.status == 429 and rate_limited < MAX_RATE_LIMITED_RETRIES:
+                        rate_limited += 1
+                        await self.handle_rate_limit(response)
+                        continue
                     if response.status != 200:
-                        logger.error(f"API request failed: {response.status} - {await response.text()}")
-                        break
+                        raise APIException(f"API request failed: {response.status} - {await response.text()}")
                     
                     data = await response.json()
                     events = data.get('data', data) if isinstance(data, dict) else data
+                    rate_limited = 0
                 
-                if not events or len(events) == 0:
-                    logger.info(f"No more events found. Total fetched: {total_fetched}")
-                    break
-                
-                # Yield this batch
-                yield events
-                total_fetched += len(events)
-                
-                # Update pagination cursor
-                last_id = events[-1].get('id')
-                
-                logger.debug(f"Fetched batch of {len(events)} events (total: {total_fetched})")
-                
-                # Break if we got fewer results than requested (end of data)
-                if len(events) < batch_size:
-                    logger.info(f"Reached end of data. Total fetched: {total_fetched}")
-                    break
-                    
+            except APIException:
+                raise
             except Exception as e:
-                logger.error(f"Error fetching events batch: {e}")
+                logger.error(f"Error fetching events batch for {start_str} to {end_str}: {e}")
                 raise APIException(f"Failed to fetch events: {e}")
+            
+            if not events:
+                logger.debug(f"No more events for {start_str} to {end_str}. Total fetched: {total_fetched}")
+                break
+            
+            yield events
+            total_fetched += len(events)
+            
+            # Update pagination cursor
+            last_id = events[-1].get('id')
+            
+            logger.debug(f"Fetched batch of {len(events)} events for {start_str} to {end_str} (total: {total_fetched})")
+            
+            # Break if we got fewer results than requested (end of data)
+            if len(events) < batch_size or not last_id:
+                break
     
     async def get_events_with_id_pagination_fast(self, 
                                                 start_date: str, 
@@ -224,6 +302,7 @@ class LeadConduitBaseClient(BaseAPIClient):
                 
                 # Make async request using the session
                 async with self.session.get(url, params=params) as response:
+                    self.record_rate_limit_headers(response.headers)
                     if response.status != 200:
                         logger.error(f"API request failed with status {response.status}: {await response.text()}")
                         return None
@@ -282,9 +361,9 @@ class LeadConduitBaseClient(BaseAPIClient):
             return str(field_data) if field_data is not None else ''
     
     async def _apply_rate_limit(self):
-        """Apply rate limiting between API requests"""
+        """Wait for the shared LeadConduit rate limiter"""
         if self.request_delay > 0:
-            await asyncio.sleep(self.request_delay)
+            await self.acquire_rate_limit()
     
     async def handle_rate_limit_error(self, response):
         """Handle rate limit errors with exponential backoff"""
@@ -0,0 +1,112 @@
+"""
+Time-sharded LeadConduit event extraction helpers
+
+The events endpoint is paged with one ``after_id`` cursor per ``start``/``end``
+window, so a long range walked as a single window is bound by the round-trip
+time of one request after another. Splitting the range into sub-windows gives
+each its own independent cursor; the windows are walked concurrently and their
+pages merged into one stream as they arrive.
+"""
+import asyncio
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Sequence, Tuple
+
+Window = Tuple[datetime, datetime]
+
+
+def shard_windows(start: datetime, end: datetime, shard_hours: float) -> List[Window]:
+    """Split ``[start, end]`` into consecutive windows of ``shard_hours``.
+
+    Neighbouring windows share their boundary second, so an event stamped on
+    it can be returned by both; callers drop the second copy with
+    ``BoundaryDeduper``.
+    """
+    if shard_hours <= 0 or end <= start:
+        return [(start, end)]
+    width = timedelta(hours=shard_hours)
+    windows = []
+    lower = start
+    while lower < end:
+        upper = min(lower + width, end)
+        windows.append((lower, upper))
+        lower = upper
+    return windows
+
+
+class BoundaryDeduper:
+    """Drops the second copy of events returned by both windows around a boundary.
+
+    Only events stamped within ``slack_seconds`` of a shard boundary (or with
+    no usable ``start_timestamp``) can come back twice, so only their IDs are
+    remembered; memory follows the traffic around boundaries rather than the
+    length of the range.
+    """
+
+    def __init__(self, windows: Sequence[Window], slack_seconds: int = 1):
+        self.boundaries = sorted(int(start.timestamp()) for start, _ in windows[1:])
+        self.slack_seconds = slack_seconds
+        self.seen = set()
+
+    def near_boundary(self, timestamp_ms: Any) -> bool:
+        if not isinstance(timestamp_ms, (int, float)):
+            return True
+        second = int(timestamp_ms // 1000)
+        index = bisect_left(self.boundaries, second - self.slack_seconds)
+        return index < len(self.boundaries) and self.boundaries[index] <= second + self.slack_seconds
+
+    def is_duplicate(self, event: Dict[str, Any]) -> bool:
+        event_id = event.get('id')
+        if not event_id or not self.near_boundary(event.get('start_timestamp')):
+            return False
+        if event_id in self.seen:
+            return True
+        self.seen.add(event_id)
+        return False
+
+
+async def merge_window_pages(windows: Sequence[Window],
+                             walk: Callable[[datetime, datetime], AsyncIterator[Any]],
+                             concurrency: int, buffer: int = 0) -> AsyncIterator[Any]:
+    """Walk ``windows`` at most ``concurrency`` at a time, yielding pages as they arrive.
+
+    ``buffer`` pages (default two per concurrent window) may wait for the
+    consumer before walkers block. The first window to fail cancels the rest
+    and its error is raised; closing the generator early cancels them too.
+    """
+    concurrency = max(1, min(concurrency, len(windows)))
+    slots = asyncio.Semaphore(buffer or concurrency * 2)
+    running = asyncio.Semaphore(concurrency)
+    # Unbounded so end markers never block; ``slots`` bounds the pages
+    pages: asyncio.Queue = asyncio.Queue()
+    end = object()
+
+    async def walk_window(window: Window):
+        error = None
+        try:
+            async with running:
+                async for page in walk(*window):
+                    await slots.acquire()
+                    pages.put_nowait(page)
+        except Exception as e:
+            error = e
+        finally:
+            pages.put_nowait((end, error))
+
+    tasks = [asyncio.create_task(walk_window(window)) for window in windows]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await pages.get()
+            if isinstance(item, tuple) and len(item) == 2 and item[0] is end:
+                remaining -= 1
+                if item[1] is not None:
+                    raise item[1]
+                continue
+            slots.release()
+            yield item
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
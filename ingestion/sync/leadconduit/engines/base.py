@@ -179,37 +179,30 @@ class LeadConduitSyncEngine:
             if dry_run:
                 logger.info("DRY RUN MODE: No database writes will be performed")
             
-            # Process each day in the date range
-            current_date = since_date.date()
-            end_date_only = end_date.date()
-            
+            # Stream the whole range; the client shards it into concurrent time windows
             total_processed = 0
             total_created = 0
             total_updated = 0
             total_failed = 0
             
-            while current_date <= end_date_only:
-                logger.info(f"Processing leads for date: {current_date}")
-                
-                # Get batch size from config or use default
-                batch_size = self.config.get('batch_size', 100)
-                max_records = self.config.get('max_records', 0)
-                logger.info(f"Using batch size: {batch_size}, max records: {max_records}")
-                
-                # Process leads in batches to avoid memory issues with large datasets
-                batch_count = 0
-                async for leads_batch in self.leads_client.get_leads_in_batches_utc(current_date, batch_size):
+            # Get batch size from config or use default
+            batch_size = self.config.get('batch_size', 100)
+            max_records = self.config.get('max_records', 0)
+            logger.info(f"Using batch size: {batch_size}, max records: {max_records}")
+            
+            # Process leads in batches to avoid memory issues with large datasets
+            batch_count = 0
+            leads_batches = self.leads_client.get_leads_in_batches_range(
+                since_date.date(), end_date.date(), batch_size
+            )
+            try:
+                async for leads_batch in leads_batches:
                     if not leads_batch:
                         continue
                     
                     batch_count += 1
                     logger.info(f"Processing batch {batch_count} with {len(leads_batch)} leads")
                     
-                    # Apply max_records limit if specified
-                    if max_records > 0 and total_processed >= max_records:
-                        logger.info(f"Reached max_records limit: {max_records}")
-                        break
-                    
                     # Truncate batch if it would exceed max_records
                     if max_records > 0:
                         remaining = max_records - total_processed
@@ -246,20 +239,16 @@ class LeadConduitSyncEngine:
                     
                     # Check if we've reached max_records
                     if max_records > 0 and total_processed >= max_records:
+                        logger.info(f"Stopping sync - reached max_records limit: {max_records}")
                         break
-                
-                if batch_count == 0:
-                    logger.info(f"No leads data found for {current_date}")
-                else:
-                    logger.info(f"Date {current_date} completed: {batch_count} batches processed")
-                
-                # Check if we've reached max_records
-                if max_records > 0 and total_processed >= max_records:
-                    logger.info(f"Stopping sync - reached max_records limit: {max_records}")
-                    break
-                
-                # Move to next day
-                current_date += timedelta(days=1)
+            finally:
+                # Stops the remaining shard walks when the loop ends early
+                await leads_batches.aclose()
+            
+            if batch_count == 0:
+                logger.info(f"No leads data found for {since_date.date()} to {end_date.date()}")
+            else:
+                logger.info(f"Date range completed: {batch_count} batches processed")
             
             # Update results with totals
             result.update({
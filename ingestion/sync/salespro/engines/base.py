@@ -7,13 +7,16 @@ from typing import Dict, Any, List, Optional, AsyncGenerator
 from datetime import datetime
 from abc import ABC, abstractmethod
 from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.utils import timezone
 from ingestion.base.sync_engine import BaseSyncEngine
 from ingestion.base.exceptions import SyncException, ValidationException
+from ingestion.base.rows import RowSchema
 from ingestion.utils import get_athena_client
 from ingestion.athena_client import AthenaClient
 from ingestion.models.common import SyncHistory
 from ingestion.models.salespro import SalesPro_LeadResultLineItem
+from ingestion.sync.salespro.processors.line_items import reconcile_line_items
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,8 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
         self.credential_manager = None
         self.automation_engine = None
         self.alert_system = None
+        # Single-pass result set position just past the last yielded batch
+        self._stream_cursor = None
         
     def get_default_batch_size(self) -> int:
         """Return default batch size for SalesPro sync operations"""
@@ -171,59 +176,73 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
     
     def _build_count_query(self, **kwargs) -> str:
         """Build COUNT query with same conditions as main query"""
-        base_table = self.table_name
+        query = f"SELECT COUNT(*) as total_count FROM {self.table_name}"
+        conditions = self._build_filter_conditions(**kwargs)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query
+    
+    def _build_filter_conditions(self, **kwargs) -> List[str]:
+        """WHERE conditions shared by the count and extraction queries"""
+        conditions = []
         
+        # Filter out records without a business key
         if self.table_name == 'lead_results':
-            # Count query for lead_results with same conditions
-            conditions = ["estimate_id IS NOT NULL AND estimate_id != ''"]
-            
-            # Add incremental sync condition if since_date is provided
-            since_date = kwargs.get('since_date')
-            if since_date:
-                since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                conditions.append(f"updated_at > timestamp '{since_date_str}'")
-            
-            where_clause = " AND ".join(conditions)
-            query = f"""
-            SELECT COUNT(*) as total_count
-            FROM {base_table}
-            WHERE {where_clause}
-            """
+            conditions.append("estimate_id IS NOT NULL AND estimate_id != ''")
+        elif self.table_name == 'customer':
+            conditions.append("customer_id IS NOT NULL AND customer_id != ''")
+        
+        # Add WHERE clause for incremental sync
+        since_date = kwargs.get('since_date')
+        if since_date:
+            since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
+            conditions.append(f"{self._incremental_column()} > timestamp '{since_date_str}'")
+        
+        return conditions
+    
+    def _incremental_column(self) -> str:
+        """Timestamp column used for incremental filtering"""
+        if self.table_name in ['credit_applications', 'customer', 'estimate', 'lead_results', 'payments']:
+            # These tables have updated_at column
+            return 'updated_at'
+        # Fallback to created_at for tables without updated_at (e.g. user_activity)
+        return 'created_at'
+    
+    def _build_extraction_query(self, **kwargs) -> str:
+        """Build the single query whose result set feeds the whole sync"""
+        if self.table_name == 'lead_results':
+            query = f"SELECT estimate_id, company_id, lead_results, created_at, updated_at FROM {self.table_name}"
+            order_by = "created_at, estimate_id"
         else:
-            # For other tables, build count query with same conditions
-            conditions = []
-            
-            # Filter out records with null customer_id
-            if self.table_name == 'customer':
-                conditions.append("customer_id IS NOT NULL AND customer_id != ''")
-            
-            # Add WHERE clause for incremental sync
-            since_date = kwargs.get('since_date')
-            if since_date:
-                if self.table_name == 'user_activity':
-                    since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                    conditions.append(f"created_at > timestamp '{since_date_str}'")
-                else:
-                    # For other tables, prefer updated_at when available
-                    since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                    if self.table_name in ['credit_applications', 'customer', 'estimate','lead_results', 'payments']:
-                        # These tables have updated_at column
-                        conditions.append(f"updated_at > timestamp '{since_date_str}'")
-                    else:
-                        # Fallback to created_at for tables without updated_at
-                        conditions.append(f"created_at > timestamp '{since_date_str}'")
-            
-            query = f"SELECT COUNT(*) as total_count FROM {base_table}"
-            if conditions:
-                query += " WHERE " + " AND ".join(conditions)
+            query = f"SELECT * FROM {self.table_name}"
+            order_by = self._incremental_column()
+        
+        conditions = self._build_filter_conditions(**kwargs)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += f" ORDER BY {order_by}"
         
+        max_records = kwargs.get('max_records', 0)
+        if max_records > 0:
+            query += f" LIMIT {max_records}"
         return query
 
     async def fetch_data(self, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
-        """Fetch data from AWS Athena in manageable chunks to handle large datasets (1M+ records)"""
+        """Fetch data from AWS Athena in batches, handling large datasets (1M+ records)
+        
+        The default ``single_pass`` extraction mode runs one query and streams
+        its result set page by page. The legacy ``chunked`` mode re-queries
+        Athena per 50K rows and is kept only as a fallback.
+        """
         if not self.connection:
             raise SyncException("Athena client not initialized")
-            
+        
+        extraction_mode = kwargs.pop('extraction_mode', None) or getattr(
+            settings, 'SALESPRO_EXTRACTION_MODE', 'single_pass'
+        )
+        total_available = None
+        total_to_process = None
+        
         try:
             batch_size = kwargs.pop('limit', self.batch_size)  # Remove from kwargs to avoid conflicts
             # Also remove batch_size from kwargs if it exists
@@ -231,44 +250,33 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
             max_records = kwargs.get('max_records', 0)
             records_fetched = 0
             
-            # Get total record count for progress tracking
-            total_available = await self.get_total_record_count(**kwargs)
-            
-            # Determine actual records to process
-            if max_records > 0:
-                total_to_process = min(total_available, max_records)
+            if extraction_mode == 'chunked':
+                # Chunk boundaries need the total up front
+                total_available = await self.get_total_record_count(**kwargs)
+                total_to_process = min(total_available, max_records) if max_records > 0 else total_available
+                logger.info(f"Will process {total_to_process:,} records out of {total_available:,} total available")
+                
+                # Early return if no records to process
+                if total_to_process == 0:
+                    logger.info(f"No records to process for {self.table_name}, skipping data fetch")
+                    return
+                batches = self._fetch_data_chunked(total_to_process, batch_size, **kwargs)
             else:
-                total_to_process = total_available
-            
-            logger.info(f"Will process {total_to_process:,} records out of {total_available:,} total available")
-            
-            # Early return if no records to process
-            if total_to_process == 0:
-                logger.info(f"No records to process for {self.table_name}, skipping data fetch")
-                return
+                batches = self._fetch_data_single_pass(batch_size, **kwargs)
             
-            # Use chunked processing for ANY dataset over 10K records to avoid memory issues
-            if total_to_process > 10000:
-                logger.info(f"Dataset detected ({total_to_process:,} records). Using memory-efficient chunked processing.")
-                async for batch in self._fetch_data_chunked(total_to_process, batch_size, **kwargs):
-                    records_fetched += len(batch)
-                    progress_pct = (records_fetched / total_to_process * 100) if total_to_process > 0 else 0
+            async for batch in batches:
+                records_fetched += len(batch)
+                if total_to_process:
+                    progress_pct = records_fetched / total_to_process * 100
                     logger.info(f"Processing chunk: {len(batch)} records "
                               f"(total processed: {records_fetched:,}/{total_to_process:,} - {progress_pct:.1f}%)")
-                    yield batch
-                    
-                    # Check if we've reached the max_records limit
-                    if max_records > 0 and records_fetched >= max_records:
-                        break
-            else:
-                # Only for very small datasets (<10K), use streaming approach 
-                async for batch in self._fetch_data_single_query(batch_size, **kwargs):
-                    records_fetched += len(batch)
-                    yield batch
-                    
-                    # Check if we've reached the max_records limit
-                    if max_records > 0 and records_fetched >= max_records:
-                        break
+                else:
+                    logger.info(f"Processing chunk: {len(batch)} records (total processed: {records_fetched:,})")
+                yield batch
+                
+                # Check if we've reached the max_records limit
+                if max_records > 0 and records_fetched >= max_records:
+                    break
             
             logger.info(f"Completed fetching {records_fetched:,} records from {self.table_name}")
             
@@ -278,9 +286,9 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
                     'operation': 'fetch_data',
                     'table': self.table_name,
                     'records_fetched': records_fetched,
-                    'total_available': total_available,
-                    'total_to_process': total_to_process,
-                    'chunked_processing': total_to_process > 100000
+                    'total_available': total_available if total_available is not None else records_fetched,
+                    'total_to_process': total_to_process if total_to_process is not None else records_fetched,
+                    'extraction_mode': extraction_mode,
                 })
             
         except Exception as e:
@@ -290,10 +298,110 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
                 await self.automation_engine.handle_error(e, {
                     'operation': 'fetch_data',
                     'table': self.table_name,
-                    'query': 'chunked_processing' if total_to_process > 100000 else 'single_query'
+                    'query': extraction_mode
                 })
             raise SyncException(f"Failed to fetch data: {e}")
     
+    def get_stream_cursor(self) -> Optional[Dict[str, Any]]:
+        """Athena query execution and result page position of the last yielded batch"""
+        return self._stream_cursor
+    
+    async def _resumable_execution(self, source: str) -> Optional[Dict[str, Any]]:
+        """Checkpointed single-pass position whose query results can still be read"""
+        cursor = self.resume_cursor or {}
+        execution_id = cursor.get('query_execution_id')
+        if not execution_id or cursor.get('source') != source:
+            return None
+        state = await sync_to_async(self.connection.get_query_state)(execution_id)
+        if state != 'SUCCEEDED':
+            logger.warning(f"Cannot resume from Athena query {execution_id} (state: {state}); starting a new query")
+            return None
+        logger.info(f"Resuming {self.table_name} from Athena query {execution_id} "
+                    f"(page token: {cursor.get('page_token')}, skipping {cursor.get('skip', 0)} rows)")
+        return cursor
+    
+    async def _fetch_data_single_pass(self, batch_size: int, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
+        """Run one Athena query and stream its result set into batches
+        
+        After each batch ``_stream_cursor`` records the query execution and
+        where the next unsaved row sits in its result set: the NextToken of
+        its API page and the rows of that page already yielded (for S3 results,
+        the rows yielded from the start of the CSV). A resumed run re-reads the
+        same results from there instead of re-running the query.
+        """
+        source = 's3' if getattr(settings, 'SALESPRO_ATHENA_RESULT_SOURCE', 'api') == 's3' else 'api'
+        resume = await self._resumable_execution(source)
+        
+        if resume:
+            execution_id = resume['query_execution_id']
+            page_token, skip, column_names = resume.get('page_token'), resume.get('skip', 0), resume.get('columns')
+        else:
+            query = self._build_extraction_query(**kwargs)
+            logger.debug(f"Executing single-pass extraction query: {query}")
+            
+            execution_id = await sync_to_async(self.connection.start_query)(query, database='home_genius_db')
+            if execution_id is None:
+                raise SyncException(f"Athena extraction query failed for {self.table_name}")
+            page_token, skip, column_names = None, 0, None
+        
+        if source == 's3':
+            pages = (
+                (columns, rows, None) for columns, rows in self.connection.iter_result_pages_from_s3(execution_id)
+            )
+        else:
+            pages = self.connection.iter_result_pages_with_tokens(
+                execution_id, start_token=page_token, column_names=column_names
+            )
+        
+        # S3 results have no page tokens, so their offset counts from the start of the CSV
+        offset_base = skip if source == 's3' else 0
+        yielded = 0
+        page_len = 0
+        next_token = page_token
+        
+        def position(remaining: int) -> Dict[str, Any]:
+            if source == 's3':
+                token, page_skip = None, offset_base + yielded
+            elif remaining or not next_token:
+                token, page_skip = page_token, page_len - remaining
+            else:
+                token, page_skip = next_token, 0
+            return {'query_execution_id': execution_id, 'source': source, 'page_token': token,
+                    'skip': page_skip, 'columns': column_names}
+        
+        # Rows are yielded as tuple-backed records sharing one column schema
+        schema = None
+        pending = []
+        while True:
+            # Each page is a blocking boto3 call
+            page = await sync_to_async(next)(pages, None)
+            if page is None:
+                break
+            page_token = next_token if source == 'api' else None
+            column_names, rows, next_token = page
+            if schema is None or schema.names != tuple(column_names):
+                schema = RowSchema(column_names)
+            page_len = len(rows)
+            if skip:
+                dropped = min(skip, len(rows))
+                rows = rows[dropped:]
+                skip -= dropped
+            pending.extend(schema.rows(rows))
+            
+            start = 0
+            while len(pending) - start >= batch_size:
+                batch = pending[start:start + batch_size]
+                start += batch_size
+                yielded += len(batch)
+                self._stream_cursor = position(len(pending) - start)
+                yield batch
+            pending = pending[start:]
+        
+        if pending:
+            yielded += len(pending)
+            self._stream_cursor = position(0)
+            yield pending
+    
     async def _fetch_data_chunked(self, total_records: int, batch_size: int, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
         """Fetch data in chunks for large datasets to prevent memory issues"""
         chunk_size = 50000  # Process 50K records per Athena query
@@ -319,11 +427,10 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
                 
                 logger.debug(f"Retrieved {len(rows)} rows from chunk (offset {offset:,})")
                 
-                # Process this chunk in smaller batches
+                # Process this chunk in smaller batches of records sharing one schema
+                schema = RowSchema(column_names)
                 for i in range(0, len(rows), batch_size):
-                    batch_rows = rows[i:i + batch_size]
-                    batch = [dict(zip(column_names, row)) for row in batch_rows]
-                    yield batch
+                    yield schema.rows(rows[i:i + batch_size])
                 
                 # Move to next chunk
                 offset += len(rows)
@@ -336,115 +443,6 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
                 logger.error(f"Error in chunked query at offset {offset:,}: {e}")
                 raise
     
-    async def _fetch_data_single_query(self, batch_size: int, **kwargs) -> AsyncGenerator[List[Dict[str, Any]], None]:
-        """Memory-efficient approach that streams data in batches without loading all records into memory"""
-        # For datasets that appear "small" but still too large for memory, use chunked processing
-        max_records = kwargs.get('max_records', 0)
-        total_to_process = max_records if max_records > 0 else 100000  # Default safe limit
-        
-        logger.info(f"Using memory-efficient streaming for {total_to_process:,} records")
-        
-        # Use chunked processing even for "smaller" datasets to avoid memory issues
-        async for batch in self._fetch_data_chunked(total_to_process, batch_size, **kwargs):
-            yield batch
-            
-    def _build_query(self, **kwargs) -> str:
-        """Build SQL query for Athena with proper batching for large datasets"""
-        base_table = self.table_name
-        
-        # For lead_results, build query with proper incremental sync support
-        if self.table_name == 'lead_results':
-            conditions = ["estimate_id IS NOT NULL AND estimate_id != ''"]
-            
-            # Add incremental sync condition if since_date is provided
-            since_date = kwargs.get('since_date')
-            if since_date:
-                since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                conditions.append(f"updated_at > timestamp '{since_date_str}'")
-            
-            where_clause = " AND ".join(conditions)
-            query = f"""
-            SELECT estimate_id, company_id, lead_results, created_at, updated_at
-            FROM {base_table}
-            WHERE {where_clause}
-            ORDER BY created_at
-            """
-            
-            # Add LIMIT based on max_records parameter
-            max_records = kwargs.get('max_records', 0)
-            full_sync = kwargs.get('full_sync', False)
-            
-            if max_records > 0:
-                # User specified specific limit
-                query += f" LIMIT {max_records}"
-            elif not full_sync:
-                # For incremental sync, use a reasonable default to avoid memory issues
-                default_limit = 50000  # Process 50K records at a time for incremental sync
-                query += f" LIMIT {default_limit}"
-            # For full sync (--full flag), don't add any LIMIT to get all records
-        else:
-            query = f"SELECT * FROM {base_table}"
-        
-        # Add additional WHERE conditions for other tables
-        conditions = []
-        
-        # Filter out records with null customer_id to get real data
-        if self.table_name == 'customer':
-            conditions.append("customer_id IS NOT NULL AND customer_id != ''")
-        
-        # Add WHERE clause for incremental sync
-        since_date = kwargs.get('since_date')
-        if since_date and self.table_name != 'lead_results':  # Don't add this for lead_results as we use CTE
-            # Use created_at for user_activity table (it doesn't have updated_at)
-            if self.table_name == 'user_activity':
-                since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                conditions.append(f"created_at > timestamp '{since_date_str}'")
-            else:
-                # For other tables, prefer updated_at when available
-                since_date_str = since_date.strftime('%Y-%m-%d %H:%M:%S')
-                if self.table_name in ['credit_applications', 'customer', 'estimate']:
-                    # These tables have updated_at column
-                    conditions.append(f"updated_at > timestamp '{since_date_str}'")
-                else:
-                    # Fallback to created_at for tables without updated_at
-                    conditions.append(f"created_at > timestamp '{since_date_str}'")
-        
-        # Add WHERE conditions if any (but not for lead_results with simplified query)
-        if conditions and self.table_name != 'lead_results':
-            query += " WHERE " + " AND ".join(conditions)
-                
-        # Add ORDER BY for consistent pagination (for non-lead_results queries)
-        if self.table_name != 'lead_results':
-            if self.table_name == 'user_activity':
-                query += " ORDER BY created_at"
-            elif self.table_name in ['credit_applications', 'customer', 'estimate']:
-                # Use updated_at for tables that have it (same as filtering)
-                query += " ORDER BY updated_at"
-            else:
-                # Default ordering for other tables
-                query += " ORDER BY created_at"
-                
-            # Add LIMIT - always limit large tables to prevent timeouts
-            max_records = kwargs.get('max_records', 0)
-            if max_records > 0:
-                query += f" LIMIT {max_records}"
-            elif self.table_name in ['user_activity'] and not since_date:
-                # For full sync of large tables, use a reasonable default limit
-                default_limit = 50000
-                query += f" LIMIT {default_limit}"
-                logger.warning(f"Large table '{self.table_name}' detected. Limiting to {default_limit} records per sync. Use --max-records or incremental sync for better control.")
-        else:
-            # For lead_results, LIMIT and ORDER BY are already included in the simplified query
-            # Only add max_records limit if specified and not using batching
-            max_records = kwargs.get('max_records', 0)
-            if max_records > 0 and 'offset' not in kwargs:
-                # Replace the existing LIMIT with max_records
-                if " LIMIT " in query:
-                    query = query.rsplit(" LIMIT ", 1)[0]  # Remove existing LIMIT
-                    query += f" LIMIT {max_records}"
-            
-        return query
-    
     def _build_chunked_query(self, chunk_size: int, offset: int, **kwargs) -> str:
         """Build SQL query for chunked processing of large datasets"""
         base_table = self.table_name
@@ -1118,7 +1116,11 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
             # Check if line items were extracted during processing
             line_items = record.get('_line_items', [])
             
-            if line_items:
+            if line_items and self.line_item_mode == 'reconcile':
+                await sync_to_async(reconcile_line_items)(
+                    [{'estimate_id': lead_result_obj.estimate_id, '_line_items': line_items}], self.model_class
+                )
+            elif line_items:
                 # Delete existing line items for this estimate
                 await sync_to_async(
                     lead_result_obj.line_items.all().delete
@@ -1145,11 +1147,24 @@ class SalesProBaseSyncEngine(BaseSyncEngine):
         except Exception as e:
             logger.error(f"Error handling line items for estimate {lead_result_obj.estimate_id}: {e}")
 
+    @property
+    def line_item_mode(self) -> str:
+        """'reconcile' writes only changed line items, 'replace' deletes and recreates them"""
+        return getattr(settings, 'SALESPRO_LINE_ITEM_MODE', 'reconcile')
+    
     async def _handle_bulk_line_items(self, records: List[Dict[str, Any]]):
         """Handle line items for multiple LeadResult records using efficient bulk operations"""
         from ingestion.models.salespro import SalesPro_LeadResultLineItem
         
         try:
+            if self.line_item_mode == 'reconcile':
+                counts = await sync_to_async(reconcile_line_items)(records, self.model_class)
+                logger.info(
+                    f"Reconciled line items: {counts['created']} created, {counts['updated']} updated, "
+                    f"{counts['deleted']} deleted, {counts['unchanged']} unchanged"
+                )
+                return
+            
             logger.info(f"Starting optimized bulk line items processing for {len(records)} records")
             
             # Collect all estimate_ids that have line items
@@ -2,6 +2,7 @@
 Base processor for SalesPro data following CRM sync framework standards
 """
 import logging
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from django.utils import timezone
@@ -141,7 +142,7 @@ class SalesProBaseProcessor(BaseDataProcessor):
         try:
             value = record
             for key in field_path.split('.'):
-                if isinstance(value, dict) and key in value:
+                if isinstance(value, Mapping) and key in value:
                     value = value[key]
                 else:
                     return None
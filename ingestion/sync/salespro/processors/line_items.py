@@ -0,0 +1,145 @@
+"""
+Diff-based reconciliation of SalesPro lead result line items.
+
+Line items are keyed by ``(estimate_id, job_type_number)``. For the
+estimates of a batch that carry line items, the stored rows are read once as
+plain value tuples and compared with the incoming items. Only the delta is
+written: new and changed items in one bulk upsert on that key, and removed
+items in one DELETE. Unchanged items are not touched, so incremental runs do
+not rewrite the line-item table and its indexes.
+
+Parent ``SalesPro_LeadResult`` rows are resolved by primary key only; their
+``estimate_id`` is the line items' foreign key value, so no parent objects
+are loaded.
+"""
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
+
+LineItemKey = Tuple[str, int]
+# (job_type, job_type_amount) of one line item
+LineItemValues = Tuple[Any, Any]
+
+AMOUNT_QUANTUM = Decimal('0.01')
+
+
+def normalize_amount(value: Any) -> Any:
+    """Amount as the 2-place Decimal the column stores, so unchanged items compare equal"""
+    if value is None or value == '':
+        return None
+    try:
+        return Decimal(str(value)).quantize(AMOUNT_QUANTUM)
+    except (InvalidOperation, ValueError):
+        return value
+
+
+def desired_line_items(records: Iterable[Mapping[str, Any]]) -> Dict[LineItemKey, LineItemValues]:
+    """Incoming line items by key, for the records that carry any; later duplicates win"""
+    desired = {}
+    for record in records:
+        estimate_id = record.get('estimate_id')
+        if not estimate_id:
+            continue
+        for item in record.get('_line_items') or []:
+            number = item.get('job_type_number')
+            if number:
+                desired[(estimate_id, int(number))] = (
+                    item.get('job_type'), normalize_amount(item.get('job_type_amount'))
+                )
+    return desired
+
+
+@dataclass
+class LineItemDelta:
+    """Writes needed to turn the stored line items into the desired ones"""
+    upserts: Dict[LineItemKey, LineItemValues] = field(default_factory=dict)
+    delete_ids: List[int] = field(default_factory=list)
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            'created': self.created,
+            'updated': self.updated,
+            'deleted': len(self.delete_ids),
+            'unchanged': self.unchanged,
+        }
+
+
+def diff_line_items(desired: Dict[LineItemKey, LineItemValues],
+                    existing: Dict[LineItemKey, Tuple[int, Any, Any]]) -> LineItemDelta:
+    """Compare desired items with stored ``{key: (id, job_type, job_type_amount)}``.
+
+    ``existing`` must cover exactly the estimates being reconciled: stored
+    items whose key is not desired are deleted.
+    """
+    delta = LineItemDelta()
+    for key, values in desired.items():
+        stored = existing.get(key)
+        if stored is None:
+            delta.upserts[key] = values
+            delta.created += 1
+        elif (stored[1], normalize_amount(stored[2])) != values:
+            delta.upserts[key] = values
+            delta.updated += 1
+        else:
+            delta.unchanged += 1
+    delta.delete_ids = [stored[0] for key, stored in existing.items() if key not in desired]
+    return delta
+
+
+def reconcile_line_items(records: Iterable[Mapping[str, Any]], parent_model,
+                         using: str = 'default') -> Dict[str, int]:
+    """Write only the line-item changes for the estimates of ``records``.
+
+    Returns ``created``, ``updated``, ``deleted``, ``unchanged`` and
+    ``missing_parents`` counts.
+    """
+    from django.db import transaction
+
+    from ingestion.base.bulk_upsert import BulkUpserter
+    from ingestion.models.salespro import SalesPro_LeadResultLineItem
+
+    desired = desired_line_items(records)
+    estimate_ids = {estimate_id for estimate_id, _ in desired}
+    if not estimate_ids:
+        return {'created': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'missing_parents': 0}
+
+    parents = set(
+        parent_model.objects.using(using).filter(pk__in=estimate_ids).values_list('pk', flat=True)
+    )
+    missing = estimate_ids - parents
+    if missing:
+        logger.warning(f"Could not find LeadResult records for estimates: {sorted(missing)}")
+        desired = {key: values for key, values in desired.items() if key[0] in parents}
+
+    existing = {
+        (estimate_id, number): (item_id, job_type, amount)
+        for item_id, estimate_id, number, job_type, amount in SalesPro_LeadResultLineItem.objects.using(using)
+        .filter(estimate_id__in=parents)
+        .values_list('id', 'estimate_id', 'job_type_number', 'job_type', 'job_type_amount')
+    }
+    delta = diff_line_items(desired, existing)
+
+    with transaction.atomic(using=using):
+        if delta.delete_ids:
+            SalesPro_LeadResultLineItem.objects.using(using).filter(id__in=delta.delete_ids).delete()
+        if delta.upserts:
+            BulkUpserter(
+                SalesPro_LeadResultLineItem,
+                unique_fields=['estimate_id', 'job_type_number'],
+                update_fields=['job_type', 'job_type_amount'],
+                using=using,
+            ).upsert([
+                {'estimate_id': estimate_id, 'job_type_number': number,
+                 'job_type': job_type, 'job_type_amount': amount}
+                for (estimate_id, number), (job_type, amount) in delta.upserts.items()
+            ])
+
+    counts = delta.counts()
+    counts['missing_parents'] = len(missing)
+    return counts
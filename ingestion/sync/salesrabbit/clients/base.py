@@ -13,11 +13,15 @@ logger = logging.getLogger(__name__)
 class SalesRabbitBaseClient(BaseAPIClient):
     """Base client for SalesRabbit API following framework standards"""
     
+    # Requests are paced by the shared rate limiter in make_request
+    rate_limit_name = 'salesrabbit'
+    default_rate_limit = 1.0
+    
     def __init__(self, api_token=None, **kwargs):
         base_url = getattr(settings, 'SALESRABBIT_API_URL', 'https://api.salesrabbit.com').rstrip('/')
         super().__init__(base_url=base_url, timeout=60, **kwargs)
         self.api_token = api_token or getattr(settings, 'SALESRABBIT_API_TOKEN', None)
-        self.rate_limit_delay = 1.0  # Seconds between requests
+        self.rate_limit_delay = 1.0  # Fallback Retry-After in seconds
         
     async def authenticate(self) -> None:
         """Implement SalesRabbit-specific authentication"""
@@ -122,9 +126,6 @@ class SalesRabbitBaseClient(BaseAPIClient):
                     
                     page += 1
                     
-                    # Add rate limiting delay
-                    await asyncio.sleep(self.rate_limit_delay)
-                    
                 except Exception as e:
                     logger.error(f"Error fetching page {page} from {endpoint}: {e}")
                     raise
@@ -206,9 +207,6 @@ class SalesRabbitBaseClient(BaseAPIClient):
                     
                     page += 1
                     
-                    # Add rate limiting delay
-                    await asyncio.sleep(self.rate_limit_delay)
-                    
                 except Exception as e:
                     logger.error(f"Error fetching page {page} from {endpoint}: {e}")
                     raise
@@ -255,9 +253,6 @@ class SalesRabbitBaseClient(BaseAPIClient):
                     
                     page += 1
                     
-                    # Add rate limiting delay
-                    await asyncio.sleep(self.rate_limit_delay)
-                    
                 except Exception as e:
                     logger.error(f"Error fetching page {page} from {endpoint}: {e}")
                     raise
@@ -312,9 +307,6 @@ class SalesRabbitBaseClient(BaseAPIClient):
                     
                     page += 1
                     
-                    # Add rate limiting delay
-                    await asyncio.sleep(self.rate_limit_delay)
-                    
                 except Exception as e:
                     logger.error(f"Error fetching page {page} from {endpoint}: {e}")
                     raise
@@ -0,0 +1,9 @@
+"""
+Offline sync benchmarks.
+
+Serves synthetic, paginated CRM API responses (built from the fixtures in
+``ingestion/tests/mock_responses.py``) from a local aiohttp server, runs a
+sync engine's full pipeline against it and a local database, and records
+records/sec, peak RSS and query counts per engine so throughput regressions
+show up between commits. Run with ``manage.py benchmark_sync``.
+"""
@@ -0,0 +1,244 @@
+"""
+Benchmark runner and result store.
+
+``run_benchmark`` starts a ``FixtureServer`` for a scenario, points the
+engine's API clients at it, lifts their rate limiters and runs the engine's
+full pipeline against the configured (local) database while counting SQL
+queries and sampling RSS. Results are appended to a JSON lines file together
+with the git commit, and compared with the last result of the same scenario
+and scale from another commit.
+"""
+import json
+import logging
+import subprocess
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import psutil
+from django.db.backends.utils import CursorWrapper
+
+from ingestion.base import rate_limiter
+from ingestion.base.rate_limiter import TokenBucket
+from ingestion.tests.benchmarks.scenarios import Scenario, import_string
+from ingestion.tests.benchmarks.server import FixtureServer
+
+logger = logging.getLogger(__name__)
+
+UNTHROTTLED_RATE = 1_000_000.0
+# Metrics compared against the baseline, and whether higher values are better
+COMPARED_METRICS = {'records_per_second': True, 'peak_rss_mb': False, 'queries': False}
+
+
+@contextmanager
+def retarget_clients(client_paths: Iterable[str], url: str):
+    """Point every instance of the given API client classes at ``url``"""
+    with ExitStack() as stack:
+        for path in client_paths:
+            client_class = import_string(path)
+
+            def __init__(self, *args, _original=client_class.__init__, **kwargs):
+                _original(self, *args, **kwargs)
+                self.base_url = url
+
+            stack.enter_context(patch.object(client_class, '__init__', __init__))
+        yield
+
+
+@contextmanager
+def unthrottled(names: Iterable[str]):
+    """Swap the named shared rate limiters for effectively unlimited ones"""
+    saved = {}
+    with rate_limiter._limiters_lock:
+        for name in names:
+            saved[name] = rate_limiter._limiters.get(name)
+            rate_limiter._limiters[name] = TokenBucket(name, UNTHROTTLED_RATE, UNTHROTTLED_RATE)
+    try:
+        yield
+    finally:
+        with rate_limiter._limiters_lock:
+            for name, limiter in saved.items():
+                if limiter is None:
+                    rate_limiter._limiters.pop(name, None)
+                else:
+                    rate_limiter._limiters[name] = limiter
+
+
+class QueryCounter:
+    """Counts SQL statements on every thread (sync_to_async work runs off the event loop thread)"""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def _counted(self, method):
+        counter = self
+
+        def wrapper(cursor, *args, **kwargs):
+            with counter._lock:
+                counter.count += 1
+            return method(cursor, *args, **kwargs)
+        return wrapper
+
+    def __enter__(self) -> 'QueryCounter':
+        self._patches = [
+            patch.object(CursorWrapper, 'execute', self._counted(CursorWrapper.execute)),
+            patch.object(CursorWrapper, 'executemany', self._counted(CursorWrapper.executemany)),
+        ]
+        for patcher in self._patches:
+            patcher.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        for patcher in reversed(self._patches):
+            patcher.stop()
+
+
+class PeakRSS:
+    """Samples this process's RSS on a background thread and keeps the maximum"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def peak_mb(self) -> float:
+        return self.peak_bytes / 1024 / 1024
+
+    def sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, self._process.memory_info().rss)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> 'PeakRSS':
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name='benchmark-rss', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+def git_revision() -> Dict[str, Any]:
+    """Current commit and whether tracked files have uncommitted changes"""
+    def git(*args) -> str:
+        return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout.strip()
+    try:
+        return {'commit': git('rev-parse', '--short', 'HEAD'),
+                'dirty': bool(git('status', '--porcelain', '--untracked-files=no'))}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': 'unknown', 'dirty': False}
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    records: int
+    latency_ms: float
+    jitter_ms: float
+    elapsed_seconds: float
+    records_per_second: float
+    peak_rss_mb: float
+    queries: int
+    requests: int
+    commit: str = 'unknown'
+    dirty: bool = False
+    recorded_at: str = ''
+    unmatched_requests: List[str] = field(default_factory=list)
+    stage_metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> tuple:
+        """Results are only comparable at the same scenario, scale and latency"""
+        return (self.scenario, self.records, self.latency_ms, self.jitter_ms)
+
+
+async def run_benchmark(scenario: Scenario, records: int, latency_ms: float = 0.0,
+                        jitter_ms: float = 0.0) -> BenchmarkResult:
+    """Run one scenario end to end against the fixture server"""
+    async with FixtureServer(scenario.endpoints(records), latency_ms, jitter_ms) as server:
+        limits = (*scenario.rate_limits, urlparse(server.url).hostname)
+        with retarget_clients(scenario.clients, server.url), unthrottled(limits), \
+                QueryCounter() as queries, PeakRSS() as rss:
+            engine = scenario.build_engine()
+            started = time.perf_counter()
+            await scenario.run(engine)
+            elapsed = time.perf_counter() - started
+
+    if server.unmatched:
+        logger.warning(f"{scenario.name}: {len(server.unmatched)} requests had no fixture, e.g. {server.unmatched[0]}")
+    stage_metrics = engine.with_stage_metrics({}) if hasattr(engine, 'with_stage_metrics') else {}
+    return BenchmarkResult(
+        scenario=scenario.name,
+        records=records,
+        latency_ms=latency_ms,
+        jitter_ms=jitter_ms,
+        elapsed_seconds=elapsed,
+        records_per_second=records / elapsed if elapsed > 0 else 0.0,
+        peak_rss_mb=rss.peak_mb,
+        queries=queries.count,
+        requests=server.requests,
+        recorded_at=datetime.now(timezone.utc).isoformat(),
+        unmatched_requests=sorted(set(server.unmatched))[:20],
+        stage_metrics=stage_metrics,
+        **git_revision(),
+    )
+
+
+class ResultStore:
+    """Append-only JSON lines file of benchmark results"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        with self.path.open() as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    def append(self, result: BenchmarkResult) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open('a') as handle:
+            handle.write(json.dumps(asdict(result), default=str) + '\n')
+
+    def baseline(self, result: BenchmarkResult) -> Optional[Dict[str, Any]]:
+        """Most recent stored result for the same key from a different commit"""
+        for row in reversed(self.load()):
+            key = (row.get('scenario'), row.get('records'), row.get('latency_ms'), row.get('jitter_ms'))
+            if key == result.key and row.get('commit') != result.commit:
+                return row
+        return None
+
+
+def find_regressions(result: BenchmarkResult, baseline: Optional[Dict[str, Any]],
+                     tolerance: float = 0.1) -> List[str]:
+    """Metrics that got worse than ``baseline`` by more than ``tolerance`` (a fraction)"""
+    if not baseline:
+        return []
+    regressions = []
+    for metric, higher_is_better in COMPARED_METRICS.items():
+        before, after = baseline.get(metric), getattr(result, metric)
+        if not before:
+            continue
+        change = (after - before) / before
+        if (higher_is_better and change < -tolerance) or (not higher_is_better and change > tolerance):
+            regressions.append(
+                f"{result.scenario}: {metric} {before:.1f} -> {after:.1f} ({change:+.0%}) "
+                f"vs {baseline.get('commit')}"
+            )
+    return regressions
@@ -0,0 +1,131 @@
+"""
+Benchmark scenarios: which engine to run and which fixture endpoints it needs.
+"""
+from dataclasses import dataclass, field
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from ingestion.tests.mock_responses import MockResponseGenerator
+from ingestion.tests.benchmarks.server import FixtureEndpoint, template_records
+
+# Templates are cycled, so a hundred distinct rows is plenty
+TEMPLATE_COUNT = 100
+
+
+def import_string(path: str) -> Any:
+    module, name = path.rsplit('.', 1)
+    return getattr(import_module(module), name)
+
+
+async def run_base_sync(engine) -> Any:
+    return await engine.run_sync(show_progress=False)
+
+
+@dataclass
+class Scenario:
+    """One engine benchmark
+
+    ``clients`` are the API client classes the engine constructs; the harness
+    points every instance at the fixture server. ``rate_limits`` names the
+    shared rate limiters to lift so the local server is not throttled like
+    the real API (clients without a ``rate_limit_name`` use the server host,
+    which is always lifted).
+    """
+    name: str
+    engine: str
+    clients: Tuple[str, ...]
+    endpoints: Callable[[int], List[FixtureEndpoint]]
+    rate_limits: Tuple[str, ...] = ()
+    engine_kwargs: Dict[str, Any] = field(default_factory=dict)
+    run: Callable[[Any], Awaitable[Any]] = run_base_sync
+
+    def build_engine(self):
+        return import_string(self.engine)(**self.engine_kwargs)
+
+
+def hubspot_contacts_endpoints(total: int) -> List[FixtureEndpoint]:
+    templates = MockResponseGenerator.hubspot_contacts_response(TEMPLATE_COUNT)['results']
+    return [FixtureEndpoint(
+        'crm/v3/objects/0-1', style='cursor', total=total, data_key='results',
+        records=template_records(templates, make_id=lambda index: str(index + 1)),
+    )]
+
+
+def callrail_calls_endpoints(total: int) -> List[FixtureEndpoint]:
+    templates = MockResponseGenerator.callrail_calls_response(TEMPLATE_COUNT)['calls']
+    return [
+        FixtureEndpoint('a.json', style='static', payload={'accounts': [{'id': 'ACC000000001'}]}),
+        FixtureEndpoint(
+            r'a/[^/]+/calls\.json', total=total, data_key='calls',
+            records=template_records(templates, make_id=lambda index: f"CAL{index + 1:012d}"),
+        ),
+    ]
+
+
+def salesrabbit_leads_endpoints(total: int) -> List[FixtureEndpoint]:
+    templates = MockResponseGenerator.salesrabbit_leads_response(TEMPLATE_COUNT)['data']
+    return [FixtureEndpoint(
+        'leads', total=total, data_key='data', default_page_size=1000,
+        records=template_records(templates),
+    )]
+
+
+def arrivy_tasks_endpoints(total: int) -> List[FixtureEndpoint]:
+    # Arrivy has no tasks generator; orders carry the same id/status/schedule
+    # shape and the tasks engine keeps the rest in raw_data
+    templates = MockResponseGenerator.arrivy_orders_response(TEMPLATE_COUNT)['orders']
+    return [
+        # test_connection probes customers before the sync starts
+        FixtureEndpoint('customers', style='static', payload=[]),
+        FixtureEndpoint(
+            'tasks', total=total, data_key='tasks',
+            records=template_records(templates, make_id=lambda index: f"task_{index + 1}"),
+        ),
+    ]
+
+
+async def run_callrail_calls(engine) -> Any:
+    return await engine.sync_calls(full_sync=True)
+
+
+async def run_salesrabbit_leads(engine) -> Any:
+    return await engine.run_sync(force_full=True)
+
+
+async def run_arrivy_tasks(engine) -> Any:
+    return await engine.execute_sync(force_full=True)
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    scenario.name: scenario for scenario in (
+        Scenario(
+            name='hubspot_contacts',
+            engine='ingestion.sync.hubspot.engines.contacts.HubSpotContactSyncEngine',
+            clients=('ingestion.sync.hubspot.clients.contacts.HubSpotContactsClient',),
+            endpoints=hubspot_contacts_endpoints,
+            rate_limits=('hubspot',),
+        ),
+        Scenario(
+            name='callrail_calls',
+            engine='ingestion.sync.callrail.engines.calls.CallsSyncEngine',
+            clients=('ingestion.sync.callrail.clients.calls.CallsClient',),
+            endpoints=callrail_calls_endpoints,
+            run=run_callrail_calls,
+        ),
+        Scenario(
+            name='salesrabbit_leads',
+            engine='ingestion.sync.salesrabbit.engines.leads.SalesRabbitLeadSyncEngine',
+            clients=('ingestion.sync.salesrabbit.clients.leads.SalesRabbitLeadsClient',),
+            endpoints=salesrabbit_leads_endpoints,
+            rate_limits=('salesrabbit',),
+            run=run_salesrabbit_leads,
+        ),
+        Scenario(
+            name='arrivy_tasks',
+            engine='ingestion.sync.arrivy.engines.tasks.ArrivyTasksSyncEngine',
+            clients=('ingestion.sync.arrivy.clients.tasks.ArrivyTasksClient',),
+            endpoints=arrivy_tasks_endpoints,
+            run=run_arrivy_tasks,
+        ),
+    )
+}
@@ -0,0 +1,144 @@
+"""
+Local stand-in API server for sync benchmarks.
+
+Each ``FixtureEndpoint`` pages through ``total`` synthetic records in the
+pagination style of one CRM. Records are built on demand from a small set of
+mock-response templates, so serving a million records needs no more memory
+than serving a hundred. Every response can be delayed to simulate API latency.
+"""
+import asyncio
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+RecordFactory = Callable[[int], Dict[str, Any]]
+
+# Query parameters CRMs use for the page size, in lookup order
+PAGE_SIZE_PARAMS = ('limit', 'per_page', 'page_size', 'items_per_page')
+
+
+def template_records(templates: List[Dict[str, Any]], id_field: str = 'id',
+                     make_id: Callable[[int], Any] = lambda index: index + 1) -> RecordFactory:
+    """Factory cycling through mock-response ``templates`` with a unique id per index.
+
+    Records are shallow copies, so nested values are shared between records;
+    they are only serialized, never mutated.
+    """
+    def build(index: int) -> Dict[str, Any]:
+        record = dict(templates[index % len(templates)])
+        record[id_field] = make_id(index)
+        return record
+    return build
+
+
+@dataclass
+class FixtureEndpoint:
+    """One paginated endpoint, matched on the request path (without query string)
+
+    ``style`` is ``'cursor'`` for ``after`` tokens with ``paging.next.after``
+    (HubSpot), ``'page'`` for page numbers with ``page``/``total_pages``
+    metadata (CallRail, SalesRabbit, Arrivy) or ``'static'`` for a fixed
+    ``payload``.
+    """
+    path: str
+    style: str = 'page'
+    total: int = 0
+    records: Optional[RecordFactory] = None
+    data_key: str = 'results'
+    default_page_size: int = 100
+    first_page: int = 1
+    payload: Any = None
+    methods: tuple = ('GET',)
+    pattern: re.Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.pattern = re.compile(f"^/?{self.path.strip('/')}/?$")
+
+    def page_size(self, query) -> int:
+        for name in PAGE_SIZE_PARAMS:
+            if query.get(name):
+                return max(1, int(query[name]))
+        return self.default_page_size
+
+    def respond(self, query) -> Any:
+        if self.style == 'static':
+            return self.payload
+        size = self.page_size(query)
+        if self.style == 'cursor':
+            start = int(query.get('after') or 0)
+        else:
+            start = (int(query.get('page') or self.first_page) - self.first_page) * size
+        stop = min(start + size, self.total)
+        results = [self.records(index) for index in range(start, stop)]
+
+        if self.style == 'cursor':
+            more = stop < self.total
+            return {
+                self.data_key: results,
+                'paging': {'next': {'after': str(stop)}} if more else {},
+            }
+        return {
+            self.data_key: results,
+            'page': start // size + self.first_page,
+            'per_page': size,
+            'total_pages': max(1, -(-self.total // size)),
+            'total_records': self.total,
+        }
+
+
+class FixtureServer:
+    """aiohttp server on 127.0.0.1 serving ``endpoints`` with injected latency
+
+    Usage::
+
+        async with FixtureServer(endpoints, latency_ms=20) as server:
+            ...  # point clients at server.url
+    """
+
+    def __init__(self, endpoints: List[FixtureEndpoint], latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, seed: int = 0):
+        self.endpoints = endpoints
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.requests = 0
+        self.unmatched: List[str] = []
+        self._random = random.Random(seed)
+        self._server: Optional[TestServer] = None
+
+    @property
+    def url(self) -> str:
+        return str(self._server.make_url('')).rstrip('/')
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        delay = self.latency_ms + self._random.uniform(0, self.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        for endpoint in self.endpoints:
+            if request.method in endpoint.methods and endpoint.pattern.match(request.path):
+                return web.json_response(endpoint.respond(request.query))
+        self.unmatched.append(f"{request.method} {request.path}")
+        return web.json_response({'message': f"no fixture for {request.path}"}, status=404)
+
+    async def start(self) -> 'FixtureServer':
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', self.handle)
+        self._server = TestServer(app, host='127.0.0.1')
+        await self._server.start_server()
+        return self
+
+    async def close(self) -> None:
+        if self._server is not None:
+            await self._server.close()
+            self._server = None
+
+    async def __aenter__(self) -> 'FixtureServer':
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
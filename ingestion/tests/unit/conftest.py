@@ -0,0 +1,12 @@
+"""
+pytest configuration for unit tests
+
+Unit tests never touch the database, but importing models still needs the
+Django app registry to be ready.
+"""
+import os
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'data_warehouse.settings')
+django.setup()
@@ -0,0 +1,89 @@
+"""
+Unit Tests for AIMD page and batch sizing
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Synthetic latency and memory readings)
+Duration: < 5 seconds
+"""
+
+from ingestion.base.adaptive_batching import (
+    ERROR, LATENCY, MEMORY, SLOWDOWN, AIMDController, adaptive_summary,
+)
+
+
+def controller(**kwargs):
+    values = dict(size=1000, minimum=100, maximum=2000, step=100, target_seconds=5.0)
+    values.update(kwargs)
+    return AIMDController(**values)
+
+
+class TestIncrease:
+    """Sizes grow by a fixed step while full batches stay healthy"""
+
+    def test_grows_additively_up_to_the_maximum(self):
+        aimd = controller()
+        sizes = [aimd.observe(aimd.size, 1.0) for _ in range(12)]
+        assert sizes[:3] == [1100, 1200, 1300]
+        assert sizes[-1] == 2000
+        assert aimd.summary()['peak_size'] == 2000
+
+    def test_partial_batches_do_not_grow(self):
+        aimd = controller()
+        assert aimd.observe(400, 0.4) == 1000
+        assert aimd.increases == 0
+
+    def test_initial_size_is_clamped(self):
+        assert controller(size=50_000).size == 2000
+        assert controller(size=1).size == 100
+
+
+class TestDecrease:
+    """Any unhealthy signal halves the size"""
+
+    def test_latency_over_target(self):
+        aimd = controller()
+        assert aimd.observe(1000, 6.0) == 500
+        assert aimd.decreases == {LATENCY: 1}
+
+    def test_per_row_slowdown(self):
+        aimd = controller()
+        aimd.observe(1000, 1.0)
+        assert aimd.observe(1100, 2.5) == 550
+        assert aimd.decreases == {SLOWDOWN: 1}
+
+    def test_memory_over_limit(self):
+        aimd = controller(memory_limit_mb=480, rss_mb=lambda: 500.0)
+        assert aimd.observe(1000, 0.5) == 500
+        assert aimd.decreases == {MEMORY: 1}
+
+    def test_failure_and_minimum(self):
+        aimd = controller(size=150)
+        assert aimd.fail() == 100
+        assert aimd.fail() == 100
+        assert aimd.decreases == {ERROR: 2}
+
+
+class TestSummary:
+    """Only controllers that saw batches are recorded"""
+
+    def test_unused_controllers_are_left_out(self):
+        used, unused = controller(), controller()
+        used.observe(1000, 1.0)
+        summary = adaptive_summary(page=used, flush=unused, other=None)
+        assert list(summary) == ['page']
+        assert summary['page']['size'] == 1100
+        assert summary['page']['initial_size'] == 1000
+
+    def test_memory_cuts_are_not_learned(self):
+        rss = [500.0]
+        aimd = controller(memory_limit_mb=480, rss_mb=lambda: rss[0])
+        aimd.observe(1000, 0.5)
+        aimd.observe(500, 0.5)
+        assert aimd.size == 250
+        assert aimd.learned_size == 1000
+        assert aimd.summary()['learned_size'] == 1000
+
+    def test_other_cuts_are_learned(self):
+        aimd = controller()
+        aimd.observe(1000, 6.0)
+        assert aimd.summary()['learned_size'] == aimd.size == 500
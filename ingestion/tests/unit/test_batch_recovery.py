@@ -0,0 +1,190 @@
+"""
+Unit Tests for bisecting batch-failure recovery
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory batches, quarantine patched out)
+Duration: < 5 seconds
+"""
+
+import asyncio
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from unittest.mock import patch, AsyncMock
+
+from ingestion.base.adaptive_batching import AIMDController
+from ingestion.base.recovery import abisect_batch, bisect_batch, quarantine_records
+from ingestion.base.rows import RowSchema
+from ingestion.tests.unit.test_sync_engine_pipeline import InMemorySyncEngine
+
+
+def strict_save(bad):
+    """Bulk attempt that rejects any chunk containing one of ``bad``"""
+    calls = []
+
+    def attempt(chunk):
+        calls.append(list(chunk))
+        hit = [record for record in chunk if record in bad]
+        if hit:
+            raise ValueError(f"bad record {hit[0]}")
+        return {'created': len(chunk), 'updated': 0}
+
+    return attempt, calls
+
+
+class TestBisectBatch:
+    """Bad records are isolated with few bulk attempts and good ones are all saved"""
+
+    def test_isolates_single_bad_record(self):
+        attempt, calls = strict_save({37})
+        outcome = bisect_batch(list(range(100)), attempt)
+
+        assert outcome.failed_records == [37]
+        assert str(outcome.failures[0][1]) == 'bad record 37'
+        assert outcome.results['created'] == 99
+        # One pass down the tree: two attempts per level instead of 100 single writes
+        assert outcome.attempts <= 2 * 7 + 1
+
+    def test_isolates_several_bad_records_in_order(self):
+        attempt, _ = strict_save({3, 64, 65})
+        outcome = bisect_batch(list(range(128)), attempt)
+
+        assert outcome.failed_records == [3, 64, 65]
+        assert outcome.results['created'] == 125
+
+    def test_known_error_skips_retrying_whole_batch(self):
+        attempt, calls = strict_save({0})
+        outcome = bisect_batch([0, 1, 2, 3], attempt, error=ValueError('batch failed'))
+
+        assert [0, 1, 2, 3] not in calls
+        assert outcome.failed_records == [0]
+
+    def test_single_record_batch_with_known_error(self):
+        attempt, calls = strict_save(set())
+        outcome = bisect_batch([9], attempt, error=ValueError('boom'))
+
+        assert calls == []
+        assert outcome.failed_records == [9]
+
+    def test_merges_list_results(self):
+        outcome = bisect_batch([1, 2], lambda chunk: {'errors': 0, 'error_details': ['x']})
+        assert outcome.results == {'errors': 0, 'error_details': ['x']}
+
+    def test_async_variant(self):
+        async def attempt(chunk):
+            if 5 in chunk:
+                raise ValueError('bad')
+            return {'created': len(chunk)}
+
+        outcome = asyncio.run(abisect_batch(list(range(10)), attempt))
+        assert outcome.failed_records == [5]
+        assert outcome.results['created'] == 9
+
+
+class TestQuarantineRecords:
+    """Quarantined records keep their key and a replayable payload"""
+
+    def test_row_batch_is_quarantined_like_dicts(self):
+        schema = RowSchema(['id', 'amount', 'updated_at'])
+        updated = datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)
+        failures = [
+            (schema.row((7, Decimal('1.50'), updated)), ValueError('bad amount')),
+            ({'id': 8, 'amount': None, 'updated_at': None}, KeyError('x')),
+        ]
+
+        with patch('ingestion.models.common.SyncQuarantinedRecord') as model:
+            model.side_effect = lambda **fields: fields
+            stored = quarantine_records(failures, 'genius', 'prospects')
+
+        assert stored == 2
+        rows = model.objects.bulk_create.call_args.args[0]
+        assert [row['record_key'] for row in rows] == ['7', '8']
+        assert rows[0]['payload'] == {'id': 7, 'amount': '1.50', 'updated_at': '2025-01-02T03:04:05Z'}
+        assert rows[0]['error_type'] == 'ValueError'
+
+
+class RecordingAtomic:
+    """Stands in for transaction.atomic() and logs how each block ended"""
+
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        self.log.append('begin')
+
+    def __exit__(self, exc_type, exc, tb):
+        self.log.append('rollback' if exc_type else 'commit')
+        return False
+
+
+class PartialSaveEngine(InMemorySyncEngine):
+    """Engine whose saves reject any write containing record 5"""
+
+    async def save_data(self, validated_data):
+        self.saved.append(list(validated_data))
+        if 5 in validated_data:
+            raise ValueError("bad record 5")
+        return {'created': len(validated_data), 'updated': 0, 'failed': 0}
+
+
+class TestEngineBatchRecovery:
+    """BaseSyncEngine saves the good part of a failed batch and quarantines the rest"""
+
+    def run(self, engine, transactions=None):
+        results = {}
+        transactions = [] if transactions is None else transactions
+
+        async def fake_complete(res, error=None):
+            results.update(res)
+
+        quarantine = AsyncMock(return_value=1)
+        with patch.object(engine, 'start_sync', AsyncMock(return_value=None)), \
+             patch.object(engine, 'complete_sync', side_effect=fake_complete), \
+             patch('ingestion.base.sync_engine.aquarantine_records', quarantine), \
+             patch('ingestion.base.sync_engine.transaction.atomic', lambda: RecordingAtomic(transactions)), \
+             patch('ingestion.base.sync_engine.connection'):
+            asyncio.run(engine.run_sync(show_progress=False))
+        return results, quarantine
+
+    def test_recovers_good_records_of_failed_batch(self):
+        engine = InMemorySyncEngine([[1, 2], [3, 4, 5, 6], [7]], fail_on=5)
+        results, quarantine = self.run(engine)
+
+        assert sorted(r for batch in engine.saved for r in batch) == [1, 2, 3, 4, 6, 7]
+        assert results['processed'] == 6
+        assert results['failed'] == 1
+        assert results['created'] == 6
+        failures = quarantine.call_args.args[0]
+        assert [record for record, _ in failures] == [5]
+
+    def test_dry_run_does_not_quarantine(self):
+        engine = InMemorySyncEngine([[1, 2]], fail_on=2, dry_run=True)
+        results, quarantine = self.run(engine)
+
+        assert engine.saved == []
+        assert results['failed'] == 1
+        quarantine.assert_not_called()
+
+    def test_each_retry_is_saved_in_its_own_transaction(self):
+        transactions = []
+        engine = PartialSaveEngine([[3, 4, 5, 6]])
+        results, quarantine = self.run(engine, transactions)
+
+        # The first save failed outside recovery; bisection retried [3, 4], [5, 6], [5], [6]
+        assert transactions == ['begin', 'commit', 'begin', 'rollback', 'begin', 'rollback', 'begin', 'commit']
+        assert results['created'] == 3
+        assert results['failed'] == 1
+
+    def test_failed_write_only_recovers_unwritten_records(self):
+        engine = PartialSaveEngine([[1, 2, 3, 4, 5, 6]])
+        with patch('ingestion.base.sync_engine.adaptive_batching_enabled', return_value=True), \
+             patch('ingestion.base.sync_engine.learned_sizes', return_value={}), \
+             patch('ingestion.base.sync_engine.build_controller',
+                   return_value=AIMDController(2, minimum=2, maximum=2)):
+            results, quarantine = self.run(engine)
+
+        # Writes of [1, 2] and [3, 4] are kept; only [5, 6] is bisected
+        assert engine.saved == [[1, 2], [3, 4], [5, 6], [5], [6]]
+        assert results['created'] == 5
+        assert results['processed'] == 5
+        assert results['failed'] == 1
+        assert [record for record, _ in quarantine.call_args.args[0]] == [5]
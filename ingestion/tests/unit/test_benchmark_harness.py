@@ -0,0 +1,98 @@
+"""
+Unit Tests for the offline sync benchmark harness
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Local aiohttp fixture server on 127.0.0.1)
+Duration: < 5 seconds
+"""
+
+import asyncio
+
+import aiohttp
+
+from ingestion.tests.benchmarks.harness import BenchmarkResult, ResultStore, find_regressions
+from ingestion.tests.benchmarks.scenarios import callrail_calls_endpoints, hubspot_contacts_endpoints
+from ingestion.tests.benchmarks.server import FixtureServer
+
+
+def fetch_pages(endpoints, path, params, next_params, latency_ms=0.0):
+    """Walk a fixture endpoint until ``next_params(response)`` returns None"""
+    async def main():
+        pages = []
+        async with FixtureServer(endpoints, latency_ms=latency_ms) as server:
+            async with aiohttp.ClientSession() as session:
+                query = dict(params)
+                while query is not None:
+                    async with session.get(f"{server.url}/{path}", params=query) as response:
+                        body = await response.json()
+                    pages.append(body)
+                    query = next_params(query, body)
+            return pages, server.requests
+    return asyncio.run(main())
+
+
+def result(records_per_second=1000.0, commit='bbb', **kwargs):
+    values = dict(
+        scenario='hubspot_contacts', records=1000, latency_ms=0.0, jitter_ms=0.0,
+        elapsed_seconds=1.0, records_per_second=records_per_second, peak_rss_mb=100.0,
+        queries=50, requests=10, commit=commit,
+    )
+    values.update(kwargs)
+    return BenchmarkResult(**values)
+
+
+class TestFixtureServer:
+    """Synthetic pages follow each CRM's pagination and cover every record once"""
+
+    def test_cursor_pagination(self):
+        def next_params(query, body):
+            after = body['paging'].get('next', {}).get('after')
+            return {**query, 'after': after} if after else None
+
+        pages, requests = fetch_pages(
+            hubspot_contacts_endpoints(250), 'crm/v3/objects/0-1', {'limit': '100'}, next_params
+        )
+        ids = [record['id'] for page in pages for record in page['results']]
+        assert requests == 3
+        assert ids == [str(n) for n in range(1, 251)]
+
+    def test_page_pagination(self):
+        def next_params(query, body):
+            return {**query, 'page': body['page'] + 1} if body['page'] < body['total_pages'] else None
+
+        pages, _ = fetch_pages(
+            callrail_calls_endpoints(205), 'a/ACC1/calls.json', {'page': 1, 'per_page': 100}, next_params
+        )
+        assert [len(page['calls']) for page in pages] == [100, 100, 5]
+        assert len({record['id'] for page in pages for record in page['calls']}) == 205
+
+    def test_unmatched_paths_are_recorded(self):
+        async def main():
+            async with FixtureServer([]) as server:
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(f"{server.url}/missing") as response:
+                        return response.status, server.unmatched
+        assert asyncio.run(main()) == (404, ['GET /missing'])
+
+
+class TestRegressions:
+    """Results are compared with the last run of another commit"""
+
+    def test_baseline_skips_same_commit_and_other_scales(self, tmp_path):
+        store = ResultStore(tmp_path / 'results.jsonl')
+        store.append(result(commit='aaa', records_per_second=2000.0))
+        store.append(result(commit='aaa', records=5000))
+        store.append(result(commit='bbb'))
+
+        baseline = store.baseline(result(commit='bbb'))
+        assert baseline['commit'] == 'aaa'
+        assert baseline['records_per_second'] == 2000.0
+
+    def test_flags_slower_and_heavier_runs(self):
+        baseline = {'commit': 'aaa', 'records_per_second': 1000.0, 'peak_rss_mb': 100.0, 'queries': 50}
+        assert find_regressions(result(records_per_second=950.0), baseline) == []
+
+        messages = find_regressions(result(records_per_second=800.0, queries=80), baseline)
+        assert len(messages) == 2
+        assert 'records_per_second' in messages[0]
+        assert 'queries' in messages[1]
@@ -0,0 +1,126 @@
+"""
+Unit Tests for the COPY/staging-table bulk upsert backend
+
+Covers COPY text encoding, batch de-duplication, column selection and the
+SQL issued against PostgreSQL, using a mocked connection.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (No database connection)
+Duration: < 5 seconds
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from unittest.mock import MagicMock, patch
+
+from ingestion.base.bulk_upsert import BulkUpserter, _copy_text_value, COPY_NULL
+from ingestion.models.arrivy import Arrivy_Entity
+
+
+class TestCopyTextEncoding:
+    """Values must round-trip through COPY text format"""
+
+    def test_null_and_booleans(self):
+        assert _copy_text_value(None) == COPY_NULL
+        assert _copy_text_value(True) == 't'
+        assert _copy_text_value(False) == 'f'
+
+    def test_special_characters_are_escaped(self):
+        assert _copy_text_value('a\tb\nc\\d\r') == 'a\\tb\\nc\\\\d\\r'
+
+    def test_json_and_datetime(self):
+        assert _copy_text_value({'a': [1, 2]}) == '{"a": [1, 2]}'
+        value = datetime(2025, 1, 2, 3, 4, 5, tzinfo=dt_timezone.utc)
+        assert _copy_text_value(value) == '2025-01-02T03:04:05+00:00'
+
+
+class TestBulkUpserter:
+    """Column resolution and statement generation"""
+
+    def test_dedupe_keeps_last_record_per_key(self):
+        upserter = BulkUpserter(Arrivy_Entity, backend='orm')
+        records = upserter._dedupe([
+            {'id': '1', 'name': 'old'},
+            {'id': '2', 'name': 'other'},
+            {'id': '1', 'name': 'new'},
+            {'name': 'missing key'},
+        ])
+        assert records == [{'id': '1', 'name': 'new'}, {'id': '2', 'name': 'other'}]
+
+    def test_update_columns_skip_key_and_auto_now_add(self):
+        upserter = BulkUpserter(Arrivy_Entity, backend='orm')
+        columns = upserter._columns_for([{'id': '1', 'name': 'x', 'not_a_field': 1}])
+        names = [field.name for field in columns]
+        assert 'not_a_field' not in names
+        assert names == [field.name for field in Arrivy_Entity._meta.concrete_fields]
+
+        update_names = [field.name for field in upserter._update_columns(columns)]
+        assert 'id' not in update_names
+        assert 'sync_created_at' not in update_names
+        assert 'name' in update_names and 'sync_updated_at' in update_names
+
+    def test_copy_path_merges_staging_table(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(True,), (False,), (True,)]
+        connection = MagicMock(vendor='postgresql')
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.cursor.return_value.__enter__.return_value = cursor
+
+        with patch('ingestion.base.bulk_upsert.connections', {'default': connection}), \
+             patch('ingestion.base.bulk_upsert.transaction.atomic'):
+            upserter = BulkUpserter(Arrivy_Entity, backend='copy')
+            counts = upserter.upsert([
+                {'id': '1', 'name': 'a'},
+                {'id': '2', 'name': 'b\tc'},
+                {'id': '3', 'name': None},
+            ])
+
+        assert counts == {'created': 2, 'updated': 1, 'skipped': 0}
+
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        assert statements[0].startswith('CREATE TEMP TABLE')
+        assert 'ON COMMIT DROP' in statements[0]
+        assert 'ON CONFLICT ("id") DO UPDATE SET "name" = EXCLUDED."name"' in statements[1]
+        assert 'RETURNING (xmax = 0)' in statements[1]
+
+        copy_sql, buffer = cursor.cursor.copy_expert.call_args.args
+        assert copy_sql.startswith('COPY ')
+        rows = buffer.getvalue().splitlines()
+        assert rows[1].split('\t')[:2] == ['2', 'b\\tc']
+        assert rows[2].split('\t')[1] == COPY_NULL
+
+    def test_copy_path_json_encodes_json_field_scalars(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(True,)] * 4
+        connection = MagicMock(vendor='postgresql')
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.cursor.return_value.__enter__.return_value = cursor
+
+        with patch('ingestion.base.bulk_upsert.connections', {'default': connection}), \
+             patch('ingestion.base.bulk_upsert.transaction.atomic'):
+            upserter = BulkUpserter(Arrivy_Entity, backend='copy')
+            upserter.upsert([
+                {'id': '1', 'additional_group_ids': 'abc'},
+                {'id': '2', 'additional_group_ids': True},
+                {'id': '3', 'additional_group_ids': None},
+                {'id': '4', 'additional_group_ids': [1, 'a\tb']},
+            ])
+
+        copy_sql, buffer = cursor.cursor.copy_expert.call_args.args
+        names = [field.name for field in upserter._columns_for([{'id': '1', 'additional_group_ids': 1}])]
+        column = names.index('additional_group_ids')
+        values = [row.split('\t')[column] for row in buffer.getvalue().splitlines()]
+        assert values == ['"abc"', 'true', COPY_NULL, '[1, "a\\\\tb"]']
+
+    def test_insert_only_uses_do_nothing(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [(True,)]
+        connection = MagicMock(vendor='postgresql')
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.cursor.return_value.__enter__.return_value = cursor
+
+        with patch('ingestion.base.bulk_upsert.connections', {'default': connection}), \
+             patch('ingestion.base.bulk_upsert.transaction.atomic'):
+            counts = BulkUpserter(Arrivy_Entity).upsert([{'id': '1', 'name': 'a'}], update=False)
+
+        assert counts == {'created': 1, 'updated': 0, 'skipped': 0}
+        assert 'DO NOTHING' in cursor.execute.call_args_list[1].args[0]
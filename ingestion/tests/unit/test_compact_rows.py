@@ -0,0 +1,60 @@
+"""
+Unit Tests for tuple-backed rows in the streaming sync paths
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory tuples)
+Duration: < 5 seconds
+"""
+
+import pickle
+import sys
+
+import pytest
+
+from ingestion.base.rows import Row, RowSchema, rows_from_columns
+
+
+class TestRow:
+    """Rows read like the dicts they replace"""
+
+    def test_mapping_access(self):
+        row = RowSchema(['id', 'name', 'zip']).row((7, 'Ann', None))
+        assert row['name'] == 'Ann'
+        assert row.get('zip', 'x') is None
+        assert row.get('missing', 'x') == 'x'
+        assert 'id' in row and 'missing' not in row
+        assert list(row) == ['id', 'name', 'zip']
+        assert dict(row) == {'id': 7, 'name': 'Ann', 'zip': None}
+        assert dict(**row) == dict(row)
+        with pytest.raises(KeyError):
+            row['missing']
+
+    def test_equality_with_dicts_and_rows(self):
+        schema = RowSchema(['id', 'name'])
+        assert schema.row((1, 'a')) == {'id': 1, 'name': 'a'}
+        assert schema.row((1, 'a')) == RowSchema(['id', 'name']).row((1, 'a'))
+        assert schema.row((1, 'a')) != schema.row((1, 'b'))
+
+    def test_rows_share_one_schema(self):
+        schema = RowSchema(['id', 'name'])
+        rows = schema.rows([[1, 'a'], [2, 'b']])
+        assert all(row.schema is schema for row in rows)
+        assert all(type(row.values) is tuple for row in rows)
+
+    def test_width_and_duplicate_columns_are_rejected(self):
+        with pytest.raises(ValueError):
+            RowSchema(['id', 'name']).row((1,))
+        with pytest.raises(ValueError):
+            RowSchema(['id', 'id'])
+
+    def test_pickled_page_keeps_one_schema(self):
+        rows = rows_from_columns({'id': [1, 2], 'name': ['a', 'b']})
+        restored = pickle.loads(pickle.dumps(rows))
+        assert restored == rows
+        assert restored[0].schema is restored[1].schema
+
+    def test_smaller_than_a_dict(self):
+        names = [f'column_{n}' for n in range(30)]
+        values = tuple(range(30))
+        row = RowSchema(names).row(values)
+        assert sys.getsizeof(row) + sys.getsizeof(row.values) < sys.getsizeof(dict(zip(names, values)))
@@ -0,0 +1,59 @@
+"""
+Unit Tests for record content fingerprints
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (No database connection)
+Duration: < 5 seconds
+"""
+
+from datetime import datetime, timezone as dt_timezone
+
+from ingestion.base.fingerprint import FingerprintStore, record_fingerprint
+from ingestion.models.arrivy import Arrivy_Entity
+
+
+class TestRecordFingerprint:
+    """Fingerprints must be stable for equal content and differ otherwise"""
+
+    def test_same_content_same_hash(self):
+        record = {'id': '1', 'name': 'a', 'updated': datetime(2025, 1, 1, tzinfo=dt_timezone.utc)}
+        assert record_fingerprint(record, ['id', 'name', 'updated']) == \
+            record_fingerprint(dict(record), ['id', 'name', 'updated'])
+
+    def test_changed_content_changes_hash(self):
+        fields = ['id', 'name']
+        assert record_fingerprint({'id': '1', 'name': 'a'}, fields) != \
+            record_fingerprint({'id': '1', 'name': 'b'}, fields)
+
+    def test_sync_bookkeeping_columns_are_ignored(self):
+        store = FingerprintStore(Arrivy_Entity)
+        base = {'id': '1', 'name': 'a'}
+        stamped = dict(base, sync_updated_at=datetime.now(dt_timezone.utc))
+        assert store.fingerprint(base) == store.fingerprint(stamped)
+
+    def test_record_key_joins_unique_fields(self):
+        store = FingerprintStore(Arrivy_Entity, unique_fields=['id', 'name'])
+        assert store._record_key({'id': 5, 'name': 'x'}) == '5|x'
+        assert store.model_label == 'ingestion.Arrivy_Entity'
+
+
+class TestFingerprintFreshness:
+    """Fingerprints older than the row they describe are not trusted"""
+
+    def test_row_timestamp_column(self):
+        assert FingerprintStore(Arrivy_Entity).row_updated_field == 'sync_updated_at'
+
+    def test_row_written_after_fingerprint_is_rewritten(self):
+        synced = datetime(2025, 1, 1, 12, tzinfo=dt_timezone.utc)
+        later = datetime(2025, 1, 2, 12, tzinfo=dt_timezone.utc)
+        stored = ('abc', synced)
+
+        assert FingerprintStore._is_current(stored, 'abc', '1', {'1': synced})
+        assert not FingerprintStore._is_current(stored, 'abc', '1', {'1': later})
+        assert FingerprintStore._is_current(stored, 'abc', '1', {'1': None})
+
+    def test_missing_row_or_changed_content_is_rewritten(self):
+        stored = ('abc', datetime(2025, 1, 1, tzinfo=dt_timezone.utc))
+        assert not FingerprintStore._is_current(stored, 'abc', '1', {})
+        assert not FingerprintStore._is_current(stored, 'def', '1', {'1': None})
+        assert not FingerprintStore._is_current(None, 'abc', '1', {'1': None})
@@ -0,0 +1,88 @@
+"""
+Unit Tests for Genius set-based batch writes
+
+Dry runs count created/updated rows with one key lookup per batch, and force
+mode upserts in place instead of deleting and re-inserting.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Model managers patched out)
+Duration: < 5 seconds
+"""
+
+from unittest.mock import MagicMock, patch
+
+from ingestion.models.genius import Genius_AppointmentService, Genius_Job
+from ingestion.sync.genius.processors.base import (
+    _record_key, count_created_updated, existing_keys, replace_fields, upsert_in_place,
+)
+
+
+def patched_manager(model_class, rows):
+    """Manager whose filter().values_list() returns ``rows``"""
+    manager = MagicMock()
+    manager.filter.return_value.values_list.return_value = rows
+    return patch.object(model_class, 'objects', manager), manager
+
+
+class TestExistingKeys:
+    """Existing keys come back from a single query"""
+
+    def test_single_field_key(self):
+        patcher, manager = patched_manager(Genius_Job, [2, 3])
+        with patcher:
+            keys = existing_keys(Genius_Job, [{'id': 1}, {'id': 2}, {'id': 3}, {'id': None}])
+
+        assert keys == {2, 3}
+        manager.filter.assert_called_once_with(id__in={1, 2, 3})
+
+    def test_composite_key_keeps_exact_matches_only(self):
+        # (1, 20) matches each column separately but is not an existing pair
+        patcher, manager = patched_manager(Genius_AppointmentService, [(1, 10), (2, 20)])
+        records = [{'appointment_id': 1, 'service_id': 10}, {'appointment_id': 1, 'service_id': 20}]
+        with patcher:
+            keys = existing_keys(Genius_AppointmentService, records, ('appointment_id', 'service_id'))
+
+        assert keys == {(1, 10)}
+        assert manager.filter.call_count == 1
+
+    def test_empty_batch_skips_query(self):
+        patcher, manager = patched_manager(Genius_Job, [])
+        with patcher:
+            assert existing_keys(Genius_Job, []) == set()
+        manager.filter.assert_not_called()
+
+    def test_count_created_updated(self):
+        patcher, _ = patched_manager(Genius_Job, [1])
+        with patcher:
+            counts = count_created_updated(Genius_Job, [{'id': 1}, {'id': 2}, {'id': 3}])
+        assert counts == {'created': 2, 'updated': 1}
+
+
+class TestUpsertInPlace:
+    """Force mode overwrites rows with one upsert statement"""
+
+    def test_record_key_reads_dicts_and_instances(self):
+        instance = Genius_AppointmentService(appointment_id=4, service_id=2)
+        assert _record_key({'id': 7}, ['id']) == 7
+        assert _record_key(instance, ['appointment_id', 'service_id']) == (4, 2)
+
+    def test_replace_fields_skip_keys_and_creation_stamps(self):
+        fields = replace_fields(Genius_AppointmentService, ('appointment_id', 'service_id'))
+        assert fields == ['created_at', 'updated_at', 'sync_updated_at']
+
+    def test_duplicates_collapse_to_last_copy(self):
+        first = Genius_Job(id=1, prospect_id=1)
+        last = Genius_Job(id=1, prospect_id=2)
+        other = Genius_Job(id=2, prospect_id=3)
+        patcher, manager = patched_manager(Genius_Job, [1])
+        with patcher:
+            counts = upsert_in_place(Genius_Job, [first, other, last], batch_size=500)
+
+        assert counts == {'created': 1, 'updated': 1}
+        args, kwargs = manager.bulk_create.call_args
+        assert args[0] == [last, other]
+        assert kwargs['update_conflicts'] is True
+        assert kwargs['unique_fields'] == ['id']
+        assert kwargs['batch_size'] == 500
+        assert 'id' not in kwargs['update_fields']
+        manager.filter.return_value.delete.assert_not_called()
@@ -0,0 +1,231 @@
+"""
+Unit Tests for Genius keyset pagination
+
+Runs GeniusBaseClient.iter_keyset_chunks against an in-memory SQLite table
+so the generated WHERE/ORDER BY clauses are executed for real, both as
+one LIMIT query per chunk and as a single streamed query.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory SQLite)
+Duration: < 5 seconds
+"""
+
+import sqlite3
+
+import pytest
+
+from ingestion.sync.genius.clients.base import GeniusBaseClient, prefetch
+
+
+ROWS = [
+    # id, label, updated_at (several rows share a timestamp)
+    (1, 'a', '2025-01-01 00:00:00'),
+    (2, 'b', '2025-01-03 00:00:00'),
+    (3, 'c', '2025-01-02 00:00:00'),
+    (4, 'd', '2025-01-02 00:00:00'),
+    (5, 'e', '2025-01-02 00:00:00'),
+    (6, 'f', '2025-01-04 00:00:00'),
+    (7, 'g', '2025-01-02 00:00:00'),
+]
+
+
+@pytest.fixture
+def client():
+    # Streamed reads run on the prefetch thread
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.execute('CREATE TABLE item (id INTEGER PRIMARY KEY, label TEXT, updated_at TEXT)')
+    connection.executemany('INSERT INTO item VALUES (?, ?, ?)', ROWS)
+
+    queries = []
+
+    def execute(query, params=()):
+        queries.append((query, params))
+        return connection.execute(query.replace('%s', '?'), params).fetchall()
+
+    # Skip __init__ so no MySQL pool is created
+    instance = GeniusBaseClient.__new__(GeniusBaseClient)
+    instance.execute_query = execute
+    instance.queries = queries
+    instance.streamed = []
+
+    def open_stream_cursor():
+        return StreamConnection(), StreamCursor(connection, instance.streamed)
+
+    instance.open_stream_cursor = open_stream_cursor
+    return instance
+
+
+class StreamCursor:
+    """SQLite cursor taking MySQL-style placeholders"""
+
+    def __init__(self, connection, log):
+        self.cursor = connection.cursor()
+        self.log = log
+
+    def execute(self, query, params=()):
+        self.log.append((query, params))
+        self.cursor.execute(query.replace('%s', '?'), params)
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    def fetchmany(self, size):
+        return self.cursor.fetchmany(size)
+
+
+class StreamConnection:
+    closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def collect(client, **kwargs):
+    chunks = list(client.iter_keyset_chunks('SELECT id, label, updated_at FROM item', 'id', **kwargs))
+    return chunks, [row for chunk in chunks for row in chunk]
+
+
+class TestKeysetPagination:
+    """Keyset chunks must cover every matching row exactly once"""
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3, 7, 50])
+    def test_full_scan_walks_primary_key(self, client, chunk_size):
+        _, rows = collect(client, chunk_size=chunk_size)
+        assert rows == sorted(ROWS)
+        assert all('OFFSET' not in query for query, _ in client.queries)
+
+    @pytest.mark.parametrize('chunk_size', [1, 2, 3])
+    def test_incremental_scan_orders_by_timestamp_then_id(self, client, chunk_size):
+        _, rows = collect(
+            client, chunk_size=chunk_size, since_date='2025-01-01 00:00:00',
+            timestamp_column='updated_at', timestamp_index=2,
+        )
+        expected = sorted((row for row in ROWS if row[2] > '2025-01-01 00:00:00'),
+                          key=lambda row: (row[2], row[0]))
+        assert rows == expected
+
+    def test_since_date_is_bound_as_parameter(self, client):
+        collect(client, chunk_size=2, since_date='2025-01-02 00:00:00',
+                timestamp_column='updated_at', timestamp_index=2)
+        query, params = client.queries[0]
+        assert '2025-01-02' not in query
+        assert params == ('2025-01-02 00:00:00', 2)
+
+    def test_max_records_shrinks_last_chunk(self, client):
+        chunks, rows = collect(client, chunk_size=3, max_records=5)
+        assert [len(chunk) for chunk in chunks] == [3, 2]
+        assert [row[0] for row in rows] == [1, 2, 3, 4, 5]
+
+    def test_composite_key(self, client):
+        chunks = list(client.iter_keyset_chunks(
+            'SELECT updated_at, id, label FROM item', ('updated_at', 'id'),
+            chunk_size=2, id_index=(0, 1),
+        ))
+        rows = [row for chunk in chunks for row in chunk]
+        assert [row[1] for row in rows] == [1, 3, 4, 5, 7, 2, 6]
+
+    def test_incremental_requires_row_key(self, client):
+        with pytest.raises(ValueError):
+            collect(client, chunk_size=2, since_date='2025-01-01', timestamp_column='updated_at')
+
+
+class TestKeysetResume:
+    """A walk restarted from keyset_position continues where the last chunk ended"""
+
+    @pytest.mark.parametrize('incremental', [False, True])
+    def test_restart_from_position_covers_the_rest(self, client, incremental):
+        kwargs = dict(chunk_size=2)
+        if incremental:
+            kwargs.update(since_date='2025-01-01 00:00:00', timestamp_column='updated_at', timestamp_index=2)
+        _, expected = collect(client, **kwargs)
+
+        walk = client.iter_keyset_chunks('SELECT id, label, updated_at FROM item', 'id', **kwargs)
+        first = next(walk)
+        position = client.keyset_position
+        assert position == list((first[-1][2], first[-1][0]) if incremental else (first[-1][0],))
+
+        _, rest = collect(client, start_key=position, **kwargs)
+        assert first + rest == expected
+
+
+class TestStreamedKeysetWalk:
+    """Streaming reads the same ordered walk with one query, page by page"""
+
+    @pytest.fixture(autouse=True)
+    def stream(self, client):
+        client.read_mode = 'stream'
+
+    @pytest.mark.parametrize('incremental', [False, True])
+    def test_matches_chunked_walk(self, client, incremental):
+        kwargs = dict(chunk_size=2)
+        if incremental:
+            kwargs.update(since_date='2025-01-01 00:00:00', timestamp_column='updated_at', timestamp_index=2)
+        chunks, rows = collect(client, **kwargs)
+
+        client.read_mode = 'keyset'
+        _, expected = collect(client, **kwargs)
+        assert rows == expected
+        assert [len(chunk) for chunk in chunks][:-1] == [2] * (len(chunks) - 1)
+        assert len(client.streamed) == 1
+        assert 'LIMIT' not in client.streamed[0][0]
+
+    def test_position_follows_each_page_and_resumes(self, client):
+        walk = client.iter_keyset_chunks('SELECT id, label, updated_at FROM item', 'id', chunk_size=3)
+        first = next(walk)
+        assert client.keyset_position == [first[-1][0]]
+        walk.close()
+
+        _, rest = collect(client, chunk_size=3, start_key=client.keyset_position)
+        assert [row[0] for row in first + rest] == [1, 2, 3, 4, 5, 6, 7]
+
+    def test_max_records_limits_the_query(self, client):
+        _, rows = collect(client, chunk_size=2, max_records=5)
+        assert [row[0] for row in rows] == [1, 2, 3, 4, 5]
+        assert client.streamed[0][1][-1] == 5
+
+    def test_dict_rows_and_read_metrics(self, client):
+        chunks = list(client.iter_keyset_chunks(
+            'SELECT id, label, updated_at FROM item', 'id', chunk_size=4, dict_rows=True,
+            row_key=lambda row: (row['id'],),
+        ))
+        assert chunks[0][0] == {'id': 1, 'label': 'a', 'updated_at': '2025-01-01 00:00:00'}
+        metrics = client.read_metrics()
+        assert metrics['read_mode'] == 'stream'
+        assert metrics['rows_fetched'] == len(ROWS)
+
+    def test_custom_execute_keeps_chunk_queries(self, client):
+        collect(client, chunk_size=3, execute=client.execute_query)
+        assert client.streamed == []
+        assert len(client.queries) == 3
+
+
+class TestPrefetch:
+    """Read-ahead keeps order, surfaces errors and cleans up on early exit"""
+
+    def test_order_and_errors(self):
+        def pages():
+            yield 1
+            yield 2
+            raise RuntimeError('lost connection')
+
+        received = []
+        with pytest.raises(RuntimeError, match='lost connection'):
+            for page in prefetch(pages(), depth=1):
+                received.append(page)
+        assert received == [1, 2]
+
+    def test_early_exit_closes_source_on_its_thread(self):
+        closed = []
+
+        def pages():
+            try:
+                for page in range(1000):
+                    yield page
+            finally:
+                closed.append(True)
+
+        reader = prefetch(pages(), depth=2)
+        assert next(reader) == 0
+        reader.close()
+        assert closed == [True]
@@ -0,0 +1,86 @@
+"""
+Unit Tests for compiled Genius transform plans
+
+The column-wise plans must produce the same records as the per-row
+transforms they replace.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory tuples)
+Duration: < 5 seconds
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from ingestion.models.genius import Genius_Lead, Genius_Prospect
+from ingestion.sync.genius.clients.leads import GeniusLeadClient
+from ingestion.sync.genius.clients.prospects import GeniusProspectsClient
+from ingestion.sync.genius.processors.appointments import GeniusAppointmentsProcessor
+from ingestion.sync.genius.processors.leads import GeniusLeadProcessor
+from ingestion.sync.genius.processors.plan import TransformPlan, to_int
+from ingestion.sync.genius.processors.prospects import GeniusProspectsProcessor
+
+
+class TestTransformPlan:
+    """Plans are compiled once and applied column by column"""
+
+    def test_renames_converts_and_drops_unknown_columns(self):
+        plan = TransformPlan.compile(
+            ['id', 'division_id', 'third_party_source_id', 'updated_at'], Genius_Prospect,
+            converters={'division_id': to_int},
+        )
+        assert plan.names == ('id', 'division_id', 'updated_at')
+
+        records = plan.records([(1, '7', 'x', datetime(2025, 1, 1)), (2, None, 'y', None)])
+        assert records[0]['division_id'] == 7
+        assert records[0]['updated_at'].tzinfo is not None
+        assert records[1] == {'id': 2, 'division_id': None, 'updated_at': None}
+
+    def test_rejects_rows_of_the_wrong_width(self):
+        plan = TransformPlan.compile(['id', 'name'])
+        with pytest.raises(ValueError):
+            plan.columns([(1, 'a'), (2,)])
+
+    def test_reads_dict_rows(self):
+        plan = TransformPlan.compile(['id', 'name'], converters={'id': to_int})
+        assert plan.records([{'id': '3', 'name': 'c'}]) == [{'id': 3, 'name': 'c'}]
+
+    def test_plans_are_cached_per_field_mapping(self):
+        processor = GeniusProspectsProcessor(Genius_Prospect)
+        mapping = GeniusProspectsClient.__new__(GeniusProspectsClient).get_field_mapping()
+        assert processor.get_transform_plan(mapping) is processor.get_transform_plan(list(mapping))
+
+
+class TestProcessorPlans:
+    """Page transforms match the per-row transforms"""
+
+    def test_leads_page_matches_validate_record(self):
+        processor = GeniusLeadProcessor(Genius_Lead)
+        mapping = GeniusLeadClient.__new__(GeniusLeadClient).get_field_mapping()
+        row = (
+            12, ' Ann ', '', 'a@example.com', '555', ' 1 Main ', 'Town', 'VA', '22000',
+            '4', 8, 2, 'note', 'new', None, datetime(2025, 1, 1, 8), datetime(2025, 2, 1, 9),
+        )
+
+        expected = processor.validate_record(row, mapping)
+        record = processor.transform_leads_page([row, (None,) + row[1:]], mapping)
+
+        assert len(record) == 1
+        expected.pop('sync_updated_at')
+        record[0].pop('sync_updated_at')
+        assert record[0] == expected
+
+    def test_appointments_page_matches_transform_record(self):
+        processor = GeniusAppointmentsProcessor()
+        row = {name: None for name in processor.APPOINTMENT_FIELDS}
+        row.update({
+            'id': 5, 'prospect_id': 9, 'type_id': 1, 'date': date(2025, 3, 1),
+            'time': timedelta(hours=13, minutes=30), 'duration': 3600, 'is_complete': 1,
+            'updated_at': datetime(2025, 3, 2, 10),
+        })
+
+        page = processor.transform_appointments_page([row])
+        assert page == [processor.transform_record(row)]
+        assert page[0]['time'] == time(13, 30)
+        assert page[0]['add_date'].date() == date(2025, 3, 1)
@@ -0,0 +1,93 @@
+"""
+Unit Tests for incremental Google Sheets sync row fingerprints
+
+Diffs fetched sheet rows against stored row hashes to check which row
+ranges are written, which are skipped and which are reported as removed.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory sheet rows)
+Duration: < 5 seconds
+"""
+
+from types import SimpleNamespace
+
+from ingestion.sync.gsheet.row_fingerprints import (
+    SheetRowFingerprints,
+    contiguous_ranges,
+    row_fingerprint,
+)
+
+FakeModel = SimpleNamespace(_meta=SimpleNamespace(label='ingestion.GoogleSheetMarketingLead'))
+
+
+def sheet(count, **overrides):
+    rows = [{'Date': f'2025-01-{n + 1:02d}', 'Source': 'Web', 'Leads': str(n)} for n in range(count)]
+    for index, values in overrides.items():
+        rows[int(index[1:])].update(values)
+    return rows
+
+
+def stored_hashes(fingerprints, rows):
+    return {fingerprints.row_number(index): row_fingerprint(row) for index, row in enumerate(rows)}
+
+
+class TestRowFingerprint:
+    """Hashes cover the raw cells only"""
+
+    def test_sync_metadata_is_ignored(self):
+        row = {'Date': '2025-01-01', 'Leads': '3'}
+        assert row_fingerprint(row) == row_fingerprint({**row, '_sheet_row_number': 2, '_year': 2025})
+        assert row_fingerprint(row) != row_fingerprint({**row, 'Leads': '4'})
+
+    def test_contiguous_ranges(self):
+        assert contiguous_ranges([0, 1, 2, 5, 7, 8]) == [(0, 3), (5, 6), (7, 9)]
+        assert contiguous_ranges([]) == []
+
+
+class TestSheetRowFingerprints:
+    """Only changed or appended rows are written"""
+
+    def test_keys_are_scoped_per_sheet(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        assert fingerprints.model_label == 'ingestion.GoogleSheetMarketingLead#rows'
+        assert fingerprints.prefix == '2025:'
+        assert fingerprints.row_number(0) == 2
+
+    def test_changed_and_appended_rows(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        stored = stored_hashes(fingerprints, sheet(6))
+        delta = fingerprints.diff(sheet(8, r1={'Leads': '99'}, r2={'Source': 'Radio'}), stored=stored)
+
+        assert delta.ranges == [(1, 3), (6, 8)]
+        assert sorted(delta.hashes) == [1, 2, 6, 7]
+        assert delta.unchanged == 4
+        assert delta.changed == 4
+        assert delta.removed_rows == []
+
+    def test_unchanged_sheet_writes_nothing(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        rows = sheet(5)
+        delta = fingerprints.diff(rows, stored=stored_hashes(fingerprints, rows))
+        assert delta.ranges == [] and delta.changed == 0
+        assert delta.unchanged == 5
+
+    def test_rows_missing_from_the_table_are_rewritten(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        rows = sheet(4)
+        delta = fingerprints.diff(rows, stored=stored_hashes(fingerprints, rows), present_rows={2, 3, 5})
+        assert delta.ranges == [(2, 3)]
+
+    def test_rows_past_the_end_are_removed(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        stored = stored_hashes(fingerprints, sheet(6))
+        delta = fingerprints.diff(sheet(4), stored=stored, present_rows={2, 3, 4, 5, 6, 7, 9})
+        assert delta.removed_rows == [6, 7, 9]
+
+        truncated = fingerprints.diff(sheet(4), stored=stored, complete=False)
+        assert truncated.removed_rows == []
+
+    def test_full_refresh_writes_every_row(self):
+        fingerprints = SheetRowFingerprints(FakeModel, scope=2025)
+        delta = fingerprints.diff(sheet(3), stored={})
+        assert delta.ranges == [(0, 3)]
+        assert delta.unchanged == 0
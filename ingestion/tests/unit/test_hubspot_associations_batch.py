@@ -0,0 +1,89 @@
+"""
+Unit Tests for HubSpot batch association reads
+
+Drives HubSpotAssociationsClient against a fake v4 batch read endpoint to
+check request sizing, bounded concurrency and per-object paging.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory association responses)
+Duration: < 5 seconds
+"""
+
+import asyncio
+
+from ingestion.sync.hubspot.clients.associations import AssociationType, HubSpotAssociationsClient
+
+
+class FakeAssociationsClient(HubSpotAssociationsClient):
+    """Each contact N is associated with appointments N-a and N-b.
+
+    Contact '0' has a second page holding appointment 0-c.
+    """
+
+    def __init__(self, source_ids, concurrency=2):
+        super().__init__(api_token='test-token')
+        self.source_ids = source_ids
+        self.read_concurrency = concurrency
+        self.request_sizes = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _get_source_ids(self, association_type, since=None):
+        self.since = since
+        return self.source_ids
+
+    async def make_request(self, method, endpoint, **kwargs):
+        assert endpoint == 'crm/v4/associations/contacts/0-421/batch/read'
+        inputs = kwargs['json']['inputs']
+        self.request_sizes.append(len(inputs))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+        results = []
+        for item in inputs:
+            cid = item['id']
+            if item.get('after'):
+                results.append({'from': {'id': cid}, 'to': [{'toObjectId': f'{cid}-c'}]})
+                continue
+            result = {'from': {'id': cid}, 'to': [{'toObjectId': f'{cid}-a'}, {'toObjectId': f'{cid}-b'}]}
+            if cid == '0':
+                result['paging'] = {'next': {'after': 'page-2'}}
+            results.append(result)
+        return {'results': results}
+
+
+def collect(client, **kwargs):
+    async def run():
+        return [batch async for batch in client._fetch_all_associations_by_type(
+            AssociationType.CONTACT_TO_APPOINTMENT, **kwargs)]
+    return asyncio.run(run())
+
+
+class TestBatchAssociationReads:
+    """Large batches, bounded fan-out, nothing lost"""
+
+    def test_reads_use_max_batch_size_with_bounded_concurrency(self):
+        client = FakeAssociationsClient([str(i) for i in range(2500)], concurrency=2)
+        batches = collect(client, batch_size=1000, max_records=0)
+
+        # Three source chunks plus one follow-up page for contact 0
+        assert sorted(client.request_sizes) == [1, 500, 1000, 1000]
+        assert client.max_in_flight == 2
+
+        records = [record for batch in batches for record in batch]
+        assert len(records) == 2500 * 2 + 1
+        assert {'contact_id': '0', 'appointment_id': '0-c'}.items() <= next(
+            r for r in records if r['appointment_id'] == '0-c').items()
+        assert all(len(batch) == 1000 for batch in batches[:-1])
+
+    def test_max_records_truncates(self):
+        client = FakeAssociationsClient([str(i) for i in range(50)])
+        batches = collect(client, batch_size=30, max_records=45)
+        assert [len(batch) for batch in batches] == [30, 15]
+
+    def test_since_is_passed_to_source_selection(self):
+        client = FakeAssociationsClient([])
+        assert collect(client, batch_size=10, max_records=0, since='2025-01-01') == []
+        assert client.since == '2025-01-01'
@@ -0,0 +1,100 @@
+"""
+Unit Tests for HubSpot contacts incremental search
+
+Serves HubSpotContactsClient from an in-memory contact list that mimics the
+search API (lastmodifieddate filters, paging and the result cap).
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory search responses)
+Duration: < 5 seconds
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from ingestion.sync.hubspot.clients.contacts import HubSpotContactsClient
+
+
+START = datetime(2025, 1, 1, tzinfo=dt_timezone.utc)
+END = START + timedelta(hours=8)
+
+
+def millis(value):
+    return int(value.timestamp() * 1000)
+
+
+class FakeSearchClient(HubSpotContactsClient):
+    """Answers search requests from a list of (id, modified) pairs"""
+
+    SEARCH_RESULT_CAP = 5
+
+    def __init__(self, contacts):
+        super().__init__(api_token='test-token')
+        self.contacts = contacts
+        self.requests = []
+
+    async def make_request(self, method, endpoint, **kwargs):
+        assert (method, endpoint) == ('POST', 'crm/v3/objects/0-1/search')
+        payload = kwargs['json']
+        self.requests.append(payload)
+        bounds = {f['operator']: int(f['value']) for f in payload['filterGroups'][0]['filters']}
+        matches = [
+            {'id': contact_id, 'properties': {'lastmodifieddate': modified.isoformat()}}
+            for contact_id, modified in self.contacts
+            if bounds['GTE'] <= millis(modified) < bounds['LT']
+        ]
+        offset = int(payload.get('after', 0))
+        if offset >= self.SEARCH_RESULT_CAP:
+            raise AssertionError('search paged past the result cap')
+        page = matches[offset:offset + payload['limit']]
+        response = {'total': len(matches), 'results': page}
+        if offset + len(page) < len(matches):
+            response['paging'] = {'next': {'after': str(offset + len(page))}}
+        return response
+
+
+def collect(client, **kwargs):
+    async def run():
+        return [batch async for batch in client._search_modified_contacts(START, END, **kwargs)]
+    return asyncio.run(run())
+
+
+class TestContactSearchWindows:
+    """Modified-since filtering happens server side, split under the cap"""
+
+    def test_small_window_is_a_single_search(self):
+        contacts = [(str(i), START + timedelta(minutes=10 * i)) for i in range(4)]
+        client = FakeSearchClient(contacts)
+        batches = collect(client, limit=2)
+
+        assert [c['id'] for batch in batches for c in batch] == ['0', '1', '2', '3']
+        assert len(client.requests) == 2
+        assert client.requests[0]['sorts'][0]['propertyName'] == 'lastmodifieddate'
+
+    def test_window_over_cap_is_split_without_gaps_or_duplicates(self):
+        # 20 contacts spread over the window, four times the cap
+        contacts = [(str(i), START + timedelta(minutes=24 * i)) for i in range(20)]
+        client = FakeSearchClient(contacts)
+        batches = collect(client, limit=2)
+
+        ids = [c['id'] for batch in batches for c in batch]
+        assert sorted(ids, key=int) == [str(i) for i in range(20)]
+        assert len(ids) == len(set(ids))
+
+    def test_unsplittable_window_stops_at_cap(self):
+        burst = START + timedelta(hours=1)
+        client = FakeSearchClient([(str(i), burst) for i in range(8)])
+        batches = collect(client, limit=2)
+
+        assert sum(len(batch) for batch in batches) == FakeSearchClient.SEARCH_RESULT_CAP
+
+    def test_naive_last_sync_is_treated_as_utc(self):
+        client = FakeSearchClient([])
+        naive = START.replace(tzinfo=None)
+
+        async def run():
+            return [b async for b in client.fetch_contacts(last_sync=naive, limit=10)]
+
+        assert asyncio.run(run()) == []
+        gte = client.requests[0]['filterGroups'][0]['filters'][0]
+        assert gte == {'propertyName': 'lastmodifieddate', 'operator': 'GTE', 'value': str(millis(START))}
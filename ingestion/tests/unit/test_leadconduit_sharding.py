@@ -0,0 +1,130 @@
+"""
+Unit Tests for time-sharded LeadConduit event extraction
+
+Drives merge_window_pages with fake per-window cursors to check window
+splitting, bounded concurrency, failure propagation and early close.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory event pages)
+Duration: < 5 seconds
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ingestion.sync.leadconduit.clients.sharding import BoundaryDeduper, merge_window_pages, shard_windows
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeCursors:
+    """Every window returns ``pages`` pages of two events tagged with its start hour"""
+
+    def __init__(self, pages=3, fail_on=None):
+        self.pages = pages
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished = 0
+
+    async def walk(self, start, end):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            for page in range(self.pages):
+                await asyncio.sleep(0)
+                if start == self.fail_on:
+                    raise RuntimeError('boom')
+                yield [{'id': f'{start.hour}-{page}-{n}'} for n in range(2)]
+            self.finished += 1
+        finally:
+            self.in_flight -= 1
+
+
+def collect(windows, cursors, concurrency, limit=None):
+    async def run():
+        events = []
+        pages = merge_window_pages(windows, cursors.walk, concurrency)
+        try:
+            async for page in pages:
+                events.extend(page)
+                if limit and len(events) >= limit:
+                    break
+        finally:
+            await pages.aclose()
+        return events
+    return asyncio.run(run())
+
+
+class TestShardWindows:
+    """The range is covered by consecutive windows"""
+
+    def test_windows_cover_the_range(self):
+        end = START + timedelta(hours=13)
+        windows = shard_windows(START, end, 6)
+        assert windows == [
+            (START, START + timedelta(hours=6)),
+            (START + timedelta(hours=6), START + timedelta(hours=12)),
+            (START + timedelta(hours=12), end),
+        ]
+
+    def test_sharding_disabled_or_empty_range(self):
+        end = START + timedelta(days=1)
+        assert shard_windows(START, end, 0) == [(START, end)]
+        assert shard_windows(START, START, 6) == [(START, START)]
+
+
+class TestBoundaryDeduper:
+    """Only events around shard boundaries are remembered"""
+
+    def event(self, event_id, at):
+        return {'id': event_id, 'start_timestamp': at.timestamp() * 1000}
+
+    def test_boundary_events_are_yielded_once(self):
+        deduper = BoundaryDeduper(shard_windows(START, START + timedelta(hours=12), 6))
+        boundary = START + timedelta(hours=6)
+        assert not deduper.is_duplicate(self.event('a', boundary))
+        assert deduper.is_duplicate(self.event('a', boundary))
+        assert not deduper.is_duplicate(self.event('b', boundary + timedelta(milliseconds=900)))
+        assert deduper.is_duplicate(self.event('b', boundary + timedelta(milliseconds=900)))
+
+    def test_events_inside_windows_are_not_remembered(self):
+        deduper = BoundaryDeduper(shard_windows(START, START + timedelta(hours=12), 6))
+        for minute in range(1, 300):
+            event = self.event(f'e{minute}', START + timedelta(minutes=minute))
+            assert not deduper.is_duplicate(event)
+        assert deduper.seen == set()
+
+    def test_events_without_timestamp_are_deduplicated(self):
+        deduper = BoundaryDeduper(shard_windows(START, START + timedelta(hours=2), 1))
+        assert not deduper.is_duplicate({'id': 'x'})
+        assert deduper.is_duplicate({'id': 'x'})
+
+
+class TestMergeWindowPages:
+    """Windows are walked concurrently and merged into one stream"""
+
+    def test_all_pages_are_merged(self):
+        windows = shard_windows(START, START + timedelta(hours=8), 1)
+        cursors = FakeCursors()
+        events = collect(windows, cursors, concurrency=3)
+        assert len(events) == 8 * 3 * 2
+        assert len({event['id'] for event in events}) == len(events)
+        assert cursors.max_in_flight == 3
+
+    def test_window_failure_is_raised(self):
+        windows = shard_windows(START, START + timedelta(hours=4), 1)
+        cursors = FakeCursors(fail_on=START + timedelta(hours=2))
+        with pytest.raises(RuntimeError, match='boom'):
+            collect(windows, cursors, concurrency=2)
+        assert cursors.in_flight == 0
+
+    def test_early_close_cancels_remaining_windows(self):
+        windows = shard_windows(START, START + timedelta(hours=6), 1)
+        cursors = FakeCursors(pages=50)
+        events = collect(windows, cursors, concurrency=2, limit=10)
+        assert len(events) >= 10
+        assert cursors.in_flight == 0
+        assert cursors.finished < len(windows)
@@ -0,0 +1,82 @@
+"""
+Unit Tests for streaming MarketSharp OData parsing
+
+Feeds an Atom feed to EntryStream in small chunks to check that entries are
+emitted as they complete and match the full-document parse.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Synthetic OData Atom feed)
+Duration: < 5 seconds
+"""
+
+import logging
+
+import pytest
+
+from ingestion.marketsharp.data_processor import DataProcessor
+
+ENTRY = """
+  <entry>
+    <id>https://api4.marketsharpm.com/WcfDataService.svc/Customers(guid'{n}')</id>
+    <content type="application/xml">
+      <m:properties>
+        <d:id>00000000-0000-0000-0000-00000000000{n}</d:id>
+        <d:firstName>Ann &amp; Bob{n}</d:firstName>
+        <d:lastUpdate m:null="true" />
+      </m:properties>
+    </content>
+  </entry>"""
+
+FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"
+      xmlns:d="http://schemas.microsoft.com/ado/2007/08/dataservices"
+      xmlns:m="http://schemas.microsoft.com/ado/2007/08/dataservices/metadata">
+  <title type="text">Customers</title>{entries}
+</feed>"""
+
+
+def feed_xml(count):
+    return FEED.format(entries=''.join(ENTRY.format(n=n) for n in range(count)))
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor(logging.getLogger(__name__))
+
+
+class TestEntryStream:
+    """Entries come out of the stream as their closing tags arrive"""
+
+    def test_chunked_parse_matches_whole_document(self, processor):
+        data = feed_xml(3).encode('utf-8')
+        stream = processor.entry_stream()
+        entries = []
+        for start in range(0, len(data), 7):
+            entries.extend(stream.feed(data[start:start + 7]))
+        entries.extend(stream.close())
+
+        assert entries == processor.parse_xml(feed_xml(3))
+        assert entries[1] == {
+            'id': '00000000-0000-0000-0000-000000000001',
+            'firstName': 'Ann & Bob1',
+            'lastUpdate': None,
+        }
+
+    def test_entries_are_emitted_before_the_feed_ends(self, processor):
+        data = feed_xml(2)
+        stream = processor.entry_stream()
+        first_end = data.index('</entry>') + len('</entry>')
+        assert len(stream.feed(data[:first_end])) == 1
+        assert len(stream.feed(data[first_end:])) == 1
+        assert stream.close() == []
+
+    def test_multibyte_characters_split_across_chunks(self, processor):
+        data = feed_xml(1).replace('Ann', 'Zoë').encode('utf-8')
+        split = data.index('ë'.encode('utf-8')) + 1
+        stream = processor.entry_stream()
+        entries = stream.feed(data[:split]) + stream.feed(data[split:]) + stream.close()
+        assert entries[0]['firstName'] == 'Zoë & Bob0'
+
+    def test_invalid_xml_is_rejected(self, processor):
+        with pytest.raises(ValueError):
+            processor.parse_xml('<feed><entry></feed>')
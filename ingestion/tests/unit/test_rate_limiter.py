@@ -0,0 +1,122 @@
+"""
+Unit Tests for the header-driven token-bucket rate limiter
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Synthetic response headers, no Redis server)
+Duration: < 5 seconds
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from ingestion.base import rate_limiter
+from ingestion.base.rate_limiter import RedisTokenBucket, TokenBucket, parse_quota_headers
+
+
+class TestParseQuotaHeaders:
+    """Quota headers from each CRM normalise to one shape"""
+
+    def test_hubspot_interval_headers(self):
+        info = parse_quota_headers({
+            'X-HubSpot-RateLimit-Max': '100',
+            'X-HubSpot-RateLimit-Remaining': '42',
+            'X-HubSpot-RateLimit-Interval-Milliseconds': '10000',
+        })
+        assert (info.limit, info.remaining, info.window_seconds) == (100, 42, 10)
+
+    def test_hubspot_secondly_headers_take_precedence(self):
+        info = parse_quota_headers({
+            'X-HubSpot-RateLimit-Max': '100',
+            'X-HubSpot-RateLimit-Interval-Milliseconds': '10000',
+            'X-HubSpot-RateLimit-Secondly': '10',
+            'X-HubSpot-RateLimit-Secondly-Remaining': '3',
+        })
+        assert (info.limit, info.remaining, info.window_seconds) == (10, 3, 1.0)
+
+    def test_epoch_reset_and_retry_after(self):
+        info = parse_quota_headers({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '2000000030'},
+                                   now=2000000000)
+        assert info.reset_after == 30
+        assert parse_quota_headers({'Retry-After': '7'}).reset_after == 7
+
+    def test_no_quota_headers(self):
+        assert parse_quota_headers({'Content-Type': 'application/json'}) is None
+
+
+class TestTokenBucket:
+    """Reservations pace requests ahead of the API's limit"""
+
+    def test_burst_then_paced(self):
+        bucket = TokenBucket('test', rate=10, capacity=2)
+        waits = [bucket._reserve(1) for _ in range(4)]
+        assert waits[:2] == [0, 0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_headers_retune_rate_and_clamp_tokens(self):
+        bucket = TokenBucket('test', rate=100, capacity=100)
+        bucket.update_from_headers({
+            'X-HubSpot-RateLimit-Max': '100',
+            'X-HubSpot-RateLimit-Remaining': '1',
+            'X-HubSpot-RateLimit-Interval-Milliseconds': '10000',
+        })
+        assert bucket.rate == 10
+        assert bucket._reserve(1) == 0
+        assert bucket._reserve(1) == pytest.approx(0.1, abs=0.01)
+
+    def test_exhausted_quota_blocks_until_reset(self):
+        bucket = TokenBucket('test', rate=10)
+        bucket.update_from_headers({'X-RateLimit-Remaining': '0', 'Retry-After': '3'})
+        assert bucket._reserve(1) == pytest.approx(3.1, abs=0.05)
+
+    def test_penalize_after_429(self):
+        bucket = TokenBucket('test', rate=5)
+        bucket.penalize(2)
+        assert bucket._reserve(1) >= 2
+
+
+class TestRedisTokenBucket:
+    """Shared state goes through Redis scripts, with a local fallback"""
+
+    def test_reserve_uses_shared_script(self):
+        client = MagicMock()
+        reserve_script, apply_script = MagicMock(return_value='0.25'), MagicMock()
+        client.register_script.side_effect = [reserve_script, apply_script]
+        bucket = RedisTokenBucket('hubspot', rate=10, redis_client=client)
+
+        assert bucket._reserve(1) == 0.25
+        assert reserve_script.call_args.kwargs['keys'] == ['ingestion:ratelimit:hubspot']
+
+        bucket.penalize(4)
+        assert apply_script.call_args.kwargs['args'][4] == 4
+
+    def test_falls_back_to_local_bucket_when_redis_fails(self):
+        client = MagicMock()
+        client.register_script.return_value = MagicMock(side_effect=ConnectionError('down'))
+        bucket = RedisTokenBucket('hubspot', rate=10, capacity=1, redis_client=client)
+
+        assert bucket._reserve(1) == 0
+        assert bucket._reserve(1) == pytest.approx(0.1, abs=0.01)
+
+    def test_skips_redis_until_retry_interval_passes(self):
+        client = MagicMock()
+        reserve_script = MagicMock(side_effect=ConnectionError('down'))
+        apply_script = MagicMock()
+        client.register_script.side_effect = [reserve_script, apply_script]
+        bucket = RedisTokenBucket('hubspot', rate=10, capacity=5, redis_client=client)
+
+        clock = [1000.0]
+        with patch.object(rate_limiter.time, 'monotonic', lambda: clock[0]):
+            bucket._reserve(1)
+            bucket._reserve(1)
+            bucket.penalize(1)
+            assert reserve_script.call_count == 1
+            assert apply_script.call_count == 0
+
+            clock[0] += rate_limiter.REDIS_RETRY_AFTER
+            reserve_script.side_effect = None
+            reserve_script.return_value = '0'
+            assert bucket._reserve(1) == 0
+            assert reserve_script.call_count == 2
+            assert not bucket._redis_failed
@@ -0,0 +1,74 @@
+"""
+Unit Tests for diff-based SalesPro lead result line item reconciliation
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory line items)
+Duration: < 5 seconds
+"""
+
+from decimal import Decimal
+
+from ingestion.sync.salespro.processors.line_items import (
+    desired_line_items,
+    diff_line_items,
+    normalize_amount,
+)
+
+
+def record(estimate_id, *items):
+    return {
+        'estimate_id': estimate_id,
+        '_line_items': [
+            {'job_type_number': number, 'job_type': job_type, 'job_type_amount': amount}
+            for number, job_type, amount in items
+        ],
+    }
+
+
+class TestDesiredLineItems:
+    """Incoming items are keyed on (estimate_id, job_type_number)"""
+
+    def test_keys_and_normalized_amounts(self):
+        desired = desired_line_items([
+            record('E1', (1, 'Roofing', 1200.5), (2, 'Gutters', '300')),
+            record('E2', (None, 'Ignored', 10)),
+            {'estimate_id': 'E3'},
+        ])
+        assert desired == {
+            ('E1', 1): ('Roofing', Decimal('1200.50')),
+            ('E1', 2): ('Gutters', Decimal('300.00')),
+        }
+
+    def test_later_duplicates_win(self):
+        desired = desired_line_items([record('E1', (1, 'Roofing', 100), (1, 'Siding', 200))])
+        assert desired == {('E1', 1): ('Siding', Decimal('200.00'))}
+
+    def test_unparsable_amounts_pass_through(self):
+        assert normalize_amount('n/a') == 'n/a'
+        assert normalize_amount('') is None
+
+
+class TestDiffLineItems:
+    """Only new, changed and removed items are written"""
+
+    def test_delta(self):
+        desired = desired_line_items([record('E1', (1, 'Roofing', 100), (2, 'Gutters', 50), (3, 'Windows', 75))])
+        existing = {
+            ('E1', 1): (11, 'Roofing', Decimal('100.00')),
+            ('E1', 2): (12, 'Gutters', Decimal('40.00')),
+            ('E1', 4): (14, 'Doors', Decimal('10.00')),
+        }
+        delta = diff_line_items(desired, existing)
+
+        assert delta.upserts == {
+            ('E1', 2): ('Gutters', Decimal('50.00')),
+            ('E1', 3): ('Windows', Decimal('75.00')),
+        }
+        assert delta.delete_ids == [14]
+        assert delta.counts() == {'created': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1}
+
+    def test_unchanged_batch_writes_nothing(self):
+        desired = desired_line_items([record('E1', (1, 'Roofing', '99.9'))])
+        delta = diff_line_items(desired, {('E1', 1): (1, 'Roofing', Decimal('99.90'))})
+        assert not delta.upserts and not delta.delete_ids
+        assert delta.unchanged == 1
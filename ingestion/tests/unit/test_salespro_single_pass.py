@@ -0,0 +1,138 @@
+"""
+Unit Tests for SalesPro single-pass Athena extraction
+
+Drives SalesProBaseSyncEngine.fetch_data against a fake Athena client that
+serves a paginated result set, without AWS access.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory result pages)
+Duration: < 5 seconds
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from ingestion.athena_client import AthenaClient
+from ingestion.models.salespro import SalesPro_LeadResult
+from ingestion.sync.salespro.engines.base import SalesProBaseSyncEngine
+
+
+class LeadResultsEngine(SalesProBaseSyncEngine):
+    def __init__(self, **kwargs):
+        super().__init__('lead_results', SalesPro_LeadResult, **kwargs)
+
+    async def _transform_record(self, record):
+        return record
+
+
+def make_page(rows, next_token=None, header=False):
+    data = [{'Data': [{'VarCharValue': v} for v in ['estimate_id', 'company_id']]}] if header else []
+    data += [{'Data': [{'VarCharValue': a}, {'VarCharValue': b}]} for a, b in rows]
+    page = {'ResultSet': {'Rows': data}}
+    if next_token:
+        page['NextToken'] = next_token
+    return page
+
+
+def fake_connection(pages):
+    """AthenaClient with boto3 replaced by canned GetQueryResults pages"""
+    connection = AthenaClient.__new__(AthenaClient)
+    connection.client = MagicMock()
+    connection.client.get_query_results.side_effect = pages
+    connection.start_query = MagicMock(return_value='exec-1')
+    connection.get_query_with_columns = MagicMock()
+    return connection
+
+
+def collect(engine, **kwargs):
+    async def run():
+        return [batch async for batch in engine.fetch_data(**kwargs)]
+    return asyncio.run(run())
+
+
+class TestSinglePassExtraction:
+    """One query, streamed page by page into engine batches"""
+
+    PAGES = [
+        make_page([('e1', 'c1'), ('e2', 'c1')], next_token='t1', header=True),
+        make_page([('e3', 'c2'), ('e4', 'c2')], next_token='t2'),
+        make_page([('e5', 'c3')]),
+    ]
+
+    def test_streams_all_pages_into_batches(self):
+        engine = LeadResultsEngine(batch_size=3)
+        engine.connection = fake_connection(list(self.PAGES))
+        batches = collect(engine)
+
+        assert [len(batch) for batch in batches] == [3, 2]
+        assert batches[0][0] == {'estimate_id': 'e1', 'company_id': 'c1'}
+        assert batches[1][-1]['estimate_id'] == 'e5'
+
+        # One query, no COUNT(*) pre-query, pages requested with NextToken
+        engine.connection.start_query.assert_called_once()
+        engine.connection.get_query_with_columns.assert_not_called()
+        tokens = [call.kwargs.get('NextToken') for call in engine.connection.client.get_query_results.call_args_list]
+        assert tokens == [None, 't1', 't2']
+
+    def test_max_records_is_pushed_into_query(self):
+        engine = LeadResultsEngine()
+        engine.connection = fake_connection(list(self.PAGES))
+        collect(engine, max_records=2, since_date=datetime(2025, 1, 1))
+
+        query = engine.connection.start_query.call_args.args[0]
+        assert 'ROW_NUMBER' not in query
+        assert "updated_at > timestamp '2025-01-01 00:00:00'" in query
+        assert query.endswith('LIMIT 2')
+
+    def test_count_query_shares_filters(self):
+        engine = LeadResultsEngine()
+        count_query = engine._build_count_query(since_date=datetime(2025, 1, 1))
+        assert count_query.startswith('SELECT COUNT(*)')
+        assert "estimate_id IS NOT NULL AND estimate_id != ''" in count_query
+        assert "updated_at > timestamp '2025-01-01 00:00:00'" in count_query
+
+
+class TestSinglePassResume:
+    """The stream cursor points at the first unsaved row of the result set"""
+
+    PAGES = TestSinglePassExtraction.PAGES
+
+    def test_cursor_tracks_page_token_and_offset(self):
+        engine = LeadResultsEngine(batch_size=3)
+        engine.connection = fake_connection(list(self.PAGES))
+        cursors = []
+
+        async def run():
+            async for _ in engine.fetch_data():
+                cursors.append(engine.get_stream_cursor())
+        asyncio.run(run())
+
+        # After e1-e3 the next row (e4) is the second row of the page fetched with 't1'
+        assert cursors[0]['query_execution_id'] == 'exec-1'
+        assert (cursors[0]['page_token'], cursors[0]['skip']) == ('t1', 1)
+        assert cursors[0]['columns'] == ['estimate_id', 'company_id']
+
+    def test_resume_rereads_results_from_the_cursor(self):
+        engine = LeadResultsEngine(batch_size=3)
+        engine.connection = fake_connection(list(self.PAGES[1:]))
+        engine.connection.get_query_state = MagicMock(return_value='SUCCEEDED')
+        engine.resume_cursor = {'query_execution_id': 'exec-1', 'source': 'api', 'page_token': 't1',
+                                'skip': 1, 'columns': ['estimate_id', 'company_id']}
+        batches = collect(engine)
+
+        assert [row['estimate_id'] for batch in batches for row in batch] == ['e4', 'e5']
+        engine.connection.start_query.assert_not_called()
+        first_call = engine.connection.client.get_query_results.call_args_list[0]
+        assert first_call.kwargs['NextToken'] == 't1'
+
+    def test_expired_results_start_a_new_query(self):
+        engine = LeadResultsEngine(batch_size=3)
+        engine.connection = fake_connection(list(self.PAGES))
+        engine.connection.get_query_state = MagicMock(return_value=None)
+        engine.resume_cursor = {'query_execution_id': 'old', 'source': 'api', 'page_token': 't1',
+                                'skip': 1, 'columns': ['estimate_id', 'company_id']}
+        batches = collect(engine)
+
+        engine.connection.start_query.assert_called_once()
+        assert sum(len(batch) for batch in batches) == 5
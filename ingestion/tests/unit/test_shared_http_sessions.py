@@ -0,0 +1,92 @@
+"""
+Unit Tests for shared keep-alive HTTP sessions
+
+Runs BaseAPIClient subclasses against a local aiohttp test server to check
+that clients of one host share a session and reuse its connections.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Local aiohttp server on 127.0.0.1)
+Duration: < 5 seconds
+"""
+
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from ingestion.base.client import BaseAPIClient
+from ingestion.base.connection_pool import SharedHTTPSessionPool, shared_http_sessions
+
+
+class LocalClient(BaseAPIClient):
+    default_rate_limit = 1000.0
+
+    def __init__(self, base_url):
+        super().__init__(base_url=base_url)
+
+    async def authenticate(self):
+        self.headers['Authorization'] = 'Bearer test'
+
+    def get_rate_limit_headers(self):
+        return {}
+
+
+async def echo_auth(request):
+    return web.json_response({'auth': request.headers.get('Authorization')})
+
+
+def run_with_server(scenario):
+    async def main():
+        app = web.Application()
+        app.router.add_get('/ping', echo_auth)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url('/')))
+        finally:
+            await server.close()
+    return asyncio.run(main())
+
+
+class TestSharedHTTPSessions:
+    """Clients of one host share a session and its connections"""
+
+    def test_clients_share_session_and_reuse_connections(self):
+        async def scenario(base_url):
+            first, second = LocalClient(base_url), LocalClient(base_url)
+            async with first, second:
+                assert first.session is second.session
+                for _ in range(5):
+                    assert await first.make_request('GET', 'ping') == {'auth': 'Bearer test'}
+                    await second.make_request('GET', 'ping')
+            return shared_http_sessions.get_stats()[SharedHTTPSessionPool.origin(base_url)]
+
+        stats = run_with_server(scenario)
+        assert stats['requests'] == 10
+        assert stats['connections_created'] == 1
+        assert stats['connections_reused'] == 9
+
+    def test_idle_session_lingers_and_closes_with_loop(self):
+        sessions = []
+
+        async def scenario(base_url):
+            client = LocalClient(base_url)
+            async with client.pooled_session() as session:
+                sessions.append(session)
+            # Released but still open for the next client on this host
+            async with LocalClient(base_url) as again:
+                assert again.session is session
+            assert not session.closed
+
+        run_with_server(scenario)
+        assert sessions[0].closed
+
+    def test_pooled_session_keeps_an_open_session(self):
+        async def scenario(base_url):
+            client = LocalClient(base_url)
+            async with client:
+                async with client.pooled_session() as session:
+                    assert session is client.session
+                assert not client.session.closed
+
+        run_with_server(scenario)
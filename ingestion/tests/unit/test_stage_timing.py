@@ -0,0 +1,73 @@
+"""
+Unit Tests for per-stage sync timing
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory batches)
+Duration: < 5 seconds
+"""
+
+import pytest
+
+from ingestion.base.stage_timing import StageTimer, percentile, stage_breakdown
+from ingestion.tests.unit.test_sync_engine_pipeline import InMemorySyncEngine, run_engine
+
+
+class TestStageTimer:
+    """Samples reduce to totals and nearest-rank percentiles"""
+
+    def test_percentiles(self):
+        values = sorted(float(n) for n in range(1, 101))
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 95) == 0.0
+
+    def test_summary(self):
+        timer = StageTimer()
+        for seconds in (0.1, 0.2, 0.3):
+            timer.add('save', seconds)
+        timer.count_batch(500, nbytes=2048)
+        timer.count_batch(100)
+
+        summary = timer.summary()
+        assert summary['stages']['save']['count'] == 3
+        assert summary['stages']['save']['total_seconds'] == pytest.approx(0.6)
+        assert summary['stages']['save']['max_seconds'] == 0.3
+        assert summary['batches']['total_rows'] == 600
+        assert summary['bytes_fetched'] == 2048
+
+    def test_timed_iter_counts_batches(self):
+        timer = StageTimer()
+        assert list(timer.timed_iter([[1, 2], [3]])) == [[1, 2], [3]]
+        assert len(timer.samples['fetch_wait']) == 2
+        assert timer.batch_rows == [2, 1]
+
+    def test_stage_breakdown(self):
+        runs = [
+            {'stages': {'fetch_wait': {'total_seconds': 3.0}, 'save': {'total_seconds': 1.0}},
+             'batches': {'total_rows': 400}},
+            {'duration_seconds': 5},
+        ]
+        breakdown = stage_breakdown(runs)
+        assert breakdown['fetch_wait']['share'] == 0.75
+        assert breakdown['save']['records_per_second'] == 400.0
+
+
+class TestEngineStageTiming:
+    """BaseSyncEngine times every stage of a run"""
+
+    @pytest.mark.parametrize('depth', [0, 2])
+    def test_run_records_each_stage(self, depth):
+        engine = InMemorySyncEngine([[1, 2], [3, 4], [5]], pipeline_depth=depth)
+        run_engine(engine)
+
+        metrics = engine.with_stage_metrics({'duration_seconds': 1.0})
+        assert metrics['duration_seconds'] == 1.0
+        for stage in ('fetch_wait', 'transform', 'validate', 'save'):
+            assert metrics['stages'][stage]['count'] == 3
+        assert metrics['batches']['total_rows'] == 5
+
+    def test_dry_run_has_no_save_stage(self):
+        engine = InMemorySyncEngine([[1]], dry_run=True)
+        run_engine(engine)
+        assert 'save' not in engine.with_stage_metrics({})['stages']
@@ -0,0 +1,85 @@
+"""
+Unit Tests for resumable sync checkpoints
+
+Checks that BaseSyncEngine checkpoints the stream cursor only after the batch
+it points past has been saved, and that SyncCheckpoint throttles its writes.
+SyncHistory persistence is patched out.
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (In-memory batches)
+Duration: < 5 seconds
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+import pytest
+
+from ingestion.base.checkpoint import SyncCheckpoint
+from ingestion.tests.unit.test_sync_engine_pipeline import InMemorySyncEngine, run_engine
+
+
+class CursorEngine(InMemorySyncEngine):
+    """Reports the index of the next unfetched batch as its stream cursor"""
+
+    async def fetch_data(self, **kwargs):
+        for index, batch in enumerate(self.batches):
+            self.position = index + 1
+            yield batch
+
+    def get_stream_cursor(self):
+        return {'next_batch': getattr(self, 'position', 0)}
+
+
+class RecordingCheckpoint:
+    def __init__(self, engine):
+        self.engine = engine
+        self.writes = []
+
+    async def aupdate(self, cursor, records_processed=0, force=False):
+        # Everything up to the cursor must already be saved
+        self.writes.append((cursor['next_batch'], len(self.engine.saved)))
+        return True
+
+
+class TestEngineCheckpoints:
+    BATCHES = [[1, 2], [3, 4], [5, 6], [7]]
+
+    @pytest.mark.parametrize('depth', [0, 2])
+    def test_cursor_is_checkpointed_after_its_batch_is_saved(self, depth):
+        engine = CursorEngine(self.BATCHES, pipeline_depth=depth)
+        engine.checkpoint = RecordingCheckpoint(engine)
+        run_engine(engine)
+
+        assert engine.checkpoint.writes == [(1, 1), (2, 2), (3, 3), (4, 4)]
+
+    def test_dry_run_does_not_checkpoint(self):
+        engine = CursorEngine(self.BATCHES, dry_run=True)
+        engine.checkpoint = RecordingCheckpoint(engine)
+        run_engine(engine)
+
+        assert engine.checkpoint.writes == []
+
+
+class TestSyncCheckpoint:
+    def make(self, interval):
+        history = SimpleNamespace(pk=1, configuration={'resumed_from': 7}, checkpoint=None, checkpoint_at=None)
+        return SyncCheckpoint(history, interval=interval), history
+
+    def test_writes_are_throttled(self):
+        checkpoint, history = self.make(interval=3600)
+        with patch('ingestion.models.common.SyncHistory.objects') as objects:
+            assert checkpoint.update({'after': 'a'}, 10) is True
+            assert checkpoint.update({'after': 'b'}, 20) is False
+            assert checkpoint.flush(20) is True
+
+        assert objects.filter.return_value.update.call_count == 2
+        assert history.checkpoint == {'cursor': {'after': 'b'}, 'records_processed': 20, 'resumed_from': 7}
+
+    def test_clear_drops_the_checkpoint(self):
+        checkpoint, history = self.make(interval=0)
+        with patch('ingestion.models.common.SyncHistory.objects'):
+            checkpoint.update({'after': 'a'})
+        checkpoint.clear()
+        assert history.checkpoint is None
@@ -0,0 +1,110 @@
+"""
+Unit Tests for dependency-aware orchestration of the *_all sync commands
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Steps are plain callables)
+Duration: < 5 seconds
+"""
+
+import threading
+import time
+
+import pytest
+
+from ingestion.base import orchestration
+from ingestion.base.orchestration import FAILED, SKIPPED, SUCCESS, SyncDAG, SyncStep
+
+
+def recorder(log, name, delay=0.0):
+    def run():
+        time.sleep(delay)
+        log.append(name)
+        return name
+    return run
+
+
+class TestDependencies:
+    """Steps start only after everything they depend on succeeded"""
+
+    def test_levels_follow_dependencies(self):
+        steps = [
+            SyncStep('jobs', lambda: None, depends_on=('prospects', 'services')),
+            SyncStep('services', lambda: None),
+            SyncStep('prospects', lambda: None, depends_on=('divisions',)),
+            SyncStep('divisions', lambda: None),
+        ]
+        assert SyncDAG(steps).levels() == [['services', 'divisions'], ['prospects'], ['jobs']]
+
+    def test_unknown_dependency_and_cycle_are_rejected(self):
+        with pytest.raises(ValueError, match='unknown'):
+            SyncDAG([SyncStep('a', lambda: None, depends_on=('missing',))])
+        with pytest.raises(ValueError, match='cycle'):
+            SyncDAG([SyncStep('a', lambda: None, depends_on=('b',)),
+                     SyncStep('b', lambda: None, depends_on=('a',))])
+
+    def test_dependents_run_after_their_dependencies(self):
+        log = []
+        steps = [
+            SyncStep('child', recorder(log, 'child'), depends_on=('parent',)),
+            SyncStep('parent', recorder(log, 'parent', delay=0.05)),
+            SyncStep('other', recorder(log, 'other')),
+        ]
+        run = SyncDAG(steps, max_parallel=3).run()
+        assert run.succeeded
+        assert log.index('parent') < log.index('child')
+        assert list(run.results) == ['child', 'parent', 'other']
+        assert run.results['child'].result == 'child'
+
+    def test_failure_skips_only_downstream_steps(self):
+        def fail():
+            raise RuntimeError('mysql went away')
+
+        log = []
+        steps = [
+            SyncStep('divisions', fail),
+            SyncStep('users', recorder(log, 'users'), depends_on=('divisions',)),
+            SyncStep('associations', recorder(log, 'associations'), depends_on=('users',)),
+            SyncStep('services', recorder(log, 'services')),
+        ]
+        run = SyncDAG(steps, max_parallel=2).run()
+
+        statuses = {name: result.status for name, result in run.results.items()}
+        assert statuses == {'divisions': FAILED, 'users': SKIPPED, 'associations': SKIPPED, 'services': SUCCESS}
+        assert run.results['divisions'].error == 'mysql went away'
+        assert log == ['services']
+        summary = run.summary()
+        assert (summary['successful_steps'], summary['failed_steps'], summary['skipped_steps']) == (1, 1, 2)
+
+
+class TestConcurrency:
+    """Independent steps overlap, bounded by parallelism and memory"""
+
+    def test_independent_steps_run_together(self):
+        barrier = threading.Barrier(3, timeout=2)
+        steps = [SyncStep(name, barrier.wait) for name in ('services', 'user_titles', 'job_statuses')]
+        run = SyncDAG(steps, max_parallel=3).run()
+        assert run.succeeded
+        assert run.peak_parallel == 3
+
+    def test_max_parallel_bounds_running_steps(self):
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def step():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        SyncDAG([SyncStep(f's{n}', step) for n in range(6)], max_parallel=2).run()
+        assert peak[0] == 2
+
+    def test_memory_budget_holds_back_new_steps(self, monkeypatch):
+        monkeypatch.setattr(orchestration, 'MEMORY_POLL_INTERVAL', 0.01)
+        steps = [SyncStep(f's{n}', lambda: time.sleep(0.02)) for n in range(3)]
+        run = SyncDAG(steps, max_parallel=3, memory_budget_mb=100, rss_mb=lambda: 500).run()
+
+        assert run.succeeded
+        assert run.peak_parallel == 1
+        assert run.memory_waits > 0
@@ -0,0 +1,78 @@
+"""
+Unit Tests for the process-pool transform executor
+
+Test Type: UNIT (Safe, Fast, No External Dependencies)
+Data Usage: MOCKED (Plain processors and module-level transform functions)
+Duration: < 5 seconds
+"""
+
+import pytest
+
+from ingestion.base.transform_pool import (
+    RecordTransform,
+    TransformExecutor,
+    iter_transforms,
+    merge_record_results,
+    transform_records,
+)
+
+
+class UpperProcessor:
+    def transform_record(self, record):
+        if record is None:
+            raise ValueError('empty record')
+        return record.upper()
+
+
+def double_page(page, factor):
+    return [value * factor for value in page]
+
+
+class TestRecordTransform:
+    """Per-record failures are returned with their position, not raised"""
+
+    def test_errors_line_up_with_input(self):
+        results, errors = RecordTransform(UpperProcessor())(['a', None, 'c'])
+        assert results == ['A', None, 'C']
+        assert errors == [(1, 'empty record')]
+
+    def test_merged_slices_rebase_error_positions(self):
+        parts = [(['A', None], [(1, 'bad')]), ([None, 'D'], [(0, 'worse')])]
+        results, errors = merge_record_results(parts, [2, 2])
+        assert results == ['A', None, None, 'D']
+        assert errors == [(1, 'bad'), (2, 'worse')]
+
+    def test_without_executor_runs_in_process(self):
+        results, errors = transform_records(UpperProcessor(), ['x', 'y'])
+        assert (results, errors) == (['X', 'Y'], [])
+
+
+class TestTransformExecutor:
+    """Batches are sliced per worker and come back in input order"""
+
+    def test_small_batches_are_not_sliced(self):
+        executor = TransformExecutor(workers=4, min_batch=10)
+        assert executor.slices(list(range(9))) == [list(range(9))]
+
+    def test_slices_cover_the_batch_in_order(self):
+        executor = TransformExecutor(workers=3, min_batch=1)
+        slices = executor.slices(list(range(10)))
+        assert len(slices) == 3
+        assert [value for part in slices for value in part] == list(range(10))
+
+    def test_inline_pages_keep_their_order(self):
+        pages = [[1, 2], [3], [4, 5]]
+        transformed = [(page, result()) for page, result in iter_transforms(double_page, pages, 10)]
+        assert transformed == [([1, 2], [10, 20]), ([3], [30]), ([4, 5], [40, 50])]
+
+    @pytest.mark.parametrize('method', ['map', 'imap'])
+    def test_pool_results_match_inline(self, method):
+        executor = TransformExecutor(workers=2, min_batch=1, start_method='fork')
+        try:
+            if method == 'map':
+                assert executor.map(double_page, [1, 2, 3, 4], 3) == [[3, 6], [9, 12]]
+            else:
+                pages = [[1], [2, 3], [4]]
+                assert [result() for _, result in executor.imap(double_page, pages, 2)] == [[2], [4, 6], [8]]
+        finally:
+            executor.shutdown()